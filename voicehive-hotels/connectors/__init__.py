@@ -39,6 +39,36 @@ from .contracts import (
     Reservation,
 )
 
+from .reference_data import (
+    ReferenceDataCache,
+    ReferenceResponse,
+    get_reference_cache,
+    invalidate_reference_data,
+)
+
+from .credential_provider import CredentialProvider
+
+from .coalescing import ReadCoalescer
+
+from .transport import (
+    SharedTransport,
+    TransportConfig,
+    TransportRegistry,
+    get_transport_registry,
+)
+
+from .rate_governor import (
+    RateGovernor,
+    RequestPriority,
+    get_rate_governor,
+    pms_request_context,
+)
+from .token_manager import (
+    OAuthToken,
+    OAuthTokenManager,
+    get_token_manager,
+)
+
 __all__ = [
     # Factory functions
     "get_connector",
@@ -71,4 +101,27 @@ __all__ = [
     "ReservationDraft",
     "ReservationPatch",
     "Reservation",
+    # Reference data cache
+    "ReferenceDataCache",
+    "ReferenceResponse",
+    "get_reference_cache",
+    "invalidate_reference_data",
+    # Read coalescing
+    "ReadCoalescer",
+    # Credentials
+    "CredentialProvider",
+    # Shared HTTP transports
+    "SharedTransport",
+    "TransportConfig",
+    "TransportRegistry",
+    "get_transport_registry",
+    # Rate governance
+    "RateGovernor",
+    "RequestPriority",
+    "get_rate_governor",
+    "pms_request_context",
+    # OAuth tokens
+    "OAuthToken",
+    "OAuthTokenManager",
+    "get_token_manager",
 ]
@@ -3,11 +3,14 @@ Apaleo PMS Connector
 Quick win implementation - modern REST API with good documentation
 """
 
+import asyncio
+import math
+import random
+from contextlib import aclosing, nullcontext
 from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import date, datetime, timezone, timedelta
 from decimal import Decimal
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 import redis.asyncio as aioredis
 
 from ...contracts import (
@@ -26,6 +29,15 @@ from ...contracts import (
     ReservationPatch,
     Reservation,
 )
+from ...reference_data import ReferenceResponse
+from ...token_manager import OAuthToken, get_token_manager
+from ...transport import SharedTransport, TransportConfig, get_transport_registry
+from ...rate_governor import (
+    RequestPriority,
+    get_rate_governor,
+    parse_retry_after,
+    pms_request_context,
+)
 from ...utils.logging import log_performance
 
 # Import circuit breaker from resilience infrastructure
@@ -73,18 +85,49 @@ class ApaleoConnector(BaseConnector):
         self._access_token = None
         self._token_expires_at = None
 
+        # Bound concurrent fan-out per property so a single availability
+        # question cannot exhaust the connection pool or the Apaleo rate limit
+        self.max_concurrent_requests_per_property = config.get("max_concurrent_requests_per_property", 8)
+        self._property_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._transport: Optional[SharedTransport] = None
+
+        # Health checks may reuse property details this recently fetched
+        self.health_check_cache_seconds = config.get("health_check_cache_seconds", 30)
+
+        # Admission control shared by every connector on this Apaleo account;
+        # rates start from the capability matrix and adapt to 429s
+        self.max_request_attempts = config.get("max_request_attempts", 3)
+        self._rate_governor = get_rate_governor(
+            f"apaleo:{self.client_id}",
+            requests_per_second=config.get("requests_per_second", 10),
+            burst=config.get("burst_limit", 50),
+            per_property_requests_per_second=config.get("per_property_requests_per_second"),
+            max_wait=config.get("max_rate_limit_wait_seconds", 10.0),
+        )
+
+        # Page size for streaming booking lists
+        self.stream_page_size = config.get("stream_page_size", 100)
+
+        # Get Redis client from config (optional)
+        redis_client = None
+        if "redis_url" in config:
+            try:
+                redis_client = aioredis.from_url(config["redis_url"])
+            except Exception as e:
+                if hasattr(self.logger, "warning"):
+                    self.logger.warning(f"Failed to connect to Redis: {e}")
+
+        # Tokens are shared by every connector for this OAuth client and,
+        # with share_oauth_tokens, across replicas through Redis
+        self._token_manager = get_token_manager(
+            f"apaleo:{self.client_id}",
+            redis_client=redis_client if config.get("share_oauth_tokens") else None,
+            renew_ratio=config.get("token_renew_ratio", 0.8),
+        )
+
         # Initialize circuit breakers if available
         self._circuit_breakers = {}
         if CircuitBreaker is not None:
-            # Get Redis client from config (optional)
-            redis_client = None
-            if "redis_url" in config:
-                try:
-                    redis_client = aioredis.from_url(config["redis_url"])
-                except Exception as e:
-                    if hasattr(self.logger, "warning"):
-                        self.logger.warning(f"Failed to connect to Redis for circuit breaker: {e}")
-
             # Circuit breaker for authentication
             auth_config = CircuitBreakerConfig(
                 name="apaleo_auth",
@@ -112,53 +155,122 @@ class ApaleoConnector(BaseConnector):
 
     async def connect(self):
         """Establish connection and get access token with optimized connection pooling"""
-        # Configure connection limits based on official httpx documentation
-        # Optimized for PMS API usage patterns - moderate concurrency with keepalive
-        connection_limits = httpx.Limits(
-            max_keepalive_connections=10,  # Keep 10 connections alive for reuse
-            max_connections=25,            # Maximum total connections for PMS operations
-            keepalive_expiry=30.0         # Keep connections alive for 30 seconds
-        )
-
-        # Create timeout configuration for different operation types
-        timeout_config = httpx.Timeout(
-            connect=10.0,    # Connection establishment timeout
-            read=30.0,       # Read timeout for API responses
-            write=10.0,      # Write timeout for API requests
-            pool=5.0         # Pool acquisition timeout
+        # Connectors for the same Apaleo account share one pooled HTTP/2 client,
+        # so connection count scales with accounts rather than properties
+        transport_config = TransportConfig(
+            max_concurrent_requests=self.config.get("max_concurrent_requests", 50),
+            max_concurrent_requests_per_property=self.max_concurrent_requests_per_property,
         )
-
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=timeout_config,
-            limits=connection_limits,
-            headers={
-                "User-Agent": "VoiceHive-Hotels/1.0",
-                "Accept": "application/json",
-                "Connection": "keep-alive",  # Enable connection reuse
-            },
-            # Enable HTTP/2 if supported by the PMS
-            http2=True,
+        self._transport = get_transport_registry().acquire(
+            "apaleo", self.base_url, scope=self.client_id, config=transport_config
         )
+        self._client = self._transport.client
 
         if hasattr(self.logger, "info"):
+            config = self._transport.config
             self.logger.info(
                 "apaleo_connection_pool_configured",
-                max_keepalive=connection_limits.max_keepalive_connections,
-                max_connections=connection_limits.max_connections,
-                keepalive_expiry=connection_limits.keepalive_expiry,
-                http2_enabled=True
+                max_keepalive=config.max_keepalive_connections,
+                max_connections=config.max_connections,
+                keepalive_expiry=config.keepalive_expiry,
+                http2_enabled=config.http2,
+                shared_by=self._transport.users,
+            )
+
+        try:
+            await self._authenticate(force=False)
+        except BaseException:
+            # Give back the transport reference taken above; disconnect()
+            # is never called for a connector that failed to connect
+            transport, self._transport, self._client = self._transport, None, None
+            await get_transport_registry().release(transport)
+            raise
+
+        self._token_manager.acquire(self._fetch_token)
+
+        if self.property_id and self.config.get("warm_reference_data", True):
+            await self.warm_reference_data(self.property_id)
+
+    async def warm_reference_data(self, property_id: str) -> None:
+        """Preload unit groups, rate plans and property details into the reference cache"""
+        # Warm-up yields to live-call traffic on the account's rate governor
+        with pms_request_context(RequestPriority.BACKGROUND):
+            results = await asyncio.gather(
+                self._get_reference_data(property_id, "/inventory/v1/unit-groups", {"propertyIds": property_id}),
+                self._get_reference_data(property_id, "/rateplan/v1/rate-plans", {"propertyIds": property_id}),
+                self._get_reference_data(property_id, f"/inventory/v1/properties/{property_id}"),
+                return_exceptions=True,
             )
 
-        await self._authenticate()
+        # Warming is best effort; failed resources load on first use
+        failures = [str(result) for result in results if isinstance(result, Exception)]
+        if failures and hasattr(self.logger, "warning"):
+            self.logger.warning(
+                "Reference data warm-up incomplete",
+                property_id=property_id,
+                errors=failures,
+            )
 
     async def disconnect(self):
         """Clean up connection"""
-        if self._client:
+        self._token_manager.release(self._fetch_token)
+        if self._transport is not None:
+            await get_transport_registry().release(self._transport)
+            self._transport = None
+        elif self._client:
             await self._client.aclose()
 
-    async def _authenticate(self):
-        """Get OAuth2 access token with circuit breaker protection"""
+    async def _authenticate(self, force: bool = True, stale_token: Optional[str] = None):
+        """
+        Get an OAuth2 access token with circuit breaker protection
+
+        Tokens come from the token manager shared by all connectors for this
+        client, so concurrent callers share one identity call. ``force``
+        fetches a new token; otherwise a valid shared token is reused.
+        ``stale_token`` is replaced unless another caller already did.
+        """
+        try:
+            token = await self._token_manager.get_token(
+                self._fetch_token, force=force, stale_token=stale_token
+            )
+
+        except CircuitBreakerOpenError as e:
+            if hasattr(self.logger, "error"):
+                self.logger.error("Authentication circuit breaker is open",
+                                circuit_name=e.circuit_name,
+                                next_attempt=e.next_attempt_time)
+            raise AuthenticationError(f"Authentication service unavailable: {e}")
+
+        except CircuitBreakerTimeoutError as e:
+            if hasattr(self.logger, "error"):
+                self.logger.error("Authentication timed out", error=str(e))
+            raise AuthenticationError(f"Authentication timeout: {e}")
+
+        except httpx.HTTPStatusError as e:
+            if hasattr(self.logger, "error"):
+                self.logger.error(
+                    f"Authentication failed: {e.response.status_code}",
+                    status_code=e.response.status_code,
+                )
+            raise AuthenticationError(f"Failed to authenticate with Apaleo: {e}")
+
+        except Exception as e:
+            if hasattr(self.logger, "error"):
+                self.logger.error("Unexpected authentication error", error=str(e))
+            raise AuthenticationError(f"Authentication error: {e}")
+
+        self._apply_token(token)
+
+    def _apply_token(self, token: OAuthToken):
+        """Use a token for this connector's requests"""
+        self._access_token = token.access_token
+        self._token_expires_at = token.expires_at
+
+        # Set auth header
+        self._client.headers["Authorization"] = f"Bearer {self._access_token}"
+
+    async def _fetch_token(self) -> Dict[str, Any]:
+        """Request a client-credentials token from Apaleo identity"""
         import base64
 
         auth_url = "https://identity.apaleo.com/connect/token"
@@ -191,13 +303,6 @@ class ApaleoConnector(BaseConnector):
             response.raise_for_status()
 
             data = response.json()
-            self._access_token = data["access_token"]
-            self._token_expires_at = datetime.now(timezone.utc).timestamp() + data.get(
-                "expires_in", 3600
-            )
-
-            # Set auth header
-            self._client.headers["Authorization"] = f"Bearer {self._access_token}"
 
             if hasattr(self.logger, "info"):
                 self.logger.info(
@@ -207,37 +312,10 @@ class ApaleoConnector(BaseConnector):
 
             return data
 
-        try:
-            # Use circuit breaker if available
-            if "auth" in self._circuit_breakers:
-                await self._circuit_breakers["auth"].call(_do_auth)
-            else:
-                await _do_auth()
-
-        except CircuitBreakerOpenError as e:
-            if hasattr(self.logger, "error"):
-                self.logger.error("Authentication circuit breaker is open",
-                                circuit_name=e.circuit_name,
-                                next_attempt=e.next_attempt_time)
-            raise AuthenticationError(f"Authentication service unavailable: {e}")
-
-        except CircuitBreakerTimeoutError as e:
-            if hasattr(self.logger, "error"):
-                self.logger.error("Authentication timed out", error=str(e))
-            raise AuthenticationError(f"Authentication timeout: {e}")
-
-        except httpx.HTTPStatusError as e:
-            if hasattr(self.logger, "error"):
-                self.logger.error(
-                    f"Authentication failed: {e.response.status_code}",
-                    status_code=e.response.status_code,
-                )
-            raise AuthenticationError(f"Failed to authenticate with Apaleo: {e}")
-
-        except Exception as e:
-            if hasattr(self.logger, "error"):
-                self.logger.error("Unexpected authentication error", error=str(e))
-            raise AuthenticationError(f"Authentication error: {e}")
+        # Use circuit breaker if available
+        if "auth" in self._circuit_breakers:
+            return await self._circuit_breakers["auth"].call(_do_auth)
+        return await _do_auth()
 
     async def _ensure_authenticated(self):
         """Ensure we have a valid token"""
@@ -245,14 +323,74 @@ class ApaleoConnector(BaseConnector):
             not self._access_token
             or datetime.now(timezone.utc).timestamp() >= self._token_expires_at
         ):
-            await self._authenticate()
+            await self._authenticate(force=False)
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     async def _request(self, method: str, path: str, **kwargs):
-        """Make authenticated request with circuit breaker and retry logic"""
+        """
+        Make an API request, coalescing identical concurrent GETs
+
+        Plain GETs for the same path and params share one upstream call
+        (and, with ``read_coalescing_ttl_seconds``, a short-lived result).
+        Conditional and custom-header requests always go upstream.
+        """
+        if (
+            method.upper() == "GET"
+            and self.config.get("coalesce_reads", True)
+            and not kwargs.get("conditional")
+            and "headers" not in kwargs
+        ):
+            return await self.coalesce_read(
+                method, path, kwargs.get("params"),
+                lambda: self._send_request(method, path, **kwargs),
+            )
+        return await self._send_request(method, path, **kwargs)
+
+    async def _send_request(self, method: str, path: str, **kwargs):
+        """
+        Send a request through the account's rate governor, retrying
+        rate limits, expired tokens and transient upstream errors
+
+        A 429 feeds its ``Retry-After`` back into the governor, which holds
+        every request for the account until then; a retry that could not be
+        sent within the caller's deadline fails fast with ``RateLimitError``.
+        """
+        property_id = kwargs.pop("property_id", None)
+
+        for attempt in range(self.max_request_attempts):
+            await self._rate_governor.acquire(property_id)
+            try:
+                result = await self._send_once(method, path, **kwargs)
+            except RateLimitError as e:
+                self._rate_governor.on_rate_limited(getattr(e, "retry_after", None))
+                if attempt == self.max_request_attempts - 1:
+                    raise
+            except (NotFoundError, ValidationError):
+                raise
+            except (AuthenticationError, PMSError):
+                # 401s refreshed the token; other errors are transient upstream
+                # failures worth a short, jittered pause
+                if attempt == self.max_request_attempts - 1:
+                    raise
+                await asyncio.sleep(random.uniform(0, 0.5 * 2 ** attempt))
+            else:
+                self._rate_governor.on_success()
+                return result
+
+    async def _send_once(self, method: str, path: str, **kwargs):
+        """
+        Make authenticated request with circuit breaker protection
+
+        With ``conditional=True`` the result is a ``ReferenceResponse``
+        carrying the ETag; ``etag`` is sent as ``If-None-Match`` and a 304
+        is reported as ``not_modified``.
+        """
+        conditional = kwargs.pop("conditional", False)
+        etag = kwargs.pop("etag", None)
+        if etag:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": etag}
+
         await self._ensure_authenticated()
+        used_token = self._access_token
 
         async def _do_request():
             """Inner request function for circuit breaker"""
@@ -263,15 +401,24 @@ class ApaleoConnector(BaseConnector):
                 response = await self._client.request(method, path, **kwargs)
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
+                    # None when Apaleo sends no Retry-After; the governor then backs off on its own
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        retry_after = math.ceil(retry_after)
                     if hasattr(self.logger, "warning"):
                         self.logger.warning(
                             f"Rate limit hit for {method} {path}", retry_after=retry_after
                         )
-                    e = RateLimitError(f"Rate limit exceeded, retry after {retry_after}s")
+                    e = RateLimitError(
+                        "Rate limit exceeded"
+                        + (f", retry after {retry_after}s" if retry_after is not None else "")
+                    )
                     setattr(e, "retry_after", retry_after)
                     raise e
 
+                if conditional and response.status_code == 304:
+                    return ReferenceResponse(data=None, etag=etag, not_modified=True)
+
                 response.raise_for_status()
 
                 # Log successful request
@@ -283,7 +430,10 @@ class ApaleoConnector(BaseConnector):
                         duration_ms=duration_ms,
                     )
 
-                return response.json() if response.content else None
+                data = response.json() if response.content else None
+                if conditional:
+                    return ReferenceResponse(data=data, etag=response.headers.get("ETag"))
+                return data
 
             except httpx.HTTPStatusError as e:
                 # Log error
@@ -297,8 +447,8 @@ class ApaleoConnector(BaseConnector):
                     )
 
                 if e.response.status_code == 401:
-                    # Token might have expired, try re-authenticating
-                    await self._authenticate()
+                    # Token might have expired; replace it once for all callers
+                    await self._authenticate(force=False, stale_token=used_token)
                     raise AuthenticationError("Authentication failed")
                 elif e.response.status_code == 404:
                     raise NotFoundError(f"Resource not found: {path}")
@@ -307,12 +457,16 @@ class ApaleoConnector(BaseConnector):
                 else:
                     raise PMSError(f"API error: {e}")
 
+        # Global limit across all connectors sharing the transport
+        limit = self._transport.limit if self._transport is not None else nullcontext()
+
         try:
             # Use circuit breaker if available, otherwise fallback to direct call
-            if "api" in self._circuit_breakers:
-                return await self._circuit_breakers["api"].call(_do_request)
-            else:
-                return await _do_request()
+            async with limit:
+                if "api" in self._circuit_breakers:
+                    return await self._circuit_breakers["api"].call(_do_request)
+                else:
+                    return await _do_request()
 
         except CircuitBreakerOpenError as e:
             if hasattr(self.logger, "error"):
@@ -329,6 +483,38 @@ class ApaleoConnector(BaseConnector):
                                 operation=f"{method} {path}")
             raise PMSError(f"Apaleo API timeout: {e}")
 
+    def _property_semaphore(self, property_id: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests for a property"""
+        if self._transport is not None:
+            # Shared with every connector on the same transport
+            return self._transport.property_limit(property_id)
+
+        semaphore = self._property_semaphores.get(property_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests_per_property)
+            self._property_semaphores[property_id] = semaphore
+        return semaphore
+
+    async def _property_request(self, property_id: str, method: str, path: str, **kwargs):
+        """Make a request counted against the property's concurrency limit"""
+        async with self._property_semaphore(property_id):
+            return await self._request(method, path, property_id=property_id, **kwargs)
+
+    async def _get_reference_data(
+        self,
+        property_id: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None
+    ) -> Any:
+        """Get static inventory through the shared reference data cache, revalidating by ETag"""
+        async def load(etag: Optional[str]) -> ReferenceResponse:
+            return await self._property_request(
+                property_id, "GET", path, params=params, conditional=True, etag=etag
+            )
+
+        return await self.get_reference_data(property_id, path, load, ttl)
+
     async def get_circuit_breaker_stats(self) -> Dict[str, Any]:
         """Get circuit breaker statistics"""
         stats = {}
@@ -363,8 +549,13 @@ class ApaleoConnector(BaseConnector):
         circuit_breaker_stats = await self.get_circuit_breaker_stats()
 
         try:
-            # Try to get property info as health check using correct Inventory API endpoint
-            await self._request("GET", f"/inventory/v1/properties/{self.property_id}")
+            # Try to get property info as health check using correct Inventory API endpoint;
+            # details fetched within health_check_cache_seconds count as proof of access
+            await self._get_reference_data(
+                self.property_id,
+                f"/inventory/v1/properties/{self.property_id}",
+                ttl=self.health_check_cache_seconds
+            )
             return {
                 "status": "healthy",
                 "vendor": "apaleo",
@@ -404,9 +595,46 @@ class ApaleoConnector(BaseConnector):
         """Get room availability using correct Apaleo availability endpoints"""
         property_id = hotel_id or self.property_id
 
-        # Get unit groups (room types) using inventory endpoint for static data
-        unit_groups = await self._request(
-            "GET", "/inventory/v1/unit-groups", params={"propertyIds": property_id}
+        # Use correct availability endpoint: /availability/v1/unit-groups
+        # This endpoint uses date format, not datetime
+        unit_groups_availability_params = {
+            "propertyId": property_id,
+            "from": start.isoformat(),
+            "to": end.isoformat()
+        }
+        if room_type:
+            unit_groups_availability_params["unitGroupIds"] = room_type
+
+        async def fetch_availability():
+            try:
+                return await self._property_request(
+                    property_id, "GET", "/availability/v1/unit-groups", params=unit_groups_availability_params
+                )
+            except (NotFoundError, PMSError) as e:
+                # If availability endpoint fails, log warning and return empty availability
+                if hasattr(self.logger, "warning"):
+                    self.logger.warning(
+                        f"Availability endpoint failed, returning empty availability: {e}",
+                        property_id=property_id
+                    )
+                return {"timeSlices": []}
+
+        async def fetch_rate_plans():
+            try:
+                return await self._get_reference_data(
+                    property_id, "/rateplan/v1/rate-plans", {"propertyIds": property_id}
+                )
+            except Exception as e:
+                if hasattr(self.logger, "warning"):
+                    self.logger.warning(f"Could not fetch rate plans: {e}", property_id=property_id)
+                return None
+
+        # Unit groups, availability and rate plans are independent - fetch them concurrently.
+        # Unit groups and rate plans are static inventory and usually come from cache.
+        unit_groups, availability_data, rate_plans = await asyncio.gather(
+            self._get_reference_data(property_id, "/inventory/v1/unit-groups", {"propertyIds": property_id}),
+            fetch_availability(),
+            fetch_rate_plans(),
         )
 
         # Map to our domain model first
@@ -423,30 +651,6 @@ class ApaleoConnector(BaseConnector):
                 )
             )
 
-        # Use correct availability endpoint: /availability/v1/unit-groups
-        # This endpoint uses date format, not datetime
-        unit_groups_availability_params = {
-            "propertyId": property_id,
-            "from": start.isoformat(),
-            "to": end.isoformat()
-        }
-        if room_type:
-            unit_groups_availability_params["unitGroupIds"] = room_type
-
-        try:
-            # Get availability using correct endpoint
-            availability_data = await self._request(
-                "GET", "/availability/v1/unit-groups", params=unit_groups_availability_params
-            )
-        except (NotFoundError, PMSError) as e:
-            # If availability endpoint fails, log warning and return empty availability
-            if hasattr(self.logger, "warning"):
-                self.logger.warning(
-                    f"Availability endpoint failed, returning empty availability: {e}",
-                    property_id=property_id
-                )
-            availability_data = {"timeSlices": []}
-
         # Parse availability grid from timeSlices format
         availability_by_date = {}
 
@@ -506,8 +710,10 @@ class ApaleoConnector(BaseConnector):
                 endpoint="/availability/v1/unit-groups"
             )
 
-        # Get restrictions for the date range
-        restrictions = await self._get_restrictions(property_id, start, end)
+        # Get restrictions for the date range, reusing the payloads fetched above
+        restrictions = await self._get_restrictions(
+            property_id, start, end, rate_plans=rate_plans, availability_data=availability_data
+        )
 
         return AvailabilityGrid(
             hotel_id=property_id,
@@ -688,6 +894,16 @@ class ApaleoConnector(BaseConnector):
                 "GET", f"/booking/v1/bookings/{reservation_id}"
             )
 
+        return self._map_reservation(result)
+
+    # Fields a booking payload needs before it can be mapped without a detail fetch
+    _RESERVATION_FIELDS = (
+        "id", "bookingNumber", "status", "property", "arrival", "departure",
+        "unitGroup", "ratePlan", "totalGrossAmount", "created", "modified",
+    )
+
+    def _map_reservation(self, result: Dict[str, Any]) -> Reservation:
+        """Map an Apaleo booking payload to a Reservation"""
         # Map guest from the reservation
         primary_guest = result.get("primaryGuest", {})
         guest = GuestProfile(
@@ -868,43 +1084,120 @@ class ApaleoConnector(BaseConnector):
         property_id = hotel_id or self.property_id
 
         # Get all arrivals for the date using official API query parameters
-        bookings = await self._request(
-            "GET",
-            "/booking/v1/bookings",
-            params={
+        bookings = self._stream_bookings(
+            property_id,
+            {
                 "propertyIds": property_id,
                 "arrival": arrival_date.isoformat(),
                 "status": "Confirmed,InHouse",
             },
         )
-
-        # Convert to async generator
-        for booking in bookings.get("bookings", []):
-            yield await self.get_reservation(booking["id"])
+        async with aclosing(bookings):
+            async for reservation in bookings:
+                yield reservation
 
     async def stream_in_house(self, hotel_id: str) -> AsyncIterator[Reservation]:
         """Stream in-house guests"""
         property_id = hotel_id or self.property_id
 
         # Get all in-house bookings using official API query parameters
-        bookings = await self._request(
-            "GET",
-            "/booking/v1/bookings",
-            params={"propertyIds": property_id, "status": "InHouse"},
+        bookings = self._stream_bookings(
+            property_id, {"propertyIds": property_id, "status": "InHouse"}
         )
+        async with aclosing(bookings):
+            async for reservation in bookings:
+                yield reservation
 
-        for booking in bookings.get("bookings", []):
-            yield await self.get_reservation(booking["id"])
+    async def _stream_bookings(
+        self, property_id: str, params: Dict[str, Any]
+    ) -> AsyncIterator[Reservation]:
+        """
+        Page through a booking list and yield reservations in list order
+
+        Bookings whose list payload carries every mapped field are converted
+        directly; the rest are hydrated with ``get_reservation``. Hydration
+        for a page starts up front under the property's concurrency limit,
+        and the next page is fetched while the current one is consumed, so
+        the first reservation is yielded as soon as it is ready.
+        """
+        page_size = self.stream_page_size
+
+        async def fetch_page(page_number: int) -> Dict[str, Any]:
+            return await self._property_request(
+                property_id,
+                "GET",
+                "/booking/v1/bookings",
+                params={**params, "pageNumber": page_number, "pageSize": page_size},
+            )
+
+        async def hydrate(booking_id: str) -> Reservation:
+            async with self._property_semaphore(property_id):
+                return await self.get_reservation(booking_id)
 
-    async def _get_restrictions(self, property_id: str, start: date, end: date) -> Dict[str, Any]:
-        """Get booking restrictions for the date range using official Apaleo endpoints"""
+        page_number = 1
+        seen = 0
+        page = await fetch_page(page_number)
+
+        while True:
+            bookings = (page or {}).get("bookings", [])
+            seen += len(bookings)
+            total = (page or {}).get("count")
+            has_more = len(bookings) >= page_size and (total is None or seen < total)
+
+            pending: List[asyncio.Future] = []
+            next_page = None
+            try:
+                for booking in bookings:
+                    if all(field in booking for field in self._RESERVATION_FIELDS):
+                        pending.append(self._completed(self._map_reservation(booking)))
+                    else:
+                        pending.append(asyncio.ensure_future(hydrate(booking["id"])))
+
+                if has_more:
+                    next_page = asyncio.ensure_future(fetch_page(page_number + 1))
+
+                for future in pending:
+                    yield await future
+            finally:
+                # Consumer stopped early or a fetch failed: drop outstanding work
+                for future in pending:
+                    future.cancel()
+                if next_page is not None and not next_page.done():
+                    next_page.cancel()
+
+            if next_page is None:
+                return
+            page_number += 1
+            page = await next_page
+
+    @staticmethod
+    def _completed(result: Any) -> asyncio.Future:
+        """Wrap an already-available result so it can be awaited in order"""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    async def _get_restrictions(
+        self,
+        property_id: str,
+        start: date,
+        end: date,
+        rate_plans: Optional[Dict[str, Any]] = None,
+        availability_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get booking restrictions for the date range using official Apaleo endpoints
+
+        ``rate_plans`` and ``availability_data`` let callers pass payloads they
+        already hold; anything missing is fetched. Rates for all rate plans are
+        fetched concurrently under the property's concurrency limit.
+        """
         try:
             # Get rate plan details first to identify available rate plans
-            rate_plans = await self._request(
-                "GET",
-                f"/rateplan/v1/rate-plans",
-                params={"propertyIds": property_id}
-            )
+            if rate_plans is None:
+                rate_plans = await self._get_reference_data(
+                    property_id, "/rateplan/v1/rate-plans", {"propertyIds": property_id}
+                )
 
             restrictions = {}
             current_date = start
@@ -920,93 +1213,57 @@ class ApaleoConnector(BaseConnector):
                 }
                 current_date = current_date + timedelta(days=1)
 
-            # Get restrictions for each rate plan
-            if rate_plans and "ratePlans" in rate_plans:
-                for rate_plan in rate_plans["ratePlans"]:
-                    rate_plan_id = rate_plan.get("id")
-                    if not rate_plan_id:
-                        continue
-
-                    try:
-                        # Get rates with restrictions for this rate plan
-                        rates_data = await self._request(
-                            "GET",
-                            f"/rateplan/v1/rate-plans/{rate_plan_id}/rates",
-                            params={
-                                "from": start.isoformat(),
-                                "to": end.isoformat(),
-                                "propertyIds": property_id
-                            }
+            rate_plan_ids = [
+                rate_plan["id"]
+                for rate_plan in (rate_plans or {}).get("ratePlans", [])
+                if rate_plan.get("id")
+            ]
+
+            # Get rates with restrictions for every rate plan concurrently
+            rates_results = await asyncio.gather(
+                *[
+                    self._property_request(
+                        property_id,
+                        "GET",
+                        f"/rateplan/v1/rate-plans/{rate_plan_id}/rates",
+                        params={
+                            "from": start.isoformat(),
+                            "to": end.isoformat(),
+                            "propertyIds": property_id
+                        }
+                    )
+                    for rate_plan_id in rate_plan_ids
+                ],
+                return_exceptions=True
+            )
+
+            # Apply in rate plan order so later plans win, as before
+            for rate_plan_id, rates_data in zip(rate_plan_ids, rates_results):
+                if isinstance(rates_data, Exception):
+                    # Log but continue with other rate plans
+                    if hasattr(self.logger, "debug"):
+                        self.logger.debug(
+                            f"Could not fetch restrictions for rate plan {rate_plan_id}: {rates_data}"
                         )
+                    continue
 
-                        # Process rate data to extract restrictions
-                        if rates_data and "rates" in rates_data:
-                            for rate_entry in rates_data["rates"]:
-                                rate_date_str = rate_entry.get("from")
-                                if rate_date_str:
-                                    rate_date = self.normalize_date(rate_date_str)
-
-                                    # Check if date is in our range
-                                    if start <= rate_date <= end and rate_date in restrictions:
-                                        # Extract restrictions from rate data
-                                        restrictions_data = rate_entry.get("restrictions", {})
-
-                                        # Update restrictions based on official API response format
-                                        if "minAdvanceBooking" in restrictions_data:
-                                            restrictions[rate_date]["min_advance_booking"] = restrictions_data["minAdvanceBooking"]
-                                        if "maxAdvanceBooking" in restrictions_data:
-                                            restrictions[rate_date]["max_advance_booking"] = restrictions_data["maxAdvanceBooking"]
-                                        if "closedOnArrival" in restrictions_data:
-                                            restrictions[rate_date]["closed_to_arrival"] = restrictions_data["closedOnArrival"]
-                                        if "closedOnDeparture" in restrictions_data:
-                                            restrictions[rate_date]["closed_to_departure"] = restrictions_data["closedOnDeparture"]
-                                        if "minLos" in restrictions_data:
-                                            restrictions[rate_date]["min_stay"] = restrictions_data["minLos"]
-                                        if "maxLos" in restrictions_data:
-                                            restrictions[rate_date]["max_stay"] = restrictions_data["maxLos"]
-
-                    except Exception as rate_plan_error:
-                        # Log but continue with other rate plans
-                        if hasattr(self.logger, "debug"):
-                            self.logger.debug(
-                                f"Could not fetch restrictions for rate plan {rate_plan_id}: {rate_plan_error}"
-                            )
-                        continue
+                self._apply_rate_restrictions(restrictions, rates_data, start, end)
 
             # Also check unit group availability for stop-sell status
             try:
-                inventory_data = await self._request(
-                    "GET",
-                    "/availability/v1/unit-groups",
-                    params={
-                        "propertyId": property_id,
-                        "from": start.isoformat(),
-                        "to": end.isoformat()
-                    }
-                )
+                if availability_data is None:
+                    availability_data = await self._property_request(
+                        property_id,
+                        "GET",
+                        "/availability/v1/unit-groups",
+                        params={
+                            "propertyId": property_id,
+                            "from": start.isoformat(),
+                            "to": end.isoformat()
+                        }
+                    )
 
-                # Process availability data for stop-sell indicators
-                if inventory_data and "timeSlices" in inventory_data:
-                    for time_slice in inventory_data["timeSlices"]:
-                        slice_from = time_slice.get("from")
-                        slice_to = time_slice.get("to")
-
-                        if slice_from and slice_to:
-                            slice_start = self.normalize_date(slice_from)
-                            slice_end = self.normalize_date(slice_to)
-
-                            # Check each date in this time slice
-                            current_date = slice_start
-                            while current_date <= slice_end and current_date <= end:
-                                if current_date >= start and current_date in restrictions:
-                                    # If total available across all unit groups is 0, consider it stop-sell
-                                    total_available = sum(
-                                        unit_group.get("available", 0)
-                                        for unit_group in time_slice.get("unitGroups", [])
-                                    )
-                                    if total_available == 0:
-                                        restrictions[current_date]["stop_sell"] = True
-                                current_date += timedelta(days=1)
+                self._apply_stop_sell(restrictions, availability_data, start, end)
 
             except Exception as availability_error:
                 # Log but continue - availability check is supplementary
@@ -1024,14 +1281,79 @@ class ApaleoConnector(BaseConnector):
                 )
             return {}
 
+    def _apply_rate_restrictions(
+        self, restrictions: Dict[date, Dict[str, Any]], rates_data: Optional[Dict[str, Any]], start: date, end: date
+    ):
+        """Merge the restrictions of one rate plan's rates into the grid"""
+        if not rates_data or "rates" not in rates_data:
+            return
+
+        for rate_entry in rates_data["rates"]:
+            rate_date_str = rate_entry.get("from")
+            if not rate_date_str:
+                continue
+
+            rate_date = self.normalize_date(rate_date_str)
+
+            # Check if date is in our range
+            if not (start <= rate_date <= end and rate_date in restrictions):
+                continue
+
+            # Extract restrictions from rate data
+            restrictions_data = rate_entry.get("restrictions", {})
+
+            # Update restrictions based on official API response format
+            if "minAdvanceBooking" in restrictions_data:
+                restrictions[rate_date]["min_advance_booking"] = restrictions_data["minAdvanceBooking"]
+            if "maxAdvanceBooking" in restrictions_data:
+                restrictions[rate_date]["max_advance_booking"] = restrictions_data["maxAdvanceBooking"]
+            if "closedOnArrival" in restrictions_data:
+                restrictions[rate_date]["closed_to_arrival"] = restrictions_data["closedOnArrival"]
+            if "closedOnDeparture" in restrictions_data:
+                restrictions[rate_date]["closed_to_departure"] = restrictions_data["closedOnDeparture"]
+            if "minLos" in restrictions_data:
+                restrictions[rate_date]["min_stay"] = restrictions_data["minLos"]
+            if "maxLos" in restrictions_data:
+                restrictions[rate_date]["max_stay"] = restrictions_data["maxLos"]
+
+    def _apply_stop_sell(
+        self, restrictions: Dict[date, Dict[str, Any]], availability_data: Optional[Dict[str, Any]], start: date, end: date
+    ):
+        """Mark dates with nothing available across unit groups as stop-sell"""
+        if not availability_data or "timeSlices" not in availability_data:
+            return
+
+        for time_slice in availability_data["timeSlices"]:
+            slice_from = time_slice.get("from")
+            slice_to = time_slice.get("to")
+
+            if not (slice_from and slice_to):
+                continue
+
+            slice_start = self.normalize_date(slice_from)
+            slice_end = self.normalize_date(slice_to)
+
+            # If total available across all unit groups is 0, consider it stop-sell
+            total_available = sum(
+                unit_group.get("available", 0)
+                for unit_group in time_slice.get("unitGroups", [])
+            )
+
+            # Check each date in this time slice
+            current_date = slice_start
+            while current_date <= slice_end and current_date <= end:
+                if current_date >= start and current_date in restrictions and total_available == 0:
+                    restrictions[current_date]["stop_sell"] = True
+                current_date += timedelta(days=1)
+
     async def _get_cancellation_policy(self, property_id: str, rate_code: str, arrival: date, departure: date) -> str:
         """Get cancellation policy for a specific rate and dates using official Apaleo endpoints"""
         try:
             # Get rate plan details including cancellation policy
-            rate_plan = await self._request(
-                "GET",
+            rate_plan = await self._get_reference_data(
+                property_id,
                 f"/rateplan/v1/rate-plans/{rate_code}",
-                params={"propertyIds": property_id}
+                {"propertyIds": property_id}
             )
 
             # Extract cancellation policy from rate plan using official API structure
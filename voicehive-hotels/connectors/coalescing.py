@@ -0,0 +1,119 @@
+"""
+VoiceHive Hotels - PMS Read Coalescing
+Share one upstream call between identical concurrent PMS reads
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+try:
+    from prometheus_client import Counter
+except ImportError:
+    # Mock Prometheus metrics if not available
+    class Counter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def labels(self, **kwargs):
+            return self
+
+        def inc(self, value=1):
+            pass
+
+logger = logging.getLogger(__name__)
+
+pms_read_coalescing = Counter(
+    "voicehive_pms_read_coalescing_total",
+    "PMS reads by coalescing outcome (upstream, joined, micro_cache)",
+    ["vendor", "outcome"],
+)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items() if v is not None))
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, set) else items)
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+class ReadCoalescer:
+    """
+    Single-flight for idempotent PMS reads
+
+    Concurrent calls with the same key await one upstream future. With
+    ``micro_ttl`` > 0 a completed result is also served for that many
+    seconds to absorb bursts (e.g. many callers asking for tonight's
+    availability at once). Errors are shared with the callers that were
+    waiting but never cached. Callers other than the one that triggered the
+    fetch get a deep copy, so mutating a result cannot affect another call.
+    """
+
+    def __init__(self, vendor: str, micro_ttl: float = 0.0, max_entries: int = 1024):
+        self.vendor = vendor
+        self.micro_ttl = micro_ttl
+        self.max_entries = max_entries
+
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._recent: Dict[Tuple, Tuple[float, Any]] = {}
+        self.stats = {"upstream": 0, "joined": 0, "micro_cache": 0}
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[Mapping[str, Any]] = None) -> Tuple:
+        """Key on method, path and params regardless of param order or None values"""
+        return (method.upper(), path, _normalize(params or {}))
+
+    async def run(self, key: Tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the shared result for ``key``, calling ``loader`` only if needed"""
+        if self.micro_ttl > 0:
+            recent = self._recent.get(key)
+            if recent is not None:
+                if time.monotonic() < recent[0]:
+                    self._record("micro_cache")
+                    return copy.deepcopy(recent[1])
+                del self._recent[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record("joined")
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        self._record("upstream")
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so a cancelled caller does not fail the others waiting
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Tuple, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if self.micro_ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+
+        if len(self._recent) >= self.max_entries:
+            now = time.monotonic()
+            self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+            if len(self._recent) >= self.max_entries:
+                self._recent.pop(next(iter(self._recent)))
+        # The leader gets task.result() itself, so the cache keeps its own copy
+        self._recent[key] = (time.monotonic() + self.micro_ttl, copy.deepcopy(task.result()))
+
+    def _record(self, outcome: str) -> None:
+        self.stats[outcome] += 1
+        pms_read_coalescing.labels(vendor=self.vendor, outcome=outcome).inc()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of reads served without their own upstream call"""
+        total = sum(self.stats.values())
+        return (total - self.stats["upstream"]) / total if total else 0.0
+
+    def clear(self) -> None:
+        self._recent.clear()
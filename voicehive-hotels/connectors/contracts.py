@@ -255,6 +255,9 @@ class BaseConnector(ABC):
         # Generate correlation ID for this instance
         self._correlation_id = None
 
+        # Created on first coalesced read
+        self._read_coalescer = None
+
     async def __aenter__(self):
         await self.connect()
         return self
@@ -292,6 +295,62 @@ class BaseConnector(ABC):
                     raise
                 await asyncio.sleep(2**attempt)
 
+    @property
+    def reference_cache(self):
+        """Process-wide reference data cache shared by all connector instances"""
+        # Relative, like the adapters, so both resolve to one module instance.
+        # Imported lazily because some tests load contracts as a top-level module.
+        from .reference_data import get_reference_cache
+
+        return get_reference_cache()
+
+    async def get_reference_data(self, property_id: str, resource: str, loader, ttl: Optional[float] = None) -> Any:
+        """
+        Get slowly-changing PMS data (room types, rate plans, property details)
+
+        ``loader`` is called with the cached ETag (or None) and returns a
+        ``ReferenceResponse``; adapters that support conditional requests
+        send ``If-None-Match`` and report ``not_modified`` on a 304.
+        """
+        if ttl is None:
+            ttl = self.config.get("reference_data_ttl_seconds")
+        return await self.reference_cache.get(self.vendor_name, property_id, resource, loader, ttl)
+
+    def invalidate_reference_data(self, property_id: Optional[str] = None, resource_prefix: Optional[str] = None) -> int:
+        """Drop cached reference data for this vendor"""
+        return self.reference_cache.invalidate(self.vendor_name, property_id, resource_prefix)
+
+    async def warm_reference_data(self, property_id: str) -> None:
+        """
+        Preload reference data after connecting
+
+        Intentionally a no-op: adapters whose PMS exposes cacheable reference
+        data override this, everything else connects without warming.
+        """
+        return None
+
+    @property
+    def read_coalescer(self):
+        """Single-flight layer shared by identical concurrent reads on this connector"""
+        if self._read_coalescer is None:
+            from .coalescing import ReadCoalescer
+
+            self._read_coalescer = ReadCoalescer(
+                getattr(self, "vendor_name", "unknown"),
+                micro_ttl=self.config.get("read_coalescing_ttl_seconds", 0.0),
+            )
+        return self._read_coalescer
+
+    async def coalesce_read(self, method: str, path: str, params: Optional[Dict[str, Any]], loader) -> Any:
+        """
+        Run an idempotent read through the coalescer
+
+        Identical concurrent reads (same method, path and params) share one
+        call to ``loader``.
+        """
+        key = self.read_coalescer.make_key(method, path, params)
+        return await self.read_coalescer.run(key, loader)
+
     def normalize_date(self, date_input) -> date:
         """Normalize various date formats to Python date"""
         if isinstance(date_input, date):
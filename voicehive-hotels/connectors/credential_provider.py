@@ -0,0 +1,208 @@
+"""
+VoiceHive Hotels - PMS Credential Provider
+Async, lease-aware cache of PMS credentials read from Vault
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CREDENTIAL_TTL_SECONDS = 300
+
+CredentialKey = Tuple[str, str]
+
+
+@dataclass
+class CredentialLease:
+    """Cached credentials and the window they may be used in"""
+    data: Dict[str, Any]
+    lease_duration: float
+    fetched_at: float
+
+    @property
+    def expires_at(self) -> float:
+        return self.fetched_at + self.lease_duration
+
+    def is_valid(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def renew_at(self, ratio: float) -> float:
+        return self.fetched_at + self.lease_duration * ratio
+
+
+class CredentialProvider:
+    """
+    Lease-aware credential cache in front of a (blocking) Vault client
+
+    Vault reads run in a worker thread so they never block the event loop.
+    Each entry lives for its Vault lease duration, or ``default_ttl`` when
+    the secret is not leased, and is re-read in the background once
+    ``renew_ratio`` of that window has passed. ``prefetch()`` loads the
+    credentials of every active hotel at startup so ``get_cached()`` can
+    serve connector creation without network I/O.
+    """
+
+    def __init__(
+        self,
+        vault_client: Any,
+        default_ttl: float = DEFAULT_CREDENTIAL_TTL_SECONDS,
+        renew_ratio: float = 0.75,
+        max_concurrency: int = 8,
+    ):
+        self.vault_client = vault_client
+        self.default_ttl = default_ttl
+        self.renew_ratio = renew_ratio
+        self.max_concurrency = max_concurrency
+
+        self._leases: Dict[CredentialKey, CredentialLease] = {}
+        self._inflight: Dict[CredentialKey, asyncio.Future] = {}
+        self._generations: Dict[CredentialKey, int] = {}
+        self._renewal_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "renewals": 0, "failures": 0}
+
+    def get_cached(self, vendor: str, hotel_id: str) -> Optional[Dict[str, Any]]:
+        """Return credentials only if they are cached and within their lease"""
+        lease = self._leases.get((vendor, hotel_id))
+        if lease is not None and lease.is_valid():
+            self.stats["hits"] += 1
+            return lease.data
+        self.stats["misses"] += 1
+        return None
+
+    async def get(self, vendor: str, hotel_id: str) -> Dict[str, Any]:
+        """Get credentials, reading Vault off the event loop on a miss"""
+        cached = self.get_cached(vendor, hotel_id)
+        if cached is not None:
+            return cached
+        return await self._refresh((vendor, hotel_id))
+
+    def load_sync(self, vendor: str, hotel_id: str) -> Dict[str, Any]:
+        """Blocking read for synchronous callers; the result is cached"""
+        return self._store((vendor, hotel_id), *self._read(vendor, hotel_id))
+
+    async def _refresh(self, key: CredentialKey) -> Dict[str, Any]:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        load = asyncio.ensure_future(self._load(key, self._generations.get(key, 0)))
+        self._inflight[key] = load
+        load.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so a cancelled caller does not cancel the read for the others waiting
+        return await asyncio.shield(load)
+
+    async def _load(self, key: CredentialKey, generation: int) -> Dict[str, Any]:
+        data, lease_duration = await asyncio.to_thread(self._read, *key)
+        if self._generations.get(key, 0) != generation:
+            # invalidate() ran during the read; don't cache what it just dropped
+            return data
+        return self._store(key, data, lease_duration)
+
+    def _finish(self, key: CredentialKey, load: asyncio.Future) -> None:
+        # invalidate() may already have replaced this load with a newer one
+        if self._inflight.get(key) is load:
+            del self._inflight[key]
+        if not load.cancelled():
+            load.exception()  # Waiters re-raise it; avoid "never retrieved" warnings
+
+    def _read(self, vendor: str, hotel_id: str) -> Tuple[Dict[str, Any], int]:
+        self.stats["loads"] += 1
+        return self.vault_client.read_pms_credentials_with_lease(vendor, hotel_id)
+
+    def _store(self, key: CredentialKey, data: Dict[str, Any], lease_duration: int) -> Dict[str, Any]:
+        self._leases[key] = CredentialLease(
+            data=data,
+            lease_duration=lease_duration or self.default_ttl,
+            fetched_at=time.monotonic(),
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return data
+
+    async def prefetch(self, hotels: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Load credentials for (vendor, hotel_id) pairs with bounded concurrency
+
+        Failures are logged and counted; those hotels fall back to an
+        on-demand read when their connector is first created.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def load(key: CredentialKey) -> bool:
+            async with semaphore:
+                try:
+                    await self._refresh(key)
+                    return True
+                except Exception as e:
+                    self.stats["failures"] += 1
+                    logger.warning(f"Failed to prefetch credentials for {key[0]}/{key[1]}: {e}")
+                    return False
+
+        results = await asyncio.gather(*[load(key) for key in dict.fromkeys(hotels)])
+        summary = {"loaded": sum(results), "failed": len(results) - sum(results)}
+        logger.info(f"Prefetched PMS credentials: {summary}")
+        return summary
+
+    def start(self) -> None:
+        """Start background renewal"""
+        if self._renewal_task is None or self._renewal_task.done():
+            self._wakeup = asyncio.Event()
+            self._renewal_task = asyncio.create_task(self._renewal_loop())
+
+    async def stop(self) -> None:
+        """Stop background renewal"""
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()
+            try:
+                await self._renewal_task
+            except asyncio.CancelledError:
+                pass
+            self._renewal_task = None
+        self._wakeup = None
+
+    async def _renewal_loop(self) -> None:
+        while True:
+            now = time.monotonic()
+            due = [key for key, lease in self._leases.items() if lease.renew_at(self.renew_ratio) <= now]
+
+            for key in due:
+                try:
+                    await self._refresh(key)
+                    self.stats["renewals"] += 1
+                except Exception as e:
+                    # Keep serving the current lease until it expires
+                    self.stats["failures"] += 1
+                    logger.warning(f"Failed to renew credentials for {key[0]}/{key[1]}: {e}")
+                    lease = self._leases.get(key)
+                    if lease is not None and not lease.is_valid():
+                        del self._leases[key]
+
+            upcoming = [lease.renew_at(self.renew_ratio) for lease in self._leases.values()]
+            next_due = min(upcoming, default=now + self.default_ttl)
+            # Retry failed renewals after a short pause instead of spinning
+            delay = max(next_due - time.monotonic(), 5.0 if due else 0.0)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def invalidate(self, vendor: str, hotel_id: Optional[str] = None) -> int:
+        """Drop cached credentials, e.g. after a secret rotation"""
+        dropped = 0
+        for key in {*self._leases, *self._inflight}:
+            if key[0] != vendor or hotel_id not in (None, key[1]):
+                continue
+            # Reads already in flight must neither be stored nor joined
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._inflight.pop(key, None)
+            if self._leases.pop(key, None) is not None:
+                dropped += 1
+        return dropped
@@ -7,13 +7,14 @@ import logging
 import importlib
 import inspect
 import os
-from typing import Dict, Type, Optional, List, Any
+from typing import Dict, Type, Optional, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 import yaml
 
 from connectors.contracts import PMSConnector, PMSError, NotFoundError, BaseConnector
+from connectors.credential_provider import CredentialProvider
 from connectors.utils.vault_client import (
     get_vault_client,
     VaultError,
@@ -207,6 +208,42 @@ class ConnectorFactory:
         else:
             self.vault_client = None
 
+        # Lease-aware credential cache; prefetch_credentials() fills it at startup
+        self.credentials = (
+            CredentialProvider(self.vault_client) if self.vault_client else None
+        )
+
+    async def prefetch_credentials(self, hotels: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Load Vault credentials for (vendor, hotel_id) pairs and keep them renewed
+
+        Connectors created afterwards take credentials from memory, so
+        ``create()`` does no Vault I/O for these hotels.
+        """
+        if not self.credentials:
+            return {"loaded": 0, "failed": 0}
+
+        summary = await self.credentials.prefetch(hotels)
+        self.credentials.start()
+        return summary
+
+    async def create_async(self, vendor: str, config: Dict[str, Any]) -> PMSConnector:
+        """
+        Create a connector from an async context
+
+        Credentials missing from the cache are read from Vault in a worker
+        thread instead of blocking the event loop.
+        """
+        if self.credentials and self.use_vault:
+            hotel_id = config.get("hotel_id", "default")
+            try:
+                await self.credentials.get(vendor, hotel_id)
+            except Exception as e:
+                # create() logs the fallback to config-based credentials
+                logger.debug(f"Async credential load failed for {vendor}/{hotel_id}: {e}")
+
+        return self.create(vendor, config)
+
     def create(self, vendor: str, config: Dict[str, Any]) -> PMSConnector:
         """Create a connector instance for the specified vendor"""
         # Check if connector exists
@@ -261,8 +298,10 @@ class ConnectorFactory:
         hotel_id = config.get("hotel_id", "default")
 
         try:
-            # Fetch credentials from Vault
-            vault_creds = self.vault_client.read_pms_credentials(vendor, hotel_id)
+            # Use prefetched credentials; fall back to a blocking Vault read
+            vault_creds = self.credentials.get_cached(vendor, hotel_id)
+            if vault_creds is None:
+                vault_creds = self.credentials.load_sync(vendor, hotel_id)
 
             # Merge Vault credentials (Vault takes precedence for security)
             for key, value in vault_creds.items():
@@ -313,6 +352,11 @@ class ConnectorFactory:
         instance_key = f"{vendor}:{hotel_id}"
         return self._instances.get(instance_key)
 
+    async def close_credentials(self):
+        """Stop background credential renewal"""
+        if self.credentials:
+            await self.credentials.stop()
+
     def close_all(self):
         """Close all connector instances"""
         for instance_key, connector in self._instances.items():
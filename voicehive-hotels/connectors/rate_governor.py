@@ -0,0 +1,302 @@
+"""
+VoiceHive Hotels - PMS Rate Governor
+Adaptive, priority-aware token buckets in front of PMS APIs
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .contracts import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Lower values are served first"""
+    CRITICAL = 0     # A guest is on the line
+    NORMAL = 1
+    BACKGROUND = 2   # Sync jobs, analytics, warm-ups
+
+
+@dataclass
+class RequestContext:
+    priority: RequestPriority = RequestPriority.NORMAL
+    # Absolute time.monotonic() by which the request must have been sent
+    deadline: Optional[float] = None
+
+
+_request_context: contextvars.ContextVar[Optional[RequestContext]] = contextvars.ContextVar(
+    "pms_request_context", default=None
+)
+
+
+@contextmanager
+def pms_request_context(
+    priority: RequestPriority = RequestPriority.NORMAL,
+    timeout: Optional[float] = None,
+) -> Iterator[RequestContext]:
+    """
+    Set the priority and deadline for PMS requests made in this context
+
+    Example:
+        with pms_request_context(RequestPriority.BACKGROUND):
+            await connector.get_availability(...)
+    """
+    context = RequestContext(
+        priority=priority,
+        deadline=time.monotonic() + timeout if timeout is not None else None,
+    )
+    token = _request_context.set(context)
+    try:
+        yield context
+    finally:
+        _request_context.reset(token)
+
+
+def current_request_context() -> RequestContext:
+    """The context set by ``pms_request_context``, or a fresh default one"""
+    context = _request_context.get()
+    return context if context is not None else RequestContext()
+
+
+def parse_retry_after(value: Optional[str], default: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header given as seconds or as an HTTP date
+
+    Returns ``default`` (None) when the header is missing or unparseable, so
+    the governor can fall back to its own short backoff.
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can be adjusted at runtime"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float, needed: float = 1.0) -> float:
+        """Seconds until ``needed`` tokens are available"""
+        self._refill(now)
+        blocked = max(0.0, self.blocked_until - now)
+        missing = max(0.0, needed - self.tokens)
+        return max(blocked, missing / self.rate)
+
+    def consume(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+
+class RateGovernor:
+    """
+    Admission control for one PMS account
+
+    Requests take a token from the account bucket and, when a per-property
+    rate is configured, from the property's bucket. Waiters are served by
+    priority, so call-critical requests overtake background work. The
+    account rate adapts AIMD-style: a 429 halves it and blocks the bucket
+    for ``Retry-After``; each success recovers a little towards the
+    configured rate. A 429 without ``Retry-After`` blocks the bucket for an
+    exponential backoff starting at ``backoff_initial`` and capped at
+    ``backoff_max``, reset by the next success. A request whose estimated
+    wait exceeds its deadline (or ``max_wait``) is rejected with
+    ``RateLimitError`` instead of queued.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float = 10.0,
+        burst: float = 50.0,
+        per_property_requests_per_second: Optional[float] = None,
+        min_rate: float = 0.5,
+        max_wait: float = 10.0,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.name = name
+        self.max_rate = requests_per_second
+        self.min_rate = min(min_rate, requests_per_second)
+        self.max_wait = max_wait
+        self.per_property_rate = per_property_requests_per_second
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self._consecutive_rate_limits = 0
+
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self._property_buckets: Dict[str, TokenBucket] = {}
+
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.stats = {"admitted": 0, "queued": 0, "shed": 0, "rate_limited": 0}
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def _property_bucket(self, property_id: Optional[str]) -> Optional[TokenBucket]:
+        if property_id is None or self.per_property_rate is None:
+            return None
+        bucket = self._property_buckets.get(property_id)
+        if bucket is None:
+            bucket = TokenBucket(self.per_property_rate, max(1.0, self.per_property_rate))
+            self._property_buckets[property_id] = bucket
+        return bucket
+
+    def estimate_wait(self, priority: RequestPriority, property_id: Optional[str] = None) -> float:
+        """Estimated queueing delay for a new request at ``priority``"""
+        now = time.monotonic()
+        ahead = sum(1 for waiter in self._waiters if waiter[0] <= priority)
+        wait = self.bucket.wait_time(now, needed=ahead + 1)
+        property_bucket = self._property_bucket(property_id)
+        if property_bucket is not None:
+            wait = max(wait, property_bucket.wait_time(now))
+        return wait
+
+    async def acquire(
+        self,
+        property_id: Optional[str] = None,
+        priority: Optional[RequestPriority] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Wait for permission to send one request
+
+        ``priority`` and ``deadline`` default to the current
+        ``pms_request_context``.
+
+        Raises:
+            RateLimitError: the estimated wait would exceed the deadline
+        """
+        context = current_request_context()
+        priority = context.priority if priority is None else priority
+        deadline = context.deadline if deadline is None else deadline
+
+        now = time.monotonic()
+        budget = self.max_wait if deadline is None else min(self.max_wait, deadline - now)
+        estimate = self.estimate_wait(priority, property_id)
+        if estimate > budget:
+            self._shed(estimate)
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        entry = (int(priority), next(self._sequence))
+        heapq.heappush(self._waiters, entry)
+        if estimate > 0:
+            self.stats["queued"] += 1
+
+        try:
+            while True:
+                now = time.monotonic()
+                if self._waiters[0] is entry:
+                    wait = self.bucket.wait_time(now)
+                    property_bucket = self._property_bucket(property_id)
+                    if property_bucket is not None:
+                        wait = max(wait, property_bucket.wait_time(now))
+                    if wait <= 0:
+                        self.bucket.consume(now)
+                        if property_bucket is not None:
+                            property_bucket.consume(now)
+                        self.stats["admitted"] += 1
+                        return
+                    if deadline is not None and now + wait > deadline:
+                        self._shed(wait)
+                else:
+                    wait = None
+                    if deadline is not None and now >= deadline:
+                        self._shed(self.estimate_wait(priority, property_id))
+
+                # Sleep until a token is due, the deadline passes, or the queue changes
+                timeouts = [t for t in (wait, None if deadline is None else deadline - now) if t is not None]
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=max(0.0, min(timeouts)) if timeouts else None
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self._wakeup.set()
+
+    def _shed(self, estimate: float) -> None:
+        self.stats["shed"] += 1
+        error = RateLimitError(
+            f"{self.name} rate limited; estimated wait {estimate:.1f}s exceeds deadline"
+        )
+        error.retry_after = math.ceil(estimate)
+        raise error
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Learn from a 429: back off the rate and honour Retry-After"""
+        now = time.monotonic()
+        self.stats["rate_limited"] += 1
+        if retry_after is None:
+            retry_after = min(self.backoff_max, self.backoff_initial * 2 ** self._consecutive_rate_limits)
+        self._consecutive_rate_limits += 1
+        self.bucket._refill(now)
+        self.bucket.rate = max(self.min_rate, self.bucket.rate / 2)
+        self.bucket.tokens = min(self.bucket.tokens, 0.0)
+        if retry_after:
+            self.bucket.blocked_until = max(self.bucket.blocked_until, now + retry_after)
+        logger.warning(
+            f"{self.name} rate limited upstream; rate now {self.bucket.rate:.2f}/s, "
+            f"retry after {retry_after}s"
+        )
+
+    def on_success(self) -> None:
+        """Recover towards the configured rate after a successful request"""
+        self._consecutive_rate_limits = 0
+        if self.bucket.rate < self.max_rate:
+            self.bucket._refill(time.monotonic())
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate / 100)
+
+
+_governors: Dict[str, RateGovernor] = {}
+
+
+def get_rate_governor(name: str, **options) -> RateGovernor:
+    """Get the process-wide governor for a PMS account; ``options`` apply on creation"""
+    governor = _governors.get(name)
+    if governor is None:
+        governor = RateGovernor(name, **options)
+        _governors[name] = governor
+    return governor
+
+
+def clear_rate_governors() -> None:
+    """Drop all governors (used by tests)"""
+    _governors.clear()
@@ -0,0 +1,186 @@
+"""
+VoiceHive Hotels - PMS Reference Data Cache
+Shared cache for slowly-changing PMS inventory (room types, rate plans, properties)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFERENCE_TTL_SECONDS = 300
+
+
+@dataclass
+class ReferenceResponse:
+    """Result of a (possibly conditional) reference data fetch"""
+    data: Any
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+
+@dataclass
+class ReferenceEntry:
+    """Cached reference data with its validator"""
+    data: Any
+    etag: Optional[str]
+    expires_at: float
+    fetched_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+# Loader receives the cached ETag (or None) and performs the fetch
+ReferenceLoader = Callable[[Optional[str]], Awaitable[ReferenceResponse]]
+
+CacheKey = Tuple[str, str, str]
+
+
+class ReferenceDataCache:
+    """
+    Process-wide cache of PMS reference data keyed by vendor + property
+
+    Entries are served until their TTL expires. Stale entries that carry an
+    ETag are revalidated with ``If-None-Match`` so an unchanged resource costs
+    a 304 instead of a full payload. Concurrent misses for the same key share
+    one fetch. Webhook handlers call ``invalidate()`` when the PMS reports a
+    change; each invalidation bumps the key's generation, and a load that
+    started under an older generation is returned to its callers but never
+    cached.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_REFERENCE_TTL_SECONDS):
+        self.default_ttl = default_ttl
+        self._entries: Dict[CacheKey, ReferenceEntry] = {}
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._generations: Dict[CacheKey, int] = {}
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "invalidated": 0}
+
+    async def get(
+        self,
+        vendor: str,
+        property_id: str,
+        resource: str,
+        loader: ReferenceLoader,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Get a resource, loading or revalidating it when stale"""
+        key = (vendor, property_id or "", resource)
+        entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh:
+            self.stats["hits"] += 1
+            return entry.data
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        self.stats["misses"] += 1
+        generation = self._generations.get(key, 0)
+        load = asyncio.ensure_future(self._load(key, entry, loader, ttl, generation))
+        self._inflight[key] = load
+        load.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so a cancelled caller does not cancel the load for the others waiting
+        return await asyncio.shield(load)
+
+    def _finish(self, key: CacheKey, load: asyncio.Future) -> None:
+        # invalidate() may already have replaced this load with a newer one
+        if self._inflight.get(key) is load:
+            del self._inflight[key]
+        if not load.cancelled():
+            load.exception()  # Waiters re-raise it; avoid "never retrieved" warnings
+
+    async def _load(
+        self,
+        key: CacheKey,
+        entry: Optional[ReferenceEntry],
+        loader: ReferenceLoader,
+        ttl: Optional[float],
+        generation: int,
+    ) -> Any:
+        response = await loader(entry.etag if entry is not None else None)
+        now = time.monotonic()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+
+        if self._generations.get(key, 0) != generation:
+            # Invalidated while loading; the result may predate the change
+            if response.not_modified and entry is not None:
+                return entry.data
+            return response.data
+
+        if response.not_modified and entry is not None:
+            self.stats["revalidated"] += 1
+            entry.expires_at = expires_at
+            entry.fetched_at = now
+            return entry.data
+
+        self._entries[key] = ReferenceEntry(
+            data=response.data,
+            etag=response.etag,
+            expires_at=expires_at,
+            fetched_at=now,
+        )
+        return response.data
+
+    def invalidate(
+        self,
+        vendor: str,
+        property_id: Optional[str] = None,
+        resource_prefix: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached entries for a vendor, optionally narrowed to a property
+        and to resources starting with ``resource_prefix``
+        """
+        keys = [
+            key
+            for key in {**self._entries, **self._inflight}
+            if key[0] == vendor
+            and (property_id is None or key[1] == property_id)
+            and (resource_prefix is None or key[2].startswith(resource_prefix))
+        ]
+        for key in keys:
+            self._entries.pop(key, None)
+            # Loads already in flight must not store their result, and new
+            # callers must not join them
+            self._inflight.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+        self.stats["invalidated"] += len(keys)
+        if keys:
+            logger.debug(
+                f"Invalidated {len(keys)} reference data entries "
+                f"(vendor={vendor}, property={property_id}, prefix={resource_prefix})"
+            )
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
+        for key in self._inflight:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        self._inflight.clear()
+
+
+_reference_cache: Optional[ReferenceDataCache] = None
+
+
+def get_reference_cache() -> ReferenceDataCache:
+    """Get the process-wide reference data cache"""
+    global _reference_cache
+    if _reference_cache is None:
+        _reference_cache = ReferenceDataCache()
+    return _reference_cache
+
+
+def invalidate_reference_data(
+    vendor: str,
+    property_id: Optional[str] = None,
+    resource_prefix: Optional[str] = None,
+) -> int:
+    """Invalidation hook for webhook handlers"""
+    return get_reference_cache().invalidate(vendor, property_id, resource_prefix)
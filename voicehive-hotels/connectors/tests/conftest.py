@@ -28,6 +28,22 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_token_managers():
+    """OAuth tokens, HTTP transports and rate governors are shared process-wide; keep them from leaking between tests"""
+    from connectors.rate_governor import clear_rate_governors
+    from connectors.token_manager import clear_token_managers
+    from connectors.transport import reset_transport_registry
+
+    clear_token_managers()
+    reset_transport_registry()
+    clear_rate_governors()
+    yield
+    clear_token_managers()
+    reset_transport_registry()
+    clear_rate_governors()
+
+
 # Markers for different test types
 def pytest_configure(config):
     """Configure custom markers"""
@@ -2,12 +2,14 @@
 Comprehensive unit tests for Apaleo connector
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import date, timedelta, datetime, timezone
 from decimal import Decimal
 
 from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.reference_data import ReferenceResponse, get_reference_cache
 from connectors.contracts import (
     PMSError,
     NotFoundError,
@@ -894,3 +896,178 @@ class TestApaleoConnector:
             assert isinstance(result, AvailabilityGrid)
             assert len(result.room_types) == 0
             assert len(result.availability) == 0
+
+
+class FakeApaleoApi:
+    """Stand-in for ApaleoConnector._request that records calls and concurrency"""
+
+    def __init__(self, rate_plan_count=20):
+        self.rate_plan_count = rate_plan_count
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, method, path, **kwargs):
+        self.calls.append(path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            data = self.respond(path)
+            return ReferenceResponse(data=data) if kwargs.get("conditional") else data
+        finally:
+            self.in_flight -= 1
+
+    def respond(self, path):
+        today = date.today().isoformat()
+        if path == "/inventory/v1/unit-groups":
+            return {"unitGroups": [{"id": "DEMO01-STD", "name": "Standard", "maxPersons": 2}]}
+        if path == "/availability/v1/unit-groups":
+            return {"timeSlices": [{"from": today, "to": today, "unitGroups": [{"id": "DEMO01-STD", "available": 0}]}]}
+        if path == "/rateplan/v1/rate-plans":
+            return {"ratePlans": [{"id": f"RP{i}"} for i in range(self.rate_plan_count)]}
+        if path.endswith("/rates"):
+            return {"rates": [{"from": today, "restrictions": {"minLos": int(path.split("/")[4][2:]) + 1}}]}
+        raise AssertionError(f"unexpected path {path}")
+
+    def count(self, path):
+        return self.calls.count(path)
+
+
+class TestApaleoAvailabilityPlanner:
+    """Test concurrent fan-out and reference data reuse in get_availability"""
+
+    @pytest.fixture
+    def connector(self):
+        get_reference_cache().clear()
+        return ApaleoConnector({
+            "client_id": "test_client",
+            "client_secret": "test_secret",
+            "property_id": "DEMO01",
+            "max_concurrent_requests_per_property": 4,
+        })
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_concurrent_and_bounded(self, connector):
+        api = FakeApaleoApi(rate_plan_count=20)
+        connector._request = api
+        today = date.today()
+
+        result = await connector.get_availability("DEMO01", today, today)
+
+        # Availability is fetched once and reused for the stop-sell check
+        assert api.count("/availability/v1/unit-groups") == 1
+        assert len(api.calls) == 23
+        assert 1 < api.max_in_flight <= 4
+        assert result.restrictions[today]["stop_sell"] is True
+        # Later rate plans win, as with sequential processing
+        assert result.restrictions[today]["min_stay"] == 20
+
+    @pytest.mark.asyncio
+    async def test_reference_data_is_cached_until_invalidated(self, connector):
+        api = FakeApaleoApi(rate_plan_count=2)
+        connector._request = api
+        today = date.today()
+
+        await asyncio.gather(*[connector.get_availability("DEMO01", today, today) for _ in range(5)])
+        await connector.get_availability("DEMO01", today, today)
+
+        assert api.count("/inventory/v1/unit-groups") == 1
+        assert api.count("/rateplan/v1/rate-plans") == 1
+        assert api.count("/availability/v1/unit-groups") == 6
+
+        connector.invalidate_reference_data("DEMO01")
+        await connector.get_availability("DEMO01", today, today)
+
+        assert api.count("/inventory/v1/unit-groups") == 2
+        assert api.count("/rateplan/v1/rate-plans") == 2
+
+
+class TestApaleoBookingStreams:
+    """Test paging and bounded hydration in stream_arrivals / stream_in_house"""
+
+    @pytest.fixture
+    def connector(self):
+        return ApaleoConnector({
+            "client_id": "test_client",
+            "client_secret": "test_secret",
+            "property_id": "DEMO01",
+            "max_concurrent_requests_per_property": 3,
+            "stream_page_size": 4,
+        })
+
+    @staticmethod
+    def booking(index, complete=True):
+        booking = {"id": f"RES{index}", "bookingNumber": f"BOOK{index}"}
+        if complete:
+            booking.update({
+                "status": "Confirmed",
+                "property": {"id": "DEMO01"},
+                "arrival": date.today().isoformat(),
+                "departure": (date.today() + timedelta(days=1)).isoformat(),
+                "unitGroup": {"id": "STD"},
+                "ratePlan": {"id": "BAR"},
+                "totalGrossAmount": {"amount": 100, "currency": "EUR"},
+                "created": "2024-01-01T00:00:00Z",
+                "modified": "2024-01-01T00:00:00Z",
+            })
+        return booking
+
+    @pytest.mark.asyncio
+    async def test_pages_are_followed_and_complete_bookings_mapped_directly(self, connector):
+        bookings = [self.booking(i, complete=i % 2 == 0) for i in range(10)]
+        pages = []
+
+        async def request(method, path, **kwargs):
+            params = kwargs["params"]
+            pages.append(params["pageNumber"])
+            start = (params["pageNumber"] - 1) * params["pageSize"]
+            return {"bookings": bookings[start:start + params["pageSize"]], "count": len(bookings)}
+
+        hydrated = []
+        in_flight = {"now": 0, "max": 0}
+
+        async def get_reservation(booking_id):
+            hydrated.append(booking_id)
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            # Later bookings finish first; the stream must still yield in list order
+            await asyncio.sleep(0.01 * (10 - int(booking_id[3:])))
+            in_flight["now"] -= 1
+            return connector._map_reservation(self.booking(int(booking_id[3:])))
+
+        connector._request = request
+        connector.get_reservation = get_reservation
+
+        ids = [res.id async for res in connector.stream_arrivals("DEMO01", date.today())]
+
+        assert ids == [f"RES{i}" for i in range(10)]
+        assert pages == [1, 2, 3]
+        assert sorted(hydrated) == [f"RES{i}" for i in range(1, 10, 2)]
+        assert 1 < in_flight["max"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_outstanding_hydration(self, connector):
+        async def request(method, path, **kwargs):
+            return {"bookings": [self.booking(i, complete=False) for i in range(3)]}
+
+        cancelled = []
+
+        async def get_reservation(booking_id):
+            try:
+                await asyncio.sleep(0 if booking_id == "RES0" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(booking_id)
+                raise
+            return connector._map_reservation(self.booking(0))
+
+        connector._request = request
+        connector.get_reservation = get_reservation
+
+        stream = connector.stream_in_house("DEMO01")
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert first.id == "RES0"
+        assert sorted(cancelled) == ["RES1", "RES2"]
@@ -0,0 +1,118 @@
+"""
+Tests for PMS read coalescing
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.coalescing import ReadCoalescer
+
+
+class TestReadCoalescer:
+    """Test single-flight, micro-TTL and error sharing"""
+
+    def test_keys_ignore_param_order_and_none(self):
+        a = ReadCoalescer.make_key("get", "/booking/v1/bookings", {"propertyIds": "DEMO01", "status": "InHouse"})
+        b = ReadCoalescer.make_key("GET", "/booking/v1/bookings", {"status": "InHouse", "propertyIds": "DEMO01", "x": None})
+        c = ReadCoalescer.make_key("GET", "/booking/v1/bookings", {"propertyIds": "DEMO02", "status": "InHouse"})
+        assert a == b
+        assert a != c
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_call(self):
+        coalescer = ReadCoalescer("apaleo")
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"timeSlices": []}
+
+        key = coalescer.make_key("GET", "/availability/v1/unit-groups", {"from": "2024-03-01"})
+        results = await asyncio.gather(*[coalescer.run(key, loader) for _ in range(10)])
+
+        assert len(calls) == 1
+        assert all(result == {"timeSlices": []} for result in results)
+        # Waiters get their own copy
+        results[1]["timeSlices"].append("mutated")
+        assert results[0] == {"timeSlices": []}
+        assert coalescer.stats == {"upstream": 1, "joined": 9, "micro_cache": 0}
+        assert coalescer.hit_rate == 0.9
+
+        # Nothing is cached without a micro-TTL
+        await coalescer.run(key, loader)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_micro_ttl_absorbs_bursts_but_not_errors(self):
+        coalescer = ReadCoalescer("apaleo", micro_ttl=0.05)
+        calls = []
+
+        async def failing():
+            calls.append("fail")
+            raise RuntimeError("upstream down")
+
+        async def loader():
+            calls.append("ok")
+            return {"id": "RES1"}
+
+        key = coalescer.make_key("GET", "/booking/v1/bookings/RES1")
+        with pytest.raises(RuntimeError):
+            await coalescer.run(key, failing)
+
+        assert await coalescer.run(key, loader) == {"id": "RES1"}
+        assert await coalescer.run(key, loader) == {"id": "RES1"}
+        await asyncio.sleep(0.06)
+        await coalescer.run(key, loader)
+
+        assert calls == ["fail", "ok", "ok"]
+        assert coalescer.stats["micro_cache"] == 1
+
+    @pytest.mark.asyncio
+    async def test_leader_mutation_does_not_leak_into_micro_cache(self):
+        coalescer = ReadCoalescer("apaleo", micro_ttl=1.0)
+
+        async def loader():
+            return {"rooms": [1, 2]}
+
+        key = coalescer.make_key("GET", "/inventory/v1/units")
+        leader_result = await coalescer.run(key, loader)
+        leader_result["rooms"].append("MUTATED")
+
+        assert await coalescer.run(key, loader) == {"rooms": [1, 2]}
+        assert coalescer.stats["micro_cache"] == 1
+
+
+class TestApaleoReadCoalescing:
+    """Test coalescing of identical Apaleo GETs"""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_hit_apaleo_once(self):
+        connector = ApaleoConnector({"client_id": "test", "client_secret": "secret"})
+        connector._access_token = "test-token"
+        connector._token_expires_at = 9999999999
+        connector._client = MagicMock()
+        requests = []
+
+        async def request(method, path, **kwargs):
+            requests.append((method, path))
+            await asyncio.sleep(0.01)
+            response = MagicMock(status_code=200, content=b"{}")
+            response.json.return_value = {"bookings": [{"id": "RES1"}]}
+            return response
+
+        connector._client.request = request
+
+        await asyncio.gather(
+            *[connector._request("GET", "/booking/v1/bookings", params={"bookingNumber": "BOOK1"}) for _ in range(5)],
+            connector._request("GET", "/booking/v1/bookings", params={"bookingNumber": "BOOK2"}),
+            connector._request("POST", "/booking/v1/bookings", json={}),
+            connector._request("POST", "/booking/v1/bookings", json={}),
+        )
+
+        assert requests.count(("GET", "/booking/v1/bookings")) == 2
+        assert requests.count(("POST", "/booking/v1/bookings")) == 2
+        assert connector.read_coalescer.stats["joined"] == 4
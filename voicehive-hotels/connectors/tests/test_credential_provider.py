@@ -0,0 +1,142 @@
+"""
+Tests for the lease-aware PMS credential provider
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from connectors.contracts import MockConnector
+from connectors.credential_provider import CredentialProvider
+from connectors.factory import (
+    ConnectorFactory,
+    ConnectorMetadata,
+    ConnectorRegistry,
+    ConnectorStatus,
+)
+
+
+class FakeVault:
+    """Vault client stand-in with a configurable lease"""
+
+    def __init__(self, lease_duration=0, delay=0.01):
+        self.lease_duration = lease_duration
+        self.delay = delay
+        self.reads = []
+        self.version = 1
+
+    def read_pms_credentials_with_lease(self, vendor, hotel_id):
+        self.reads.append((vendor, hotel_id))
+        time.sleep(self.delay)
+        return {"api_key": f"{hotel_id}-key-v{self.version}"}, self.lease_duration
+
+
+class TestCredentialProvider:
+    """Test caching, prefetch and lease renewal"""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fills_cache_and_dedupes(self):
+        vault = FakeVault()
+        provider = CredentialProvider(vault, max_concurrency=4)
+
+        hotels = [("apaleo", f"HOTEL{i}") for i in range(10)] + [("apaleo", "HOTEL0")]
+        summary = await provider.prefetch(hotels)
+
+        assert summary == {"loaded": 10, "failed": 0}
+        assert len(vault.reads) == 10
+        assert provider.get_cached("apaleo", "HOTEL3") == {"api_key": "HOTEL3-key-v1"}
+
+        # Concurrent misses for the same hotel share one Vault read
+        await asyncio.gather(*[provider.get("mews", "HOTELX") for _ in range(5)])
+        assert vault.reads.count(("mews", "HOTELX")) == 1
+
+    @pytest.mark.asyncio
+    async def test_leases_are_honoured_and_renewed(self):
+        vault = FakeVault(lease_duration=0.2, delay=0)
+        provider = CredentialProvider(vault, renew_ratio=0.5)
+
+        await provider.prefetch([("apaleo", "HOTEL1")])
+        provider.start()
+        try:
+            vault.version = 2
+            await asyncio.sleep(0.15)
+            assert provider.get_cached("apaleo", "HOTEL1") == {"api_key": "HOTEL1-key-v2"}
+            assert provider.stats["renewals"] >= 1
+        finally:
+            await provider.stop()
+
+        # Without renewal the lease runs out and the cache stops serving it
+        await asyncio.sleep(0.25)
+        assert provider.get_cached("apaleo", "HOTEL1") is None
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_read(self):
+        vault = FakeVault(delay=0.05)
+        provider = CredentialProvider(vault)
+
+        leader = asyncio.create_task(provider.get("apaleo", "HOTEL1"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(provider.get("apaleo", "HOTEL1")) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*waiters) == [{"api_key": "HOTEL1-key-v1"}] * 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert provider.get_cached("apaleo", "HOTEL1") == {"api_key": "HOTEL1-key-v1"}
+        assert len(vault.reads) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_renewal_is_not_undone(self):
+        vault = FakeVault(lease_duration=0.2, delay=0.05)
+        provider = CredentialProvider(vault, renew_ratio=0.5)
+
+        await provider.prefetch([("apaleo", "HOTEL1")])
+        provider.start()
+        try:
+            # Wait until the renewal loop has started its Vault read
+            while len(vault.reads) < 2:
+                await asyncio.sleep(0.01)
+            assert provider.invalidate("apaleo", "HOTEL1") == 1
+            await asyncio.sleep(0.1)
+            assert provider.get_cached("apaleo", "HOTEL1") is None
+        finally:
+            await provider.stop()
+
+class TestFactoryCredentialPrefetch:
+    """Test that prefetched credentials keep Vault off connector creation"""
+
+    @pytest.mark.asyncio
+    async def test_create_uses_prefetched_credentials(self):
+        registry = ConnectorRegistry()
+        registry.register(
+            "test",
+            MockConnector,
+            ConnectorMetadata(
+                vendor="test",
+                name="Test",
+                version="1.0.0",
+                status=ConnectorStatus.AVAILABLE,
+                capabilities={},
+                regions=[],
+                rate_limits={},
+                authentication="api_key",
+            ),
+        )
+        factory = ConnectorFactory(registry)
+        vault = FakeVault()
+        factory.vault_client = vault
+        factory.credentials = CredentialProvider(vault)
+
+        await factory.prefetch_credentials([("test", "HOTEL01"), ("test", "HOTEL02")])
+        try:
+            connector = factory.create("test", {"base_url": "https://api.test.com", "hotel_id": "HOTEL01"})
+            other = await factory.create_async("test", {"base_url": "https://api.test.com", "hotel_id": "HOTEL02"})
+        finally:
+            await factory.close_credentials()
+
+        assert connector.config["api_key"] == "HOTEL01-key-v1"
+        assert other.config["api_key"] == "HOTEL02-key-v1"
+        assert len(vault.reads) == 2
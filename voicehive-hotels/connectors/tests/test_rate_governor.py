@@ -0,0 +1,143 @@
+"""
+Tests for the adaptive PMS rate governor
+"""
+
+import asyncio
+import time
+import pytest
+
+from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.contracts import NotFoundError, RateLimitError
+from connectors.reference_data import get_reference_cache
+from connectors.rate_governor import (
+    RateGovernor,
+    RequestPriority,
+    current_request_context,
+    parse_retry_after,
+    pms_request_context,
+)
+
+
+class TestRateGovernor:
+    """Test priority queueing, shedding and quota learning"""
+
+    @pytest.mark.asyncio
+    async def test_critical_requests_overtake_background_work(self):
+        governor = RateGovernor("test", requests_per_second=50, burst=1)
+        order = []
+
+        async def request(name, priority):
+            await governor.acquire(priority=priority)
+            order.append(name)
+
+        await governor.acquire()  # drain the burst
+        background = [asyncio.create_task(request(f"bg{i}", RequestPriority.BACKGROUND)) for i in range(3)]
+        await asyncio.sleep(0)
+        critical = asyncio.create_task(request("call", RequestPriority.CRITICAL))
+        await asyncio.gather(critical, *background)
+
+        assert order[0] == "call"
+        assert order[1:] == ["bg0", "bg1", "bg2"]
+
+    @pytest.mark.asyncio
+    async def test_requests_are_shed_when_wait_exceeds_deadline(self):
+        governor = RateGovernor("test", requests_per_second=1, burst=1)
+        await governor.acquire()
+
+        with pms_request_context(RequestPriority.CRITICAL, timeout=0.1):
+            with pytest.raises(RateLimitError) as exc:
+                await governor.acquire()
+
+        assert exc.value.retry_after == 1
+        assert governor.stats["shed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_429_halves_rate_and_honours_retry_after(self):
+        governor = RateGovernor("test", requests_per_second=10, burst=10)
+
+        governor.on_rate_limited(retry_after=0.2)
+        assert governor.rate == 5
+        assert governor.estimate_wait(RequestPriority.NORMAL) >= 0.19
+
+        start = time.monotonic()
+        await governor.acquire()
+        assert time.monotonic() - start >= 0.19
+
+        for _ in range(100):
+            governor.on_success()
+        assert governor.rate == 10
+
+    def test_429_without_retry_after_uses_short_exponential_backoff(self):
+        governor = RateGovernor("test", requests_per_second=10, burst=10, backoff_initial=0.5, backoff_max=2)
+
+        blocked = []
+        for _ in range(4):
+            governor.on_rate_limited(None)
+            blocked.append(round(governor.bucket.blocked_until - time.monotonic(), 1))
+
+        assert blocked == [0.5, 1.0, 2.0, 2.0]
+
+        governor.on_success()
+        governor.bucket.blocked_until = 0.0
+        governor.on_rate_limited(None)
+        assert round(governor.bucket.blocked_until - time.monotonic(), 1) == 0.5
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("7") == 7
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    def test_default_request_context_is_not_shared(self):
+        context = current_request_context()
+        context.priority = RequestPriority.BACKGROUND
+
+        assert current_request_context().priority == RequestPriority.NORMAL
+        with pms_request_context(RequestPriority.CRITICAL, timeout=5) as scoped:
+            assert current_request_context() is scoped
+        assert current_request_context().deadline is None
+
+
+class TestApaleoRateLimitRetry:
+    """Test that Apaleo requests are retried through the governor"""
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried_and_404_is_not(self):
+        connector = ApaleoConnector({"client_id": "test", "client_secret": "secret"})
+        outcomes = []
+
+        async def send_once(method, path, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        connector._send_once = send_once
+
+        rate_limited = RateLimitError("Rate limit exceeded")
+        rate_limited.retry_after = 0
+        outcomes[:] = [rate_limited, {"ok": True}]
+        assert await connector._request("POST", "/booking/v1/bookings", json={}) == {"ok": True}
+        assert connector._rate_governor.stats["rate_limited"] == 1
+        assert connector._rate_governor.rate == 5 + 10 / 100
+
+        outcomes[:] = [NotFoundError("missing"), {"ok": True}]
+        with pytest.raises(NotFoundError):
+            await connector._request("POST", "/booking/v1/bookings/RES1/cancel", json={})
+        assert outcomes == [{"ok": True}]
+
+    @pytest.mark.asyncio
+    async def test_reference_data_warm_up_runs_at_background_priority(self):
+        get_reference_cache().clear()
+        connector = ApaleoConnector({"client_id": "test", "client_secret": "secret"})
+        priorities = []
+
+        async def send_once(method, path, **kwargs):
+            priorities.append(current_request_context().priority)
+            return {}
+
+        connector._send_once = send_once
+        await connector.warm_reference_data("HOTEL1")
+
+        assert priorities == [RequestPriority.BACKGROUND] * 3
+        assert current_request_context().priority == RequestPriority.NORMAL
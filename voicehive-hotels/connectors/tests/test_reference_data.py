@@ -0,0 +1,174 @@
+"""
+Tests for the shared PMS reference data cache
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.reference_data import ReferenceDataCache, ReferenceResponse, get_reference_cache
+
+
+class CountingLoader:
+    """Loader that serves a versioned payload and honours If-None-Match"""
+
+    def __init__(self, data=None, etag="v1"):
+        self.data = data or {"unitGroups": [{"id": "STD"}]}
+        self.etag = etag
+        self.calls = []
+
+    async def __call__(self, etag):
+        self.calls.append(etag)
+        await asyncio.sleep(0.01)
+        if etag is not None and etag == self.etag:
+            return ReferenceResponse(data=None, etag=etag, not_modified=True)
+        return ReferenceResponse(data=self.data, etag=self.etag)
+
+
+class TestReferenceDataCache:
+    """Test TTLs, revalidation, single-flight and invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entries_are_served_from_cache(self):
+        cache = ReferenceDataCache(default_ttl=60)
+        loader = CountingLoader()
+
+        results = await asyncio.gather(
+            *[cache.get("apaleo", "DEMO01", "/inventory/v1/unit-groups", loader) for _ in range(10)]
+        )
+        await cache.get("apaleo", "DEMO01", "/inventory/v1/unit-groups", loader)
+
+        assert loader.calls == [None]
+        assert all(result == loader.data for result in results)
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_are_revalidated_with_etag(self):
+        cache = ReferenceDataCache()
+        loader = CountingLoader()
+
+        first = await cache.get("apaleo", "DEMO01", "units", loader, ttl=0)
+        second = await cache.get("apaleo", "DEMO01", "units", loader, ttl=0)
+
+        assert loader.calls == [None, "v1"]
+        assert second == first
+        assert cache.stats["revalidated"] == 1
+
+        # Changed upstream: the new payload replaces the cached one
+        loader.data, loader.etag = {"unitGroups": []}, "v2"
+        assert await cache.get("apaleo", "DEMO01", "units", loader, ttl=0) == {"unitGroups": []}
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_scoped(self):
+        cache = ReferenceDataCache(default_ttl=60)
+        loader = CountingLoader()
+        for property_id in ("DEMO01", "DEMO02"):
+            await cache.get("apaleo", property_id, "/inventory/v1/unit-groups", loader)
+            await cache.get("apaleo", property_id, "/rateplan/v1/rate-plans", loader)
+        await cache.get("mews", "DEMO01", "/inventory/v1/unit-groups", loader)
+
+        assert cache.invalidate("apaleo", "DEMO01", "/rateplan") == 1
+        assert cache.invalidate("apaleo", "DEMO02") == 2
+        assert cache.invalidate("apaleo") == 1
+        assert cache.invalidate("mews") == 1
+
+    @pytest.mark.asyncio
+    async def test_load_in_flight_during_invalidation_is_not_cached(self):
+        cache = ReferenceDataCache(default_ttl=60)
+        release = asyncio.Event()
+        calls = []
+
+        async def loader(etag):
+            calls.append(etag)
+            if len(calls) == 1:
+                await release.wait()
+                return ReferenceResponse(data={"version": "stale"}, etag="v1")
+            return ReferenceResponse(data={"version": "fresh"}, etag="v2")
+
+        stale_load = asyncio.create_task(cache.get("apaleo", "DEMO01", "units", loader))
+        await asyncio.sleep(0)
+
+        assert cache.invalidate("apaleo", "DEMO01") == 1
+        # New callers start a fresh load rather than joining the stale one
+        assert await cache.get("apaleo", "DEMO01", "units", loader) == {"version": "fresh"}
+
+        release.set()
+        assert await stale_load == {"version": "stale"}
+        assert await cache.get("apaleo", "DEMO01", "units", loader) == {"version": "fresh"}
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        cache = ReferenceDataCache(default_ttl=60)
+        loader = CountingLoader()
+
+        leader = asyncio.create_task(cache.get("apaleo", "DEMO01", "units", loader))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(cache.get("apaleo", "DEMO01", "units", loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == [loader.data, loader.data]
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await cache.get("apaleo", "DEMO01", "units", loader) == loader.data
+        assert loader.calls == [None]
+
+
+class TestApaleoConditionalRequests:
+    """Test ETag handling in ApaleoConnector"""
+
+    @pytest.fixture
+    def connector(self):
+        get_reference_cache().clear()
+        connector = ApaleoConnector({"client_id": "test", "client_secret": "secret", "property_id": "DEMO01"})
+        connector._access_token = "test-token"
+        connector._token_expires_at = 9999999999
+        connector._client = MagicMock()
+        return connector
+
+    @staticmethod
+    def response(status_code, payload=None, etag=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        response.content = b"{}" if payload is not None else b""
+        response.headers = {"ETag": etag} if etag else {}
+        response.raise_for_status = MagicMock()
+        return response
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_payload(self, connector):
+        requests = []
+
+        async def request(method, path, **kwargs):
+            requests.append(kwargs.get("headers", {}).get("If-None-Match"))
+            if requests[-1] == '"abc"':
+                return self.response(304)
+            return self.response(200, {"id": "DEMO01", "name": "Demo"}, etag='"abc"')
+
+        connector._client.request = request
+        path = "/inventory/v1/properties/DEMO01"
+
+        first = await connector._get_reference_data("DEMO01", path, ttl=0)
+        second = await connector._get_reference_data("DEMO01", path, ttl=0)
+
+        assert requests == [None, '"abc"']
+        assert first == second == {"id": "DEMO01", "name": "Demo"}
+
+    @pytest.mark.asyncio
+    async def test_warm_on_connect_fills_cache(self, connector):
+        async def request(method, path, **kwargs):
+            return self.response(200, {"path": path})
+
+        connector._client.request = request
+        await connector.warm_reference_data("DEMO01")
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("reference data should come from cache")
+
+        connector._client.request = fail
+        health = await connector.health_check()
+
+        assert health["status"] == "healthy"
@@ -0,0 +1,142 @@
+"""
+Tests for the shared OAuth token manager
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.token_manager import OAuthTokenManager, get_token_manager
+
+
+class CountingFetcher:
+    """Identity endpoint stand-in issuing numbered tokens"""
+
+    def __init__(self, expires_in=3600, delay=0.01):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"access_token": f"token-{self.calls}", "expires_in": self.expires_in}
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for token sharing"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.values.get(key) == token:
+            del self.values[key]
+            return 1
+        return 0
+
+
+class TestOAuthTokenManager:
+    """Test single-flight refresh, renewal and Redis sharing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_fetch(self):
+        manager = OAuthTokenManager("apaleo:client")
+        fetcher = CountingFetcher()
+
+        tokens = await asyncio.gather(*[manager.get_token(fetcher) for _ in range(20)])
+
+        assert fetcher.calls == 1
+        assert {token.access_token for token in tokens} == {"token-1"}
+
+        # A stale token reported after someone else replaced it costs nothing
+        refreshed = await manager.get_token(fetcher, stale_token="token-1")
+        assert refreshed.access_token == "token-2"
+        assert (await manager.get_token(fetcher, stale_token="token-1")).access_token == "token-2"
+        assert fetcher.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_refresh(self):
+        manager = OAuthTokenManager("apaleo:client")
+        fetcher = CountingFetcher()
+
+        leader = asyncio.create_task(manager.get_token(fetcher))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(manager.get_token(fetcher)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        tokens = await asyncio.gather(*waiters)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert {token.access_token for token in tokens} == {"token-1"}
+        assert (await manager.get_token(fetcher)).access_token == "token-1"
+        assert fetcher.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_token_is_renewed_in_background(self):
+        manager = OAuthTokenManager("apaleo:client", renew_ratio=0.5)
+        fetcher = CountingFetcher(expires_in=0.2, delay=0)
+
+        manager.acquire(fetcher)
+        await manager.get_token(fetcher)
+        await asyncio.sleep(0.15)
+
+        assert fetcher.calls == 2
+        assert manager.token.access_token == "token-2"
+
+        manager.release(fetcher)
+        await asyncio.sleep(0.15)
+        assert fetcher.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_tokens_through_redis(self):
+        redis = FakeRedis()
+        replica_a = OAuthTokenManager("apaleo:client", redis_client=redis)
+        replica_b = OAuthTokenManager("apaleo:client", redis_client=redis)
+        fetcher_a, fetcher_b = CountingFetcher(delay=0.2), CountingFetcher()
+
+        token_a, token_b = await asyncio.gather(
+            replica_a.get_token(fetcher_a),
+            replica_b.get_token(fetcher_b),
+        )
+
+        assert fetcher_a.calls == 1
+        assert fetcher_b.calls == 0
+        assert token_a.access_token == token_b.access_token == "token-1"
+        assert replica_b.stats["shared_hits"] == 1
+
+
+class TestApaleoTokenSharing:
+    """Test that Apaleo connectors share tokens per client_id"""
+
+    @staticmethod
+    def connector(property_id):
+        connector = ApaleoConnector({"client_id": "shared", "client_secret": "secret", "property_id": property_id})
+        connector._client = MagicMock()
+        connector._client.headers = {}
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_connectors_for_same_client_share_refresh(self):
+        connectors = [self.connector(f"HOTEL{i}") for i in range(5)]
+        fetcher = CountingFetcher()
+        for connector in connectors:
+            connector._fetch_token = fetcher
+
+        await asyncio.gather(*[connector._ensure_authenticated() for connector in connectors])
+
+        assert fetcher.calls == 1
+        assert get_token_manager("apaleo:shared").stats["coalesced"] >= 1
+        assert {connector._client.headers["Authorization"] for connector in connectors} == {"Bearer token-1"}
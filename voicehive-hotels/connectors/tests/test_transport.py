@@ -0,0 +1,98 @@
+"""
+Tests for shared PMS HTTP transports
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from connectors.adapters.apaleo.connector import ApaleoConnector
+from connectors.transport import TransportRegistry, get_transport_registry
+
+
+def mock_client():
+    client = MagicMock()
+    client.headers = {}
+    client.aclose = AsyncMock()
+    response = MagicMock()
+    response.json.return_value = {"access_token": "token", "expires_in": 3600}
+    client.post = AsyncMock(return_value=response)
+    return client
+
+
+class TestTransportRegistry:
+    """Test sharing, limits and release of transports"""
+
+    @pytest.mark.asyncio
+    async def test_transports_are_shared_per_scope(self):
+        registry = TransportRegistry()
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: mock_client()):
+            a = registry.acquire("apaleo", "https://api.apaleo.com", scope="client-1")
+            b = registry.acquire("apaleo", "https://api.apaleo.com/", scope="client-1")
+            c = registry.acquire("apaleo", "https://api.apaleo.com", scope="client-2")
+
+        assert a is b
+        assert a is not c
+        assert a.property_limit("HOTEL1") is b.property_limit("HOTEL1")
+
+        await registry.release(a)
+        a.client.aclose.assert_not_called()
+        await registry.release(b)
+        a.client.aclose.assert_called_once()
+        assert registry.stats()["transports"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connectors_share_one_pool_and_global_limit(self):
+        connectors = [
+            ApaleoConnector({
+                "client_id": "chain",
+                "client_secret": "secret",
+                "property_id": f"HOTEL{i}",
+                "warm_reference_data": False,
+                "max_concurrent_requests": 3,
+            })
+            for i in range(20)
+        ]
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: mock_client()) as client_class:
+            for connector in connectors:
+                await connector.connect()
+
+        assert client_class.call_count == 1
+        assert len({id(connector._client) for connector in connectors}) == 1
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def request(method, path, **kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            response = MagicMock(status_code=200, content=b"{}")
+            response.json.return_value = {}
+            return response
+
+        connectors[0]._client.request = request
+        await asyncio.gather(*[connector._request("GET", "/ping") for connector in connectors])
+        assert in_flight["max"] == 3
+
+        for connector in connectors:
+            await connector.disconnect()
+        assert get_transport_registry().stats()["transports"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_releases_transport(self):
+        connector = ApaleoConnector({
+            "client_id": "failing",
+            "client_secret": "secret",
+            "property_id": "HOTEL1",
+            "warm_reference_data": False,
+        })
+        connector._authenticate = AsyncMock(side_effect=RuntimeError("identity service down"))
+
+        with patch("httpx.AsyncClient", side_effect=lambda **kwargs: mock_client()):
+            with pytest.raises(RuntimeError):
+                await connector.connect()
+
+        assert connector._transport is None
+        assert ("apaleo", "https://api.apaleo.com", "failing") not in get_transport_registry()._transports
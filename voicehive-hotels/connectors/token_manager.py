@@ -0,0 +1,288 @@
+"""
+VoiceHive Hotels - OAuth Token Manager
+Shared, single-flight OAuth2 client-credentials tokens for PMS connectors
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENEW_RATIO = 0.8
+DEFAULT_EXPIRES_IN = 3600
+REDIS_TOKEN_PREFIX = "voicehive:oauth"
+
+# Fetcher performs the identity call and returns the OAuth2 token response
+TokenFetcher = Callable[[], Awaitable[Dict[str, Any]]]
+
+# Release the refresh lock only if this process still owns it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class OAuthToken:
+    """Access token with its lifetime"""
+    access_token: str
+    expires_at: float
+    issued_at: float
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "OAuthToken":
+        now = time.time()
+        return cls(
+            access_token=data["access_token"],
+            expires_at=now + data.get("expires_in", DEFAULT_EXPIRES_IN),
+            issued_at=now,
+        )
+
+    def is_valid(self) -> bool:
+        return time.time() < self.expires_at
+
+    def renew_at(self, ratio: float) -> float:
+        """Time at which ``ratio`` of the token lifetime has elapsed"""
+        return self.issued_at + (self.expires_at - self.issued_at) * ratio
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "access_token": self.access_token,
+            "expires_at": self.expires_at,
+            "issued_at": self.issued_at,
+        })
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "OAuthToken":
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return cls(**json.loads(raw))
+
+
+class OAuthTokenManager:
+    """
+    Token holder shared by every connector using the same OAuth client
+
+    Refreshes are single-flight: concurrent callers that find the token
+    missing or stale await one identity call. While at least one connector
+    holds the manager, the token is renewed in the background once
+    ``renew_ratio`` of its lifetime has passed, so requests rarely wait on
+    the identity endpoint. With a Redis client the token is also shared
+    across replicas, and a Redis lock lets one replica refresh it while
+    the others pick up the result.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        renew_ratio: float = DEFAULT_RENEW_RATIO,
+        redis_client: Optional[Any] = None,
+        lock_timeout: float = 15.0,
+    ):
+        self.key = key
+        self.renew_ratio = renew_ratio
+        self.redis = redis_client
+        self.lock_timeout = lock_timeout
+
+        self._token: Optional[OAuthToken] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._fetchers: List[TokenFetcher] = []
+        self._renewal_task: Optional[asyncio.Task] = None
+        self._renewing = False
+
+        self.stats = {"fetches": 0, "shared_hits": 0, "coalesced": 0, "renewals": 0, "renewal_failures": 0}
+
+    @property
+    def token(self) -> Optional[OAuthToken]:
+        return self._token
+
+    @property
+    def _redis_key(self) -> str:
+        return f"{REDIS_TOKEN_PREFIX}:{self.key}"
+
+    async def get_token(
+        self,
+        fetcher: TokenFetcher,
+        force: bool = False,
+        stale_token: Optional[str] = None,
+    ) -> OAuthToken:
+        """
+        Get a valid token, fetching one if needed
+
+        ``stale_token`` names a token the caller knows is bad (e.g. it got a
+        401); it is replaced unless someone already did. ``force`` treats
+        the current token as stale.
+        """
+        current = self._token
+        if force and current is not None:
+            stale_token = current.access_token
+
+        if current is not None and current.is_valid() and current.access_token != stale_token:
+            return current
+
+        if self._inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(self._inflight)
+
+        refresh = asyncio.ensure_future(self._refresh(fetcher, stale_token))
+        self._inflight = refresh
+        refresh.add_done_callback(self._finish_refresh)
+        # Shielded so a cancelled caller does not cancel the refresh for the others waiting
+        return await asyncio.shield(refresh)
+
+    def _finish_refresh(self, refresh: asyncio.Future) -> None:
+        if self._inflight is refresh:
+            self._inflight = None
+        if not refresh.cancelled():
+            refresh.exception()  # Waiters re-raise it; avoid "never retrieved" warnings
+
+    async def _refresh(self, fetcher: TokenFetcher, stale_token: Optional[str]) -> OAuthToken:
+        if self.redis is None:
+            return self._store(await self._fetch(fetcher))
+
+        shared = await self._read_shared(stale_token)
+        if shared is not None:
+            return self._store(shared)
+
+        lock_key = f"{self._redis_key}:lock"
+        lock_token = uuid.uuid4().hex
+        try:
+            locked = await self.redis.set(lock_key, lock_token, nx=True, px=int(self.lock_timeout * 1000))
+        except Exception as e:
+            logger.warning(f"OAuth token lock unavailable for {self.key}: {e}")
+            locked = True
+
+        if not locked:
+            # Another replica is refreshing; wait for its token
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.1)
+                shared = await self._read_shared(stale_token)
+                if shared is not None:
+                    return self._store(shared)
+
+        try:
+            token = await self._fetch(fetcher)
+            await self._write_shared(token)
+            return self._store(token)
+        finally:
+            if locked:
+                try:
+                    await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+                except Exception:
+                    pass
+
+    async def _fetch(self, fetcher: TokenFetcher) -> OAuthToken:
+        self.stats["fetches"] += 1
+        return OAuthToken.from_response(await fetcher())
+
+    async def _read_shared(self, stale_token: Optional[str]) -> Optional[OAuthToken]:
+        """Read a replica-shared token that is fresh enough to adopt"""
+        try:
+            raw = await self.redis.get(self._redis_key)
+            if raw is None:
+                return None
+            token = OAuthToken.from_json(raw)
+        except Exception as e:
+            logger.warning(f"Could not read shared OAuth token for {self.key}: {e}")
+            return None
+
+        if token.access_token == stale_token or time.time() >= token.renew_at(self.renew_ratio):
+            return None
+        self.stats["shared_hits"] += 1
+        return token
+
+    async def _write_shared(self, token: OAuthToken) -> None:
+        ttl = int(token.expires_at - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await self.redis.set(self._redis_key, token.to_json(), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Could not share OAuth token for {self.key}: {e}")
+
+    def _store(self, token: OAuthToken) -> OAuthToken:
+        self._token = token
+        self._schedule_renewal()
+        return token
+
+    def acquire(self, fetcher: TokenFetcher) -> None:
+        """Register a connector's fetcher; renewal runs while any is registered"""
+        self._fetchers.append(fetcher)
+        self._schedule_renewal()
+
+    def release(self, fetcher: TokenFetcher) -> None:
+        """Unregister a fetcher, stopping renewal once none remain"""
+        try:
+            self._fetchers.remove(fetcher)
+        except ValueError:
+            pass
+        if not self._fetchers:
+            self._cancel_renewal()
+
+    def _schedule_renewal(self) -> None:
+        if self._token is None or not self._fetchers:
+            return
+        self._cancel_renewal()
+
+        delay = max(0.0, self._token.renew_at(self.renew_ratio) - time.time())
+        self._renewal_task = asyncio.get_running_loop().create_task(self._renew_after(delay))
+
+    def _cancel_renewal(self) -> None:
+        # A renewal that already started its refresh is left to finish; the
+        # refresh is shared with any request waiting on it
+        if self._renewal_task is not None and not self._renewing:
+            self._renewal_task.cancel()
+        self._renewal_task = None
+
+    async def _renew_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if not self._fetchers:
+            return
+        self._renewing = True
+        try:
+            await self.get_token(self._fetchers[-1], force=True)
+            self.stats["renewals"] += 1
+        except Exception as e:
+            # The token is still valid until expiry; requests refresh on demand
+            self.stats["renewal_failures"] += 1
+            logger.warning(f"Background OAuth token renewal failed for {self.key}: {e}")
+        finally:
+            self._renewing = False
+
+    async def close(self) -> None:
+        self._fetchers.clear()
+        self._cancel_renewal()
+
+
+_token_managers: Dict[str, OAuthTokenManager] = {}
+
+
+def get_token_manager(
+    key: str,
+    redis_client: Optional[Any] = None,
+    renew_ratio: float = DEFAULT_RENEW_RATIO,
+) -> OAuthTokenManager:
+    """Get the process-wide token manager for an OAuth client"""
+    manager = _token_managers.get(key)
+    if manager is None:
+        manager = OAuthTokenManager(key, renew_ratio=renew_ratio, redis_client=redis_client)
+        _token_managers[key] = manager
+    elif manager.redis is None and redis_client is not None:
+        manager.redis = redis_client
+    return manager
+
+
+def clear_token_managers() -> None:
+    """Drop all token managers (used by tests and on credential rotation)"""
+    for manager in _token_managers.values():
+        manager._fetchers.clear()
+        manager._cancel_renewal()
+    _token_managers.clear()
@@ -0,0 +1,155 @@
+"""
+VoiceHive Hotels - Shared PMS HTTP Transports
+One pooled HTTP/2 client per vendor host and credential scope
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TransportKey = Tuple[str, str, str]
+
+
+@dataclass
+class TransportConfig:
+    """Pool settings for a shared transport"""
+    max_connections: int = 25
+    max_keepalive_connections: int = 10
+    # Idle keep-alive connections are dropped after this many seconds
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 5.0
+    http2: bool = True
+    # Requests in flight across every connector sharing the transport
+    max_concurrent_requests: int = 50
+    # Requests in flight for a single property
+    max_concurrent_requests_per_property: int = 8
+    headers: Dict[str, str] = field(default_factory=lambda: {
+        "User-Agent": "VoiceHive-Hotels/1.0",
+        "Accept": "application/json",
+    })
+
+
+class SharedTransport:
+    """
+    Reference-counted HTTP client shared by connectors for one PMS tenant
+
+    Connectors bound to the same vendor, base URL and credential scope
+    share the connection pool, a global request limit and per-property
+    request limits.
+    """
+
+    def __init__(self, key: TransportKey, config: TransportConfig):
+        self.key = key
+        self.config = config
+        self.client = httpx.AsyncClient(
+            base_url=key[1],
+            timeout=httpx.Timeout(
+                connect=config.connect_timeout,
+                read=config.read_timeout,
+                write=config.write_timeout,
+                pool=config.pool_timeout,
+            ),
+            limits=httpx.Limits(
+                max_keepalive_connections=config.max_keepalive_connections,
+                max_connections=config.max_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            headers=dict(config.headers),
+            http2=config.http2,
+        )
+        self.limit = asyncio.Semaphore(config.max_concurrent_requests)
+        self._property_limits: Dict[str, asyncio.Semaphore] = {}
+        self.users = 0
+
+    def property_limit(self, property_id: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests for a property"""
+        semaphore = self._property_limits.get(property_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_requests_per_property)
+            self._property_limits[property_id] = semaphore
+        return semaphore
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class TransportRegistry:
+    """
+    Process-wide registry of shared transports
+
+    Connection count follows the number of distinct PMS hosts and
+    credential scopes, not the number of hotels. A transport is closed when
+    the last connector using it releases it; idle keep-alive connections
+    inside a live transport expire after ``keepalive_expiry``.
+    """
+
+    def __init__(self):
+        self._transports: Dict[TransportKey, SharedTransport] = {}
+
+    def acquire(
+        self,
+        vendor: str,
+        base_url: str,
+        scope: Optional[str] = None,
+        config: Optional[TransportConfig] = None,
+    ) -> SharedTransport:
+        """
+        Get (or create) the transport for a vendor host and credential scope
+
+        ``config`` only applies when the transport is created; later
+        connectors share the existing pool.
+        """
+        key = (vendor, base_url.rstrip("/"), scope or "")
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = SharedTransport(key, config or TransportConfig())
+            self._transports[key] = transport
+            logger.info(f"Created shared transport for {vendor} at {key[1]}")
+        transport.users += 1
+        return transport
+
+    async def release(self, transport: SharedTransport) -> None:
+        """Drop a connector's reference, closing the transport when unused"""
+        transport.users -= 1
+        if transport.users > 0:
+            return
+        if self._transports.get(transport.key) is transport:
+            del self._transports[transport.key]
+        await transport.aclose()
+        logger.info(f"Closed shared transport for {transport.key[0]} at {transport.key[1]}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "transports": len(self._transports),
+            "users": {f"{key[0]}:{key[1]}": t.users for key, t in self._transports.items()},
+        }
+
+    async def close_all(self) -> None:
+        for transport in list(self._transports.values()):
+            await transport.aclose()
+        self._transports.clear()
+
+
+_transport_registry: Optional[TransportRegistry] = None
+
+
+def get_transport_registry() -> TransportRegistry:
+    """Get the process-wide transport registry"""
+    global _transport_registry
+    if _transport_registry is None:
+        _transport_registry = TransportRegistry()
+    return _transport_registry
+
+
+def reset_transport_registry() -> None:
+    """Forget all transports without closing them (used by tests)"""
+    global _transport_registry
+    _transport_registry = None
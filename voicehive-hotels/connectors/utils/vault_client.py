@@ -196,6 +196,24 @@ class VaultClient:
             logger.debug(f"Secret retrieved from cache: {path}")
             return cached
 
+        data, _ = self.read_secret_with_lease(path)
+        return data
+
+    def read_secret_with_lease(self, path: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Read secret from Vault, bypassing the cache
+
+        Args:
+            path: Secret path (relative to mount_path)
+
+        Returns:
+            Tuple of secret data and lease duration in seconds (0 when
+            the secret engine does not lease, as with KV v2)
+
+        Raises:
+            VaultSecretNotFoundError: Secret not found
+            VaultError: Other Vault errors
+        """
         # Initialize if needed
         if not self._initialized:
             self._initialize()
@@ -205,7 +223,6 @@ class VaultClient:
 
         try:
             # Read from KV v2 secret engine
-            mount_point = f"{self.mount_path}/data"
             response = self._client.secrets.kv.v2.read_secret_version(
                 path=path, mount_point=self.mount_path
             )
@@ -219,8 +236,10 @@ class VaultClient:
             self._add_to_cache(path, data)
 
             logger.info(f"Secret retrieved from Vault: {path}")
-            return data
+            return data, int(response.get("lease_duration") or 0)
 
+        except VaultSecretNotFoundError:
+            raise
         except hvac.exceptions.InvalidPath:
             raise VaultSecretNotFoundError(f"Secret not found: {path}")
         except Exception as e:
@@ -248,6 +267,22 @@ class VaultClient:
             path = f"pms/{vendor}/default/api-credentials"
             return self.read_secret(path)
 
+    def read_pms_credentials_with_lease(
+        self, vendor: str, hotel_id: str
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Read PMS credentials from Vault together with their lease duration
+
+        Falls back to vendor-level credentials like ``read_pms_credentials``.
+        """
+        path = f"pms/{vendor}/{hotel_id}/api-credentials"
+
+        try:
+            return self.read_secret_with_lease(path)
+        except VaultSecretNotFoundError:
+            path = f"pms/{vendor}/default/api-credentials"
+            return self.read_secret_with_lease(path)
+
     def encrypt_data(self, plaintext: str, context: Optional[str] = None) -> str:
         """
         Encrypt data using Vault's transit engine
@@ -356,6 +391,10 @@ class DevelopmentVaultClient(VaultClient):
         except Exception as e:
             raise VaultError(f"Failed to read secret file: {e}")
 
+    def read_secret_with_lease(self, path: str) -> Tuple[Dict[str, Any], int]:
+        """Read secret from local file (never leased)"""
+        return self.read_secret(path), 0
+
     def encrypt_data(self, plaintext: str, context: Optional[str] = None) -> str:
         """Mock encryption for development"""
         import base64
@@ -395,6 +434,15 @@ class AsyncVaultClient:
             self._executor, self._client.read_pms_credentials, vendor, hotel_id
         )
 
+    async def read_pms_credentials_with_lease(
+        self, vendor: str, hotel_id: str
+    ) -> Tuple[Dict[str, Any], int]:
+        """Async read PMS credentials with their lease duration"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, self._client.read_pms_credentials_with_lease, vendor, hotel_id
+        )
+
     async def encrypt_data(self, plaintext: str, context: Optional[str] = None) -> str:
         """Async encrypt data"""
         loop = asyncio.get_event_loop()
@@ -26,7 +26,6 @@ from routers.resilience import router as resilience_router
 # Authentication imports
 from jwt_service import JWTService
 from vault_client import VaultClient, MockVaultClient
-from auth_middleware import AuthenticationMiddleware
 
 # Secrets management imports
 from secrets_manager import initialize_secrets_manager, get_secrets_manager
@@ -169,6 +168,10 @@ async def startup_configuration():
         app._jwt_service = jwt_service
         app._vault_client = vault_client
         
+        # Resolved per request by the authentication layer of the middleware chain
+        app.state.jwt_service = jwt_service
+        app.state.vault_client = vault_client
+        
         # Initialize auth services
         initialize_auth_services(jwt_service, vault_client)
         
@@ -193,9 +196,6 @@ async def startup_configuration():
             ]
         )
         
-        # Add authentication middleware
-        app.add_middleware(AuthenticationMiddleware, jwt_service=jwt_service, vault_client=vault_client)
-        
         logger.info("configuration_and_auth_services_initialized")
         
     except Exception as e:
@@ -267,6 +267,18 @@ async def startup_drift_monitoring():
         logger.error("drift_monitoring_initialization_failed", error=str(e))
         # Continue startup even if drift monitoring fails
 
+# Start the asynchronous audit pipeline (batched persistence + local spool)
+@app.on_event("startup")
+async def startup_audit_pipeline():
+    """Move audit event persistence off the request path"""
+    try:
+        from audit_pipeline import start_audit_pipeline
+        await start_audit_pipeline(get_audit_logger())
+        logger.info("audit_pipeline_initialized")
+    except Exception as e:
+        logger.error("audit_pipeline_initialization_failed", error=str(e))
+        # Continue startup; audit events fall back to inline logging
+
 @app.on_event("shutdown")
 async def shutdown_monitoring():
     """Shutdown monitoring components and database"""
@@ -274,6 +286,10 @@ async def shutdown_monitoring():
         from enhanced_alerting import enhanced_alerting
         await enhanced_alerting.stop()
 
+        # Flush queued audit events before the database pool closes
+        from audit_pipeline import stop_audit_pipeline
+        await stop_audit_pipeline(get_audit_logger())
+
         # Flush any pending traces
         from distributed_tracing import enhanced_tracer
         enhanced_tracer.flush_traces()
@@ -375,19 +391,18 @@ app.mount("/metrics", metrics_app)
 
 # Import comprehensive error handling
 from error_middleware import (
-    ComprehensiveErrorMiddleware, 
     validation_exception_handler,
     http_exception_handler,
     generic_exception_handler
 )
-from correlation_middleware import CorrelationIDMiddleware
+from middleware_chain import MiddlewareChain, build_orchestrator_layers
 from pydantic import ValidationError as PydanticValidationError
 
 # Import security hardening components
-from input_validation_middleware import InputValidationMiddleware, ValidationConfig
-from security_headers_middleware import SecurityHeadersMiddleware, get_production_security_config, get_development_security_config
+from input_validation_middleware import ValidationConfig
+from security_headers_middleware import get_production_security_config, get_development_security_config
 from webhook_security import WebhookSecurityManager, WebhookConfig
-from audit_logging import AuditLogger, get_audit_logger, AuditMiddleware
+from audit_logging import AuditLogger, get_audit_logger
 from enhanced_pii_redactor import EnhancedPIIRedactor, create_gdpr_compliant_config
 from secure_config_manager import SecureConfigManager
 
@@ -423,16 +438,30 @@ app.state.webhook_security_manager = webhook_security_manager
 app.state.audit_logger = audit_logger
 app.state.enhanced_pii_redactor = enhanced_pii_redactor
 
-# Add security middleware (order matters - most specific first)
-app.add_middleware(SecurityHeadersMiddleware, config=security_headers_config, environment=ENVIRONMENT)
-app.add_middleware(InputValidationMiddleware, config=validation_config)
-app.add_middleware(AuditMiddleware, audit_logger=audit_logger)
-
-# Add correlation ID middleware
-app.add_middleware(CorrelationIDMiddleware)
+# Rate limiting runs inside the middleware chain, so its rules come from the
+# same resilience configuration the resilience manager uses at startup
+resilience_middleware_config = get_resilience_config(ENVIRONMENT)
+rate_limit_redis_url = (
+    resilience_middleware_config.redis_url
+    if resilience_middleware_config.rate_limiting_enabled else None
+)
 
-# Add comprehensive error handling middleware
-app.add_middleware(ComprehensiveErrorMiddleware)
+# Correlation ID, audit, security headers, error handling, rate limiting,
+# authentication and input validation run as a single composed chain
+# (outermost). Auth services are resolved from app.state once
+# startup_configuration has created them.
+app.add_middleware(
+    MiddlewareChain,
+    layers=build_orchestrator_layers(
+        security_headers_config=security_headers_config,
+        environment=ENVIRONMENT,
+        audit_logger=audit_logger,
+        validation_config=validation_config,
+        rate_limit_redis_url=rate_limit_redis_url,
+        rate_limit_rules=resilience_middleware_config.rate_limiting_rules,
+        rate_limit_default_config=resilience_middleware_config.default_rate_limit_config,
+    ),
+)
 
 # Register specific exception handlers
 app.add_exception_handler(PydanticValidationError, validation_exception_handler)
@@ -0,0 +1,211 @@
+"""
+Audit Log Hash Chain and Merkle Checkpoints for VoiceHive Hotels
+Tamper-evident linking of audit_logs rows with incremental verification
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+from logging_adapter import get_safe_logger
+
+logger = get_safe_logger("orchestrator.audit_hash_chain")
+
+# Hash preceding the first row of every chain partition
+GENESIS_HASH = "0" * 64
+
+# Each writer owns its own chains, so replicas never contend for a chain head
+WRITER_ID = os.getenv("AUDIT_CHAIN_WRITER_ID", os.getenv("HOSTNAME", "orchestrator"))
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def compute_chain_hash(prev_hash: str, checksum: str) -> str:
+    """Link a row's checksum to the previous chain hash"""
+    return _sha256(prev_hash + checksum)
+
+
+def chain_partition_for(timestamp: Any, writer_id: str = WRITER_ID) -> str:
+    """Chain partition for a row: one chain per writer per UTC day"""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return f"{writer_id}:{timestamp.strftime('%Y-%m-%d')}"
+
+
+@dataclass
+class ChainHead:
+    """Last linked row of a chain partition"""
+    position: int
+    chain_hash: str
+
+
+class AuditHashChain:
+    """
+    Assigns chain_partition / chain_position / prev_hash / chain_hash to rows
+
+    Heads are cached in memory and only advanced with ``commit()`` once the
+    batch has been persisted, so a failed write leaves the chain untouched.
+    """
+
+    def __init__(self, writer_id: str = WRITER_ID):
+        self.writer_id = writer_id
+        self._heads: Dict[str, ChainHead] = {}
+
+    def known_head(self, partition: str) -> Optional[ChainHead]:
+        return self._heads.get(partition)
+
+    def partitions_for(self, rows: Iterable[Dict[str, Any]]) -> List[str]:
+        return sorted({chain_partition_for(row["timestamp"], self.writer_id) for row in rows})
+
+    def link(self, rows: List[Dict[str, Any]],
+             heads: Optional[Dict[str, ChainHead]] = None) -> Dict[str, ChainHead]:
+        """
+        Link rows in order and return the new heads (not yet committed)
+
+        ``heads`` supplies heads loaded from storage for partitions this
+        process has not seen yet.
+        """
+        pending: Dict[str, ChainHead] = {}
+        for row in rows:
+            partition = chain_partition_for(row["timestamp"], self.writer_id)
+            head = pending.get(partition) or self._heads.get(partition) or (heads or {}).get(partition)
+            if head is None:
+                head = ChainHead(position=0, chain_hash=GENESIS_HASH)
+
+            position = head.position + 1
+            chain_hash = compute_chain_hash(head.chain_hash, row["checksum"])
+
+            row["chain_partition"] = partition
+            row["chain_position"] = position
+            row["prev_hash"] = head.chain_hash
+            row["chain_hash"] = chain_hash
+            pending[partition] = ChainHead(position=position, chain_hash=chain_hash)
+
+        return pending
+
+    def commit(self, heads: Dict[str, ChainHead]) -> None:
+        self._heads.update(heads)
+
+    def reset(self, partitions: Optional[Iterable[str]] = None) -> None:
+        """Forget cached heads so they are reloaded from storage"""
+        if partitions is None:
+            self._heads.clear()
+        else:
+            for partition in partitions:
+                self._heads.pop(partition, None)
+
+
+@dataclass
+class ChainBreak:
+    """A row whose chain link does not verify"""
+    position: int
+    event_id: Optional[str]
+    reason: str
+
+
+def verify_chain_segment(rows: Iterable[Tuple[int, Optional[str], str, str, str]],
+                         prev_hash: str,
+                         prev_position: int) -> Tuple[List[ChainBreak], ChainHead, List[str]]:
+    """
+    Verify a contiguous run of chain rows
+
+    ``rows`` are ``(chain_position, event_id, checksum, prev_hash, chain_hash)``
+    ordered by position. Returns the breaks found, the last verified head and
+    the chain hashes seen (the Merkle leaves for checkpointing).
+    """
+    breaks: List[ChainBreak] = []
+    leaves: List[str] = []
+    expected_hash = prev_hash
+    expected_position = prev_position + 1
+
+    for position, event_id, checksum, row_prev_hash, row_chain_hash in rows:
+        if position != expected_position:
+            breaks.append(ChainBreak(
+                position=position,
+                event_id=event_id,
+                reason=f"missing chain positions {expected_position}-{position - 1}"
+            ))
+        if row_prev_hash != expected_hash:
+            breaks.append(ChainBreak(position=position, event_id=event_id, reason="prev_hash mismatch"))
+        if compute_chain_hash(row_prev_hash, checksum) != row_chain_hash:
+            breaks.append(ChainBreak(position=position, event_id=event_id, reason="chain_hash mismatch"))
+
+        leaves.append(row_chain_hash)
+        expected_hash = row_chain_hash
+        expected_position = position + 1
+
+    return breaks, ChainHead(position=expected_position - 1, chain_hash=expected_hash), leaves
+
+
+class MerkleTree:
+    """
+    Binary Merkle tree over hex-encoded leaf hashes
+
+    Odd nodes are promoted unchanged to the next level, so a proof for any
+    leaf has at most ceil(log2(n)) steps.
+    """
+
+    def __init__(self, leaves: List[str]):
+        if not leaves:
+            raise ValueError("Merkle tree requires at least one leaf")
+        self.levels: List[List[str]] = [list(leaves)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [
+                _sha256(level[i] + level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+            self.levels.append(parents)
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1][0]
+
+    def proof(self, index: int) -> List[Tuple[str, str]]:
+        """Sibling path for a leaf as ``(side, hash)`` pairs, side being 'L' or 'R'"""
+        return [
+            (side, self.levels[level][node_index])
+            for level, node_index, side in self.sibling_path(len(self.levels[0]), index)
+        ]
+
+    def interior_nodes(self) -> List[Tuple[int, int, str]]:
+        """``(level, index, hash)`` for every node between the leaves and the root"""
+        return [
+            (level, node_index, node_hash)
+            for level in range(1, len(self.levels) - 1)
+            for node_index, node_hash in enumerate(self.levels[level])
+        ]
+
+    @staticmethod
+    def sibling_path(leaf_count: int, index: int) -> List[Tuple[int, int, str]]:
+        """
+        ``(level, index, side)`` of each sibling on a leaf's proof path
+
+        Depends only on the tree's shape, so a proof can be assembled from
+        stored nodes without rebuilding the tree.
+        """
+        if not 0 <= index < leaf_count:
+            raise IndexError(f"leaf index {index} out of range")
+
+        path = []
+        level, size = 0, leaf_count
+        while size > 1:
+            sibling = index ^ 1
+            if sibling < size:
+                path.append((level, sibling, "L" if sibling < index else "R"))
+            index //= 2
+            size = (size + 1) // 2
+            level += 1
+        return path
+
+
+def verify_merkle_proof(leaf: str, proof: List[Tuple[str, str]], root: str) -> bool:
+    """Check an inclusion proof in O(log n)"""
+    node = leaf
+    for side, sibling in proof:
+        node = _sha256(sibling + node) if side == "L" else _sha256(node + sibling)
+    return node == root
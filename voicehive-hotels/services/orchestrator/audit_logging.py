@@ -169,6 +169,13 @@ class AuditLogger:
                 self.pii_redactor = None
         else:
             self.pii_redactor = None
+        
+        # Optional asynchronous pipeline (see audit_pipeline.py)
+        self.pipeline = None
+    
+    def attach_pipeline(self, pipeline) -> None:
+        """Route events through an AuditPipeline instead of logging inline"""
+        self.pipeline = pipeline
     
     def log_event(self, 
                   event_type: AuditEventType,
@@ -437,6 +444,12 @@ class AuditLogger:
     def _process_and_log_event(self, event: AuditEvent):
         """Process and log the audit event"""
         
+        # Hand off to the background pipeline; redaction, logging and
+        # persistence happen there, off the request path
+        if self.pipeline is not None and self.pipeline.running:
+            self.pipeline.submit(event)
+            return
+        
         # Convert to dictionary
         event_data = event.to_dict()
         
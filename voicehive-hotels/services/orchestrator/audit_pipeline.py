@@ -0,0 +1,575 @@
+"""
+Asynchronous Audit Event Pipeline for VoiceHive Hotels
+Moves audit redaction, serialization and persistence off the request path
+"""
+
+import asyncio
+import json
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+from audit_logging import AuditEvent, AuditSeverity
+from audit_hash_chain import AuditHashChain, ChainHead
+from logging_adapter import get_safe_logger
+
+logger = get_safe_logger("orchestrator.audit_pipeline")
+
+# Prometheus metrics for pipeline health
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+
+    audit_pipeline_queue_depth = Gauge(
+        'voicehive_audit_pipeline_queue_depth',
+        'Audit events waiting in the in-memory queue'
+    )
+
+    audit_pipeline_events_total = Counter(
+        'voicehive_audit_pipeline_events_total',
+        'Audit events handled by the pipeline',
+        ['outcome']  # persisted, spooled, replayed, overflow_spooled, failed
+    )
+
+    audit_pipeline_batch_size = Histogram(
+        'voicehive_audit_pipeline_batch_size',
+        'Number of audit events written per batch',
+        buckets=(1, 10, 50, 100, 250, 500, 1000, 2500)
+    )
+
+    audit_pipeline_flush_duration_seconds = Histogram(
+        'voicehive_audit_pipeline_flush_duration_seconds',
+        'Time taken to persist one batch of audit events',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    )
+
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Column order used for both COPY and INSERT into audit_logs
+AUDIT_LOG_COLUMNS: Tuple[str, ...] = (
+    "event_id",
+    "event_type",
+    "event_category",
+    "timestamp",
+    "severity",
+    "description",
+    "user_id",
+    "session_id",
+    "correlation_id",
+    "client_ip",
+    "service_name",
+    "resource_type",
+    "resource_id",
+    "action",
+    "success",
+    "error_code",
+    "error_message",
+    "metadata",
+    "gdpr_lawful_basis",
+    "data_subject_id",
+    "retention_period",
+    "checksum",
+    "chain_partition",
+    "chain_position",
+    "prev_hash",
+    "chain_hash",
+)
+
+# Event type prefixes mapped to AuditTrailVerifier categories
+_EVENT_CATEGORY_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("auth.", "authentication"),
+    ("authz.", "authorization"),
+    ("data.read", "data_access"),
+    ("data.", "data_modification"),
+    ("pii.", "compliance_events"),
+    ("system.security.", "security_events"),
+    ("system.", "system_administration"),
+    ("webhook.failed", "error_events"),
+)
+
+
+def categorize_event_type(event_type: str) -> str:
+    """Map an audit event type to its verification category"""
+    for prefix, category in _EVENT_CATEGORY_PREFIXES:
+        if event_type.startswith(prefix):
+            return category
+    return "data_access"
+
+
+@dataclass
+class AuditPipelineConfig:
+    """Configuration for the asynchronous audit pipeline"""
+
+    # Bounded in-memory queue; beyond this, events spill straight to the spool
+    queue_size: int = 10000
+
+    # Batching
+    batch_size: int = 500
+    flush_interval_seconds: float = 0.5
+
+    # A DB write slower than this is treated as a failure and spooled
+    db_write_timeout_seconds: float = 2.0
+
+    # Use COPY (fastest) rather than multi-row INSERT
+    use_copy: bool = True
+
+    # Append-only local spool used while the database is slow or unavailable
+    spool_path: str = os.getenv(
+        "AUDIT_SPOOL_PATH", "/var/lib/voicehive/audit-spool/audit_events.jsonl"
+    )
+    spool_replay_interval_seconds: float = 30.0
+    spool_replay_batch_size: int = 2000
+
+
+class AuditSink:
+    """Destination for batches of serialized audit rows"""
+
+    async def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def replay_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Write spooled rows, some of which may already be persisted"""
+        await self.write_batch(rows)
+
+
+class PostgresAuditSink(AuditSink):
+    """
+    Bulk-write audit rows into the audit_logs table via asyncpg
+
+    Rows are hash-chained per partition (see audit_hash_chain.py) inside the
+    same transaction that writes them, so the chain in the table never has
+    holes left by failed batches.
+    """
+
+    def __init__(self, db_manager=None, table_name: str = "audit_logs", use_copy: bool = True,
+                 chain: Optional[AuditHashChain] = None):
+        if db_manager is None:
+            from database.connection import db_manager as default_db_manager
+            db_manager = default_db_manager
+        self.db_manager = db_manager
+        self.table_name = table_name
+        self.use_copy = use_copy
+        self.chain = chain or AuditHashChain()
+
+        placeholders = ", ".join(f"${i}" for i in range(1, len(AUDIT_LOG_COLUMNS) + 1))
+        self._insert_sql = (
+            f"INSERT INTO {table_name} ({', '.join(AUDIT_LOG_COLUMNS)}) "
+            f"VALUES ({placeholders})"
+        )
+        self._heads_sql = (
+            f"SELECT DISTINCT ON (chain_partition) chain_partition, chain_position, chain_hash "
+            f"FROM {table_name} WHERE chain_partition = ANY($1::text[]) "
+            f"ORDER BY chain_partition, chain_position DESC"
+        )
+        self._existing_sql = f"SELECT event_id FROM {table_name} WHERE event_id = ANY($1::text[])"
+
+    async def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        await self._write_chained(rows, skip_existing=False)
+
+    async def replay_batch(self, rows: List[Dict[str, Any]]) -> None:
+        # Spooled rows may already be persisted; those are dropped before
+        # linking so they do not consume chain positions twice
+        await self._write_chained(rows, skip_existing=True)
+
+    async def _write_chained(self, rows: List[Dict[str, Any]], skip_existing: bool) -> None:
+        partitions = self.chain.partitions_for(rows)
+
+        try:
+            async with self.db_manager.get_asyncpg_connection() as conn:
+                async with conn.transaction():
+                    if skip_existing:
+                        existing = {
+                            record["event_id"] for record in
+                            await conn.fetch(self._existing_sql, [row["event_id"] for row in rows])
+                        }
+                        rows = [row for row in rows if row["event_id"] not in existing]
+                        if not rows:
+                            return
+
+                    heads = await self._load_heads(conn, partitions)
+                    pending = self.chain.link(rows, heads)
+                    records = [self._to_record(row) for row in rows]
+
+                    if self.use_copy:
+                        await conn.copy_records_to_table(
+                            self.table_name,
+                            records=records,
+                            columns=list(AUDIT_LOG_COLUMNS)
+                        )
+                    else:
+                        await conn.executemany(self._insert_sql, records)
+        except BaseException:
+            # The outcome of the transaction is unknown; reload heads next time
+            self.chain.reset(partitions)
+            raise
+
+        self.chain.commit(pending)
+
+    async def _load_heads(self, conn, partitions: List[str]) -> Dict[str, ChainHead]:
+        unknown = [partition for partition in partitions if self.chain.known_head(partition) is None]
+        if not unknown:
+            return {}
+        records = await conn.fetch(self._heads_sql, unknown)
+        return {
+            record["chain_partition"]: ChainHead(position=record["chain_position"], chain_hash=record["chain_hash"])
+            for record in records
+        }
+
+    @staticmethod
+    def _to_record(row: Dict[str, Any]) -> tuple:
+        record = []
+        for column in AUDIT_LOG_COLUMNS:
+            value = row.get(column)
+            if column == "timestamp" and isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif column == "metadata" and value is not None:
+                value = json.dumps(value, default=str)
+            record.append(value)
+        return tuple(record)
+
+
+class AuditSpool:
+    """
+    Append-only JSON-lines spool for audit rows that could not be persisted
+
+    File I/O runs in a worker thread so the event loop never blocks on disk.
+    Replay renames the spool before reading it, so rows appended while a
+    replay is in progress go to a fresh file and are never lost.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._replay_path = self.path.with_suffix(self.path.suffix + ".replay")
+        self._lock = asyncio.Lock()
+
+    async def append(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        payload = "".join(json.dumps(row, default=str, separators=(",", ":")) + "\n" for row in rows)
+        async with self._lock:
+            await asyncio.to_thread(self._append_sync, payload)
+
+    def _append_sync(self, payload: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as spool_file:
+            spool_file.write(payload)
+            spool_file.flush()
+            os.fsync(spool_file.fileno())
+
+    def has_pending(self) -> bool:
+        return self._replay_path.exists() or (self.path.exists() and self.path.stat().st_size > 0)
+
+    async def replay(self, sink: AuditSink, batch_size: int) -> int:
+        """Write spooled rows to the sink; returns the number of rows replayed"""
+        async with self._lock:
+            if not self._replay_path.exists():
+                if not self.path.exists():
+                    return 0
+                await asyncio.to_thread(os.replace, self.path, self._replay_path)
+
+        rows = await asyncio.to_thread(self._read_rows, self._replay_path)
+        for start in range(0, len(rows), batch_size):
+            # On failure the .replay file is kept and retried on the next cycle;
+            # replay_batch ignores duplicate event_ids so partial replays are safe
+            await sink.replay_batch(rows[start:start + batch_size])
+
+        await asyncio.to_thread(self._replay_path.unlink)
+        return len(rows)
+
+    @staticmethod
+    def _read_rows(path: Path) -> List[Dict[str, Any]]:
+        rows = []
+        with open(path, "r", encoding="utf-8") as spool_file:
+            for line in spool_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    logger.warning("audit_spool_corrupt_line_skipped", path=str(path))
+        return rows
+
+
+class AuditPipeline:
+    """
+    Bounded, batched audit pipeline
+
+    The request path only pays ``submit()`` (a ``put_nowait``). A background
+    worker drains the queue in batches, redacts and serializes events, emits
+    them to the structured log and bulk-writes them to the sink. Batches
+    that fail or exceed the write timeout are appended to the local spool and
+    replayed once the sink recovers. Events that arrive while the queue is
+    full go to a side buffer that a separate task redacts and spools in a
+    worker thread.
+    """
+
+    def __init__(self,
+                 config: Optional[AuditPipelineConfig] = None,
+                 sink: Optional[AuditSink] = None,
+                 pii_redactor=None):
+        self.config = config or AuditPipelineConfig()
+        self.sink = sink or PostgresAuditSink(use_copy=self.config.use_copy)
+        self.pii_redactor = pii_redactor
+        self.spool = AuditSpool(self.config.spool_path)
+
+        self._queue: "asyncio.Queue[AuditEvent]" = asyncio.Queue(maxsize=self.config.queue_size)
+        self._worker_task: Optional[asyncio.Task] = None
+        self._overflow: List[AuditEvent] = []
+        self._overflow_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._last_replay_attempt = 0.0
+
+        self.stats = {
+            "submitted": 0,
+            "persisted": 0,
+            "spooled": 0,
+            "replayed": 0,
+            "overflow_spooled": 0,
+            "batches": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Start the background worker"""
+        if self._running:
+            return
+        self._running = True
+        # Measure the replay interval from startup, not from the monotonic
+        # clock's origin (which is host uptime)
+        self._last_replay_attempt = time.monotonic()
+        self._worker_task = asyncio.create_task(self._run())
+        logger.info("audit_pipeline_started", queue_size=self.config.queue_size, batch_size=self.config.batch_size)
+
+    async def stop(self) -> None:
+        """Stop the worker after flushing everything still queued"""
+        if not self._running:
+            return
+        self._running = False
+        if self._worker_task:
+            # The worker notices _running within one flush interval; waiting
+            # for it (rather than cancelling) lets an in-flight batch finish
+            # its write or spool fallback
+            await self._worker_task
+            self._worker_task = None
+
+        # Final flush of anything left in the queue
+        while not self._queue.empty():
+            await self._flush(self._drain_batch())
+
+        if self._overflow_task:
+            await self._overflow_task
+            self._overflow_task = None
+
+        logger.info("audit_pipeline_stopped", **self.stats)
+
+    def submit(self, event: AuditEvent) -> None:
+        """Enqueue an event; never awaits"""
+        self.stats["submitted"] += 1
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Never drop audit events: park this one for the overflow task,
+            # which redacts and spools it off the event loop
+            self._overflow.append(event)
+            if self._overflow_task is None or self._overflow_task.done():
+                self._overflow_task = asyncio.get_running_loop().create_task(self._spool_overflow())
+            return
+
+        if METRICS_AVAILABLE:
+            audit_pipeline_queue_depth.set(self._queue.qsize())
+
+    def serialize_event(self, event: AuditEvent) -> Dict[str, Any]:
+        """Redact and flatten an event into an audit_logs row"""
+        event_data = event.to_dict()
+
+        metadata = event_data.get("metadata")
+        if self.pii_redactor and metadata:
+            metadata = self.pii_redactor.redact_dict(metadata)
+
+        context = event_data.pop("context", None) or {}
+        row = {
+            "event_id": event_data["event_id"],
+            "event_type": event_data["event_type"],
+            "event_category": categorize_event_type(event_data["event_type"]),
+            "timestamp": event_data["timestamp"],
+            "severity": event_data["severity"],
+            "description": event_data["description"],
+            "user_id": context.get("user_id"),
+            "session_id": context.get("session_id"),
+            "correlation_id": context.get("correlation_id"),
+            "client_ip": context.get("client_ip"),
+            "service_name": context.get("service_name"),
+            "resource_type": event_data.get("resource_type"),
+            "resource_id": event_data.get("resource_id"),
+            "action": event_data.get("action"),
+            "success": event_data.get("success", True),
+            "error_code": event_data.get("error_code"),
+            "error_message": event_data.get("error_message"),
+            "metadata": metadata,
+            "gdpr_lawful_basis": event_data.get("gdpr_lawful_basis"),
+            "data_subject_id": event_data.get("data_subject_id"),
+            "retention_period": event_data.get("retention_period"),
+        }
+        row["checksum"] = hashlib.sha256(
+            json.dumps(row, sort_keys=True, default=str, separators=(",", ":")).encode()
+        ).hexdigest()
+        # Carried for log emission only; not an audit_logs column
+        row["_context"] = context
+        return row
+
+    async def _spool_overflow(self) -> None:
+        """Redact and spool events that did not fit in the queue"""
+        while self._overflow:
+            events, self._overflow = self._overflow, []
+            try:
+                rows = await asyncio.to_thread(self._serialize_rows, events)
+                await self.spool.append(rows)
+            except Exception as e:
+                logger.error("audit_overflow_spool_failed", error=str(e), batch_size=len(events))
+                continue
+
+            self.stats["overflow_spooled"] += len(rows)
+            if METRICS_AVAILABLE:
+                audit_pipeline_events_total.labels(outcome="overflow_spooled").inc(len(rows))
+            logger.warning("audit_pipeline_queue_full_events_spooled", batch_size=len(rows))
+
+    def _serialize_rows(self, events: List[AuditEvent]) -> List[Dict[str, Any]]:
+        rows = [self.serialize_event(event) for event in events]
+        for row in rows:
+            row.pop("_context", None)
+        return rows
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                # Wait for the first event, then drain whatever else is ready
+                try:
+                    first = await asyncio.wait_for(self._queue.get(), timeout=self.config.flush_interval_seconds)
+                except asyncio.TimeoutError:
+                    await self._maybe_replay_spool()
+                    continue
+
+                batch = [first]
+                batch.extend(self._drain_batch(self.config.batch_size - 1))
+                await self._flush(batch)
+                await self._maybe_replay_spool()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("audit_pipeline_worker_error", error=str(e))
+
+    def _drain_batch(self, limit: Optional[int] = None) -> List[AuditEvent]:
+        limit = self.config.batch_size if limit is None else limit
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush(self, events: List[AuditEvent]) -> None:
+        if not events:
+            return
+
+        rows = [self.serialize_event(event) for event in events]
+        for row in rows:
+            self._emit_log(row)
+            row.pop("_context", None)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.sink.write_batch(rows), timeout=self.config.db_write_timeout_seconds)
+            self.stats["persisted"] += len(rows)
+            outcome = "persisted"
+        except asyncio.CancelledError:
+            # The batch is already off the queue; spool it before giving up
+            await asyncio.shield(self.spool.append(rows))
+            self.stats["spooled"] += len(rows)
+            raise
+        except Exception as e:
+            logger.warning("audit_batch_write_failed_spooling", error=str(e) or type(e).__name__, batch_size=len(rows))
+            await self.spool.append(rows)
+            self.stats["spooled"] += len(rows)
+            outcome = "spooled"
+
+        self.stats["batches"] += 1
+        if METRICS_AVAILABLE:
+            audit_pipeline_events_total.labels(outcome=outcome).inc(len(rows))
+            audit_pipeline_batch_size.observe(len(rows))
+            audit_pipeline_flush_duration_seconds.observe(time.perf_counter() - start)
+            audit_pipeline_queue_depth.set(self._queue.qsize())
+
+    def _emit_log(self, row: Dict[str, Any]) -> None:
+        """Emit the event to the structured audit log stream"""
+        log_data = {key: value for key, value in row.items() if key != "_context"}
+        log_data["context"] = row.get("_context")
+        logger.info("audit_event", **log_data)
+
+        # For critical events, also log to a separate audit trail
+        if row["severity"] == AuditSeverity.CRITICAL.value:
+            logger.critical(
+                "critical_audit_event",
+                event_id=row["event_id"],
+                event_type=row["event_type"],
+                description=row["description"]
+            )
+
+    async def _maybe_replay_spool(self) -> None:
+        now = time.monotonic()
+        if now - self._last_replay_attempt < self.config.spool_replay_interval_seconds:
+            return
+        self._last_replay_attempt = now
+
+        if not await asyncio.to_thread(self.spool.has_pending):
+            return
+
+        try:
+            replayed = await self.spool.replay(self.sink, self.config.spool_replay_batch_size)
+        except Exception as e:
+            logger.warning("audit_spool_replay_failed", error=str(e))
+            return
+
+        if replayed:
+            self.stats["replayed"] += replayed
+            if METRICS_AVAILABLE:
+                audit_pipeline_events_total.labels(outcome="replayed").inc(replayed)
+            logger.info("audit_spool_replayed", events=replayed)
+
+
+# Global pipeline instance
+_audit_pipeline: Optional[AuditPipeline] = None
+
+
+async def start_audit_pipeline(audit_logger, config: Optional[AuditPipelineConfig] = None,
+                               sink: Optional[AuditSink] = None) -> AuditPipeline:
+    """Create the global pipeline, attach it to an AuditLogger and start it"""
+    global _audit_pipeline
+    if _audit_pipeline is None:
+        _audit_pipeline = AuditPipeline(config=config, sink=sink, pii_redactor=audit_logger.pii_redactor)
+    await _audit_pipeline.start()
+    audit_logger.attach_pipeline(_audit_pipeline)
+    return _audit_pipeline
+
+
+async def stop_audit_pipeline(audit_logger=None) -> None:
+    """Flush and stop the global pipeline"""
+    global _audit_pipeline
+    if _audit_pipeline is None:
+        return
+    if audit_logger is not None:
+        audit_logger.attach_pipeline(None)
+    await _audit_pipeline.stop()
+    _audit_pipeline = None
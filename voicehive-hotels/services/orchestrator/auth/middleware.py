@@ -4,11 +4,13 @@ Authentication and Authorization middleware for VoiceHive Hotels Orchestrator
 
 import re
 from datetime import datetime
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Tuple, Pattern
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from auth_models import (
     UserContext, ServiceContext, AuthenticationError, 
@@ -23,41 +25,159 @@ logger = get_safe_logger("orchestrator.auth_middleware")
 # Security scheme for FastAPI docs
 security = HTTPBearer(auto_error=False)
 
+# Paths that don't require authentication. "/" is matched exactly, every
+# other entry is a prefix (so "/docs" also covers "/docs/oauth2-redirect" and
+# "/health" covers the Kubernetes "/health/live" and "/health/ready" probes).
+# Webhook endpoints verify their provider's signature instead of a JWT.
+DEFAULT_PUBLIC_PATHS = [
+    "/",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/health",
+    "/healthz",
+    "/metrics",
+    "/auth/login",
+    "/auth/refresh",
+    "/v1/livekit/webhook",
+    "/v1/livekit/transcription",
+    "/call/event",
+    "/v1/apaleo/webhook"
+]
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """JWT and API Key authentication middleware"""
+# Paths that require specific permissions
+DEFAULT_PROTECTED_PATHS = {
+    r"/calls/.*": [Permission.CALL_START, Permission.CALL_VIEW],
+    r"/hotels/.*": [Permission.HOTEL_VIEW],
+    r"/admin/.*": [Permission.SYSTEM_ADMIN],
+    r"/auth/api-keys.*": [Permission.SYSTEM_ADMIN],
+}
+
+# Headers added to every authenticated HTTP response
+AUTH_RESPONSE_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+)
+
+
+class AuthRouteTable:
+    """
+    Precomputed public-path and permission lookup tables
+
+    Public paths are split into an exact-match set and a prefix tuple so the
+    check is a set lookup plus a single ``str.startswith``. Permission
+    patterns are compiled once and per-path results are memoized in a
+    bounded dict, so steady-state lookups never touch the regex engine.
+    """
+
+    def __init__(
+        self,
+        public_paths: Optional[List[str]] = None,
+        protected_paths: Optional[Dict[str, List[Permission]]] = None,
+        cache_size: int = 4096
+    ):
+        public_paths = DEFAULT_PUBLIC_PATHS if public_paths is None else public_paths
+        protected_paths = DEFAULT_PROTECTED_PATHS if protected_paths is None else protected_paths
+
+        self.public_exact = frozenset(p for p in public_paths if p == "/")
+        self.public_prefixes: Tuple[str, ...] = tuple(p for p in public_paths if p != "/")
+        self.permission_rules: List[Tuple[Pattern[str], List[Permission]]] = [
+            (re.compile(pattern), list(permissions))
+            for pattern, permissions in protected_paths.items()
+        ]
+        self.cache_size = cache_size
+        self._permission_cache: Dict[str, List[Permission]] = {}
+
+    def is_public(self, path: str) -> bool:
+        """Check if path is public (doesn't require authentication)"""
+        return path in self.public_exact or path.startswith(self.public_prefixes)
+
+    def required_permissions(self, path: str) -> List[Permission]:
+        """Get required permissions for a path"""
+        cached = self._permission_cache.get(path)
+        if cached is not None:
+            return cached
+
+        permissions: List[Permission] = []
+        for pattern, rule_permissions in self.permission_rules:
+            if pattern.match(path):
+                permissions = rule_permissions
+                break
+
+        if len(self._permission_cache) >= self.cache_size:
+            # Paths carry ids (/hotels/{id}/...), so drop the oldest entry
+            # rather than letting the memo grow without bound
+            self._permission_cache.pop(next(iter(self._permission_cache)))
+        self._permission_cache[path] = permissions
+        return permissions
+
+
+class AuthenticationMiddleware:
+    """
+    JWT and API Key authentication middleware
+
+    Implemented as a pure ASGI middleware: public paths are passed straight
+    through without building a request object, and the response body is
+    never wrapped or buffered, so streaming responses and WebSocket
+    connections keep their native behaviour.
+
+    When ``jwt_service``/``vault_client`` are not supplied they are resolved
+    from ``app.state`` on each request, which lets the middleware be
+    installed at import time and the services be created during startup.
+    """
     
-    def __init__(self, app, jwt_service: JWTService, vault_client: VaultClient):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        jwt_service: Optional[JWTService] = None,
+        vault_client: Optional[VaultClient] = None,
+        route_table: Optional[AuthRouteTable] = None
+    ):
+        self.app = app
         self.jwt_service = jwt_service
         self.vault_client = vault_client
-        
-        # Paths that don't require authentication
-        self.public_paths = [
-            "/",
-            "/docs",
-            "/openapi.json",
-            "/redoc",
-            "/healthz",
-            "/metrics",
-            "/auth/login",
-            "/auth/refresh"
-        ]
-        
-        # Paths that require specific permissions
-        self.protected_paths = {
-            r"/calls/.*": [Permission.CALL_START, Permission.CALL_VIEW],
-            r"/hotels/.*": [Permission.HOTEL_VIEW],
-            r"/admin/.*": [Permission.SYSTEM_ADMIN],
-            r"/auth/api-keys.*": [Permission.SYSTEM_ADMIN],
-        }
+        self.route_table = route_table or AuthRouteTable()
     
-    async def dispatch(self, request: Request, call_next):
-        """Process authentication for each request"""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process authentication for each HTTP request and WebSocket connection"""
+        
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
         
         # Skip authentication for public paths
-        if self._is_public_path(request.url.path):
-            return await call_next(request)
+        if self.route_table.is_public(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        
+        request = HTTPConnection(scope)
+        error_response = await self._authenticate_and_authorize(request)
+        
+        if error_response is not None:
+            if scope["type"] == "websocket":
+                # Policy violation; the handshake is rejected before accept
+                await send({"type": "websocket.close", "code": 1008})
+            else:
+                await error_response(scope, receive, send)
+            return
+        
+        if scope["type"] == "websocket":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in AUTH_RESPONSE_HEADERS:
+                    headers[name] = value
+            await send(message)
+        
+        await self.app(scope, receive, send_with_security_headers)
+    
+    async def _authenticate_and_authorize(self, request: HTTPConnection) -> Optional[JSONResponse]:
+        """Authenticate and authorize the request, returning an error response on failure"""
         
         try:
             # Extract and validate authentication
@@ -68,117 +188,117 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             
             # Check authorization for protected paths
             await self._authorize_request(request, auth_context)
-            
-            # Process request
-            response = await call_next(request)
-            
-            # Add security headers
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["X-Frame-Options"] = "DENY"
-            response.headers["X-XSS-Protection"] = "1; mode=block"
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-            
-            return response
+            return None
             
         except AuthenticationError as e:
             logger.warning(
                 "authentication_failed",
                 path=request.url.path,
-                method=request.method,
+                method=request.scope.get("method", "WEBSOCKET"),
                 error=str(e),
                 user_agent=request.headers.get("User-Agent", "unknown")
             )
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "error": {
-                        "code": "AUTHENTICATION_ERROR",
-                        "message": str(e),
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                }
-            )
+            return self._error_response(401, "AUTHENTICATION_ERROR", str(e))
         
         except AuthorizationError as e:
+            auth_context = getattr(request.state, 'auth_context', None)
             logger.warning(
                 "authorization_failed",
                 path=request.url.path,
-                method=request.method,
+                method=request.scope.get("method", "WEBSOCKET"),
                 error=str(e),
-                user_id=getattr(request.state, 'auth_context', {}).get('user_id', 'unknown')
-            )
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "error": {
-                        "code": "AUTHORIZATION_ERROR",
-                        "message": str(e),
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                }
+                user_id=getattr(auth_context, 'user_id', None)
+                or getattr(auth_context, 'service_name', 'unknown')
             )
+            return self._error_response(403, "AUTHORIZATION_ERROR", str(e))
         
         except Exception as e:
             logger.error(
                 "auth_middleware_error",
                 path=request.url.path,
-                method=request.method,
+                method=request.scope.get("method", "WEBSOCKET"),
                 error=str(e)
             )
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": {
-                        "code": "INTERNAL_ERROR",
-                        "message": "Authentication service error",
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
+            return self._error_response(500, "INTERNAL_ERROR", "Authentication service error")
+    
+    @staticmethod
+    def _error_response(status_code: int, code: str, message: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": {
+                    "code": code,
+                    "message": message,
+                    "timestamp": datetime.utcnow().isoformat()
                 }
-            )
+            }
+        )
     
     def _is_public_path(self, path: str) -> bool:
         """Check if path is public (doesn't require authentication)"""
-        return any(path.startswith(public_path) for public_path in self.public_paths)
+        return self.route_table.is_public(path)
     
-    async def _authenticate_request(self, request: Request) -> Union[UserContext, ServiceContext]:
+    def _resolve_services(self, request: HTTPConnection) -> Tuple[Optional[JWTService], Optional[VaultClient]]:
+        """Resolve auth services, falling back to those registered on app.state"""
+        jwt_service = self.jwt_service
+        vault_client = self.vault_client
+        
+        if jwt_service is None or vault_client is None:
+            state = getattr(request.scope.get("app"), "state", None)
+            jwt_service = jwt_service or getattr(state, "jwt_service", None)
+            vault_client = vault_client or getattr(state, "vault_client", None)
+        
+        return jwt_service, vault_client
+    
+    async def _authenticate_request(self, request: HTTPConnection) -> Union[UserContext, ServiceContext]:
         """Authenticate request using JWT or API key"""
         
+        jwt_service, vault_client = self._resolve_services(request)
+        
         # Try Authorization header first
         auth_header = request.headers.get("Authorization")
         if auth_header:
             if auth_header.startswith("Bearer "):
                 token = auth_header[7:]  # Remove "Bearer " prefix
-                return await self._authenticate_jwt(token)
+                return await self._authenticate_jwt(token, jwt_service)
             elif auth_header.startswith("ApiKey "):
                 api_key = auth_header[7:]  # Remove "ApiKey " prefix
-                return await self._authenticate_api_key(api_key)
+                return await self._authenticate_api_key(api_key, vault_client)
         
         # Try X-API-Key header
         api_key = request.headers.get("X-API-Key")
         if api_key:
-            return await self._authenticate_api_key(api_key)
+            return await self._authenticate_api_key(api_key, vault_client)
         
         raise AuthenticationError("No valid authentication provided")
     
-    async def _authenticate_jwt(self, token: str) -> UserContext:
+    async def _authenticate_jwt(self, token: str, jwt_service: Optional[JWTService] = None) -> UserContext:
         """Authenticate using JWT token"""
+        jwt_service = jwt_service or self.jwt_service
+        if jwt_service is None:
+            raise RuntimeError("JWT service not initialized")
+        
         try:
-            return await self.jwt_service.validate_token(token)
+            return await jwt_service.validate_token(token)
         except Exception as e:
             raise AuthenticationError(f"JWT validation failed: {str(e)}")
     
-    async def _authenticate_api_key(self, api_key: str) -> ServiceContext:
+    async def _authenticate_api_key(self, api_key: str, vault_client: Optional[VaultClient] = None) -> ServiceContext:
         """Authenticate using API key"""
+        vault_client = vault_client or self.vault_client
+        if vault_client is None:
+            raise RuntimeError("Vault client not initialized")
+        
         try:
-            return await self.vault_client.validate_api_key(api_key)
+            return await vault_client.validate_api_key(api_key)
         except Exception as e:
             raise AuthenticationError(f"API key validation failed: {str(e)}")
     
-    async def _authorize_request(self, request: Request, auth_context: Union[UserContext, ServiceContext]):
+    async def _authorize_request(self, request: HTTPConnection, auth_context: Union[UserContext, ServiceContext]):
         """Check if authenticated user/service has permission for the request"""
         
         path = request.url.path
-        method = request.method
+        method = request.scope.get("method", "WEBSOCKET")
         
         # Check path-based permissions
         required_permissions = self._get_required_permissions(path)
@@ -200,12 +320,9 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     
     def _get_required_permissions(self, path: str) -> List[Permission]:
         """Get required permissions for a path"""
-        for pattern, permissions in self.protected_paths.items():
-            if re.match(pattern, path):
-                return permissions
-        return []
+        return self.route_table.required_permissions(path)
     
-    async def _authorize_user_request(self, request: Request, user_context: UserContext):
+    async def _authorize_user_request(self, request: HTTPConnection, user_context: UserContext):
         """Additional authorization checks for user requests"""
         
         # Hotel-specific authorization
@@ -215,13 +332,13 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             if hotel_id and hotel_id not in user_context.hotel_ids:
                 raise AuthorizationError(f"Access denied to hotel {hotel_id}")
     
-    async def _authorize_service_request(self, request: Request, service_context: ServiceContext):
+    async def _authorize_service_request(self, request: HTTPConnection, service_context: ServiceContext):
         """Additional authorization checks for service requests"""
         
         # Service-specific rate limiting and restrictions can be added here
         pass
     
-    def _extract_hotel_id(self, request: Request) -> Optional[str]:
+    def _extract_hotel_id(self, request: HTTPConnection) -> Optional[str]:
         """Extract hotel ID from request path or parameters"""
         
         # Try to extract from path like /hotels/{hotel_id}/...
@@ -17,7 +17,7 @@ import redis.asyncio as redis
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 from openai import AzureOpenAI
 
-from connectors import ConnectorFactory
+from connectors import ConnectorFactory, RequestPriority, pms_request_context
 from services.orchestrator.utils import PIIRedactor
 from services.orchestrator.tts_client import TTSClient, TTSSynthesisResponse
 from services.orchestrator.enhanced_intent_detection_service import EnhancedIntentDetectionService
@@ -33,6 +33,10 @@ from services.orchestrator.logging_adapter import get_safe_logger
 logger = get_safe_logger(__name__)
 pii_redactor = PIIRedactor()
 
+# PMS requests made while a guest is on the line jump the rate governor's
+# queue, and fail fast rather than wait longer than this for a slot
+PMS_CALL_DEADLINE_SECONDS = float(os.getenv("PMS_CALL_DEADLINE_SECONDS", "5"))
+
 
 class CallState(str, Enum):
     """Enumeration of call states"""
@@ -710,39 +714,40 @@ class CallManager:
             except Exception as e:
                 logger.error("failed_to_get_pms_connector", error=str(e))
 
-        # Handle enhanced hotel functions
-        if function_name == "create_reservation":
-            return await self._handle_create_reservation(args, connector)
-        elif function_name == "modify_reservation":
-            return await self._handle_modify_reservation(args, connector)
-        elif function_name == "cancel_reservation":
-            return await self._handle_cancel_reservation(args, connector)
-        elif function_name == "check_availability":
-            return await self._handle_check_availability(args, connector)
-        elif function_name == "get_reservation":
-            return await self._handle_get_reservation(args, connector)
-        elif function_name == "get_upselling_options":
-            return await self._handle_get_upselling_options(args, connector, context)
-        elif function_name == "process_upsell":
-            return await self._handle_process_upsell(args, connector, context)
-        elif function_name == "book_restaurant":
-            return await self._handle_book_restaurant(args, connector)
-        elif function_name == "book_spa_service":
-            return await self._handle_book_spa_service(args, connector)
-        elif function_name == "request_room_service":
-            return await self._handle_request_room_service(args, connector)
-        elif function_name == "handle_complaint":
-            return await self._handle_complaint(args, connector, context)
-        elif function_name == "get_concierge_recommendations":
-            return await self._handle_concierge_recommendations(args, context)
-        elif function_name == "transfer_to_human":
-            return await self._handle_transfer_to_human(args, context)
-        elif function_name == "get_hotel_info":
-            return await self._handle_get_hotel_info(args, connector)
-        elif function_name == "process_payment":
-            return await self._handle_process_payment(args, connector)
-        else:
-            return {"error": f"Unknown function: {function_name}", "success": False}
+        # Handle enhanced hotel functions as call-critical PMS traffic
+        with pms_request_context(RequestPriority.CRITICAL, timeout=PMS_CALL_DEADLINE_SECONDS):
+            if function_name == "create_reservation":
+                return await self._handle_create_reservation(args, connector)
+            elif function_name == "modify_reservation":
+                return await self._handle_modify_reservation(args, connector)
+            elif function_name == "cancel_reservation":
+                return await self._handle_cancel_reservation(args, connector)
+            elif function_name == "check_availability":
+                return await self._handle_check_availability(args, connector)
+            elif function_name == "get_reservation":
+                return await self._handle_get_reservation(args, connector)
+            elif function_name == "get_upselling_options":
+                return await self._handle_get_upselling_options(args, connector, context)
+            elif function_name == "process_upsell":
+                return await self._handle_process_upsell(args, connector, context)
+            elif function_name == "book_restaurant":
+                return await self._handle_book_restaurant(args, connector)
+            elif function_name == "book_spa_service":
+                return await self._handle_book_spa_service(args, connector)
+            elif function_name == "request_room_service":
+                return await self._handle_request_room_service(args, connector)
+            elif function_name == "handle_complaint":
+                return await self._handle_complaint(args, connector, context)
+            elif function_name == "get_concierge_recommendations":
+                return await self._handle_concierge_recommendations(args, context)
+            elif function_name == "transfer_to_human":
+                return await self._handle_transfer_to_human(args, context)
+            elif function_name == "get_hotel_info":
+                return await self._handle_get_hotel_info(args, connector)
+            elif function_name == "process_payment":
+                return await self._handle_process_payment(args, connector)
+            else:
+                return {"error": f"Unknown function: {function_name}", "success": False}
     
 # Note: Old _call_openai_with_functions method replaced by _call_openai_with_enhanced_functions
     
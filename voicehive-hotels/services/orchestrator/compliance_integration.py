@@ -47,13 +47,16 @@ class ComplianceIntegrationManager:
     def __init__(self, 
                  db_session: AsyncSession,
                  audit_logger: Optional[AuditLogger] = None,
-                 config_path: Optional[str] = None):
+                 config_path: Optional[str] = None,
+                 partition_manager=None):
         self.db = db_session
         self.audit_logger = audit_logger or AuditLogger()
         
         # Initialize all compliance components
         self.gdpr_manager = GDPRComplianceManager(db_session, audit_logger, config_path)
-        self.retention_enforcer = DataRetentionEnforcer(db_session, audit_logger, config_path)
+        self.retention_enforcer = DataRetentionEnforcer(
+            db_session, audit_logger, config_path, partition_manager=partition_manager
+        )
         self.classification_engine = DataClassificationEngine(audit_logger, config_path)
         self.evidence_collector = ComplianceEvidenceCollector(db_session, audit_logger, config_path)
         self.monitoring_system = ComplianceMonitoringSystem(db_session, audit_logger, config_path)
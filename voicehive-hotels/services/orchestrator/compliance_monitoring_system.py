@@ -1107,11 +1107,12 @@ class ComplianceMonitoringSystem:
                     escalation_level = :escalation_level,
                     notifications_sent = :notifications_sent,
                     updated_at = :updated_at
-                WHERE violation_id = :violation_id
+                WHERE violation_id = :violation_id AND detected_at = :detected_at
             """)
             
             await self.db.execute(query, {
                 "violation_id": violation.violation_id,
+                "detected_at": violation.detected_at,
                 "status": violation.status,
                 "assigned_to": violation.assigned_to,
                 "resolved_at": violation.resolved_at,
@@ -34,6 +34,7 @@ CREATE TABLE IF NOT EXISTS gdpr_erasure_requests (
     verification_token VARCHAR(255),
     verification_expires TIMESTAMP WITH TIME ZONE,
     completed_at TIMESTAMP WITH TIME ZONE,
+    progress JSONB NOT NULL DEFAULT '{}', -- per work item state, see gdpr_erasure_executor.py
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     
     INDEX idx_gdpr_erasure_data_subject (data_subject_id),
@@ -67,9 +68,9 @@ CREATE TABLE IF NOT EXISTS data_retention_policies (
     INDEX idx_retention_policy_action (action)
 );
 
--- Data Retention Records
+-- Data Retention Records (monthly range partitions on created_at, see database/partition_manager.py)
 CREATE TABLE IF NOT EXISTS data_retention_records (
-    record_id VARCHAR(36) PRIMARY KEY,
+    record_id VARCHAR(36) NOT NULL,
     data_subject_id VARCHAR(255),
     data_category VARCHAR(100) NOT NULL,
     policy_id VARCHAR(36) NOT NULL,
@@ -88,12 +89,13 @@ CREATE TABLE IF NOT EXISTS data_retention_records (
     error_message TEXT,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     
+    PRIMARY KEY (record_id, created_at),
     FOREIGN KEY (policy_id) REFERENCES data_retention_policies(policy_id),
     INDEX idx_retention_record_subject (data_subject_id),
     INDEX idx_retention_record_policy (policy_id),
     INDEX idx_retention_record_expires (expires_at),
     INDEX idx_retention_record_status (status)
-);
+) PARTITION BY RANGE (created_at);
 
 -- Compliance Monitoring Rules
 CREATE TABLE IF NOT EXISTS compliance_monitoring_rules (
@@ -123,9 +125,9 @@ CREATE TABLE IF NOT EXISTS compliance_monitoring_rules (
     INDEX idx_monitoring_rule_severity (severity)
 );
 
--- Compliance Violations
+-- Compliance Violations (monthly range partitions on detected_at)
 CREATE TABLE IF NOT EXISTS compliance_violations (
-    violation_id VARCHAR(36) PRIMARY KEY,
+    violation_id VARCHAR(36) NOT NULL,
     rule_id VARCHAR(36) NOT NULL,
     violation_type VARCHAR(100) NOT NULL,
     framework VARCHAR(50) NOT NULL,
@@ -152,13 +154,13 @@ CREATE TABLE IF NOT EXISTS compliance_violations (
     notifications_sent JSONB,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     
+    PRIMARY KEY (violation_id, detected_at),
     FOREIGN KEY (rule_id) REFERENCES compliance_monitoring_rules(rule_id),
     INDEX idx_violation_rule (rule_id),
     INDEX idx_violation_framework (framework),
     INDEX idx_violation_status (status),
-    INDEX idx_violation_severity (severity),
-    INDEX idx_violation_detected (detected_at)
-);
+    INDEX idx_violation_severity (severity)
+) PARTITION BY RANGE (detected_at);
 
 -- Compliance Evidence Items
 CREATE TABLE IF NOT EXISTS compliance_evidence_items (
@@ -244,9 +246,9 @@ CREATE TABLE IF NOT EXISTS data_classification_results (
     INDEX idx_classification_analyzed (analyzed_at)
 );
 
--- PII Detections
+-- PII Detections (monthly range partitions on detected_at)
 CREATE TABLE IF NOT EXISTS pii_detections (
-    detection_id VARCHAR(36) PRIMARY KEY,
+    detection_id VARCHAR(36) NOT NULL,
     content_id VARCHAR(36) NOT NULL,
     pii_type VARCHAR(100) NOT NULL,
     value_hash VARCHAR(255), -- Hashed value for privacy
@@ -262,13 +264,105 @@ CREATE TABLE IF NOT EXISTS pii_detections (
     detected_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     detector_version VARCHAR(50) DEFAULT '1.0',
     
+    PRIMARY KEY (detection_id, detected_at),
     FOREIGN KEY (content_id) REFERENCES data_classification_results(content_id),
     INDEX idx_pii_content (content_id),
     INDEX idx_pii_type (pii_type),
-    INDEX idx_pii_sensitivity (sensitivity_level),
-    INDEX idx_pii_detected (detected_at)
+    INDEX idx_pii_sensitivity (sensitivity_level)
+) PARTITION BY RANGE (detected_at);
+
+-- Audit Logs (written in batches by audit_pipeline.py; daily range partitions on timestamp)
+-- Unique keys on a partitioned table must include the partition key.
+CREATE TABLE IF NOT EXISTS audit_logs (
+    sequence_number BIGSERIAL NOT NULL,
+    event_id VARCHAR(36) NOT NULL,
+    event_type VARCHAR(100) NOT NULL,
+    event_category VARCHAR(50) NOT NULL,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+    severity VARCHAR(20) NOT NULL,
+    description TEXT NOT NULL,
+    user_id VARCHAR(255),
+    session_id VARCHAR(255),
+    correlation_id VARCHAR(255),
+    client_ip VARCHAR(45),
+    service_name VARCHAR(100),
+    resource_type VARCHAR(100),
+    resource_id VARCHAR(255),
+    action VARCHAR(50),
+    success BOOLEAN NOT NULL DEFAULT TRUE,
+    error_code VARCHAR(100),
+    error_message TEXT,
+    metadata JSONB,
+    gdpr_lawful_basis VARCHAR(50),
+    data_subject_id VARCHAR(255),
+    retention_period INTEGER,
+    checksum VARCHAR(64) NOT NULL,
+    -- Hash chain (see audit_hash_chain.py): chain_hash = sha256(prev_hash || checksum)
+    chain_partition VARCHAR(255) NOT NULL,
+    chain_position BIGINT NOT NULL,
+    prev_hash VARCHAR(64) NOT NULL,
+    chain_hash VARCHAR(64) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    modified_at TIMESTAMP WITH TIME ZONE,
+    
+    PRIMARY KEY (sequence_number, timestamp),
+    UNIQUE (event_id, timestamp),
+    UNIQUE (chain_partition, chain_position, timestamp),
+    INDEX idx_audit_logs_chain (chain_partition, chain_position),
+    INDEX idx_audit_logs_category (event_category),
+    INDEX idx_audit_logs_user (user_id)
+) PARTITION BY RANGE (timestamp);
+
+-- Merkle checkpoints over verified ranges of an audit_logs hash chain
+CREATE TABLE IF NOT EXISTS audit_chain_checkpoints (
+    checkpoint_id VARCHAR(36) PRIMARY KEY,
+    chain_partition VARCHAR(255) NOT NULL,
+    start_position BIGINT NOT NULL,
+    end_position BIGINT NOT NULL,
+    merkle_root VARCHAR(64) NOT NULL,
+    chain_hash VARCHAR(64) NOT NULL, -- chain_hash of the row at end_position
+    leaf_count INTEGER NOT NULL,
+    verified_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    
+    UNIQUE (chain_partition, end_position),
+    INDEX idx_audit_checkpoints_partition (chain_partition, end_position)
+);
+
+-- Interior Merkle tree levels of each checkpoint (leaves are the rows'
+-- chain_hash values), so an inclusion proof reads only its sibling path
+CREATE TABLE IF NOT EXISTS audit_chain_checkpoint_nodes (
+    checkpoint_id VARCHAR(36) NOT NULL REFERENCES audit_chain_checkpoints(checkpoint_id) ON DELETE CASCADE,
+    level SMALLINT NOT NULL,
+    node_index BIGINT NOT NULL,
+    node_hash VARCHAR(64) NOT NULL,
+    
+    PRIMARY KEY (checkpoint_id, level, node_index)
 );
 
+-- Partitioning
+-- Dated partitions are pre-created and dropped at end of retention by
+-- database/partition_manager.py; the DEFAULT partitions only catch rows that
+-- arrive before their range exists. Indexes declared on the parent cascade to
+-- every partition, and BRIN suits append-only timestamps at a fraction of a
+-- B-tree's size.
+CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT;
+CREATE TABLE IF NOT EXISTS pii_detections_default PARTITION OF pii_detections DEFAULT;
+CREATE TABLE IF NOT EXISTS data_retention_records_default PARTITION OF data_retention_records DEFAULT;
+CREATE TABLE IF NOT EXISTS compliance_violations_default PARTITION OF compliance_violations DEFAULT;
+
+-- A unique constraint on a partitioned table must include the partition key,
+-- so the parent's UNIQUE (..., timestamp) only rejects duplicates with the
+-- same timestamp. The partition manager adds these per-partition indexes to
+-- every dated audit_logs partition; the DEFAULT partition gets them here.
+CREATE UNIQUE INDEX IF NOT EXISTS audit_logs_default_chain_partition_chain_position_key
+    ON audit_logs_default (chain_partition, chain_position);
+CREATE UNIQUE INDEX IF NOT EXISTS audit_logs_default_event_id_key ON audit_logs_default (event_id);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp_brin ON audit_logs USING BRIN (timestamp);
+CREATE INDEX IF NOT EXISTS idx_pii_detected_brin ON pii_detections USING BRIN (detected_at);
+CREATE INDEX IF NOT EXISTS idx_retention_record_created_brin ON data_retention_records USING BRIN (created_at);
+CREATE INDEX IF NOT EXISTS idx_violation_detected_brin ON compliance_violations USING BRIN (detected_at);
+
 -- Create views for compliance reporting
 CREATE OR REPLACE VIEW compliance_dashboard_summary AS
 SELECT 
@@ -292,12 +386,12 @@ SELECT
     COUNT(CASE WHEN severity = 'critical' AND status = 'open' THEN 1 END) as expired_count
 FROM compliance_violations;
 
--- Create indexes for performance
-CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_gdpr_search 
+-- Create indexes for performance (CONCURRENTLY is not supported on partitioned parents)
+CREATE INDEX IF NOT EXISTS idx_audit_logs_gdpr_search 
 ON audit_logs (timestamp, event_type, data_subject_id) 
 WHERE data_subject_id IS NOT NULL;
 
-CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_logs_retention_search 
+CREATE INDEX IF NOT EXISTS idx_audit_logs_retention_search 
 ON audit_logs (timestamp, resource_type, action) 
 WHERE action IN ('create', 'update', 'delete');
 
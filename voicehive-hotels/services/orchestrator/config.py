@@ -76,6 +76,12 @@ class DatabaseConfig(BaseModel):
     ssl_mode: str = Field(default="require", description="SSL mode")
     pool_size: int = Field(default=10, ge=1, le=100, description="Connection pool size")
     max_overflow: int = Field(default=20, ge=0, le=100, description="Max pool overflow")
+    prepared_statements: bool = Field(
+        default=True,
+        description="Use server-side prepared statements; disable behind PgBouncer "
+                    "transaction pooling without max_prepared_statements (< 1.21)"
+    )
+    statement_cache_size: int = Field(default=256, ge=1, le=10000, description="Prepared statements cached per connection")
     
     @field_validator('ssl_mode')
     @classmethod
@@ -50,6 +50,9 @@ async def app_lifespan(app: FastAPI):
         # Initialize performance optimization components
         await _initialize_performance_components(app)
         
+        # Keep dated partitions of the audit and compliance tables ahead of time
+        await _initialize_partition_manager(app)
+        
         # Initialize core services
         await _initialize_core_services(app)
         
@@ -84,6 +87,10 @@ async def app_lifespan(app: FastAPI):
             await app.state.audio_optimizer.close()
             logger.info("audio_optimizer_closed")
         
+        # Stop partition maintenance before the pools it uses go away
+        if getattr(app.state, 'partition_manager', None):
+            await app.state.partition_manager.shutdown()
+        
         # Close cache manager
         if hasattr(app.state, 'cache_manager'):
             await app.state.cache_manager.close_all()
@@ -94,6 +101,10 @@ async def app_lifespan(app: FastAPI):
             await app.state.connection_pool_manager.close_all()
             logger.info("connection_pools_closed")
         
+        # Stop PMS credential renewal
+        if hasattr(app.state, 'connector_factory'):
+            await app.state.connector_factory.close_credentials()
+        
         # Close call manager and TTS client
         if hasattr(app.state, 'call_manager'):
             if hasattr(app.state.call_manager, 'tts_client'):
@@ -180,6 +191,33 @@ async def _initialize_performance_components(app: FastAPI):
     logger.info("performance_monitoring_initialized")
 
 
+async def _initialize_partition_manager(app: FastAPI):
+    """Create upcoming partitions and start retention-driven partition drops"""
+    pool_manager = getattr(app.state, 'connection_pool_manager', None)
+    db_pool = pool_manager.get_database_pool("default") if pool_manager else None
+    app.state.partition_manager = None
+    if db_pool is None:
+        logger.info("partition_manager_skipped", reason="no_database_pool")
+        return
+    
+    partition_manager = None
+    try:
+        from database.partition_manager import PartitionManager
+        partition_manager = PartitionManager(db_pool)
+        await partition_manager.initialize(
+            interval_seconds=int(os.getenv("PARTITION_MAINTENANCE_INTERVAL", "3600"))
+        )
+    except Exception as e:
+        # Rows land in the DEFAULT partitions until maintenance succeeds
+        logger.error("partition_manager_init_failed", error=str(e))
+        if partition_manager:
+            await partition_manager.shutdown()
+        return
+    
+    app.state.partition_manager = partition_manager
+    logger.info("partition_manager_initialized")
+
+
 async def _initialize_core_services(app: FastAPI):
     """Initialize core application services"""
     logger.info("initializing_core_services")
@@ -193,6 +231,7 @@ async def _initialize_core_services(app: FastAPI):
     # Initialize connector factory
     from connectors import ConnectorFactory
     app.state.connector_factory = ConnectorFactory()
+    await _prefetch_pms_credentials(app)
     
     # Initialize call manager with optimized TTS client
     app.state.call_manager = CallManager(
@@ -212,6 +251,27 @@ async def _initialize_core_services(app: FastAPI):
     logger.info("core_services_initialized")
 
 
+async def _prefetch_pms_credentials(app: FastAPI):
+    """Load Vault credentials for all active hotels so connector creation stays off Vault"""
+    pool_manager = getattr(app.state, 'connection_pool_manager', None)
+    db_pool = pool_manager.get_database_pool("default") if pool_manager else None
+    if db_pool is None:
+        logger.info("pms_credential_prefetch_skipped", reason="no_database_pool")
+        return
+    
+    try:
+        async with db_pool.acquire() as conn:
+            rows = await conn.fetch("SELECT pms_type, id FROM hotels WHERE active")
+        
+        summary = await app.state.connector_factory.prefetch_credentials(
+            [(row["pms_type"], row["id"]) for row in rows]
+        )
+        logger.info("pms_credentials_prefetched", **summary)
+    except Exception as e:
+        # Connectors fall back to on-demand Vault reads
+        logger.warning("pms_credential_prefetch_failed", error=str(e))
+
+
 async def _initialize_auth_services(app: FastAPI):
     """Initialize authentication services"""
     logger.info("initializing_auth_services")
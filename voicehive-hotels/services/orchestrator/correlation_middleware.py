@@ -3,10 +3,10 @@ Correlation ID middleware for distributed request tracing
 """
 
 import uuid
-from typing import Callable, Optional
+from typing import Optional
 from contextvars import ContextVar
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from logging_adapter import get_safe_logger
 
@@ -16,7 +16,7 @@ logger = get_safe_logger("correlation_middleware")
 correlation_id_context: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """
     Middleware to handle correlation IDs for distributed tracing
     
@@ -26,70 +26,80 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     3. Stores it in context for use throughout the request
     4. Adds it to response headers
     5. Ensures it's available for logging
+    
+    Implemented as pure ASGI so the response body is streamed through
+    untouched; only the ``http.response.start`` message is amended.
     """
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         header_name: str = "X-Correlation-ID",
         response_header_name: Optional[str] = None,
         generate_if_missing: bool = True
     ):
-        super().__init__(app)
+        self.app = app
         self.header_name = header_name
         self.response_header_name = response_header_name or header_name
         self.generate_if_missing = generate_if_missing
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add correlation ID handling"""
         
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        
         # Extract correlation ID from request headers
-        correlation_id = request.headers.get(self.header_name)
+        incoming_id = Headers(scope=scope).get(self.header_name)
+        correlation_id = incoming_id
         
         # Generate new correlation ID if missing and generation is enabled
         if not correlation_id and self.generate_if_missing:
             correlation_id = str(uuid.uuid4())
         
+        if not correlation_id:
+            await self.app(scope, receive, send)
+            return
+        
         # Store correlation ID in context
-        if correlation_id:
-            correlation_id_context.set(correlation_id)
-            
-            # Add to request state for easy access
-            request.state.correlation_id = correlation_id
-            
-            logger.debug(
-                "correlation_id_set",
-                correlation_id=correlation_id,
-                path=request.url.path,
-                method=request.method,
-                source="header" if request.headers.get(self.header_name) else "generated"
-            )
+        token = correlation_id_context.set(correlation_id)
+        
+        # Add to request state for easy access
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        
+        logger.debug(
+            "correlation_id_set",
+            correlation_id=correlation_id,
+            path=scope["path"],
+            method=scope.get("method", "WEBSOCKET"),
+            source="header" if incoming_id else "generated"
+        )
+        
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.response_header_name] = correlation_id
+            await send(message)
         
         try:
             # Process the request
-            response = await call_next(request)
-            
-            # Add correlation ID to response headers
-            if correlation_id:
-                response.headers[self.response_header_name] = correlation_id
-            
-            return response
+            await self.app(scope, receive, send_with_correlation_id)
             
         except Exception as e:
             # Ensure correlation ID is available even for error responses
             logger.error(
                 "request_processing_error",
                 correlation_id=correlation_id,
-                path=request.url.path,
-                method=request.method,
+                path=scope["path"],
+                method=scope.get("method", "WEBSOCKET"),
                 error=str(e),
                 error_type=type(e).__name__
             )
             raise
         
         finally:
-            # Clear correlation ID from context
-            correlation_id_context.set(None)
+            # Restore the previous correlation ID context
+            correlation_id_context.reset(token)
 
 
 def get_correlation_id() -> Optional[str]:
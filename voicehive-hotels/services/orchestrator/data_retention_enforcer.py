@@ -10,13 +10,13 @@ from typing import Dict, List, Any, Optional, Set, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 from pathlib import Path
-import uuid
 import crontab
 
 from pydantic import BaseModel, Field, validator
 from sqlalchemy import text, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from logging_adapter import get_safe_logger
@@ -57,6 +57,37 @@ class RetentionStatus(str, Enum):
     FAILED = "failed"
 
 
+# enforcement results counter for each action
+_ACTION_COUNTERS = {
+    RetentionAction.DELETE: "deleted",
+    RetentionAction.ARCHIVE: "archived",
+    RetentionAction.ANONYMIZE: "anonymized",
+    RetentionAction.QUARANTINE: "quarantined",
+}
+
+# Record status once an action has completed (DELETED otherwise)
+_FINAL_STATUS = {
+    RetentionAction.ARCHIVE: RetentionStatus.ARCHIVED,
+    RetentionAction.NOTIFY: RetentionStatus.EXPIRED,
+}
+
+# SQL replacement values for PII columns, applied to whichever exist on a table
+ANONYMIZATION_EXPRESSIONS = {
+    "email": "'anonymized_email_' || substr(md5(random()::text), 1, 8) || '@anonymized.local'",
+    "phone": "'+1-XXX-XXX-XXXX'",
+    "name": "'Anonymized User'",
+    "ip_address": "'0.0.0.0'",
+    "user_agent": "'Anonymized Browser'",
+}
+
+
+def _json_list(value: Any) -> List[str]:
+    """JSONB list columns arrive as text or already decoded depending on the driver"""
+    if value is None:
+        return []
+    return json.loads(value) if isinstance(value, (str, bytes)) else list(value)
+
+
 @dataclass
 class RetentionPolicy:
     """Data retention policy configuration"""
@@ -159,15 +190,27 @@ class DataRetentionEnforcer:
     def __init__(self, 
                  db_session: AsyncSession,
                  audit_logger: Optional[AuditLogger] = None,
-                 config_path: Optional[str] = None):
+                 config_path: Optional[str] = None,
+                 partition_manager=None,
+                 session_factory: Optional[Callable[[], AsyncSession]] = None):
         self.db = db_session
         self.audit_logger = audit_logger or AuditLogger()
         
+        # Independent sessions let retention chunks run in parallel
+        self.session_factory = session_factory
+        
+        # Optional database.partition_manager.PartitionManager for range-partitioned tables
+        self.partition_manager = partition_manager
+        
         # Load configuration
         self.config = self._load_config(config_path)
         
         # Initialize storage clients
         self.s3_client = self._init_s3_client()
+        self.transfer_config = TransferConfig(**self.config["bulk_enforcement"]["transfer"])
+        
+        # Column names per table, for set-based anonymization
+        self._table_columns: Dict[str, Set[str]] = {}
         
         # Policy and record storage
         self.policies: Dict[str, RetentionPolicy] = {}
@@ -321,6 +364,11 @@ class DataRetentionEnforcer:
                     results["errors"].append(error_msg)
                     logger.error(error_msg)
             
+            # Partitioned tables expire whole time ranges at once
+            if self.partition_manager:
+                dropped = await self.partition_manager.drop_expired_partitions(dry_run=dry_run)
+                results["partitions_dropped"] = {table: names for table, names in dropped.items() if names}
+            
             results["completed_at"] = datetime.now(timezone.utc).isoformat()
             results["duration_seconds"] = (datetime.now(timezone.utc) - enforcement_start).total_seconds()
             results["status"] = "success" if not results["errors"] else "partial_success"
@@ -462,7 +510,15 @@ class DataRetentionEnforcer:
         return stats
     
     async def _enforce_policy(self, policy: RetentionPolicy, dry_run: bool = False) -> Dict[str, Any]:
-        """Enforce a specific retention policy"""
+        """
+        Enforce a specific retention policy
+
+        Expired records are read from data_retention_records in keyset-paginated
+        chunks of ``policy.batch_size`` and each chunk is handled with set-based
+        statements. With a session factory, up to ``max_parallel_chunks`` chunks
+        run at once; ``chunk_pause_seconds`` spaces out chunk starts so retention
+        does not crowd out OLTP traffic.
+        """
         
         policy_results = {
             "policy_id": policy.policy_id,
@@ -478,294 +534,369 @@ class DataRetentionEnforcer:
             "notifications_sent": 0
         }
         
-        # Get expired records for this policy
-        expired_records = [
-            record for record in self.records.values()
-            if (record.policy_id == policy.policy_id and 
-                record.is_expired() and 
-                record.status == RetentionStatus.ACTIVE)
-        ]
+        bulk_settings = self.config["bulk_enforcement"]
+        parallel = self.session_factory is not None and not dry_run
+        semaphore = asyncio.Semaphore(bulk_settings["max_parallel_chunks"])
+        tasks = []
+        outcomes = []
         
-        policy_results["records_processed"] = len(expired_records)
+        async def run_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+            try:
+                async with self.session_factory() as session:
+                    return await self._process_chunk(session, policy, chunk, dry_run)
+            finally:
+                semaphore.release()
         
-        # Process records in batches
-        batch_size = policy.batch_size
-        for i in range(0, len(expired_records), batch_size):
-            batch = expired_records[i:i + batch_size]
+        async for chunk in self._iter_expired_chunks(policy, datetime.now(timezone.utc)):
+            policy_results["records_processed"] += len(chunk)
             
-            for record in batch:
-                try:
-                    if not dry_run:
-                        record.status = RetentionStatus.PROCESSING
-                        record.processing_started_at = datetime.now(timezone.utc)
-                        await self._update_retention_record(record)
-                    
-                    # Execute retention action
-                    action_result = await self._execute_retention_action(policy, record, dry_run)
-                    
-                    if action_result["success"]:
-                        policy_results["actions_taken"][policy.action.value] += 1
-                        
-                        if not dry_run:
-                            record.status = getattr(RetentionStatus, policy.action.value.upper(), RetentionStatus.DELETED)
-                            record.processing_completed_at = datetime.now(timezone.utc)
-                            await self._update_retention_record(record)
-                    else:
-                        policy_results["errors"].append(action_result["error"])
-                        
-                        if not dry_run:
-                            record.status = RetentionStatus.FAILED
-                            record.error_message = action_result["error"]
-                            await self._update_retention_record(record)
-                
-                except Exception as e:
-                    error_msg = f"Failed to process record {record.record_id}: {e}"
-                    policy_results["errors"].append(error_msg)
-                    logger.error(error_msg)
+            if parallel:
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(run_chunk(chunk)))
+            else:
+                outcomes.append(await self._process_chunk(self.db, policy, chunk, dry_run))
+            
+            if bulk_settings["chunk_pause_seconds"] and not dry_run:
+                await asyncio.sleep(bulk_settings["chunk_pause_seconds"])
+        
+        if tasks:
+            outcomes.extend(await asyncio.gather(*tasks))
+        
+        counter = _ACTION_COUNTERS.get(policy.action)
+        for outcome in outcomes:
+            if counter:
+                policy_results["actions_taken"][counter] += outcome["succeeded"]
+            policy_results["errors"].extend(outcome["errors"])
         
         return policy_results
     
-    async def _execute_retention_action(self, 
-                                      policy: RetentionPolicy, 
-                                      record: RetentionRecord, 
-                                      dry_run: bool = False) -> Dict[str, Any]:
-        """Execute the retention action for a specific record"""
+    async def _iter_expired_chunks(self, policy: RetentionPolicy, now: datetime):
+        """Yield expired active records for a policy, keyset-paginated on record_id"""
+        
+        query = text("""
+            SELECT record_id, created_at, data_subject_id, file_paths, database_tables
+            FROM data_retention_records
+            WHERE policy_id = :policy_id
+              AND status = 'active'
+              AND expires_at < :now
+              AND record_id > :after
+            ORDER BY record_id
+            LIMIT :limit
+        """)
+        
+        after = ""
+        while True:
+            result = await self.db.execute(query, {
+                "policy_id": policy.policy_id,
+                "now": now,
+                "after": after,
+                "limit": policy.batch_size
+            })
+            rows = result.mappings().fetchall()
+            if not rows:
+                return
+            
+            yield [
+                {
+                    "record_id": row["record_id"],
+                    "created_at": row["created_at"],
+                    "data_subject_id": row["data_subject_id"],
+                    "file_paths": _json_list(row["file_paths"]),
+                    "database_tables": _json_list(row["database_tables"])
+                }
+                for row in rows
+            ]
+            
+            if len(rows) < policy.batch_size:
+                return
+            after = rows[-1]["record_id"]
+    
+    async def _process_chunk(self,
+                             session: AsyncSession,
+                             policy: RetentionPolicy,
+                             chunk: List[Dict[str, Any]],
+                             dry_run: bool = False) -> Dict[str, Any]:
+        """Apply the policy action to one chunk of expired records"""
+        
+        outcome = {"succeeded": 0, "errors": []}
+        record_ids = [record["record_id"] for record in chunk]
         
-        result = {"success": False, "error": None, "details": {}}
+        if dry_run:
+            outcome["succeeded"] = len(chunk)
+            return outcome
         
         try:
-            if policy.action == RetentionAction.DELETE:
-                result = await self._delete_record_data(record, dry_run)
-            
-            elif policy.action == RetentionAction.ARCHIVE:
-                result = await self._archive_record_data(record, policy.archive_location, dry_run)
+            await self._set_chunk_status(session, chunk, RetentionStatus.PROCESSING)
             
+            if policy.action == RetentionAction.DELETE:
+                details = await self._bulk_delete(session, chunk)
             elif policy.action == RetentionAction.ANONYMIZE:
-                result = await self._anonymize_record_data(record, dry_run)
-            
+                details = await self._bulk_anonymize(session, chunk)
+            elif policy.action == RetentionAction.ARCHIVE:
+                details = await self._bulk_archive(session, chunk, policy.archive_location)
             elif policy.action == RetentionAction.QUARANTINE:
-                result = await self._quarantine_record_data(record, dry_run)
-            
+                details = await self._bulk_quarantine(session, chunk, policy)
             elif policy.action == RetentionAction.NOTIFY:
-                result = await self._notify_record_expiry(record, policy, dry_run)
-            
+                details = await self._bulk_notify(chunk, policy)
             else:
-                result["error"] = f"Unknown retention action: {policy.action}"
+                raise ValueError(f"Unknown retention action: {policy.action}")
+            
+            final_status = _FINAL_STATUS.get(policy.action, RetentionStatus.DELETED)
+            await self._set_chunk_status(session, chunk, final_status)
+            await session.commit()
             
-            # Audit the action
-            if not dry_run and result["success"]:
-                self.audit_logger.log_event(
-                    event_type=AuditEventType.DATA_DELETE if policy.action == RetentionAction.DELETE else AuditEventType.ADMIN_ACTION,
-                    description=f"Retention action executed: {policy.action.value} on {record.record_id}",
-                    severity=AuditSeverity.HIGH,
-                    resource_type="retention_record",
-                    resource_id=record.record_id,
-                    action=policy.action.value,
-                    success=result["success"],
-                    metadata={
-                        "policy_id": policy.policy_id,
-                        "data_category": record.data_category.value,
-                        "action_details": result["details"]
-                    },
-                    gdpr_lawful_basis=policy.lawful_basis.value,
-                    data_subject_id=record.data_subject_id
-                )
-        
         except Exception as e:
-            result["error"] = str(e)
-            logger.error(f"Retention action failed for record {record.record_id}: {e}")
-        
-        return result
-    
-    async def _delete_record_data(self, record: RetentionRecord, dry_run: bool = False) -> Dict[str, Any]:
-        """Delete data for a retention record"""
-        
-        result = {"success": True, "error": None, "details": {"files_deleted": [], "tables_updated": []}}
-        
-        try:
-            # Delete files from storage
-            for file_path in record.file_paths:
-                if dry_run:
-                    result["details"]["files_deleted"].append(f"[DRY RUN] {file_path}")
-                else:
-                    if file_path.startswith("s3://"):
-                        # S3 deletion
-                        bucket, key = self._parse_s3_path(file_path)
-                        self.s3_client.delete_object(Bucket=bucket, Key=key)
-                        result["details"]["files_deleted"].append(file_path)
-                    else:
-                        # Local file deletion
-                        Path(file_path).unlink(missing_ok=True)
-                        result["details"]["files_deleted"].append(file_path)
+            error_msg = f"Failed to process {len(chunk)} records for policy {policy.policy_id}: {e}"
+            outcome["errors"].append(error_msg)
+            logger.error(error_msg)
             
-            # Delete from database tables
-            for table in record.database_tables:
-                if dry_run:
-                    result["details"]["tables_updated"].append(f"[DRY RUN] DELETE FROM {table}")
-                else:
-                    query = text(f"DELETE FROM {table} WHERE record_id = :record_id")
-                    await self.db.execute(query, {"record_id": record.record_id})
-                    result["details"]["tables_updated"].append(table)
+            await session.rollback()
+            try:
+                await self._set_chunk_status(session, chunk, RetentionStatus.FAILED, error_message=str(e))
+                await session.commit()
+            except Exception as mark_error:
+                logger.error(f"Failed to mark records failed for policy {policy.policy_id}: {mark_error}")
+                await session.rollback()
             
-            if not dry_run:
-                await self.db.commit()
+            self._sync_cached_records(record_ids, RetentionStatus.FAILED, error_message=str(e))
+            return outcome
         
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
+        outcome["succeeded"] = len(chunk)
+        self._sync_cached_records(record_ids, final_status)
         
-        return result
-    
-    async def _archive_record_data(self, 
-                                 record: RetentionRecord, 
-                                 archive_location: Optional[str], 
-                                 dry_run: bool = False) -> Dict[str, Any]:
-        """Archive data for a retention record"""
+        # One audit event per chunk rather than per record
+        self.audit_logger.log_event(
+            event_type=AuditEventType.DATA_DELETE if policy.action == RetentionAction.DELETE else AuditEventType.ADMIN_ACTION,
+            description=f"Retention action executed: {policy.action.value} on {len(chunk)} records",
+            severity=AuditSeverity.HIGH,
+            resource_type="retention_record",
+            resource_id=policy.policy_id,
+            action=policy.action.value,
+            success=True,
+            metadata={
+                "policy_id": policy.policy_id,
+                "data_category": policy.data_category.value,
+                "record_ids": record_ids,
+                "data_subject_ids": sorted({r["data_subject_id"] for r in chunk if r["data_subject_id"]}),
+                "action_details": details
+            },
+            gdpr_lawful_basis=policy.lawful_basis.value
+        )
         
-        result = {"success": True, "error": None, "details": {"files_archived": [], "archive_location": archive_location}}
+        return outcome
+    
+    async def _set_chunk_status(self,
+                                session: AsyncSession,
+                                chunk: List[Dict[str, Any]],
+                                status: RetentionStatus,
+                                error_message: Optional[str] = None):
+        """Set the status of every record in a chunk with one statement"""
+        
+        now = datetime.now(timezone.utc)
+        if status == RetentionStatus.PROCESSING:
+            timestamp_column = "processing_started_at"
+        else:
+            timestamp_column = "processing_completed_at"
+        
+        # Joining on (record_id, created_at) keeps the update partition-pruned
+        query = text(f"""
+            UPDATE data_retention_records r
+            SET status = :status,
+                {timestamp_column} = :now,
+                error_message = :error_message,
+                updated_at = :now
+            FROM unnest(CAST(:record_ids AS text[]), CAST(:created_ats AS timestamptz[]))
+                AS expired(record_id, created_at)
+            WHERE r.record_id = expired.record_id
+              AND r.created_at = expired.created_at
+        """)
+        
+        await session.execute(query, {
+            "status": status.value,
+            "now": now,
+            "error_message": error_message,
+            "record_ids": [record["record_id"] for record in chunk],
+            "created_ats": [record["created_at"] for record in chunk]
+        })
+    
+    def _sync_cached_records(self,
+                             record_ids: List[str],
+                             status: RetentionStatus,
+                             error_message: Optional[str] = None):
+        """Mirror a chunk's outcome onto records registered in this process"""
+        
+        now = datetime.now(timezone.utc)
+        for record_id in record_ids:
+            record = self.records.get(record_id)
+            if record:
+                record.status = status
+                record.processing_completed_at = now
+                record.error_message = error_message
+    
+    @staticmethod
+    def _ids_by_table(chunk: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Group record IDs by the database tables holding their data"""
+        
+        by_table: Dict[str, List[str]] = {}
+        for record in chunk:
+            for table in record["database_tables"]:
+                by_table.setdefault(table, []).append(record["record_id"])
+        return by_table
+    
+    async def _bulk_delete(self, session: AsyncSession, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Delete files and table rows for a chunk of records"""
         
-        if not archive_location:
-            result["error"] = "No archive location specified"
-            result["success"] = False
-            return result
+        details = {"files_deleted": 0, "tables_updated": []}
         
-        try:
-            # Archive files
-            for file_path in record.file_paths:
-                if dry_run:
-                    archive_path = f"{archive_location}/{record.record_id}/{Path(file_path).name}"
-                    result["details"]["files_archived"].append(f"[DRY RUN] {file_path} -> {archive_path}")
-                else:
-                    # Move to archive location (implementation depends on storage type)
-                    archive_path = await self._move_to_archive(file_path, archive_location, record.record_id)
-                    result["details"]["files_archived"].append(f"{file_path} -> {archive_path}")
-            
-            # Update database records to mark as archived
-            if not dry_run:
-                for table in record.database_tables:
-                    query = text(f"UPDATE {table} SET archived = true, archived_at = :archived_at WHERE record_id = :record_id")
-                    await self.db.execute(query, {
-                        "record_id": record.record_id,
-                        "archived_at": datetime.now(timezone.utc)
-                    })
-                
-                await self.db.commit()
+        details["files_deleted"] = await self._delete_files(
+            [path for record in chunk for path in record["file_paths"]]
+        )
         
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
+        for table, record_ids in self._ids_by_table(chunk).items():
+            query = text(f"""
+                DELETE FROM {table} t
+                USING unnest(CAST(:record_ids AS text[])) AS expired(record_id)
+                WHERE t.record_id = expired.record_id
+            """)
+            await session.execute(query, {"record_ids": record_ids})
+            details["tables_updated"].append(table)
         
-        return result
+        return details
     
-    async def _anonymize_record_data(self, record: RetentionRecord, dry_run: bool = False) -> Dict[str, Any]:
-        """Anonymize data for a retention record"""
+    async def _delete_files(self, file_paths: List[str]) -> int:
+        """Delete files, batching S3 keys through DeleteObjects"""
+        
+        s3_keys: Dict[str, List[str]] = {}
+        local_paths = []
+        for file_path in file_paths:
+            if file_path.startswith("s3://"):
+                bucket, key = self._parse_s3_path(file_path)
+                s3_keys.setdefault(bucket, []).append(key)
+            else:
+                local_paths.append(file_path)
+        
+        for bucket, keys in s3_keys.items():
+            # DeleteObjects accepts at most 1000 keys per request
+            for i in range(0, len(keys), 1000):
+                await asyncio.to_thread(
+                    self.s3_client.delete_objects,
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in keys[i:i + 1000]], "Quiet": True}
+                )
         
-        result = {"success": True, "error": None, "details": {"tables_anonymized": [], "fields_anonymized": []}}
+        for file_path in local_paths:
+            await asyncio.to_thread(Path(file_path).unlink, missing_ok=True)
         
-        try:
-            # Anonymization mapping for different data types
-            anonymization_fields = {
-                "email": "anonymized_email_" + str(uuid.uuid4())[:8] + "@anonymized.local",
-                "phone": "+1-XXX-XXX-XXXX",
-                "name": "Anonymized User",
-                "ip_address": "0.0.0.0",
-                "user_agent": "Anonymized Browser"
-            }
-            
-            # Anonymize database records
-            for table in record.database_tables:
-                if dry_run:
-                    result["details"]["tables_anonymized"].append(f"[DRY RUN] {table}")
-                else:
-                    # Update PII fields with anonymized values
-                    for field, anon_value in anonymization_fields.items():
-                        try:
-                            query = text(f"UPDATE {table} SET {field} = :anon_value WHERE record_id = :record_id")
-                            await self.db.execute(query, {
-                                "record_id": record.record_id,
-                                "anon_value": anon_value
-                            })
-                            result["details"]["fields_anonymized"].append(f"{table}.{field}")
-                        except Exception:
-                            # Field might not exist in this table, continue
-                            pass
-                    
-                    result["details"]["tables_anonymized"].append(table)
+        return len(file_paths)
+    
+    async def _bulk_anonymize(self, session: AsyncSession, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Overwrite PII columns for a chunk of records, one UPDATE per table"""
+        
+        details = {"tables_anonymized": [], "fields_anonymized": []}
+        
+        for table, record_ids in self._ids_by_table(chunk).items():
+            columns = await self._existing_columns(session, table, list(ANONYMIZATION_EXPRESSIONS))
+            if columns:
+                assignments = ", ".join(f"{column} = {ANONYMIZATION_EXPRESSIONS[column]}" for column in columns)
+                query = text(f"""
+                    UPDATE {table} t
+                    SET {assignments}
+                    FROM unnest(CAST(:record_ids AS text[])) AS expired(record_id)
+                    WHERE t.record_id = expired.record_id
+                """)
+                await session.execute(query, {"record_ids": record_ids})
+                details["fields_anonymized"].extend(f"{table}.{column}" for column in columns)
             
-            if not dry_run:
-                await self.db.commit()
-        
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
+            details["tables_anonymized"].append(table)
         
-        return result
+        return details
     
-    async def _quarantine_record_data(self, record: RetentionRecord, dry_run: bool = False) -> Dict[str, Any]:
-        """Quarantine data for manual review"""
+    async def _existing_columns(self, session: AsyncSession, table: str, candidates: List[str]) -> List[str]:
+        """Which of ``candidates`` exist on ``table`` (cached per table)"""
         
-        result = {"success": True, "error": None, "details": {"quarantine_location": "", "files_quarantined": []}}
-        
-        quarantine_location = f"quarantine/{record.data_category.value}/{record.record_id}"
-        result["details"]["quarantine_location"] = quarantine_location
+        if table not in self._table_columns:
+            result = await session.execute(
+                text("SELECT column_name FROM information_schema.columns WHERE table_name = :table"),
+                {"table": table}
+            )
+            self._table_columns[table] = {row[0] for row in result.fetchall()}
         
-        try:
-            # Move files to quarantine
-            for file_path in record.file_paths:
-                if dry_run:
-                    quarantine_path = f"{quarantine_location}/{Path(file_path).name}"
-                    result["details"]["files_quarantined"].append(f"[DRY RUN] {file_path} -> {quarantine_path}")
-                else:
-                    quarantine_path = await self._move_to_quarantine(file_path, quarantine_location)
-                    result["details"]["files_quarantined"].append(f"{file_path} -> {quarantine_path}")
-            
-            # Mark database records as quarantined
-            if not dry_run:
-                for table in record.database_tables:
-                    query = text(f"UPDATE {table} SET quarantined = true, quarantined_at = :quarantined_at WHERE record_id = :record_id")
-                    await self.db.execute(query, {
-                        "record_id": record.record_id,
-                        "quarantined_at": datetime.now(timezone.utc)
-                    })
-                
-                await self.db.commit()
+        return [column for column in candidates if column in self._table_columns[table]]
+    
+    async def _bulk_archive(self,
+                            session: AsyncSession,
+                            chunk: List[Dict[str, Any]],
+                            archive_location: Optional[str]) -> Dict[str, Any]:
+        """Stream a chunk's files to the archive and flag its rows as archived"""
         
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
+        if not archive_location:
+            raise ValueError("No archive location specified")
+        
+        details = {"files_archived": 0, "archive_location": archive_location}
+        semaphore = asyncio.Semaphore(self.config["bulk_enforcement"]["archive_concurrency"])
+        
+        async def archive(file_path: str, record_id: str):
+            async with semaphore:
+                await self._move_to_archive(file_path, archive_location, record_id)
+        
+        await asyncio.gather(*[
+            archive(file_path, record["record_id"])
+            for record in chunk
+            for file_path in record["file_paths"]
+        ])
+        details["files_archived"] = sum(len(record["file_paths"]) for record in chunk)
+        
+        archived_at = datetime.now(timezone.utc)
+        for table, record_ids in self._ids_by_table(chunk).items():
+            query = text(f"""
+                UPDATE {table} t
+                SET archived = true, archived_at = :archived_at
+                FROM unnest(CAST(:record_ids AS text[])) AS expired(record_id)
+                WHERE t.record_id = expired.record_id
+            """)
+            await session.execute(query, {"record_ids": record_ids, "archived_at": archived_at})
         
-        return result
+        return details
     
-    async def _notify_record_expiry(self, 
-                                  record: RetentionRecord, 
-                                  policy: RetentionPolicy, 
-                                  dry_run: bool = False) -> Dict[str, Any]:
-        """Send notification about record expiry"""
+    async def _bulk_quarantine(self,
+                               session: AsyncSession,
+                               chunk: List[Dict[str, Any]],
+                               policy: RetentionPolicy) -> Dict[str, Any]:
+        """Move a chunk's files to quarantine and flag its rows"""
+        
+        details = {"files_quarantined": 0}
+        
+        for record in chunk:
+            quarantine_location = f"quarantine/{policy.data_category.value}/{record['record_id']}"
+            for file_path in record["file_paths"]:
+                await self._move_to_quarantine(file_path, quarantine_location)
+                details["files_quarantined"] += 1
+        
+        quarantined_at = datetime.now(timezone.utc)
+        for table, record_ids in self._ids_by_table(chunk).items():
+            query = text(f"""
+                UPDATE {table} t
+                SET quarantined = true, quarantined_at = :quarantined_at
+                FROM unnest(CAST(:record_ids AS text[])) AS expired(record_id)
+                WHERE t.record_id = expired.record_id
+            """)
+            await session.execute(query, {"record_ids": record_ids, "quarantined_at": quarantined_at})
         
-        result = {"success": True, "error": None, "details": {"notifications_sent": []}}
+        return details
+    
+    async def _bulk_notify(self, chunk: List[Dict[str, Any]], policy: RetentionPolicy) -> Dict[str, Any]:
+        """Send one expiry notification per recipient covering the whole chunk"""
         
-        try:
-            notification_data = {
-                "record_id": record.record_id,
-                "data_category": record.data_category.value,
-                "policy_name": policy.name,
-                "expired_at": record.expires_at.isoformat(),
-                "data_subject_id": record.data_subject_id
-            }
-            
-            for recipient in policy.notification_recipients:
-                if dry_run:
-                    result["details"]["notifications_sent"].append(f"[DRY RUN] {recipient}")
-                else:
-                    # Send notification (email, webhook, etc.)
-                    await self._send_notification(recipient, "Data Retention Expiry", notification_data)
-                    result["details"]["notifications_sent"].append(recipient)
+        notification_data = {
+            "policy_name": policy.name,
+            "data_category": policy.data_category.value,
+            "record_ids": [record["record_id"] for record in chunk]
+        }
         
-        except Exception as e:
-            result["success"] = False
-            result["error"] = str(e)
+        for recipient in policy.notification_recipients:
+            await self._send_notification(recipient, "Data Retention Expiry", notification_data)
         
-        return result
+        return {"notifications_sent": len(policy.notification_recipients)}
     
     def _load_default_policies(self):
         """Load default retention policies"""
@@ -846,10 +977,25 @@ class DataRetentionEnforcer:
         return bucket, key
     
     async def _move_to_archive(self, file_path: str, archive_location: str, record_id: str) -> str:
-        """Move file to archive location"""
-        # Implementation depends on storage type (S3, local filesystem, etc.)
-        # This is a placeholder
+        """Copy file to archive location using multipart transfers"""
         archive_path = f"{archive_location}/{record_id}/{Path(file_path).name}"
+        if self.s3_client is None or not archive_path.startswith("s3://"):
+            return archive_path
+        
+        # Managed transfers stream in parts instead of buffering whole objects
+        bucket, key = self._parse_s3_path(archive_path)
+        if file_path.startswith("s3://"):
+            source_bucket, source_key = self._parse_s3_path(file_path)
+            await asyncio.to_thread(
+                self.s3_client.copy,
+                {"Bucket": source_bucket, "Key": source_key},
+                bucket, key,
+                Config=self.transfer_config
+            )
+        else:
+            await asyncio.to_thread(
+                self.s3_client.upload_file, file_path, bucket, key, Config=self.transfer_config
+            )
         return archive_path
     
     async def _move_to_quarantine(self, file_path: str, quarantine_location: str) -> str:
@@ -963,11 +1109,12 @@ class DataRetentionEnforcer:
                     processing_completed_at = :processing_completed_at,
                     error_message = :error_message,
                     updated_at = :updated_at
-                WHERE record_id = :record_id
+                WHERE record_id = :record_id AND created_at = :created_at
             """)
             
             await self.db.execute(query, {
                 "record_id": record.record_id,
+                "created_at": record.created_at,
                 "status": record.status.value,
                 "last_accessed": record.last_accessed,
                 "processing_started_at": record.processing_started_at,
@@ -996,6 +1143,16 @@ class DataRetentionEnforcer:
             "storage_settings": {
                 "s3_bucket": "voicehive-data",
                 "archive_bucket": "voicehive-archive"
+            },
+            "bulk_enforcement": {
+                "max_parallel_chunks": 4,  # Only with a session factory
+                "chunk_pause_seconds": 0.05,
+                "archive_concurrency": 8,
+                "transfer": {
+                    "multipart_threshold": 8 * 1024 * 1024,
+                    "multipart_chunksize": 8 * 1024 * 1024,
+                    "max_concurrency": 4
+                }
             }
         }
         
@@ -1003,8 +1160,13 @@ class DataRetentionEnforcer:
             try:
                 with open(config_path, 'r') as f:
                     import yaml
-                    config = yaml.safe_load(f)
-                    default_config.update(config)
+                    config = yaml.safe_load(f) or {}
+                # Partial bulk_enforcement sections keep the defaults they leave out
+                bulk = config.pop("bulk_enforcement", None) or {}
+                transfer = bulk.pop("transfer", None) or {}
+                default_config.update(config)
+                default_config["bulk_enforcement"].update(bulk)
+                default_config["bulk_enforcement"]["transfer"].update(transfer)
             except Exception as e:
                 logger.error(f"Failed to load retention config from {config_path}: {e}")
         
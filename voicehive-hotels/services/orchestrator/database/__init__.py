@@ -11,6 +11,7 @@ from .migration_manager import DatabaseMigrationManager
 from .capacity_planner import DatabaseCapacityPlanner
 from .reliability_suite import DatabaseReliabilitySuite
 from .pgbouncer_config import PgBouncerConfigManager
+from .partition_manager import PartitionManager, PartitionedTable, PartitionInterval
 
 # Core database components
 from .models import Base, User, Role, Hotel, UserSession
@@ -40,6 +41,11 @@ __all__ = [
     # Connection Pooling
     "PgBouncerConfigManager",
 
+    # Partitioning
+    "PartitionManager",
+    "PartitionedTable",
+    "PartitionInterval",
+
     # Core Models
     "Base",
     "User",
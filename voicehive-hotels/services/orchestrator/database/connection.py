@@ -5,8 +5,10 @@ Enhanced with circuit breaker protection for resilient database operations
 
 import asyncio
 import os
+import weakref
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional, Dict, Any, Union
+from typing import AsyncGenerator, Optional, Dict, Any, Union, Iterable, Sequence
 from urllib.parse import quote_plus
 import time
 
@@ -103,12 +105,101 @@ try:
         buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
     )
 
+    database_statement_duration_seconds = Histogram(
+        'voicehive_database_statement_duration_seconds',
+        'Execution time of named (registered) statements',
+        ['statement'],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+    )
+
+    database_prepared_statement_cache = Counter(
+        'voicehive_database_prepared_statement_cache_total',
+        'Prepared statement cache lookups by result',
+        ['result']  # hit, miss, evicted
+    )
+
     METRICS_AVAILABLE = True
 except ImportError:
     METRICS_AVAILABLE = False
 
 logger = get_safe_logger("orchestrator.database.connection")
 
+
+# A user's roles and hotels as JSON arrays, so the user and its access load in one round trip
+_USER_ACCESS_COLUMNS = (
+    "COALESCE((SELECT json_agg(roles.*) FROM roles JOIN user_roles ON user_roles.role_id = roles.id "
+    "WHERE user_roles.user_id = users.id), '[]') AS roles_json, "
+    "COALESCE((SELECT json_agg(hotels.*) FROM hotels JOIN user_hotels ON user_hotels.hotel_id = hotels.id "
+    "WHERE user_hotels.user_id = users.id), '[]') AS hotels_json"
+)
+
+# Hot statements, run by name with execute_named()/execute_many(). They are
+# prepared when each asyncpg connection is created, so the server parses and
+# plans them once per connection instead of on every call.
+QUERY_REGISTRY: Dict[str, str] = {
+    "session_by_jti": (
+        "SELECT * FROM user_sessions "
+        "WHERE access_token_jti = $1 OR refresh_token_jti = $1"
+    ),
+    "session_touch": "UPDATE user_sessions SET accessed_at = now() WHERE session_id = $1",
+    "user_by_id": "SELECT * FROM users WHERE id = $1",
+    "user_by_email": "SELECT * FROM users WHERE email = $1",
+    "user_with_access_by_id": f"SELECT users.*, {_USER_ACCESS_COLUMNS} FROM users WHERE users.id = $1",
+    "user_with_access_by_email": f"SELECT users.*, {_USER_ACCESS_COLUMNS} FROM users WHERE users.email = $1",
+    "session_with_user_by_jti": (
+        f"SELECT user_sessions.*, to_json(users.*) AS user_json, {_USER_ACCESS_COLUMNS} "
+        "FROM user_sessions JOIN users ON users.id = user_sessions.user_id "
+        "WHERE user_sessions.access_token_jti = $1 OR user_sessions.refresh_token_jti = $1"
+    ),
+}
+
+
+def register_query(name: str, sql: str) -> None:
+    """Add a named statement; connections that already exist prepare it on first use"""
+    existing = QUERY_REGISTRY.get(name)
+    if existing is not None and existing != sql:
+        raise ValueError(f"Query {name!r} is already registered with different SQL")
+    QUERY_REGISTRY[name] = sql
+
+
+class PreparedStatementCache:
+    """LRU of prepared statements for one asyncpg connection, keyed by query name"""
+
+    def __init__(self, connection, max_size: int):
+        self._connection = connection
+        self._statements: "OrderedDict[str, Any]" = OrderedDict()
+        self.max_size = max(1, max_size)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    async def get(self, name: str, sql: str):
+        """Return the prepared statement for ``name``, preparing it on a miss"""
+        statement = self._statements.get(name)
+        if statement is not None:
+            self._statements.move_to_end(name)
+            if METRICS_AVAILABLE:
+                database_prepared_statement_cache.labels(result="hit").inc()
+            return statement
+
+        if METRICS_AVAILABLE:
+            database_prepared_statement_cache.labels(result="miss").inc()
+
+        statement = await self._connection.prepare(sql)
+        self._statements[name] = statement
+        while len(self._statements) > self.max_size:
+            # asyncpg deallocates the server-side statement once it is unreferenced
+            self._statements.popitem(last=False)
+            if METRICS_AVAILABLE:
+                database_prepared_statement_cache.labels(result="evicted").inc()
+        return statement
+
+
+def _unwrap_connection(connection):
+    """pool.acquire() hands out a proxy; statement caches belong to the real connection"""
+    return getattr(connection, "_con", None) or connection
+
+
 class DatabaseManager:
     """Manages database connections and sessions with circuit breaker protection"""
 
@@ -122,6 +213,9 @@ class DatabaseManager:
         self._asyncpg_pool: Optional[asyncpg.Pool] = None
         self._asyncpg_dsn: Optional[str] = None
 
+        # Per-connection prepared statement caches; entries vanish with their connection
+        self._statement_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
         # Initialize circuit breakers if available
         if CIRCUIT_BREAKER_AVAILABLE and CircuitBreaker is not None:
             self._initialize_circuit_breakers()
@@ -215,6 +309,8 @@ class DatabaseManager:
 
                 # Performance settings
                 command_timeout=30.0,  # 30 second command timeout
+                # asyncpg's own LRU for ad-hoc SQL passed to execute_raw_query
+                statement_cache_size=self._statement_cache_size(db_config),
                 server_settings={
                     'application_name': 'voicehive_orchestrator_asyncpg',
                     'timezone': 'UTC',
@@ -235,7 +331,8 @@ class DatabaseManager:
                 min_size=self._asyncpg_pool._minsize,
                 max_size=self._asyncpg_pool._maxsize,
                 max_queries=50000,
-                ssl_enabled=ssl_context is not None
+                ssl_enabled=ssl_context is not None,
+                prepared_statements=db_config.prepared_statements
             )
 
         except Exception as e:
@@ -256,6 +353,25 @@ class DatabaseManager:
         except Exception as e:
             logger.warning(f"Failed to initialize asyncpg connection: {e}")
 
+        db_config = self._config.database
+        if not db_config.prepared_statements:
+            return
+
+        # Prepare the registered hot statements once for this connection
+        cache = PreparedStatementCache(connection, db_config.statement_cache_size)
+        self._statement_caches[connection] = cache
+        for name, sql in list(QUERY_REGISTRY.items())[:cache.max_size]:
+            try:
+                await cache.get(name, sql)
+            except Exception as e:
+                # e.g. the table does not exist yet; retried on first use
+                logger.warning("prepare_registered_statement_failed", statement=name, error=str(e))
+
+    @staticmethod
+    def _statement_cache_size(db_config) -> int:
+        """Prepared statement cache size, 0 when prepared statements are disabled"""
+        return db_config.statement_cache_size if db_config.prepared_statements else 0
+
     async def initialize(self) -> None:
         """Initialize database engine and session factory with circuit breaker protection"""
         if self.engine is not None:
@@ -278,8 +394,14 @@ class DatabaseManager:
             )
 
             # Add SSL mode if specified
+            url_params = []
             if db_config.ssl_mode != "disable":
-                database_url += f"?sslmode={db_config.ssl_mode}"
+                url_params.append(f"sslmode={db_config.ssl_mode}")
+
+            # SQLAlchemy's asyncpg dialect keeps its own per-connection LRU of
+            # prepared statements for ORM queries; 0 turns it off
+            url_params.append(f"prepared_statement_cache_size={self._statement_cache_size(db_config)}")
+            database_url += "?" + "&".join(url_params)
 
             # Create async engine with optimized settings
             self.engine = create_async_engine(
@@ -305,6 +427,7 @@ class DatabaseManager:
                         "idle_in_transaction_session_timeout": "300000",  # 5 minutes
                     },
                     "command_timeout": 30,
+                    "statement_cache_size": self._statement_cache_size(db_config),
                 }
             )
 
@@ -629,6 +752,11 @@ class DatabaseManager:
             logger.error(f"database_{operation_name}_failed", error=str(e))
             raise
 
+    @property
+    def asyncpg_available(self) -> bool:
+        """Whether the direct asyncpg pool behind execute_named/execute_many is up"""
+        return ASYNCPG_AVAILABLE and self._asyncpg_pool is not None
+
     @asynccontextmanager
     async def get_asyncpg_connection(self) -> AsyncGenerator[asyncpg.Connection, None]:
         """
@@ -697,6 +825,128 @@ class DatabaseManager:
             circuit_breaker_type=circuit_breaker_type
         )
 
+    async def _get_prepared_statement(self, connection, name: str):
+        """Prepared statement for a registered query on this connection, or None if disabled"""
+        if name not in QUERY_REGISTRY:
+            raise KeyError(f"Unknown query: {name}")
+
+        db_config = self._config.database
+        if not db_config.prepared_statements:
+            return None
+
+        raw_connection = _unwrap_connection(connection)
+        cache = self._statement_caches.get(raw_connection)
+        if cache is None:
+            cache = PreparedStatementCache(raw_connection, db_config.statement_cache_size)
+            self._statement_caches[raw_connection] = cache
+        return await cache.get(name, QUERY_REGISTRY[name])
+
+    async def execute_named(
+        self,
+        name: str,
+        *args,
+        fetch: str = "all",
+        circuit_breaker_type: str = "query"
+    ) -> Union[list, dict, None]:
+        """
+        Execute a registered query using its prepared statement.
+
+        Args:
+            name: Key in QUERY_REGISTRY
+            *args: Query parameters
+            fetch: 'all', 'one', 'val', or 'none'
+            circuit_breaker_type: Circuit breaker type to use
+
+        Returns:
+            Query results based on fetch type
+        """
+        if not ASYNCPG_AVAILABLE or self._asyncpg_pool is None:
+            raise RuntimeError("Asyncpg connection pool not available")
+        if fetch not in ("all", "one", "val", "none"):
+            raise ValueError(f"Invalid fetch type: {fetch}")
+        # A typo is a programming error, not a database failure for the circuit breaker
+        if name not in QUERY_REGISTRY:
+            raise KeyError(f"Unknown query: {name}")
+
+        async def _execute_statement():
+            async with self.get_asyncpg_connection() as conn:
+                statement = await self._get_prepared_statement(conn, name)
+                start_time = time.perf_counter()
+                try:
+                    if statement is None:
+                        # Prepared statements disabled (e.g. PgBouncer without max_prepared_statements)
+                        sql = QUERY_REGISTRY[name]
+                        if fetch == "all":
+                            return await conn.fetch(sql, *args)
+                        elif fetch == "one":
+                            return await conn.fetchrow(sql, *args)
+                        elif fetch == "val":
+                            return await conn.fetchval(sql, *args)
+                        await conn.execute(sql, *args)
+                        return None
+
+                    if fetch == "all":
+                        return await statement.fetch(*args)
+                    elif fetch == "one":
+                        return await statement.fetchrow(*args)
+                    elif fetch == "val":
+                        return await statement.fetchval(*args)
+                    await statement.fetch(*args)
+                    return None
+                finally:
+                    if METRICS_AVAILABLE:
+                        database_statement_duration_seconds.labels(statement=name).observe(
+                            time.perf_counter() - start_time
+                        )
+
+        return await self.execute_with_circuit_breaker(
+            operation_name=f"named_query_{fetch}",
+            operation_func=_execute_statement,
+            circuit_breaker_type=circuit_breaker_type
+        )
+
+    async def execute_many(
+        self,
+        query: str,
+        args_list: Iterable[Sequence[Any]],
+        circuit_breaker_type: str = "transaction"
+    ) -> None:
+        """
+        Execute one statement for many parameter rows in a single transaction.
+
+        asyncpg pipelines ``executemany``: every row is sent without waiting
+        for the previous result, so a batch costs one round trip instead of
+        one per row. ``query`` may be a QUERY_REGISTRY name or SQL text.
+        """
+        if not ASYNCPG_AVAILABLE or self._asyncpg_pool is None:
+            raise RuntimeError("Asyncpg connection pool not available")
+
+        rows = list(args_list)
+        if not rows:
+            return None
+
+        async def _execute_batch():
+            async with self.get_asyncpg_connection() as conn:
+                start_time = time.perf_counter()
+                async with conn.transaction():
+                    statement = None
+                    if query in QUERY_REGISTRY:
+                        statement = await self._get_prepared_statement(conn, query)
+                    if statement is not None:
+                        await statement.executemany(rows)
+                    else:
+                        await conn.executemany(QUERY_REGISTRY.get(query, query), rows)
+                if METRICS_AVAILABLE and query in QUERY_REGISTRY:
+                    database_statement_duration_seconds.labels(statement=query).observe(
+                        time.perf_counter() - start_time
+                    )
+
+        return await self.execute_with_circuit_breaker(
+            operation_name="batch_execute",
+            operation_func=_execute_batch,
+            circuit_breaker_type=circuit_breaker_type
+        )
+
     async def get_connection_pool_stats(self) -> Dict[str, Any]:
         """Get detailed connection pool statistics for both SQLAlchemy and asyncpg pools"""
         stats = {"pools": {}}
@@ -0,0 +1,275 @@
+"""
+Database Partition Manager for VoiceHive Hotels
+Time-range partition maintenance for audit and compliance tables
+"""
+
+import asyncio
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+
+from prometheus_client import Gauge, Counter
+from logging_adapter import get_safe_logger
+
+logger = get_safe_logger("orchestrator.db_partitions")
+
+# Prometheus metrics for partition maintenance
+db_partition_count = Gauge(
+    'voicehive_db_partitions',
+    'Number of dated partitions attached to a partitioned table',
+    ['table']
+)
+
+db_partitions_created = Counter(
+    'voicehive_db_partitions_created_total',
+    'Partitions created ahead of time',
+    ['table']
+)
+
+db_partitions_dropped = Counter(
+    'voicehive_db_partitions_dropped_total',
+    'Partitions detached and dropped at end of retention',
+    ['table']
+)
+
+
+class PartitionInterval(str, Enum):
+    """Width of one range partition"""
+    DAY = "day"
+    MONTH = "month"
+
+
+@dataclass
+class PartitionedTable:
+    """A table range-partitioned on a timestamp column"""
+    table_name: str
+    partition_column: str
+    interval: PartitionInterval
+    retention_days: int
+    premake: int = 3  # Partitions kept ready beyond the current one
+    # Column sets unique within each dated partition. Parent-level unique
+    # constraints must include the partition column, so this is where
+    # uniqueness on the other columns is enforced.
+    partition_unique_keys: Sequence[Tuple[str, ...]] = field(default_factory=tuple)
+
+    def floor(self, moment: datetime) -> datetime:
+        """Start of the partition containing ``moment``"""
+        moment = moment.astimezone(timezone.utc)
+        if self.interval == PartitionInterval.DAY:
+            return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    def advance(self, start: datetime, steps: int = 1) -> datetime:
+        """Start of the partition ``steps`` intervals after ``start``"""
+        if self.interval == PartitionInterval.DAY:
+            return start + timedelta(days=steps)
+        months = start.month - 1 + steps
+        return start.replace(year=start.year + months // 12, month=months % 12 + 1)
+
+    def partition_name(self, start: datetime) -> str:
+        """Name of the partition beginning at ``start``"""
+        fmt = "%Y%m%d" if self.interval == PartitionInterval.DAY else "%Y%m"
+        return f"{self.table_name}_p{start.strftime(fmt)}"
+
+    def partition_start(self, partition_name: str) -> Optional[datetime]:
+        """Inverse of ``partition_name``; None for DEFAULT or foreign partitions"""
+        prefix = f"{self.table_name}_p"
+        if not partition_name.startswith(prefix):
+            return None
+        fmt = "%Y%m%d" if self.interval == PartitionInterval.DAY else "%Y%m"
+        try:
+            return datetime.strptime(partition_name[len(prefix):], fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+
+# Partitioned tables declared in compliance_schema.sql
+DEFAULT_PARTITIONED_TABLES = [
+    PartitionedTable(
+        "audit_logs", "timestamp", PartitionInterval.DAY, retention_days=2555, premake=7,
+        partition_unique_keys=(("chain_partition", "chain_position"), ("event_id",))
+    ),
+    PartitionedTable("pii_detections", "detected_at", PartitionInterval.MONTH, retention_days=365),
+    # Tracking rows must outlive the longest policy they describe (7 years)
+    PartitionedTable("data_retention_records", "created_at", PartitionInterval.MONTH, retention_days=2920),
+    PartitionedTable("compliance_violations", "detected_at", PartitionInterval.MONTH, retention_days=2555),
+]
+
+
+class PartitionManager:
+    """Pre-creates future partitions and drops partitions past retention"""
+
+    def __init__(self, connection_pool, tables: Optional[List[PartitionedTable]] = None,
+                 lock_timeout: str = "5s"):
+        self.pool = connection_pool
+        self.tables = tables if tables is not None else DEFAULT_PARTITIONED_TABLES
+        self.lock_timeout = lock_timeout
+        self.maintenance_tasks = []
+
+    async def initialize(self, interval_seconds: int = 3600):
+        """Run maintenance once, then keep it running in the background"""
+        logger.info("initializing_partition_manager", tables=[t.table_name for t in self.tables])
+        await self.run_maintenance()
+        self.maintenance_tasks.append(asyncio.create_task(self._periodic_maintenance(interval_seconds)))
+
+    async def _periodic_maintenance(self, interval_seconds: int):
+        """Run partition maintenance on a fixed interval"""
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                await self.run_maintenance()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("periodic_partition_maintenance_error", error=str(e))
+
+    async def run_maintenance(self, now: Optional[datetime] = None) -> Dict[str, Dict[str, List[str]]]:
+        """Create upcoming partitions and drop expired ones"""
+        now = now or datetime.now(timezone.utc)
+        created = await self.ensure_partitions(now)
+        dropped = await self.drop_expired_partitions(now)
+        return {"created": created, "dropped": dropped}
+
+    async def ensure_partitions(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """Create the current partition and ``premake`` future ones for every table"""
+        now = now or datetime.now(timezone.utc)
+        created: Dict[str, List[str]] = {}
+
+        async with self.pool.acquire() as conn:
+            for table in self.tables:
+                created[table.table_name] = []
+                try:
+                    existing = set(await self._list_partitions(conn, table.table_name))
+                except Exception as e:
+                    logger.error("partition_list_failed", table=table.table_name, error=str(e))
+                    continue
+
+                start = table.floor(now)
+                for step in range(table.premake + 1):
+                    lower = table.advance(start, step)
+                    name = table.partition_name(lower)
+                    try:
+                        if name not in existing:
+                            await self._create_partition(conn, table, name, lower, existing)
+                            existing.add(name)
+                            created[table.table_name].append(name)
+                            db_partitions_created.labels(table=table.table_name).inc()
+                            logger.info("partition_created", table=table.table_name, partition=name)
+                        await self._ensure_unique_indexes(conn, table, name)
+                    except Exception as e:
+                        # One bad range must not stop the partitions after it
+                        logger.error(
+                            "partition_create_failed",
+                            table=table.table_name, partition=name, error=str(e)
+                        )
+
+                db_partition_count.labels(table=table.table_name).set(
+                    sum(1 for p in existing if table.partition_start(p) is not None)
+                )
+
+        return created
+
+    async def _create_partition(self, conn, table: PartitionedTable, name: str,
+                                lower: datetime, existing) -> None:
+        """
+        Create the partition for ``[lower, advance(lower))``.
+
+        Postgres refuses ``PARTITION OF`` while the DEFAULT partition holds
+        rows in the new range, so those rows are moved into a standalone
+        table that is then attached, all in one transaction.
+        """
+        upper = table.advance(lower)
+        bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        default = f"{table.table_name}_default"
+        column = table.partition_column
+
+        async with conn.transaction():
+            await conn.execute(f"SET LOCAL lock_timeout = '{self.lock_timeout}'")
+
+            stranded = default in existing and await conn.fetchval(
+                f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {column} >= $1 AND {column} < $2)",
+                lower, upper
+            )
+            if not stranded:
+                await conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table.table_name} {bounds}"
+                )
+                return
+
+            await conn.execute(
+                f"CREATE TABLE {name} (LIKE {table.table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            moved = await conn.execute(
+                f"WITH moved AS (DELETE FROM {default} WHERE {column} >= $1 AND {column} < $2 "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+                lower, upper
+            )
+            await conn.execute(f"ALTER TABLE {table.table_name} ATTACH PARTITION {name} {bounds}")
+            logger.info("partition_rows_moved_from_default", table=table.table_name,
+                        partition=name, result=moved)
+
+    async def _ensure_unique_indexes(self, conn, table: PartitionedTable, name: str) -> None:
+        """Create the per-partition unique indexes declared on ``table``"""
+        for columns in table.partition_unique_keys:
+            await conn.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {name}_{'_'.join(columns)}_key "
+                f"ON {name} ({', '.join(columns)})"
+            )
+
+    async def drop_expired_partitions(self, now: Optional[datetime] = None,
+                                      dry_run: bool = False) -> Dict[str, List[str]]:
+        """
+        Detach and drop partitions whose whole range is past retention.
+
+        Retention becomes a catalog operation per partition instead of a
+        DELETE that scans and WAL-logs every expired row.
+        """
+        now = now or datetime.now(timezone.utc)
+        dropped: Dict[str, List[str]] = {}
+
+        async with self.pool.acquire() as conn:
+            for table in self.tables:
+                dropped[table.table_name] = []
+                cutoff = now - timedelta(days=table.retention_days)
+                try:
+                    partitions = await self._list_partitions(conn, table.table_name)
+                    for name in sorted(partitions):
+                        start = table.partition_start(name)
+                        if start is None or table.advance(start) > cutoff:
+                            continue
+                        if not dry_run:
+                            async with conn.transaction():
+                                await conn.execute(f"SET LOCAL lock_timeout = '{self.lock_timeout}'")
+                                await conn.execute(f"ALTER TABLE {table.table_name} DETACH PARTITION {name}")
+                                await conn.execute(f"DROP TABLE {name}")
+                            db_partitions_dropped.labels(table=table.table_name).inc()
+                        dropped[table.table_name].append(name)
+                        logger.info("partition_dropped", table=table.table_name, partition=name, dry_run=dry_run)
+                except Exception as e:
+                    logger.error("partition_drop_failed", table=table.table_name, error=str(e))
+
+        return dropped
+
+    async def _list_partitions(self, conn, table_name: str) -> List[str]:
+        """Names of the partitions attached to ``table_name``"""
+        rows = await conn.fetch(
+            """
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = $1
+            """,
+            table_name
+        )
+        return [row['relname'] for row in rows]
+
+    async def shutdown(self):
+        """Stop background maintenance"""
+        for task in self.maintenance_tasks:
+            task.cancel()
+        if self.maintenance_tasks:
+            await asyncio.gather(*self.maintenance_tasks, return_exceptions=True)
+        self.maintenance_tasks.clear()
+        logger.info("partition_manager_shutdown")
@@ -2,13 +2,15 @@
 User repository for database operations
 """
 
+import json
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, update, delete
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, and_, or_, func, update, delete, inspect
+from sqlalchemy.orm import selectinload, joinedload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from database.models import User, Role, Hotel, UserSession
@@ -18,11 +20,75 @@ from logging_adapter import get_safe_logger
 logger = get_safe_logger("orchestrator.database.repository")
 
 
+def _default_db_manager(db_manager):
+    """The process-wide DatabaseManager unless one is injected"""
+    if db_manager is not None:
+        return db_manager
+    from database.connection import db_manager as default_db_manager
+    return default_db_manager
+
+
+def _detached(model, row, **relationships):
+    """
+    ORM instance for a row read outside the session, as if loaded by a query
+
+    Merging it with ``load=False`` makes it persistent without another
+    SELECT, so later changes are flushed as usual.
+    """
+    columns = inspect(model).columns.keys()
+    instance = model(**{key: value for key, value in dict(row).items() if key in columns})
+    make_transient_to_detached(instance)
+    for name, value in relationships.items():
+        set_committed_value(instance, name, value)
+    return instance
+
+
+def _json(value):
+    """asyncpg hands json columns over as text unless a codec is registered"""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _from_json(model, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Row for ``model`` from its to_json()/json_agg() form
+
+    JSON carries UUIDs and timestamps as strings; they are restored to what
+    a plain row of the table would hold.
+    """
+    row = {}
+    for key, column in inspect(model).columns.items():
+        if key not in data:
+            continue
+        item = data[key]
+        if isinstance(item, str):
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = str
+            if python_type is UUID:
+                item = UUID(item)
+            elif python_type is datetime:
+                item = datetime.fromisoformat(item)
+        row[key] = item
+    return row
+
+
+def _detached_user(row, user_row=None) -> User:
+    """User with roles and hotels from a statement selecting _USER_ACCESS_COLUMNS"""
+    return _detached(
+        User, user_row if user_row is not None else row,
+        roles=[_detached(Role, _from_json(Role, role)) for role in _json(row["roles_json"])],
+        hotels=[_detached(Hotel, _from_json(Hotel, hotel)) for hotel in _json(row["hotels_json"])]
+    )
+
+
 class UserRepository:
     """Repository for user database operations"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, db_manager=None):
         self.session = session
+        # Hot lookups run as prepared statements on the asyncpg pool when it is up
+        self.db_manager = _default_db_manager(db_manager)
 
     async def create_user(
         self,
@@ -76,14 +142,26 @@ class UserRepository:
             raise
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email with all relationships loaded"""
+        """
+        Get user by email with roles and hotels loaded
+
+        With the asyncpg pool up this is one prepared statement on a pooled
+        connection, outside this repository's session transaction: it sees
+        committed data only, not changes the session has flushed but not
+        committed.
+        """
         try:
+            if self.db_manager.asyncpg_available:
+                row = await self.db_manager.execute_named(
+                    "user_with_access_by_email", email.lower().strip(), fetch="one"
+                )
+                return await self._merge_user(row)
+
             stmt = (
                 select(User)
                 .options(
                     selectinload(User.roles),
-                    selectinload(User.hotels),
-                    selectinload(User.sessions)
+                    selectinload(User.hotels)
                 )
                 .where(User.email == email.lower().strip())
             )
@@ -95,14 +173,22 @@ class UserRepository:
             raise
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID with all relationships loaded"""
+        """
+        Get user by ID with roles and hotels loaded
+
+        Reads outside the session transaction on the asyncpg path, as
+        get_user_by_email() does.
+        """
         try:
+            if self.db_manager.asyncpg_available:
+                row = await self.db_manager.execute_named("user_with_access_by_id", user_id, fetch="one")
+                return await self._merge_user(row)
+
             stmt = (
                 select(User)
                 .options(
                     selectinload(User.roles),
-                    selectinload(User.hotels),
-                    selectinload(User.sessions)
+                    selectinload(User.hotels)
                 )
                 .where(User.id == user_id)
             )
@@ -113,6 +199,12 @@ class UserRepository:
             logger.error("get_user_by_id_failed", user_id=str(user_id), error=str(e))
             raise
 
+    async def _merge_user(self, row) -> Optional[User]:
+        """Attach a user read by named statement to this session"""
+        if row is None:
+            return None
+        return await self.session.merge(_detached_user(row), load=False)
+
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user and return user object if successful"""
         try:
@@ -385,8 +477,10 @@ class UserRepository:
 class SessionRepository:
     """Repository for user session operations"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, db_manager=None):
         self.session = session
+        # Hot lookups run as prepared statements on the asyncpg pool when it is up
+        self.db_manager = _default_db_manager(db_manager)
 
     async def create_session(
         self,
@@ -430,11 +524,27 @@ class SessionRepository:
             raise
 
     async def get_session_by_jti(self, jti: str) -> Optional[UserSession]:
-        """Get session by JWT ID"""
+        """
+        Get session by JWT ID with its user, roles and hotels loaded
+
+        With the asyncpg pool up the session, user and access are read by one
+        prepared statement on a pooled connection, outside this repository's
+        session transaction: it sees committed data only.
+        """
         try:
+            if self.db_manager.asyncpg_available:
+                row = await self.db_manager.execute_named("session_with_user_by_jti", jti, fetch="one")
+                if row is None:
+                    return None
+                user = _detached_user(row, _from_json(User, _json(row["user_json"])))
+                return await self.session.merge(_detached(UserSession, row, user=user), load=False)
+
             stmt = (
                 select(UserSession)
-                .options(joinedload(UserSession.user))
+                .options(
+                    joinedload(UserSession.user).selectinload(User.roles),
+                    joinedload(UserSession.user).selectinload(User.hotels)
+                )
                 .where(
                     or_(
                         UserSession.access_token_jti == jti,
@@ -7,9 +7,14 @@ import asyncio
 import os
 import json
 import gzip
+import zlib
+import bz2
+import random
 import hashlib
 import tempfile
 import shutil
+import socket
+import tarfile
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass, field
@@ -27,6 +32,11 @@ from logging_adapter import get_safe_logger
 from audit_logging import AuditLogger
 from security.path_validator import voicehive_path_validator, PathValidationError
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = get_safe_logger("orchestrator.db_backup")
 audit_logger = AuditLogger("database_backup")
 
@@ -69,6 +79,65 @@ backup_retention_violations = Counter(
     ['policy_type', 'violation_type']
 )
 
+backup_stream_bytes = Counter(
+    'voicehive_backup_stream_bytes_total',
+    'Bytes moved through the streaming backup pipeline',
+    ['backup_type', 'stage']  # read (from pg_dump), written (after compression)
+)
+
+backup_stream_progress_bytes = Gauge(
+    'voicehive_backup_stream_progress_bytes',
+    'Bytes read so far by the running backup',
+    ['database']
+)
+
+
+WAL_MANIFEST_NAME = "wal_manifest.json"
+
+
+def _pg_connection_args() -> List[str]:
+    """Connection flags shared by the PostgreSQL client tools"""
+    return [
+        "--host", os.getenv("DB_HOST", "localhost"),
+        "--port", os.getenv("DB_PORT", "5432"),
+        "--username", os.getenv("DB_USER", "postgres")
+    ]
+
+
+def _is_wal_segment(name: str) -> bool:
+    """True for WAL segment file names (24 hex digits), not .history/.backup files"""
+    return len(name) == 24 and all(c in "0123456789ABCDEF" for c in name)
+
+
+def _decompress_file(source: Path, target: Path, compression: "CompressionType"):
+    """Decompress a backup file to ``target`` in fixed-size chunks"""
+    safe_source = voicehive_path_validator.get_safe_path(source)
+    stream = _open_decompressed(safe_source, compression)
+    if stream is None:
+        raise ValueError(f"Cannot read {compression.value} backups")
+    with stream as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, 4 * 1024 * 1024)
+
+
+def _free_port() -> int:
+    """An unused local TCP port for a scratch PostgreSQL instance"""
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _copy_wal_segment(source: Path, target_dir: Path) -> Dict[str, Any]:
+    """Copy one archived WAL segment, hashing it as it is copied"""
+    sha256_hash = hashlib.sha256()
+    size = 0
+    with voicehive_path_validator.open_safe_file(source, 'rb') as src, \
+         voicehive_path_validator.open_safe_file(target_dir / source.name, 'wb') as dst:
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            sha256_hash.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    return {"name": source.name, "size_bytes": size, "sha256": sha256_hash.hexdigest()}
+
 
 class BackupType(str, Enum):
     """Database backup types"""
@@ -79,6 +148,12 @@ class BackupType(str, Enum):
     PHYSICAL = "physical"
 
 
+class DumpFormat(str, Enum):
+    """pg_dump archive formats for logical backups"""
+    CUSTOM = "custom"  # Single streamed file
+    DIRECTORY = "directory"  # One file per table, dumped and restored with --jobs
+
+
 class BackupStatus(str, Enum):
     """Backup execution status"""
     PENDING = "pending"
@@ -107,6 +182,120 @@ class CompressionType(str, Enum):
     ZSTD = "zstd"
 
 
+# File suffix of a streamed logical backup per applied codec
+_COMPRESSION_SUFFIXES = {
+    CompressionType.GZIP: ".gz",
+    CompressionType.BZIP2: ".bz2",
+    CompressionType.ZSTD: ".zst",
+}
+
+
+def _stream_compressor(compression: CompressionType, level: int):
+    """
+    Compressor for a backup stream as ``(codec applied, compressobj)``
+
+    Codecs without a streaming compressor here (LZ4, or ZSTD without the
+    zstandard package) fall back to an uncompressed stream, and the
+    returned codec says so.
+    """
+    if compression == CompressionType.GZIP:
+        # wbits=31 selects the gzip container, so output is readable by gzip.open/zcat
+        return compression, zlib.compressobj(level, zlib.DEFLATED, 31)
+    if compression == CompressionType.BZIP2:
+        return compression, bz2.BZ2Compressor(min(max(level, 1), 9))
+    if compression == CompressionType.ZSTD and zstandard is not None:
+        return compression, zstandard.ZstdCompressor(level=level).compressobj()
+    return CompressionType.NONE, None
+
+
+def _open_decompressed(path: Path, compression: CompressionType):
+    """Readable stream of decompressed backup bytes, or None if the codec is unavailable"""
+    if compression == CompressionType.NONE:
+        return open(path, 'rb')
+    if compression == CompressionType.GZIP:
+        return gzip.open(path, 'rb')
+    if compression == CompressionType.BZIP2:
+        return bz2.open(path, 'rb')
+    if compression == CompressionType.ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return None
+
+
+def _drain_decompressed(path: Path, compression: CompressionType, chunk_size: int,
+                        max_bytes: Optional[int] = None) -> Optional[int]:
+    """Decompress and discard a backup chunk by chunk; raises on corrupt input"""
+    stream = _open_decompressed(path, compression)
+    if stream is None:
+        return None
+    total = 0
+    with stream:
+        while max_bytes is None or total < max_bytes:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            total += len(chunk)
+    return total
+
+
+def _hash_file_into(path: Path, sha256_hash, chunk_size: int):
+    """Feed a file into ``sha256_hash`` one chunk at a time"""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256_hash.update(chunk)
+
+
+def _hash_file_blocks(path: Path, block_size: int, indices: List[int], chunk_size: int) -> Dict[int, str]:
+    """SHA256 of selected fixed-size blocks of a file"""
+    digests = {}
+    with open(path, 'rb') as f:
+        for index in indices:
+            f.seek(index * block_size)
+            block_hash = hashlib.sha256()
+            remaining = block_size
+            while remaining:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                block_hash.update(chunk)
+                remaining -= len(chunk)
+            digests[index] = block_hash.hexdigest()
+    return digests
+
+
+def _sample_block_indices(block_count: int, samples: int) -> List[int]:
+    """First and last block plus a random spread of the rest"""
+    if block_count <= samples:
+        return list(range(block_count))
+    middle = random.sample(range(1, block_count - 1), max(0, samples - 2))
+    return sorted({0, block_count - 1, *middle})
+
+
+def _scan_for_markers(path: Path, compression: CompressionType, markers: List[str],
+                      chunk_size: int) -> Dict[str, Any]:
+    """Find which ``markers`` occur in a backup without holding it in memory"""
+    wanted = {marker: marker.encode() for marker in markers}
+    overlap = max(len(m) for m in wanted.values()) - 1
+    found: Set[str] = set()
+    scanned = 0
+    tail = b""
+    
+    stream = _open_decompressed(path, compression)
+    if stream is None:
+        raise ValueError(f"Cannot read {compression.value} backups")
+    with stream:
+        while len(found) < len(wanted):
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            scanned += len(chunk)
+            # Keep the end of the previous chunk so markers split across reads still match
+            window = tail + chunk
+            found.update(m for m, raw in wanted.items() if m not in found and raw in window)
+            tail = window[-overlap:] if overlap else b""
+    
+    return {"found": found, "scanned_bytes": scanned}
+
+
 @dataclass
 class BackupConfig:
     """Backup configuration"""
@@ -128,6 +317,27 @@ class BackupConfig:
     checkpoint_segments: int = 32
     wal_buffers: str = "16MB"
     maintenance_work_mem: str = "256MB"
+    
+    # Streaming settings; memory use is bounded by these, not the database size
+    compression_level: int = 6
+    stream_chunk_size: int = 4 * 1024 * 1024
+    multipart_part_size: int = 64 * 1024 * 1024  # S3 minimum is 5 MiB
+    
+    # Logical dump format; DIRECTORY dumps and restores with parallel_jobs workers
+    dump_format: DumpFormat = DumpFormat.CUSTOM
+    
+    # Incremental backups copy segments from the server's WAL archive
+    # (the archive_command destination) on top of the latest physical backup
+    wal_archive_path: Optional[str] = None
+    wal_archive_timeout_seconds: int = 60
+    
+    # Verification settings; memory use is bounded by these, not the backup size
+    verification_chunk_size: int = 4 * 1024 * 1024
+    verification_memory_budget: int = 256 * 1024 * 1024  # Shared by concurrent verifications
+    checksum_block_size: int = 64 * 1024 * 1024
+    # Above this size, checksums and decompression are checked on sampled blocks
+    sampled_verification_threshold: int = 20 * 1024 * 1024 * 1024
+    verification_sample_blocks: int = 16
 
 
 @dataclass
@@ -149,6 +359,11 @@ class BackupMetadata:
     status: BackupStatus = BackupStatus.PENDING
     error_message: Optional[str] = None
     verification_results: Dict[str, Any] = field(default_factory=dict)
+    # {"block_size": int, "sha256": [...]} for streamed backups, used for sampled verification
+    block_checksums: Dict[str, Any] = field(default_factory=dict)
+    # Codec actually applied to the stored artifact; None for backups recorded
+    # before this was tracked (see stored_compression)
+    compression: Optional[CompressionType] = None
     
     @property
     def duration_seconds(self) -> Optional[float]:
@@ -161,13 +376,180 @@ class BackupMetadata:
         if self.size_bytes and self.compressed_size_bytes:
             return self.compressed_size_bytes / self.size_bytes
         return None
+    
+    def stored_compression(self, config: BackupConfig) -> CompressionType:
+        """Codec to decode the stored artifact with"""
+        if self.compression is not None:
+            return self.compression
+        # Older writers only ever gzipped the stream, whatever the configured codec
+        return CompressionType.GZIP if config.compression == CompressionType.GZIP else CompressionType.NONE
+
+
+class _LocalFileSink:
+    """Writes a backup stream to a local file"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.location = str(path)
+        # open_safe_file is a context manager; the sink owns the handle for the whole stream
+        self._file = open(voicehive_path_validator.get_safe_path(path), 'wb')
+    
+    def write(self, data: bytes):
+        self._file.write(data)
+    
+    def close(self):
+        self._file.close()
+    
+    def abort(self):
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
+class _S3MultipartSink:
+    """Uploads a backup stream to S3 in fixed-size multipart parts"""
+    
+    def __init__(self, s3_client, bucket: str, key: str, part_size: int, encrypt: bool):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, 5 * 1024 * 1024)
+        self.location = f"s3://{bucket}/{key}"
+        self._buffer = bytearray()
+        self._parts: List[Dict[str, Any]] = []
+        
+        extra = {"ServerSideEncryption": "AES256"} if encrypt else {}
+        try:
+            upload = s3_client.create_multipart_upload(Bucket=bucket, Key=key, **extra)
+        except ClientError as e:
+            raise RuntimeError(f"S3 upload failed: {str(e)}")
+        self._upload_id = upload["UploadId"]
+    
+    def write(self, data: bytes):
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+    
+    def close(self):
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts}
+            )
+        except ClientError as e:
+            raise RuntimeError(f"S3 upload failed: {str(e)}")
+    
+    def abort(self):
+        self._buffer.clear()
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+        except ClientError as e:
+            logger.warning("s3_multipart_abort_failed", key=self.key, error=str(e))
+    
+    def _upload_part(self, body: bytes):
+        part_number = len(self._parts) + 1
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+        except ClientError as e:
+            raise RuntimeError(f"S3 upload failed: {str(e)}")
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+
+class _StreamingBackupWriter:
+    """
+    Compresses, hashes and writes a backup stream one chunk at a time.
+    
+    The checksum covers the bytes as stored, matching what BackupVerifier
+    recomputes. Methods are blocking and are meant to run in a worker thread.
+    """
+    
+    def __init__(self, sink, compression: CompressionType, compression_level: int,
+                 block_size: int = 64 * 1024 * 1024):
+        self.sink = sink
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self.block_size = block_size
+        self.block_checksums: List[str] = []
+        self._sha256 = hashlib.sha256()
+        self._block_sha256 = hashlib.sha256()
+        self._block_filled = 0
+        self.compression, self._compressor = _stream_compressor(compression, compression_level)
+    
+    def write(self, chunk: bytes):
+        self.raw_bytes += len(chunk)
+        self._emit(self._compressor.compress(chunk) if self._compressor else chunk)
+    
+    def close(self):
+        if self._compressor:
+            self._emit(self._compressor.flush())
+        if self._block_filled:
+            self.block_checksums.append(self._block_sha256.hexdigest())
+        self.sink.close()
+    
+    def abort(self):
+        self.sink.abort()
+    
+    @property
+    def checksum(self) -> str:
+        return self._sha256.hexdigest()
+    
+    def _emit(self, data: bytes):
+        if data:
+            self._sha256.update(data)
+            self._update_blocks(data)
+            self.stored_bytes += len(data)
+            self.sink.write(data)
+    
+    def _update_blocks(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self.block_size - self._block_filled)
+            self._block_sha256.update(view[:take])
+            self._block_filled += take
+            view = view[take:]
+            if self._block_filled == self.block_size:
+                self.block_checksums.append(self._block_sha256.hexdigest())
+                self._block_sha256 = hashlib.sha256()
+                self._block_filled = 0
 
 
 class BackupVerifier:
-    """Backup verification and integrity checking"""
+    """
+    Backup verification and integrity checking
+    
+    File reads, hashing and decompression run in worker threads one chunk
+    at a time. Each streaming pass holds a slot sized for two chunks, so
+    concurrent verifications share ``memory_budget_bytes`` instead of each
+    needing memory proportional to the backup.
+    """
     
-    def __init__(self, connection_pool):
+    def __init__(self, connection_pool, memory_budget_bytes: int = 256 * 1024 * 1024,
+                 chunk_size: int = 4 * 1024 * 1024):
         self.pool = connection_pool
+        self.chunk_size = chunk_size
+        self._stream_slots = asyncio.Semaphore(max(1, memory_budget_bytes // (2 * chunk_size)))
+    
+    async def verify_backups(self, backups: List[BackupMetadata],
+                             config: BackupConfig) -> Dict[str, Dict[str, Any]]:
+        """Verify several backups concurrently within the memory budget"""
+        results = await asyncio.gather(*(self.verify_backup(b, config) for b in backups))
+        return {b.backup_id: result for b, result in zip(backups, results)}
+    
+    async def _run_streaming(self, func, *args):
+        """Run a blocking chunked pass in a worker thread, within the memory budget"""
+        async with self._stream_slots:
+            return await asyncio.to_thread(func, *args)
         
     async def verify_backup(self, backup_metadata: BackupMetadata, 
                           config: BackupConfig) -> Dict[str, Any]:
@@ -239,6 +621,16 @@ class BackupVerifier:
                 result["errors"].append("Backup file not found")
                 return result
             
+            # Directory dumps, base backups and WAL sets are checked file by file
+            if backup_path.is_dir():
+                files = [f for f in backup_path.rglob('*') if f.is_file()]
+                result["details"]["file_count"] = len(files)
+                result["details"]["file_size"] = sum(f.stat().st_size for f in files)
+                if not files:
+                    result["passed"] = False
+                    result["errors"].append("Backup directory is empty")
+                return result
+            
             # Check file size
             file_size = backup_path.stat().st_size
             result["details"]["file_size"] = file_size
@@ -263,11 +655,16 @@ class BackupVerifier:
                 result["passed"] = False
                 result["errors"].append(f"File not readable: {str(e)}")
             
-            # If compressed, test decompression
-            if config.compression != CompressionType.NONE:
+            # If compressed, test decompression; large artifacts only decompress a sample
+            compression = backup_metadata.stored_compression(config)
+            if compression != CompressionType.NONE:
+                max_bytes = None
+                if file_size >= config.sampled_verification_threshold:
+                    max_bytes = config.verification_sample_blocks * self.chunk_size
                 try:
-                    await self._test_decompression(backup_path, config.compression)
-                    result["details"]["decompressible"] = True
+                    decompressed = await self._test_decompression(backup_path, compression, max_bytes)
+                    result["details"]["decompressible"] = decompressed is not None
+                    result["details"]["decompressed_bytes"] = decompressed
                 except Exception as e:
                     result["passed"] = False
                     result["errors"].append(f"Decompression failed: {str(e)}")
@@ -290,8 +687,16 @@ class BackupVerifier:
             
             backup_path = self._get_backup_file_path(backup_metadata, config)
             
+            if (backup_metadata.block_checksums and not backup_path.is_dir()
+                    and backup_path.stat().st_size >= config.sampled_verification_threshold):
+                return await self._verify_sampled_blocks(backup_metadata, backup_path, config)
+            
             # Calculate current checksum
-            current_checksum = await self._calculate_file_checksum(backup_path)
+            result["details"]["mode"] = "full"
+            if backup_path.is_dir():
+                current_checksum = await self._calculate_directory_checksum(backup_path)
+            else:
+                current_checksum = await self._calculate_file_checksum(backup_path)
             result["details"]["expected_checksum"] = backup_metadata.checksum
             result["details"]["actual_checksum"] = current_checksum
             
@@ -305,32 +710,72 @@ class BackupVerifier:
         
         return result
     
+    async def _verify_sampled_blocks(self, backup_metadata: BackupMetadata, backup_path: Path,
+                                     config: BackupConfig) -> Dict[str, Any]:
+        """Spot-check stored block checksums instead of hashing the whole artifact"""
+        result = {"passed": True, "errors": [], "details": {"mode": "sampled"}}
+        
+        block_size = backup_metadata.block_checksums["block_size"]
+        expected = backup_metadata.block_checksums["sha256"]
+        file_size = backup_path.stat().st_size
+        
+        if len(expected) != -(-file_size // block_size):
+            result["passed"] = False
+            result["errors"].append(f"Block count mismatch: expected {len(expected)} blocks "
+                                    f"for {file_size} bytes")
+            return result
+        
+        indices = _sample_block_indices(len(expected), config.verification_sample_blocks)
+        actual = await self._run_streaming(
+            _hash_file_blocks, voicehive_path_validator.get_safe_path(backup_path),
+            block_size, indices, self.chunk_size
+        )
+        mismatched = [i for i in indices if actual[i] != expected[i]]
+        
+        result["details"]["blocks_total"] = len(expected)
+        result["details"]["blocks_checked"] = len(indices)
+        if mismatched:
+            result["passed"] = False
+            result["details"]["mismatched_blocks"] = mismatched
+            result["errors"].append("Checksum mismatch - backup may be corrupted")
+        
+        return result
+    
     async def _verify_completeness(self, backup_metadata: BackupMetadata, 
                                  config: BackupConfig) -> Dict[str, Any]:
         """Verify backup completeness"""
         result = {"passed": True, "errors": [], "details": {}}
         
         try:
+            backup_path = self._get_backup_file_path(backup_metadata, config)
+            
+            # Directory dumps carry a table of contents plus one data file per table
+            if backup_metadata.backup_type == BackupType.LOGICAL and backup_path.is_dir():
+                if not (backup_path / "toc.dat").exists():
+                    result["passed"] = False
+                    result["errors"].append("Directory dump has no toc.dat")
+                result["details"]["data_files"] = len(
+                    [f for f in backup_path.glob("*.dat*") if f.name != "toc.dat"]
+                )
+            
             # For logical backups, check if all expected objects are present
-            if backup_metadata.backup_type == BackupType.LOGICAL:
-                backup_path = self._get_backup_file_path(backup_metadata, config)
+            elif backup_metadata.backup_type == BackupType.LOGICAL:
                 
-                # Read backup content and check for expected database objects
-                backup_content = await self._read_backup_content(backup_path, config.compression)
-                
-                # Check for essential database objects
+                # Scan backup content for expected database objects
                 expected_objects = ["CREATE TABLE", "CREATE INDEX", "CREATE SEQUENCE"]
-                missing_objects = []
+                scan = await self._scan_backup_content(
+                    backup_path, backup_metadata.stored_compression(config),
+                    expected_objects + ["INSERT INTO", "COPY "]
+                )
                 
-                for obj in expected_objects:
-                    if obj not in backup_content:
-                        missing_objects.append(obj)
+                # Check for essential database objects
+                missing_objects = [obj for obj in expected_objects if obj not in scan["found"]]
                 
                 if missing_objects:
                     result["errors"].append(f"Missing database objects: {', '.join(missing_objects)}")
                 
-                result["details"]["backup_size_lines"] = len(backup_content.split('\n'))
-                result["details"]["contains_data"] = "INSERT INTO" in backup_content or "COPY " in backup_content
+                result["details"]["scanned_bytes"] = scan["scanned_bytes"]
+                result["details"]["contains_data"] = "INSERT INTO" in scan["found"] or "COPY " in scan["found"]
             
             # For physical backups, check for required files
             elif backup_metadata.backup_type == BackupType.PHYSICAL:
@@ -339,6 +784,20 @@ class BackupVerifier:
                 # This would be implemented based on the backup format
                 pass
             
+            # For incremental backups, every segment in the manifest must be intact
+            elif backup_metadata.backup_type == BackupType.INCREMENTAL:
+                manifest = self._read_wal_manifest(backup_path)
+                for segment in manifest["segments"]:
+                    segment_path = backup_path / "wal" / segment["name"]
+                    if not segment_path.exists():
+                        result["errors"].append(f"Missing WAL segment {segment['name']}")
+                    elif await self._calculate_file_checksum(segment_path) != segment["sha256"]:
+                        result["errors"].append(f"Corrupted WAL segment {segment['name']}")
+                if result["errors"]:
+                    result["passed"] = False
+                result["details"]["wal_segments"] = len(manifest["segments"])
+                result["details"]["base_backup_id"] = manifest["base_backup_id"]
+            
         except Exception as e:
             result["passed"] = False
             result["errors"].append(f"Completeness check error: {str(e)}")
@@ -346,8 +805,19 @@ class BackupVerifier:
         return result
     
     async def _test_restore(self, backup_metadata: BackupMetadata, 
-                          config: BackupConfig) -> Dict[str, Any]:
-        """Test backup restore functionality"""
+                          config: BackupConfig,
+                          target_time: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Test backup restore functionality
+        
+        Logical backups are restored into a scratch database with parallel
+        ``pg_restore``. Physical and incremental backups are recovered into
+        a scratch cluster, replaying archived WAL up to ``target_time`` (or
+        to the end of the available WAL).
+        """
+        if backup_metadata.backup_type in (BackupType.PHYSICAL, BackupType.INCREMENTAL):
+            return await self._test_point_in_time_restore(backup_metadata, config, target_time)
+        
         result = {"passed": True, "errors": [], "details": {}}
         
         try:
@@ -389,9 +859,116 @@ class BackupVerifier:
         
         return result
     
+    async def _test_point_in_time_restore(self, backup_metadata: BackupMetadata,
+                                         config: BackupConfig,
+                                         target_time: Optional[datetime] = None) -> Dict[str, Any]:
+        """Recover a base backup plus archived WAL into a scratch cluster"""
+        result = {"passed": True, "errors": [], "details": {}}
+        restore_start = datetime.now()
+        
+        try:
+            backup_path = self._get_backup_file_path(backup_metadata, config)
+            if backup_metadata.backup_type == BackupType.INCREMENTAL:
+                manifest = self._read_wal_manifest(backup_path)
+                base_path = Path(manifest["base_location"])
+                wal_directories = [Path(link["wal_directory"]) for link in manifest["chain"]]
+                result["details"]["base_backup_id"] = manifest["base_backup_id"]
+            else:
+                base_path = backup_path
+                wal_directories = []
+            
+            with tempfile.TemporaryDirectory(prefix=f"pitr_{backup_metadata.backup_id}_") as workdir:
+                workdir = Path(workdir)
+                data_dir = workdir / "data"
+                await asyncio.to_thread(
+                    self._prepare_recovery_cluster, base_path, wal_directories, workdir, data_dir, target_time
+                )
+                
+                port = _free_port()
+                await self._run_command(
+                    "pg_ctl", "start", "--wait", "--timeout", "600",
+                    "-D", str(data_dir), "-l", str(workdir / "recovery.log"),
+                    "-o", f"-p {port} -k {workdir} -c listen_addresses=''"
+                )
+                try:
+                    verification_results = await self._verify_restored_data(
+                        backup_metadata.database_name, host=str(workdir), port=port
+                    )
+                finally:
+                    await self._run_command("pg_ctl", "stop", "--mode", "fast", "-D", str(data_dir))
+            
+            result["details"]["data_verification"] = verification_results
+            result["details"]["target_time"] = target_time.isoformat() if target_time else None
+            if not verification_results.get("passed", False):
+                result["passed"] = False
+                result["errors"].extend(verification_results.get("errors", []))
+            
+            restore_duration = (datetime.now() - restore_start).total_seconds()
+            result["details"]["restore_duration_seconds"] = restore_duration
+            restore_test_duration.labels(
+                backup_type=backup_metadata.backup_type.value
+            ).observe(restore_duration)
+            
+        except Exception as e:
+            result["passed"] = False
+            result["errors"].append(f"Point-in-time restore test error: {str(e)}")
+        
+        return result
+    
+    def _prepare_recovery_cluster(self, base_path: Path, wal_directories: List[Path],
+                                  workdir: Path, data_dir: Path, target_time: Optional[datetime]):
+        """Unpack a tar-format base backup and configure archive recovery"""
+        data_dir.mkdir(mode=0o700)
+        # The "data" filter rejects absolute paths, links and members escaping data_dir
+        with tarfile.open(base_path / "base.tar.gz") as tar:
+            tar.extractall(data_dir, filter="data")
+        
+        wal_tar = base_path / "pg_wal.tar.gz"
+        if wal_tar.exists():
+            with tarfile.open(wal_tar) as tar:
+                tar.extractall(data_dir / "pg_wal", filter="data")
+        
+        # Segments from every incremental in the chain, served by restore_command
+        archive_dir = workdir / "wal_archive"
+        archive_dir.mkdir()
+        for wal_directory in wal_directories:
+            for segment in wal_directory.iterdir():
+                shutil.copy2(segment, archive_dir / segment.name)
+        
+        settings = [
+            f"restore_command = 'cp {archive_dir}/%f %p'",
+            "recovery_target_action = 'promote'",
+            "archive_mode = off",
+        ]
+        if target_time:
+            settings.append(f"recovery_target_time = '{target_time.isoformat()}'")
+        with open(data_dir / "postgresql.auto.conf", "a") as f:
+            f.write("\n" + "\n".join(settings) + "\n")
+        (data_dir / "recovery.signal").touch()
+    
+    def _read_wal_manifest(self, backup_path: Path) -> Dict[str, Any]:
+        """Load the WAL manifest of an incremental backup"""
+        with voicehive_path_validator.open_safe_file(backup_path / WAL_MANIFEST_NAME, 'r') as f:
+            return json.load(f)
+    
+    async def _run_command(self, *cmd: str):
+        """Run a PostgreSQL client tool, raising with its stderr on failure"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"{cmd[0]} failed: {stderr.decode()}")
+    
     def _get_backup_file_path(self, backup_metadata: BackupMetadata, 
                             config: BackupConfig) -> Path:
         """Get backup file path based on storage configuration"""
+        # Directory dumps, base backups and WAL sets are always written locally
+        if backup_metadata.storage_location and not backup_metadata.storage_location.startswith("s3://"):
+            return Path(backup_metadata.storage_location)
+        
         if config.storage_type == StorageType.LOCAL:
             base_path = Path(config.local_path or "/var/backups/postgresql")
             return base_path / f"{backup_metadata.backup_id}.sql.gz"
@@ -400,51 +977,72 @@ class BackupVerifier:
             temp_dir = Path(tempfile.gettempdir())
             return temp_dir / f"{backup_metadata.backup_id}.sql.gz"
     
-    async def _test_decompression(self, file_path: Path, compression: CompressionType):
-        """Test if compressed file can be decompressed"""
-        if compression == CompressionType.GZIP:
-            # Validate path before decompression
-            try:
-                safe_path = voicehive_path_validator.get_safe_path(file_path)
-                with gzip.open(safe_path, 'rb') as f:
-                    # Read first 1KB to test decompression
-                    f.read(1024)
-            except PathValidationError as e:
-                logger.error("Decompression path validation failed", file_path=str(file_path), error=str(e))
-                raise
-        # Add other compression types as needed
+    async def _test_decompression(self, file_path: Path, compression: CompressionType,
+                                  max_bytes: Optional[int] = None) -> Optional[int]:
+        """
+        Stream-decompress a backup, returning the decompressed byte count
+        
+        The whole stream is decoded unless ``max_bytes`` is given, so
+        truncation and corruption anywhere in the file are caught. Returns
+        None for compression types that cannot be decoded here.
+        """
+        try:
+            safe_path = voicehive_path_validator.get_safe_path(file_path)
+        except PathValidationError as e:
+            logger.error("Decompression path validation failed", file_path=str(file_path), error=str(e))
+            raise
+        
+        return await self._run_streaming(_drain_decompressed, safe_path, compression, self.chunk_size, max_bytes)
     
     async def _calculate_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of file using secure path validation"""
+        try:
+            safe_path = voicehive_path_validator.get_safe_path(file_path)
+        except PathValidationError as e:
+            logger.error("Checksum calculation path validation failed", file_path=str(file_path), error=str(e))
+            raise
+        
+        sha256_hash = hashlib.sha256()
+        await self._run_streaming(_hash_file_into, safe_path, sha256_hash, self.chunk_size)
+        return sha256_hash.hexdigest()
+    
+    async def _calculate_directory_checksum(self, directory: Path) -> str:
+        """Calculate checksum of entire directory using secure path validation"""
         sha256_hash = hashlib.sha256()
 
         try:
-            with voicehive_path_validator.open_safe_file(file_path, "rb") as f:
-                # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+            # Validate the directory path first
+            safe_directory = voicehive_path_validator.get_safe_path(directory)
+
+            # Sort files for consistent checksum
+            files = sorted(safe_directory.rglob('*'))
+
+            for file_path in files:
+                if file_path.is_file():
+                    try:
+                        safe_file = voicehive_path_validator.get_safe_path(file_path)
+                    except PathValidationError as e:
+                        logger.warning("Skipping file due to path validation failure",
+                                     file_path=str(file_path), error=str(e))
+                        continue
+                    await self._run_streaming(_hash_file_into, safe_file, sha256_hash, self.chunk_size)
+
         except PathValidationError as e:
-            logger.error("Checksum calculation path validation failed", file_path=str(file_path), error=str(e))
+            logger.error("Directory checksum path validation failed", directory=str(directory), error=str(e))
             raise
 
         return sha256_hash.hexdigest()
     
-    async def _read_backup_content(self, file_path: Path, compression: CompressionType) -> str:
-        """Read backup file content using secure path validation"""
+    async def _scan_backup_content(self, file_path: Path, compression: CompressionType,
+                                   markers: List[str]) -> Dict[str, Any]:
+        """Stream backup content looking for SQL markers, stopping once all are found"""
         try:
-            if compression == CompressionType.GZIP:
-                # Validate path and use gzip
-                safe_path = voicehive_path_validator.get_safe_path(file_path)
-                with gzip.open(safe_path, 'rt') as f:
-                    # Read first 10MB to check content
-                    return f.read(10 * 1024 * 1024)
-            else:
-                # Use secure file opening for uncompressed files
-                with voicehive_path_validator.open_safe_file(file_path, 'r') as f:
-                    return f.read(10 * 1024 * 1024)
+            safe_path = voicehive_path_validator.get_safe_path(file_path)
         except PathValidationError as e:
             logger.error("Backup content read path validation failed", file_path=str(file_path), error=str(e))
             raise
+        
+        return await self._run_streaming(_scan_for_markers, safe_path, compression, markers, self.chunk_size)
     
     async def _create_test_database(self, db_name: str):
         """Create test database for restore testing"""
@@ -466,40 +1064,35 @@ class BackupVerifier:
     
     async def _restore_to_test_database(self, backup_metadata: BackupMetadata, 
                                       config: BackupConfig, test_db_name: str):
-        """Restore backup to test database"""
+        """Restore backup to test database with parallel pg_restore"""
         backup_path = self._get_backup_file_path(backup_metadata, config)
         
-        # Build psql command for restore
-        cmd = [
-            "psql",
-            "-h", "localhost",  # Would be configured
-            "-d", test_db_name,
-            "-f", str(backup_path)
-        ]
-        
-        if config.compression == CompressionType.GZIP:
-            # Use zcat to decompress on the fly
-            cmd = ["zcat", str(backup_path)] + ["|"] + cmd
-        
-        # Execute restore command
-        process = await asyncio.create_subprocess_shell(
-            " ".join(cmd),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode != 0:
-            raise RuntimeError(f"Restore failed: {stderr.decode()}")
+        with tempfile.TemporaryDirectory(prefix=f"restore_{backup_metadata.backup_id}_") as workdir:
+            archive = backup_path
+            compression = backup_metadata.stored_compression(config)
+            if not backup_path.is_dir() and compression != CompressionType.NONE:
+                # pg_restore --jobs needs a seekable archive, so unwrap the compressed stream first
+                archive = Path(workdir) / "backup.dump"
+                await asyncio.to_thread(_decompress_file, backup_path, archive, compression)
+            
+            await self._run_command(
+                "pg_restore",
+                "--no-password",
+                "--no-owner",
+                "--no-privileges",
+                f"--jobs={max(1, config.parallel_jobs)}",
+                "--dbname", test_db_name,
+                *_pg_connection_args(),
+                str(archive)
+            )
     
-    async def _verify_restored_data(self, test_db_name: str) -> Dict[str, Any]:
+    async def _verify_restored_data(self, test_db_name: str, **connect_kwargs) -> Dict[str, Any]:
         """Verify restored data integrity"""
         result = {"passed": True, "errors": [], "details": {}}
         
         try:
             # Connect to test database
-            test_conn = await asyncpg.connect(database=test_db_name)
+            test_conn = await asyncpg.connect(database=test_db_name, **connect_kwargs)
             
             try:
                 # Check basic database structure
@@ -548,7 +1141,11 @@ class DatabaseBackupManager:
     def __init__(self, connection_pool, config: BackupConfig):
         self.pool = connection_pool
         self.config = config
-        self.verifier = BackupVerifier(connection_pool)
+        self.verifier = BackupVerifier(
+            connection_pool,
+            memory_budget_bytes=config.verification_memory_budget,
+            chunk_size=config.verification_chunk_size
+        )
         self.backup_history: List[BackupMetadata] = []
         self.s3_client = None
         
@@ -594,10 +1191,20 @@ class DatabaseBackupManager:
                     status VARCHAR(50) NOT NULL,
                     error_message TEXT,
                     verification_results JSONB,
+                    block_checksums JSONB,
+                    compression VARCHAR(20),
                     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
                 )
             """)
             
+            # Tables created before block checksums and applied codecs were tracked
+            await conn.execute("""
+                ALTER TABLE backup_metadata ADD COLUMN IF NOT EXISTS block_checksums JSONB
+            """)
+            await conn.execute("""
+                ALTER TABLE backup_metadata ADD COLUMN IF NOT EXISTS compression VARCHAR(20)
+            """)
+            
             # Create indexes
             await conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_backup_metadata_database_time 
@@ -635,9 +1242,14 @@ class DatabaseBackupManager:
             
             # Execute backup based on type
             if backup_type == BackupType.LOGICAL:
-                await self._create_logical_backup(backup_metadata)
+                if self.config.dump_format == DumpFormat.DIRECTORY:
+                    await self._create_directory_backup(backup_metadata)
+                else:
+                    await self._create_logical_backup(backup_metadata)
             elif backup_type == BackupType.PHYSICAL:
                 await self._create_physical_backup(backup_metadata)
+            elif backup_type == BackupType.INCREMENTAL:
+                await self._create_incremental_backup(backup_metadata)
             else:
                 raise ValueError(f"Unsupported backup type: {backup_type}")
             
@@ -728,10 +1340,19 @@ class DatabaseBackupManager:
         return backup_metadata
     
     async def _create_logical_backup(self, backup_metadata: BackupMetadata):
-        """Create logical backup using pg_dump"""
+        """
+        Create logical backup using pg_dump
+        
+        pg_dump output is streamed through compression, hashing and storage
+        in ``stream_chunk_size`` pieces, so memory use stays constant
+        regardless of database size.
+        """
         
         # Prepare output file
+        compression, _ = _stream_compressor(self.config.compression, self.config.compression_level)
         output_file = self._get_backup_output_path(backup_metadata)
+        if compression in _COMPRESSION_SUFFIXES:
+            output_file = output_file.with_suffix(output_file.suffix + _COMPRESSION_SUFFIXES[compression])
         
         # Build pg_dump command
         cmd = [
@@ -739,58 +1360,140 @@ class DatabaseBackupManager:
             "--verbose",
             "--no-password",
             "--format=custom",
-            "--compress=9",
+            # The stream is compressed on the way out; compressing inside the archive too only burns CPU
+            f"--compress={0 if compression != CompressionType.NONE else self.config.compression_level}",
             "--no-privileges",
             "--no-owner",
             backup_metadata.database_name
         ]
         
         # Add connection parameters
-        cmd.extend([
-            "--host", os.getenv("DB_HOST", "localhost"),
-            "--port", os.getenv("DB_PORT", "5432"),
-            "--username", os.getenv("DB_USER", "postgres")
-        ])
+        cmd.extend(_pg_connection_args())
+        
+        sink = await asyncio.to_thread(self._open_backup_sink, output_file)
+        writer = _StreamingBackupWriter(
+            sink, self.config.compression, self.config.compression_level, self.config.checksum_block_size
+        )
+        progress = backup_stream_progress_bytes.labels(database=backup_metadata.database_name)
         
         # Execute backup
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception:
+            await asyncio.to_thread(writer.abort)
+            raise
+        
+        # Drain --verbose output concurrently so a full stderr pipe cannot stall pg_dump
+        stderr_task = asyncio.create_task(process.stderr.read())
+        
+        try:
+            while True:
+                chunk = await process.stdout.read(self.config.stream_chunk_size)
+                if not chunk:
+                    break
+                
+                stored_before = writer.stored_bytes
+                await asyncio.to_thread(writer.write, chunk)
+                
+                backup_stream_bytes.labels(backup_type=backup_metadata.backup_type.value, stage="read").inc(len(chunk))
+                backup_stream_bytes.labels(backup_type=backup_metadata.backup_type.value, stage="written").inc(
+                    writer.stored_bytes - stored_before
+                )
+                progress.set(writer.raw_bytes)
+            
+            await process.wait()
+            stderr = await stderr_task
+            
+            if process.returncode != 0:
+                raise RuntimeError(f"pg_dump failed: {stderr.decode()}")
+            
+            await asyncio.to_thread(writer.close)
+            
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+            await asyncio.to_thread(writer.abort)
+            raise
+        
+        finally:
+            progress.set(0)
+        
+        # Update metadata
+        backup_metadata.size_bytes = writer.raw_bytes
+        backup_metadata.compressed_size_bytes = writer.stored_bytes
+        backup_metadata.checksum = writer.checksum
+        backup_metadata.block_checksums = {"block_size": writer.block_size, "sha256": writer.block_checksums}
+        backup_metadata.compression = writer.compression
+        backup_metadata.storage_location = writer.sink.location
+        
+        # Get PostgreSQL version
+        async with self.pool.acquire() as conn:
+            pg_version = await conn.fetchval("SELECT version()")
+            backup_metadata.pg_version = pg_version.split()[1]  # Extract version number
+    
+    async def _create_directory_backup(self, backup_metadata: BackupMetadata):
+        """
+        Create logical backup using parallel pg_dump in directory format
+        
+        Each table is dumped by one of ``parallel_jobs`` workers into its own
+        compressed file, and the result can be restored with ``pg_restore
+        --jobs``. The dump is written locally, like physical backups.
+        """
+        
+        output_dir = self._get_backup_output_path(backup_metadata, is_directory=True)
+        
+        cmd = [
+            "pg_dump",
+            "--verbose",
+            "--no-password",
+            "--format=directory",
+            f"--jobs={max(1, self.config.parallel_jobs)}",
+            f"--compress={self.config.compression_level}",
+            "--no-privileges",
+            "--no-owner",
+            "--file", str(output_dir),
+            backup_metadata.database_name
+        ]
+        cmd.extend(_pg_connection_args())
+        
+        # Table data goes to files, so only --verbose output needs draining
         process = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE
         )
         
-        stdout, stderr = await process.communicate()
+        _, stderr = await process.communicate()
         
         if process.returncode != 0:
+            shutil.rmtree(output_dir, ignore_errors=True)
             raise RuntimeError(f"pg_dump failed: {stderr.decode()}")
         
-        # Write output to file
-        backup_content = stdout
-        
-        # Compress if configured
-        if self.config.compression == CompressionType.GZIP:
-            backup_content = gzip.compress(backup_content)
-            output_file = output_file.with_suffix(output_file.suffix + '.gz')
-        
-        # Write to storage
-        await self._write_backup_to_storage(backup_content, output_file, backup_metadata)
-        
-        # Update metadata
-        backup_metadata.size_bytes = len(stdout)
-        backup_metadata.compressed_size_bytes = len(backup_content)
-        backup_metadata.checksum = hashlib.sha256(backup_content).hexdigest()
-        backup_metadata.storage_location = str(output_file)
+        total_size = sum(f.stat().st_size for f in output_dir.rglob('*') if f.is_file())
+        backup_metadata.size_bytes = total_size
+        backup_metadata.compressed_size_bytes = total_size  # Compressed per table by pg_dump
+        backup_metadata.checksum = await self._calculate_directory_checksum(output_dir)
+        backup_metadata.storage_location = str(output_dir)
         
-        # Get PostgreSQL version
         async with self.pool.acquire() as conn:
             pg_version = await conn.fetchval("SELECT version()")
-            backup_metadata.pg_version = pg_version.split()[1]  # Extract version number
+            backup_metadata.pg_version = pg_version.split()[1]
     
     async def _create_physical_backup(self, backup_metadata: BackupMetadata):
         """Create physical backup using pg_basebackup"""
         
         output_dir = self._get_backup_output_path(backup_metadata, is_directory=True)
         
+        # Incremental backups replay WAL from here, so capture it before the copy starts
+        async with self.pool.acquire() as conn:
+            backup_metadata.wal_start_lsn = str(await conn.fetchval("SELECT pg_current_wal_lsn()"))
+        
         # Build pg_basebackup command
         cmd = [
             "pg_basebackup",
@@ -803,11 +1506,7 @@ class DatabaseBackupManager:
         ]
         
         # Add connection parameters
-        cmd.extend([
-            "--host", os.getenv("DB_HOST", "localhost"),
-            "--port", os.getenv("DB_PORT", "5432"),
-            "--username", os.getenv("DB_USER", "postgres")
-        ])
+        cmd.extend(_pg_connection_args())
         
         # Execute backup
         process = await asyncio.create_subprocess_exec(
@@ -833,9 +1532,113 @@ class DatabaseBackupManager:
         # Get WAL information
         async with self.pool.acquire() as conn:
             wal_info = await conn.fetchrow("SELECT pg_current_wal_lsn(), version()")
-            backup_metadata.wal_start_lsn = wal_info[0]
+            backup_metadata.wal_end_lsn = str(wal_info[0])
             backup_metadata.pg_version = wal_info[1].split()[1]
     
+    async def _create_incremental_backup(self, backup_metadata: BackupMetadata):
+        """
+        Create incremental backup from the WAL archive
+        
+        Forces a WAL switch so everything up to now is archived, then copies
+        the segments written since the previous incremental (or since the
+        base backup started) next to a ``wal_manifest.json``. The manifest
+        lists the base backup and every WAL directory in the chain, so one
+        incremental is enough to drive a point-in-time restore.
+        """
+        
+        if not self.config.wal_archive_path:
+            raise ValueError("Incremental backups require wal_archive_path")
+        
+        database_name = backup_metadata.database_name
+        base = self._latest_backup(database_name, BackupType.PHYSICAL)
+        if base is None or not base.wal_start_lsn:
+            raise ValueError(f"No completed physical base backup for {database_name}")
+        
+        previous = self._latest_backup(database_name, BackupType.INCREMENTAL, since=base.start_time)
+        previous_manifest = (
+            self.verifier._read_wal_manifest(Path(previous.storage_location)) if previous else None
+        )
+        
+        async with self.pool.acquire() as conn:
+            end_lsn = str(await conn.fetchval("SELECT pg_switch_wal()"))
+            last_segment = await conn.fetchval("SELECT pg_walfile_name($1::pg_lsn)", end_lsn)
+            start_lsn = previous_manifest["wal_end_lsn"] if previous_manifest else base.wal_start_lsn
+            first_segment = await conn.fetchval("SELECT pg_walfile_name($1::pg_lsn)", start_lsn)
+            pg_version = await conn.fetchval("SELECT version()")
+        
+        archive_dir = Path(self.config.wal_archive_path)
+        await self._wait_for_archived_segment(archive_dir, last_segment)
+        
+        segments = [
+            path for path in sorted(archive_dir.iterdir())
+            if _is_wal_segment(path.name)
+            # The previous incremental already holds the segment its end LSN falls in
+            and (path.name > first_segment if previous_manifest else path.name >= first_segment)
+            and path.name <= last_segment
+        ]
+        
+        output_dir = self._get_backup_output_path(backup_metadata, is_directory=True)
+        wal_dir = output_dir / "wal"
+        
+        try:
+            wal_dir.mkdir(parents=True)
+            copied = [await asyncio.to_thread(_copy_wal_segment, path, wal_dir) for path in segments]
+            
+            chain = list(previous_manifest["chain"]) if previous_manifest else []
+            chain.append({"backup_id": backup_metadata.backup_id, "wal_directory": str(wal_dir)})
+            manifest = {
+                "backup_id": backup_metadata.backup_id,
+                "database_name": database_name,
+                "base_backup_id": base.backup_id,
+                "base_location": base.storage_location,
+                "previous_backup_id": previous.backup_id if previous else None,
+                "wal_start_lsn": start_lsn,
+                "wal_end_lsn": end_lsn,
+                "segments": copied,
+                "chain": chain,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }
+            with voicehive_path_validator.open_safe_file(output_dir / WAL_MANIFEST_NAME, 'w') as f:
+                json.dump(manifest, f, indent=2)
+        except BaseException:
+            shutil.rmtree(output_dir, ignore_errors=True)
+            raise
+        
+        total_size = sum(segment["size_bytes"] for segment in copied)
+        backup_metadata.size_bytes = total_size
+        backup_metadata.compressed_size_bytes = total_size
+        backup_metadata.checksum = await self._calculate_directory_checksum(output_dir)
+        backup_metadata.storage_location = str(output_dir)
+        backup_metadata.wal_start_lsn = start_lsn
+        backup_metadata.wal_end_lsn = end_lsn
+        backup_metadata.pg_version = pg_version.split()[1]
+        
+        logger.info("incremental_backup_collected",
+                   backup_id=backup_metadata.backup_id,
+                   base_backup_id=base.backup_id,
+                   segments=len(copied))
+    
+    def _latest_backup(self, database_name: str, backup_type: BackupType,
+                       since: Optional[datetime] = None) -> Optional[BackupMetadata]:
+        """Most recent usable backup of a type from the loaded history"""
+        candidates = [
+            b for b in self.backup_history
+            if b.database_name == database_name
+            and b.backup_type == backup_type
+            and b.status in (BackupStatus.SUCCESS, BackupStatus.VERIFIED)
+            and (since is None or b.start_time >= since)
+        ]
+        return max(candidates, key=lambda b: b.start_time, default=None)
+    
+    async def _wait_for_archived_segment(self, archive_dir: Path, segment_name: str):
+        """Wait until archive_command has shipped ``segment_name``"""
+        deadline = asyncio.get_running_loop().time() + self.config.wal_archive_timeout_seconds
+        while not (archive_dir / segment_name).exists():
+            if asyncio.get_running_loop().time() >= deadline:
+                raise RuntimeError(f"WAL segment {segment_name} was not archived within "
+                                   f"{self.config.wal_archive_timeout_seconds}s")
+            await asyncio.sleep(1)
+    
     def _generate_backup_id(self, database_name: str, backup_type: BackupType) -> str:
         """Generate unique backup ID"""
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -864,66 +1667,33 @@ class DatabaseBackupManager:
             else:
                 return temp_dir / f"{backup_metadata.backup_id}.sql"
     
-    async def _write_backup_to_storage(self, backup_content: bytes, 
-                                     output_file: Path, 
-                                     backup_metadata: BackupMetadata):
-        """Write backup to configured storage"""
+    def _open_backup_sink(self, output_file: Path):
+        """Open the configured storage for a streamed backup"""
         
         if self.config.storage_type == StorageType.LOCAL:
             # Write to local file using secure path validation
             try:
-                with voicehive_path_validator.open_safe_file(output_file, 'wb') as f:
-                    f.write(backup_content)
+                return _LocalFileSink(output_file)
             except PathValidationError as e:
                 logger.error("Backup write path validation failed", output_file=str(output_file), error=str(e))
                 raise
         
         elif self.config.storage_type == StorageType.S3:
-            # Upload to S3
+            # Multipart upload, one part buffered at a time
             s3_key = f"{self.config.s3_prefix or 'backups'}/{output_file.name}"
-            
-            try:
-                self.s3_client.put_object(
-                    Bucket=self.config.s3_bucket,
-                    Key=s3_key,
-                    Body=backup_content,
-                    ServerSideEncryption='AES256' if self.config.encryption_enabled else None
-                )
-                
-                backup_metadata.storage_location = f"s3://{self.config.s3_bucket}/{s3_key}"
-                
-            except ClientError as e:
-                raise RuntimeError(f"S3 upload failed: {str(e)}")
+            return _S3MultipartSink(
+                self.s3_client,
+                self.config.s3_bucket,
+                s3_key,
+                self.config.multipart_part_size,
+                self.config.encryption_enabled
+            )
         
-        # Add other storage types as needed
+        raise ValueError(f"Streaming backups are not supported for storage type: {self.config.storage_type.value}")
     
     async def _calculate_directory_checksum(self, directory: Path) -> str:
-        """Calculate checksum of entire directory using secure path validation"""
-        sha256_hash = hashlib.sha256()
-
-        try:
-            # Validate the directory path first
-            safe_directory = voicehive_path_validator.get_safe_path(directory)
-
-            # Sort files for consistent checksum
-            files = sorted(safe_directory.rglob('*'))
-
-            for file_path in files:
-                if file_path.is_file():
-                    try:
-                        with voicehive_path_validator.open_safe_file(file_path, 'rb') as f:
-                            for chunk in iter(lambda: f.read(4096), b""):
-                                sha256_hash.update(chunk)
-                    except PathValidationError as e:
-                        logger.warning("Skipping file due to path validation failure",
-                                     file_path=str(file_path), error=str(e))
-                        continue
-
-        except PathValidationError as e:
-            logger.error("Directory checksum path validation failed", directory=str(directory), error=str(e))
-            raise
-
-        return sha256_hash.hexdigest()
+        """Calculate checksum of entire directory"""
+        return await self.verifier._calculate_directory_checksum(directory)
     
     async def _save_backup_metadata(self, backup_metadata: BackupMetadata):
         """Save backup metadata to database"""
@@ -933,8 +1703,8 @@ class DatabaseBackupManager:
                 (backup_id, database_name, backup_type, start_time, end_time,
                  size_bytes, compressed_size_bytes, checksum, storage_location,
                  encryption_key_id, pg_version, wal_start_lsn, wal_end_lsn,
-                 status, error_message, verification_results)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+                 status, error_message, verification_results, block_checksums, compression)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18)
                 ON CONFLICT (backup_id) DO UPDATE SET
                     end_time = EXCLUDED.end_time,
                     size_bytes = EXCLUDED.size_bytes,
@@ -943,7 +1713,9 @@ class DatabaseBackupManager:
                     storage_location = EXCLUDED.storage_location,
                     status = EXCLUDED.status,
                     error_message = EXCLUDED.error_message,
-                    verification_results = EXCLUDED.verification_results
+                    verification_results = EXCLUDED.verification_results,
+                    block_checksums = EXCLUDED.block_checksums,
+                    compression = EXCLUDED.compression
             """,
             backup_metadata.backup_id,
             backup_metadata.database_name,
@@ -960,7 +1732,9 @@ class DatabaseBackupManager:
             backup_metadata.wal_end_lsn,
             backup_metadata.status.value,
             backup_metadata.error_message,
-            json.dumps(backup_metadata.verification_results) if backup_metadata.verification_results else None
+            json.dumps(backup_metadata.verification_results) if backup_metadata.verification_results else None,
+            json.dumps(backup_metadata.block_checksums) if backup_metadata.block_checksums else None,
+            backup_metadata.compression.value if backup_metadata.compression else None
             )
     
     async def _load_backup_history(self):
@@ -991,7 +1765,9 @@ class DatabaseBackupManager:
                         wal_end_lsn=row['wal_end_lsn'],
                         status=BackupStatus(row['status']),
                         error_message=row['error_message'],
-                        verification_results=json.loads(row['verification_results']) if row['verification_results'] else {}
+                        verification_results=json.loads(row['verification_results']) if row['verification_results'] else {},
+                        block_checksums=json.loads(row['block_checksums']) if row.get('block_checksums') else {},
+                        compression=CompressionType(row['compression']) if row.get('compression') else None
                     )
                     self.backup_history.append(metadata)
                 
@@ -1025,6 +1801,13 @@ class DatabaseBackupManager:
                 validation_result["errors"].append(f"S3 connectivity test failed: {str(e)}")
                 validation_result["valid"] = False
         
+        if self.config.backup_type == BackupType.INCREMENTAL and not self.config.wal_archive_path:
+            validation_result["errors"].append("Incremental backups require wal_archive_path")
+            validation_result["valid"] = False
+        
+        if self.config.dump_format == DumpFormat.DIRECTORY and self.config.parallel_jobs < 2:
+            validation_result["warnings"].append("Directory dumps only run in parallel with parallel_jobs >= 2")
+        
         # Check retention policy
         if self.config.retention_days < 1:
             validation_result["errors"].append("Retention days must be at least 1")
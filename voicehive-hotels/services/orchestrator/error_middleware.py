@@ -7,33 +7,65 @@ import traceback
 from typing import Dict, Any, Optional
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from pydantic import ValidationError
 
+from correlation_middleware import get_correlation_id
 from logging_adapter import get_safe_logger
 
 logger = get_safe_logger("orchestrator.error_middleware")
 
 
-class ComprehensiveErrorMiddleware(BaseHTTPMiddleware):
-    """Comprehensive error handling middleware"""
+class ComprehensiveErrorMiddleware:
+    """
+    Comprehensive error handling middleware
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    Pure ASGI: exceptions raised before the response has started are turned
+    into standardized JSON errors. Once headers have been sent the
+    exception is logged and re-raised, since the response can no longer be
+    replaced.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle all exceptions and provide standardized responses"""
         
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_tracking_start)
             
         except Exception as e:
-            return await self._handle_exception(request, e)
+            if response_started:
+                logger.error(
+                    "exception_after_response_started",
+                    path=scope["path"],
+                    method=scope["method"],
+                    error_type=type(e).__name__,
+                    error_message=str(e)
+                )
+                raise
+            
+            response = await self._handle_exception(Request(scope, receive), e)
+            await response(scope, receive, send)
     
     async def _handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
         """Handle different types of exceptions"""
         
         # Get correlation ID for tracking
-        correlation_id = request.headers.get("X-Correlation-ID", "unknown")
+        correlation_id = get_correlation_id() or request.headers.get("X-Correlation-ID", "unknown")
         
         # Log the error
         logger.error(
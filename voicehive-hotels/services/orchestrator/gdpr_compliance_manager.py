@@ -7,9 +7,10 @@ import asyncio
 import json
 import hashlib
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, Set, Union, Tuple
+from typing import Dict, List, Any, Optional, Set, Union, Tuple, Callable
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from contextlib import asynccontextmanager
 from pathlib import Path
 import uuid
 
@@ -20,6 +21,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from logging_adapter import get_safe_logger
 from audit_logging import AuditLogger, AuditEventType, AuditSeverity, AuditContext
 from enhanced_pii_redactor import EnhancedPIIRedactor, PIICategory
+from gdpr_erasure_executor import (
+    ErasureExecutor, ErasureExecutorConfig, ErasureStore, ErasureWorkItem,
+    plan_erasure, restore_progress, summarize_by_category
+)
 
 logger = get_safe_logger("orchestrator.gdpr_compliance")
 
@@ -115,6 +120,7 @@ class ErasureRequest:
     completed_at: Optional[datetime] = None
     verification_token: Optional[str] = None
     verification_expires: Optional[datetime] = None
+    progress: Dict[str, Any] = field(default_factory=dict)  # Checkpointed work item states
     
     def generate_verification_token(self) -> str:
         """Generate verification token for erasure request"""
@@ -131,13 +137,23 @@ class GDPRComplianceManager:
                  db_session: AsyncSession,
                  audit_logger: Optional[AuditLogger] = None,
                  pii_redactor: Optional[EnhancedPIIRedactor] = None,
-                 config_path: Optional[str] = None):
+                 config_path: Optional[str] = None,
+                 session_factory: Optional[Callable[[], AsyncSession]] = None):
         self.db = db_session
         self.audit_logger = audit_logger or AuditLogger()
         self.pii_redactor = pii_redactor or EnhancedPIIRedactor()
         
+        # Independent sessions let erasure work items hit the database in parallel;
+        # without them, database work is serialized on db_session
+        self.session_factory = session_factory
+        self._db_lock = asyncio.Lock()
+        
         # Load configuration
         self.config = self._load_config(config_path)
+        self.erasure_executor_config = ErasureExecutorConfig(
+            store_concurrency=self.config["erasure_concurrency"],
+            max_attempts=self.config["erasure_max_attempts"]
+        )
         
         # Initialize data stores
         self.processing_records: Dict[str, ProcessingRecord] = {}
@@ -325,23 +341,41 @@ class GDPRComplianceManager:
         return True
     
     async def execute_erasure_request(self, request_id: str) -> Dict[str, Any]:
-        """Execute verified erasure request (Article 17)"""
+        """
+        Execute verified erasure request (Article 17)
         
-        request = self.erasure_requests.get(request_id)
-        if not request or request.status != "verified":
+        The request is planned into per-store work items that run concurrently
+        under per-store limits. Progress is checkpointed to gdpr_erasure_requests,
+        so re-executing a processing or failed request (after a crash or for a
+        retry) only runs the items that have not completed yet.
+        """
+        
+        request = self.erasure_requests.get(request_id) or await self._load_erasure_request(request_id)
+        if not request or request.status not in ("verified", "processing", "failed", "completed"):
             raise ValueError(f"Invalid or unverified erasure request: {request_id}")
         
-        request.status = "processing"
-        await self._update_erasure_request(request)
+        work_items = plan_erasure(request.data_subject_id, request.scope)
+        resumed_items = restore_progress(work_items, request.progress)
         
         erasure_results = {
             "request_id": request_id,
             "data_subject_id": request.data_subject_id,
             "started_at": datetime.now(timezone.utc).isoformat(),
             "scope": request.scope,
+            "resumed_items": resumed_items,
             "results": {}
         }
         
+        # Retrying a finished request is a no-op
+        if request.status == "completed":
+            erasure_results["results"] = summarize_by_category(work_items, request.scope)
+            erasure_results["completed_at"] = request.completed_at.isoformat() if request.completed_at else None
+            erasure_results["status"] = "success"
+            return erasure_results
+        
+        request.status = "processing"
+        await self._update_erasure_request(request)
+        
         try:
             # Get all processing records for the data subject
             subject_records = [
@@ -349,12 +383,17 @@ class GDPRComplianceManager:
                 if record.data_subject_id == request.data_subject_id
             ]
             
-            # Execute erasure for each data category in scope
-            for category in request.scope:
-                category_results = await self._erase_data_category(
-                    request.data_subject_id, category, subject_records
-                )
-                erasure_results["results"][category] = category_results
+            executor = ErasureExecutor(
+                handlers=self._erasure_handlers(),
+                checkpoint=lambda progress: self._checkpoint_erasure_request(request, progress),
+                config=self.erasure_executor_config
+            )
+            await executor.run(request.data_subject_id, work_items)
+            erasure_results["results"] = summarize_by_category(work_items, request.scope)
+            
+            failed_items = [item.item_id for item in work_items if item.status != "completed"]
+            if failed_items:
+                raise RuntimeError(f"{len(failed_items)} erasure work items failed: {', '.join(failed_items)}")
             
             # Update processing records status
             for record in subject_records:
@@ -544,119 +583,66 @@ class GDPRComplianceManager:
                                  processing_records: List[ProcessingRecord]) -> Dict[str, Any]:
         """Erase data for a specific category"""
         
-        category_results = {
-            "category": category,
-            "records_affected": 0,
-            "databases_updated": [],
-            "files_deleted": [],
-            "external_services_notified": [],
-            "errors": []
-        }
+        work_items = plan_erasure(data_subject_id, [category])
+        executor = ErasureExecutor(handlers=self._erasure_handlers(), config=self.erasure_executor_config)
+        await executor.run(data_subject_id, work_items)
         
-        try:
-            # Database erasure
-            if category in ["call_recordings", "transcripts", "metadata"]:
-                affected_rows = await self._erase_database_data(data_subject_id, category)
-                category_results["records_affected"] = affected_rows
-                category_results["databases_updated"].append(f"main_db_{category}")
-            
-            # File system erasure
-            if category in ["call_recordings", "audio_files"]:
-                deleted_files = await self._erase_file_data(data_subject_id, category)
-                category_results["files_deleted"] = deleted_files
-            
-            # External service notification
-            if category in ["voice_profiles", "ai_models"]:
-                notified_services = await self._notify_external_services_erasure(data_subject_id, category)
-                category_results["external_services_notified"] = notified_services
-            
-        except Exception as e:
-            error_msg = f"Failed to erase {category} for subject {data_subject_id}: {e}"
-            category_results["errors"].append(error_msg)
+        category_results = summarize_by_category(work_items, [category])[category]
+        for error_msg in category_results["errors"]:
             logger.error(error_msg)
         
         return category_results
     
-    async def _erase_database_data(self, data_subject_id: str, category: str) -> int:
-        """Erase data from database tables"""
-        
-        table_mappings = {
-            "call_recordings": ["call_recordings", "call_metadata"],
-            "transcripts": ["call_transcripts", "transcript_segments"],
-            "metadata": ["guest_preferences", "call_history"],
-            "pii_data": ["guest_profiles", "contact_information"]
+    def _erasure_handlers(self) -> Dict[str, Callable]:
+        """Erasure work item handlers keyed by store"""
+        return {
+            ErasureStore.DATABASE: self._erase_table,
+            ErasureStore.FILES: self._erase_files,
+            ErasureStore.EXTERNAL: self._notify_external_service,
         }
+    
+    @asynccontextmanager
+    async def _session(self):
+        """A database session for one unit of work"""
+        if self.session_factory is not None:
+            async with self.session_factory() as session:
+                yield session
+        else:
+            async with self._db_lock:
+                yield self.db
+    
+    async def _erase_table(self, item: ErasureWorkItem, data_subject_id: str) -> int:
+        """Delete a data subject's rows from one table"""
         
-        total_affected = 0
-        tables = table_mappings.get(category, [])
-        
-        for table in tables:
+        async with self._session() as session:
             try:
                 # Use parameterized query to prevent SQL injection
-                query = text(f"DELETE FROM {table} WHERE data_subject_id = :subject_id")
-                result = await self.db.execute(query, {"subject_id": data_subject_id})
-                affected_rows = result.rowcount
-                total_affected += affected_rows
-                
-                logger.info(f"Deleted {affected_rows} rows from {table} for subject {data_subject_id}")
-                
+                query = text(f"DELETE FROM {item.target} WHERE data_subject_id = :subject_id")
+                result = await session.execute(query, {"subject_id": data_subject_id})
+                await session.commit()
             except Exception as e:
-                logger.error(f"Failed to delete from {table}: {e}")
+                logger.error(f"Failed to delete from {item.target}: {e}")
+                await session.rollback()
                 raise
         
-        await self.db.commit()
-        return total_affected
+        logger.info(f"Deleted {result.rowcount} rows from {item.target} for subject {data_subject_id}")
+        return result.rowcount
     
-    async def _erase_file_data(self, data_subject_id: str, category: str) -> List[str]:
-        """Erase files from storage"""
-        
-        deleted_files = []
+    async def _erase_files(self, item: ErasureWorkItem, data_subject_id: str) -> List[str]:
+        """Erase files matching one storage pattern"""
         
         # This would integrate with actual file storage (S3, local filesystem, etc.)
         # For now, we'll simulate the process
-        
-        file_patterns = {
-            "call_recordings": [f"recordings/{data_subject_id}/*.wav", f"recordings/{data_subject_id}/*.mp3"],
-            "audio_files": [f"audio/{data_subject_id}/*"],
-            "documents": [f"documents/{data_subject_id}/*"]
-        }
-        
-        patterns = file_patterns.get(category, [])
-        
-        for pattern in patterns:
-            # Simulate file deletion
-            # In real implementation, this would use boto3 for S3, os.remove for local files, etc.
-            deleted_files.append(pattern)
-            logger.info(f"Deleted files matching pattern: {pattern}")
-        
-        return deleted_files
+        logger.info(f"Deleted files matching pattern: {item.target}")
+        return [item.target]
     
-    async def _notify_external_services_erasure(self, data_subject_id: str, category: str) -> List[str]:
-        """Notify external services about data erasure"""
-        
-        notified_services = []
-        
-        service_mappings = {
-            "voice_profiles": ["elevenlabs", "azure_speech"],
-            "ai_models": ["openai", "anthropic"],
-            "analytics": ["mixpanel", "amplitude"]
-        }
-        
-        services = service_mappings.get(category, [])
-        
-        for service in services:
-            try:
-                # This would make actual API calls to external services
-                # For now, we'll simulate the notification
-                
-                logger.info(f"Notified {service} about erasure for subject {data_subject_id}")
-                notified_services.append(service)
-                
-            except Exception as e:
-                logger.error(f"Failed to notify {service}: {e}")
-                # Don't raise here, continue with other services
+    async def _notify_external_service(self, item: ErasureWorkItem, data_subject_id: str) -> str:
+        """Notify one external service about data erasure"""
         
-        return notified_services
+        # This would make actual API calls to external services
+        # For now, we'll simulate the notification
+        logger.info(f"Notified {item.target} about erasure for subject {data_subject_id}")
+        return item.target
     
     async def _delete_expired_data(self, record: ProcessingRecord):
         """Delete data for expired processing record"""
@@ -901,6 +887,7 @@ class GDPRComplianceManager:
                 UPDATE gdpr_erasure_requests 
                 SET status = :status,
                     completed_at = :completed_at,
+                    progress = :progress,
                     updated_at = :updated_at
                 WHERE request_id = :request_id
             """)
@@ -909,6 +896,7 @@ class GDPRComplianceManager:
                 "request_id": request.request_id,
                 "status": request.status,
                 "completed_at": request.completed_at,
+                "progress": json.dumps(request.progress),
                 "updated_at": datetime.now(timezone.utc)
             })
             
@@ -919,6 +907,66 @@ class GDPRComplianceManager:
             await self.db.rollback()
             raise
     
+    async def _checkpoint_erasure_request(self, request: ErasureRequest, progress: Dict[str, Any]):
+        """Persist erasure work item progress"""
+        request.progress = progress
+        
+        async with self._session() as session:
+            try:
+                query = text("""
+                    UPDATE gdpr_erasure_requests 
+                    SET progress = :progress,
+                        updated_at = :updated_at
+                    WHERE request_id = :request_id
+                """)
+                
+                await session.execute(query, {
+                    "request_id": request.request_id,
+                    "progress": json.dumps(progress),
+                    "updated_at": datetime.now(timezone.utc)
+                })
+                
+                await session.commit()
+                
+            except Exception:
+                await session.rollback()
+                raise
+    
+    async def _load_erasure_request(self, request_id: str) -> Optional[ErasureRequest]:
+        """Load an erasure request, with its checkpointed progress, from the database"""
+        query = text("""
+            SELECT request_id, data_subject_id, requested_at, requested_by, reason, scope,
+                   status, verification_token, verification_expires, completed_at, progress
+            FROM gdpr_erasure_requests
+            WHERE request_id = :request_id
+        """)
+        
+        result = await self.db.execute(query, {"request_id": request_id})
+        row = result.mappings().fetchone()
+        if not row:
+            return None
+        
+        def decode(value, default):
+            if value is None:
+                return default
+            return json.loads(value) if isinstance(value, (str, bytes)) else value
+        
+        request = ErasureRequest(
+            request_id=row["request_id"],
+            data_subject_id=row["data_subject_id"],
+            requested_at=row["requested_at"],
+            requested_by=row["requested_by"],
+            reason=row["reason"],
+            scope=decode(row["scope"], []),
+            status=row["status"],
+            completed_at=row["completed_at"],
+            verification_token=row["verification_token"],
+            verification_expires=row["verification_expires"],
+            progress=decode(row["progress"], {})
+        )
+        self.erasure_requests[request_id] = request
+        return request
+    
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load GDPR configuration"""
         
@@ -930,6 +978,12 @@ class GDPRComplianceManager:
                 "audit_logs": 2555
             },
             "erasure_verification_required": True,
+            "erasure_concurrency": {
+                "database": 4,
+                "files": 8,
+                "external": 4
+            },
+            "erasure_max_attempts": 3,
             "automatic_retention_enforcement": True,
             "compliance_check_frequency": "daily"
         }
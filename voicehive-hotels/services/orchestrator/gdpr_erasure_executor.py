@@ -0,0 +1,233 @@
+"""
+GDPR Erasure Executor for VoiceHive Hotels
+Plans Article 17 erasures as per-store work items and runs them concurrently
+"""
+
+import asyncio
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Set, Callable, Awaitable
+
+from logging_adapter import get_safe_logger
+
+logger = get_safe_logger("orchestrator.gdpr_erasure")
+
+
+# Where each data category lives, per store
+ERASURE_TABLES: Dict[str, List[str]] = {
+    "call_recordings": ["call_recordings", "call_metadata"],
+    "transcripts": ["call_transcripts", "transcript_segments"],
+    "metadata": ["guest_preferences", "call_history"],
+    "pii_data": ["guest_profiles", "contact_information"],
+}
+
+ERASURE_FILE_PATTERNS: Dict[str, List[str]] = {
+    "call_recordings": ["recordings/{subject}/*.wav", "recordings/{subject}/*.mp3"],
+    "audio_files": ["audio/{subject}/*"],
+    "documents": ["documents/{subject}/*"],
+}
+
+ERASURE_EXTERNAL_SERVICES: Dict[str, List[str]] = {
+    "voice_profiles": ["elevenlabs", "azure_speech"],
+    "ai_models": ["openai", "anthropic"],
+    "analytics": ["mixpanel", "amplitude"],
+}
+
+
+class ErasureStore:
+    """Data stores an erasure fans out to"""
+    DATABASE = "database"
+    FILES = "files"
+    EXTERNAL = "external"
+
+
+# Categories each store erases automatically. The maps above also list
+# targets (pii_data tables, documents, analytics) that stay out of scope.
+ERASURE_STORE_CATEGORIES: Dict[str, Set[str]] = {
+    ErasureStore.DATABASE: {"call_recordings", "transcripts", "metadata"},
+    ErasureStore.FILES: {"call_recordings", "audio_files"},
+    ErasureStore.EXTERNAL: {"voice_profiles", "ai_models"},
+}
+
+
+@dataclass
+class ErasureWorkItem:
+    """One unit of erasure work against a single store target"""
+    store: str
+    category: str
+    target: str  # table name, file pattern or service name
+    status: str = "pending"  # pending, completed, failed
+    attempts: int = 0
+    result: Any = None
+    error: Optional[str] = None
+    completed_at: Optional[str] = None
+
+    @property
+    def item_id(self) -> str:
+        """Stable identifier used to match checkpointed progress"""
+        return f"{self.store}:{self.category}:{self.target}"
+
+
+def plan_erasure(data_subject_id: str, scope: List[str]) -> List[ErasureWorkItem]:
+    """Expand an erasure scope into per-store work items"""
+    items: Dict[str, ErasureWorkItem] = {}
+
+    def targets(store: str, category: str, mapping: Dict[str, List[str]]) -> List[str]:
+        return mapping.get(category, []) if category in ERASURE_STORE_CATEGORIES[store] else []
+
+    for category in scope:
+        candidates = (
+            [ErasureWorkItem(ErasureStore.DATABASE, category, table)
+             for table in targets(ErasureStore.DATABASE, category, ERASURE_TABLES)]
+            + [ErasureWorkItem(ErasureStore.FILES, category, pattern.format(subject=data_subject_id))
+               for pattern in targets(ErasureStore.FILES, category, ERASURE_FILE_PATTERNS)]
+            + [ErasureWorkItem(ErasureStore.EXTERNAL, category, service)
+               for service in targets(ErasureStore.EXTERNAL, category, ERASURE_EXTERNAL_SERVICES)]
+        )
+        for item in candidates:
+            items.setdefault(item.item_id, item)
+
+    return list(items.values())
+
+
+def restore_progress(items: List[ErasureWorkItem], progress: Optional[Dict[str, Any]]) -> int:
+    """Carry completed items over from a checkpoint; returns how many were restored"""
+    if not progress:
+        return 0
+
+    restored = 0
+    saved = progress.get("items", {})
+    for item in items:
+        state = saved.get(item.item_id)
+        if state and state.get("status") == "completed":
+            item.status = "completed"
+            item.attempts = state.get("attempts", 0)
+            item.result = state.get("result")
+            item.completed_at = state.get("completed_at")
+            restored += 1
+    return restored
+
+
+@dataclass
+class ErasureExecutorConfig:
+    """Concurrency and retry settings for the erasure executor"""
+
+    # Work items in flight at once, per store
+    store_concurrency: Dict[str, int] = field(default_factory=lambda: {
+        ErasureStore.DATABASE: 4,
+        ErasureStore.FILES: 8,
+        ErasureStore.EXTERNAL: 4,
+    })
+
+    max_attempts: int = 3
+    retry_backoff_seconds: float = 0.5
+
+
+class ErasureExecutor:
+    """
+    Runs erasure work items concurrently with per-store limits.
+
+    Every handler must be idempotent (deleting what is already gone is a
+    no-op), so an item is simply re-run after a crash or retry. Progress
+    is handed to ``checkpoint`` after each item settles; completed items
+    are never run again for the same request.
+    """
+
+    def __init__(self,
+                 handlers: Dict[str, Callable[[ErasureWorkItem, str], Awaitable[Any]]],
+                 checkpoint: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+                 config: Optional[ErasureExecutorConfig] = None):
+        self.handlers = handlers
+        self.checkpoint = checkpoint
+        self.config = config or ErasureExecutorConfig()
+        self._checkpoint_lock = asyncio.Lock()
+
+    async def run(self, data_subject_id: str, items: List[ErasureWorkItem]) -> List[ErasureWorkItem]:
+        """Run every pending item; failures are recorded on the item, not raised"""
+        semaphores = {
+            store: asyncio.Semaphore(max(1, limit))
+            for store, limit in self.config.store_concurrency.items()
+        }
+        pending = [item for item in items if item.status != "completed"]
+
+        async def run_item(item: ErasureWorkItem):
+            semaphore = semaphores.setdefault(item.store, asyncio.Semaphore(1))
+            async with semaphore:
+                await self._run_with_retries(item, data_subject_id)
+            await self._save_progress(items)
+
+        await asyncio.gather(*(run_item(item) for item in pending))
+        return items
+
+    async def _run_with_retries(self, item: ErasureWorkItem, data_subject_id: str):
+        """Run one item, retrying with linear backoff"""
+        handler = self.handlers.get(item.store)
+        if handler is None:
+            item.status = "failed"
+            item.error = f"No erasure handler for store: {item.store}"
+            return
+
+        while item.attempts < self.config.max_attempts:
+            item.attempts += 1
+            try:
+                item.result = await handler(item, data_subject_id)
+                item.status = "completed"
+                item.error = None
+                item.completed_at = datetime.now(timezone.utc).isoformat()
+                return
+            except Exception as e:
+                item.error = str(e)
+                logger.warning("erasure_item_failed", item=item.item_id, attempt=item.attempts, error=str(e))
+                if item.attempts < self.config.max_attempts:
+                    await asyncio.sleep(self.config.retry_backoff_seconds * item.attempts)
+
+        item.status = "failed"
+
+    async def _save_progress(self, items: List[ErasureWorkItem]):
+        """Checkpoint the state of every item"""
+        if self.checkpoint is None:
+            return
+
+        progress = {
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "items": {item.item_id: asdict(item) for item in items},
+        }
+        async with self._checkpoint_lock:
+            try:
+                await self.checkpoint(progress)
+            except Exception as e:
+                # A lost checkpoint only means re-running idempotent work on resume
+                logger.error("erasure_checkpoint_failed", error=str(e))
+
+
+def _empty_category_result(category: str) -> Dict[str, Any]:
+    """Result shape for one erased data category"""
+    return {
+        "category": category,
+        "records_affected": 0,
+        "databases_updated": [],
+        "files_deleted": [],
+        "external_services_notified": [],
+        "errors": []
+    }
+
+
+def summarize_by_category(items: List[ErasureWorkItem], scope: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fold work item outcomes into the per-category erasure result format"""
+    results = {category: _empty_category_result(category) for category in scope}
+
+    for item in items:
+        category_results = results.setdefault(item.category, _empty_category_result(item.category))
+        if item.status != "completed":
+            category_results["errors"].append(
+                f"Failed to erase {item.target} ({item.store}) for {item.category}: {item.error}"
+            )
+        elif item.store == ErasureStore.DATABASE:
+            category_results["records_affected"] += item.result or 0
+            category_results["databases_updated"].append(item.target)
+        elif item.store == ErasureStore.FILES:
+            category_results["files_deleted"].extend(item.result or [])
+        elif item.store == ErasureStore.EXTERNAL:
+            category_results["external_services_notified"].append(item.target)
+
+    return results
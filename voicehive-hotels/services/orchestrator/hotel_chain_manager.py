@@ -5,8 +5,13 @@ Provides hierarchical configuration, multi-property operations, and chain-level
 
 import asyncio
 import json
+import math
+from collections import deque
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Union, Set, Tuple
+from typing import (
+    Any, AsyncContextManager, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+)
 from enum import Enum
 from uuid import uuid4
 
@@ -188,6 +193,18 @@ class ChainOperation(BaseModel):
     failed_properties: List[str] = Field(default_factory=list)
     skipped_properties: List[str] = Field(default_factory=list)
 
+    # Execution strategy
+    batch_size: int = Field(50, ge=1, description="Properties per checkpointed batch")
+    max_concurrency: int = Field(10, ge=1, description="Properties processed at once")
+    properties_per_second: float = Field(0.0, ge=0, description="Start rate limit (0 = unlimited)")
+    # Cumulative share of targets reached by each wave; the first wave is the canary
+    rollout_waves: List[float] = Field(default_factory=lambda: [1.0])
+    wave_pause_seconds: float = Field(0.0, ge=0, description="Bake time between waves")
+    # A wave failing on more than this share of its properties halts the rollout
+    max_failure_rate: float = Field(1.0, ge=0, le=1)
+    completed_batches: int = 0
+    current_wave: int = 0
+
     # Approval and authorization
     requires_approval: bool = True
     approved_by: Optional[str] = None
@@ -245,23 +262,112 @@ class ChainAnalytics(BaseModel):
     generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# Chain totals, regional breakdown and call-volume rankings in one round trip.
+# Rooms, calls, regions and rankings cover active properties with a tenant.
+CHAIN_ANALYTICS_QUERY = text("""
+    WITH props AS (
+        SELECT
+            h.property_id,
+            h.property_data->>'property_status' AS property_status,
+            h.property_data->>'region' AS region,
+            COALESCE((h.property_data->>'room_count')::int, 0) AS rooms,
+            COALESCE((t.metadata->'current_usage'->>'calls_count')::bigint, 0) AS calls,
+            t.tenant_id IS NOT NULL AS has_tenant
+        FROM chain_property_hierarchies h
+        LEFT JOIN tenant_metadata t ON t.tenant_id = h.property_id
+        WHERE h.chain_id = :chain_id
+    ),
+    scored AS (
+        SELECT property_id, region, rooms, calls
+        FROM props
+        WHERE property_status = 'active' AND has_tenant
+    ),
+    regions AS (
+        SELECT region, COUNT(*) AS properties, SUM(calls) AS calls
+        FROM scored
+        GROUP BY region
+    )
+    SELECT
+        (SELECT COUNT(*) FROM props) AS total_properties,
+        (SELECT COUNT(*) FROM props WHERE property_status = 'active') AS active_properties,
+        (SELECT COALESCE(SUM(rooms), 0) FROM scored) AS total_rooms,
+        (SELECT COALESCE(SUM(calls), 0) FROM scored) AS total_calls,
+        (SELECT COALESCE(AVG(calls), 0) FROM scored) AS average_calls,
+        (
+            SELECT COALESCE(json_object_agg(
+                region, json_build_object('properties', properties, 'calls', calls, 'revenue', 0.0)
+            ), '{}'::json)
+            FROM regions
+        ) AS by_region,
+        (
+            SELECT COALESCE(json_agg(property_id ORDER BY calls DESC, property_id), '[]'::json)
+            FROM (SELECT property_id, calls FROM scored ORDER BY calls DESC, property_id LIMIT 5) top
+        ) AS top_properties,
+        (
+            SELECT COALESCE(json_agg(json_build_array(property_id, calls) ORDER BY calls DESC, property_id), '[]'::json)
+            FROM (SELECT property_id, calls FROM scored ORDER BY calls ASC, property_id DESC LIMIT 5) bottom
+        ) AS bottom_properties
+""")
+
+
+def _json_value(value: Any) -> Any:
+    """JSON columns arrive as text or already decoded depending on the driver"""
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+class _StartPacer:
+    """Spaces out property starts to at most ``rate`` per second"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(self._next_start, loop.time()) + self.interval
+
+
 class HotelChainManager:
     """Comprehensive hotel chain management with hierarchical operations"""
 
+    # Materialized effective configurations, one Redis key per property
+    EFFECTIVE_CONFIG_PREFIX = "chain:effective_config:"
+    EFFECTIVE_CONFIG_VERSION_KEY = "chain:effective_config:version"
+
+    # Redis stream feeding chain operation workers
+    OPERATION_STREAM = "chain:operations"
+    OPERATION_WORKER_GROUP = "chain-operation-workers"
+    # Pending operations idle this long belong to a worker that died
+    OPERATION_CLAIM_IDLE_MS = 60000
+
     def __init__(
         self,
         redis_client: redis.Redis,
         db_session: AsyncSession,
-        tenant_manager: TenantManager
+        tenant_manager: TenantManager,
+        session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None
     ):
         self.redis = redis_client
         self.db = db_session
         self.tenant_manager = tenant_manager
+        # Chain operations open one session per concurrent lane; without a
+        # factory they run sequentially on the shared session
+        self.session_factory = session_factory
 
         # Caching
         self.chain_cache: Dict[str, ChainMetadata] = {}
         self.property_cache: Dict[str, PropertyHierarchy] = {}
         self.cache_ttl = 1800  # 30 minutes
+        # Entries are refreshed on every chain write; the TTL only bounds
+        # staleness from tenant config edits made outside this manager
+        self.effective_config_ttl = 86400
 
     # Chain Lifecycle Management
 
@@ -390,6 +496,9 @@ class HotelChainManager:
         if inheritance_type != ConfigInheritanceType.NO_INHERITANCE:
             await self._apply_inherited_configurations(property_hierarchy)
 
+        self.property_cache[property_tenant_id] = property_hierarchy
+        await self.refresh_effective_configuration(property_tenant_id)
+
         # Update chain statistics
         await self._update_chain_statistics(chain_id)
 
@@ -429,6 +538,7 @@ class HotelChainManager:
         await self.tenant_manager.update_tenant(property_id, {
             "chain_hierarchy": None
         })
+        await self._invalidate_effective_configuration(property_id)
 
         # Update chain statistics
         await self._update_chain_statistics(chain_id)
@@ -484,7 +594,9 @@ class HotelChainManager:
                 created_by=updated_by
             )
 
-            await self._execute_chain_operation(operation)
+            await self._execute_chain_operation(operation, refresh_configs=False)
+
+        await self.refresh_chain_configurations(chain_id)
 
         logger.info("chain_configuration_updated",
                    chain_id=chain_id,
@@ -498,22 +610,227 @@ class HotelChainManager:
         property_id: str,
         config_section: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get effective configuration for a property (including inheritance)"""
+        """
+        Get effective configuration for a property (including inheritance)
+
+        Served from the materialized store; a property that has not been
+        materialized yet (or whose entry expired) is computed and stored.
+        """
+        entry = await self._load_effective_configuration(property_id)
+        if entry is None:
+            entry = await self._materialize_effective_configuration(property_id)
 
+        effective_config = entry["config"]
+
+        # Return specific section if requested
+        if config_section:
+            return effective_config.get(config_section, {})
+
+        return effective_config
+
+    async def get_effective_configuration_version(self, property_id: str) -> Optional[int]:
+        """Version tag of a property's materialized configuration, if any"""
+        entry = await self._load_effective_configuration(property_id)
+        return entry["version"] if entry else None
+
+    async def update_property_overrides(
+        self,
+        property_id: str,
+        overrides: Dict[str, Any],
+        replace: bool = False
+    ) -> PropertyHierarchy:
+        """Update a property's local configuration overrides"""
         property_hierarchy = await self.get_property_hierarchy(property_id)
         if not property_hierarchy:
             raise ValueError(f"Property {property_id} not found")
 
-        # Start with property's base configuration
-        property_tenant = await self.tenant_manager.get_tenant(property_id)
+        if replace:
+            property_hierarchy.local_overrides = dict(overrides)
+        else:
+            property_hierarchy.local_overrides.update(overrides)
+        property_hierarchy.updated_at = datetime.now(timezone.utc)
+
+        await self._save_property_hierarchy(property_hierarchy)
+        self.property_cache[property_id] = property_hierarchy
+
+        await self.refresh_effective_configuration(property_id)
+
+        logger.info("property_overrides_updated",
+                   property_id=property_id,
+                   keys=list(overrides.keys()))
+
+        return property_hierarchy
+
+    async def move_property(
+        self,
+        property_id: str,
+        new_parent_property_id: Optional[str]
+    ) -> PropertyHierarchy:
+        """Re-parent a property (and its subtree) within its chain"""
+        property_hierarchy = await self.get_property_hierarchy(property_id)
+        if not property_hierarchy:
+            raise ValueError(f"Property {property_id} not found")
+
+        properties = {
+            p.property_id: p for p in await self.get_chain_properties(property_hierarchy.chain_id)
+        }
+        properties[property_id] = property_hierarchy
+        children = self._children_by_parent(properties.values())
+
+        new_level = 1
+        if new_parent_property_id:
+            new_parent = properties.get(new_parent_property_id)
+            if not new_parent:
+                raise ValueError(f"Invalid parent property {new_parent_property_id}")
+            if new_parent_property_id in self._subtree_ids(property_id, children):
+                raise ValueError(f"Cannot move property {property_id} under its own descendant")
+            new_level = new_parent.level + 1
+
+        # Shift the subtree by the change in depth
+        level_delta = new_level - property_hierarchy.level
+        subtree = [properties[pid] for pid in self._subtree_ids(property_id, children)]
+        if any(p.level + level_delta > 5 for p in subtree):
+            raise ValueError(f"Moving property {property_id} would exceed the maximum hierarchy depth")
+
+        property_hierarchy.parent_property_id = new_parent_property_id
+        now = datetime.now(timezone.utc)
+        for hierarchy in subtree:
+            hierarchy.level += level_delta
+            hierarchy.updated_at = now
+            await self._save_property_hierarchy(hierarchy)
+            self.property_cache[hierarchy.property_id] = hierarchy
+
+        await self.tenant_manager.update_tenant(property_id, {
+            "chain_hierarchy": {
+                "chain_id": property_hierarchy.chain_id,
+                "parent_property_id": new_parent_property_id,
+                "property_level": property_hierarchy.level
+            }
+        })
+
+        await self.refresh_effective_configuration(property_id)
+
+        logger.info("property_moved",
+                   property_id=property_id,
+                   parent_id=new_parent_property_id,
+                   subtree_size=len(subtree))
+
+        return property_hierarchy
+
+    # Effective Configuration Materialization
+
+    async def refresh_effective_configuration(self, property_id: str) -> int:
+        """
+        Recompute the materialized configuration of a property and everything below it
+
+        Returns the version tag assigned to the recomputed entries.
+        """
+        property_hierarchy = await self.get_property_hierarchy(property_id)
+        if not property_hierarchy:
+            raise ValueError(f"Property {property_id} not found")
+        return await self._refresh_subtrees(property_hierarchy.chain_id, [property_id])
+
+    async def refresh_chain_configurations(self, chain_id: str) -> int:
+        """Recompute the materialized configuration of every property in a chain"""
+        return await self._refresh_subtrees(chain_id, None)
+
+    async def _refresh_subtrees(self, chain_id: str, root_ids: Optional[List[str]]) -> int:
+        """
+        Recompute materialized configurations top-down from ``root_ids``
+
+        The chain's hierarchy is read once and walked parent-first, so every
+        property is merged against its parent's freshly computed config
+        instead of re-resolving its ancestors. ``None`` refreshes the whole
+        chain. All entries written by one refresh share a version tag.
+        """
+        chain = await self.get_chain(chain_id)
+        properties = {p.property_id: p for p in await self.get_chain_properties(chain_id)}
+        for property_id in root_ids or []:
+            if property_id not in properties:
+                hierarchy = await self.get_property_hierarchy(property_id)
+                if hierarchy:
+                    properties[property_id] = hierarchy
+        children = self._children_by_parent(properties.values())
+
+        if root_ids is None:
+            root_ids = [
+                pid for pid, p in properties.items()
+                if not p.parent_property_id or p.parent_property_id not in properties
+            ]
+
+        version = await self.redis.incr(self.EFFECTIVE_CONFIG_VERSION_KEY)
+        entries: Dict[str, Dict[str, Any]] = {}
+        computed: Dict[str, Dict[str, Any]] = {}
+
+        for root_id in root_ids:
+            root = properties.get(root_id)
+            if not root:
+                continue
+            parent_config = None
+            if root.parent_property_id:
+                parent_config = await self.get_effective_configuration(root.parent_property_id)
+
+            queue: Deque[Tuple[PropertyHierarchy, Optional[Dict[str, Any]]]] = deque([(root, parent_config)])
+            while queue:
+                hierarchy, inherited_parent = queue.popleft()
+                if hierarchy.property_id in computed:
+                    continue
+                try:
+                    config = await self._compute_effective_configuration(hierarchy, chain, inherited_parent)
+                except ValueError as e:
+                    logger.warning("effective_config_refresh_skipped",
+                                 property_id=hierarchy.property_id,
+                                 error=str(e))
+                    continue
+
+                computed[hierarchy.property_id] = config
+                entries[hierarchy.property_id] = self._effective_config_entry(hierarchy, config, version)
+                queue.extend((child, config) for child in children.get(hierarchy.property_id, []))
+
+        await self._store_effective_configurations(entries)
+
+        logger.info("effective_configurations_refreshed",
+                   chain_id=chain_id,
+                   properties=len(entries),
+                   version=version)
+
+        return version
+
+    async def _materialize_effective_configuration(self, property_id: str) -> Dict[str, Any]:
+        """Compute and store a single property's configuration on a cache miss"""
+        property_hierarchy = await self.get_property_hierarchy(property_id)
+        if not property_hierarchy:
+            raise ValueError(f"Property {property_id} not found")
+
+        parent_config = None
+        if property_hierarchy.parent_property_id:
+            # Materializes missing ancestors once on the way up
+            parent_config = await self.get_effective_configuration(property_hierarchy.parent_property_id)
+
+        chain = await self.get_chain(property_hierarchy.chain_id)
+        config = await self._compute_effective_configuration(property_hierarchy, chain, parent_config)
+
+        version = await self.redis.incr(self.EFFECTIVE_CONFIG_VERSION_KEY)
+        entry = self._effective_config_entry(property_hierarchy, config, version)
+        await self._store_effective_configurations({property_id: entry})
+        return entry
+
+    async def _compute_effective_configuration(
+        self,
+        property_hierarchy: PropertyHierarchy,
+        chain: Optional[ChainMetadata],
+        parent_config: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Merge tenant config, inherited config and local overrides for one property"""
+        property_tenant = await self.tenant_manager.get_tenant(property_hierarchy.property_id)
         if not property_tenant:
-            raise ValueError(f"Property tenant {property_id} not found")
+            raise ValueError(f"Property tenant {property_hierarchy.property_id} not found")
 
-        effective_config = property_tenant.tenant_config.model_dump()
+        effective_config = property_tenant.tenant_config.model_dump(mode="json")
 
         # Apply inherited configurations based on inheritance type
         if property_hierarchy.inheritance_type != ConfigInheritanceType.NO_INHERITANCE:
-            inherited_config = await self._get_inherited_configuration(property_hierarchy)
+            inherited_config = self._merge_inherited_configuration(chain, parent_config)
 
             if property_hierarchy.inheritance_type == ConfigInheritanceType.FULL_INHERITANCE:
                 # Full inheritance: chain config overrides local config
@@ -531,12 +848,85 @@ class HotelChainManager:
         if property_hierarchy.local_overrides:
             effective_config.update(property_hierarchy.local_overrides)
 
-        # Return specific section if requested
-        if config_section:
-            return effective_config.get(config_section, {})
-
         return effective_config
 
+    @staticmethod
+    def _merge_inherited_configuration(
+        chain: Optional[ChainMetadata],
+        parent_config: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Chain policies overlaid with the parent's effective configuration"""
+        inherited_config = {}
+        if chain:
+            inherited_config.update(chain.chain_policies)
+        if parent_config:
+            inherited_config.update(parent_config)
+        return inherited_config
+
+    @staticmethod
+    def _effective_config_entry(
+        property_hierarchy: PropertyHierarchy,
+        config: Dict[str, Any],
+        version: int
+    ) -> Dict[str, Any]:
+        return {
+            "property_id": property_hierarchy.property_id,
+            "chain_id": property_hierarchy.chain_id,
+            "version": version,
+            "computed_at": datetime.now(timezone.utc).isoformat(),
+            "config": config
+        }
+
+    async def _load_effective_configuration(self, property_id: str) -> Optional[Dict[str, Any]]:
+        """Read a materialized entry: one Redis round trip"""
+        try:
+            cached = await self.redis.get(f"{self.EFFECTIVE_CONFIG_PREFIX}{property_id}")
+        except Exception as e:
+            logger.warning("effective_config_cache_read_error", property_id=property_id, error=str(e))
+            return None
+        return json.loads(cached) if cached else None
+
+    async def _store_effective_configurations(self, entries: Dict[str, Dict[str, Any]]):
+        """Write materialized entries in one pipeline"""
+        if not entries:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for property_id, entry in entries.items():
+                pipe.setex(
+                    f"{self.EFFECTIVE_CONFIG_PREFIX}{property_id}",
+                    self.effective_config_ttl,
+                    json.dumps(entry, default=str)
+                )
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("effective_config_cache_write_error", properties=len(entries), error=str(e))
+
+    async def _invalidate_effective_configuration(self, property_id: str):
+        try:
+            await self.redis.delete(f"{self.EFFECTIVE_CONFIG_PREFIX}{property_id}")
+        except Exception as e:
+            logger.warning("effective_config_cache_delete_error", property_id=property_id, error=str(e))
+
+    @staticmethod
+    def _children_by_parent(properties) -> Dict[str, List[PropertyHierarchy]]:
+        children: Dict[str, List[PropertyHierarchy]] = {}
+        for hierarchy in properties:
+            if hierarchy.parent_property_id:
+                children.setdefault(hierarchy.parent_property_id, []).append(hierarchy)
+        return children
+
+    @staticmethod
+    def _subtree_ids(property_id: str, children: Dict[str, List[PropertyHierarchy]]) -> List[str]:
+        subtree = [property_id]
+        seen = {property_id}
+        for current in subtree:
+            for child in children.get(current, []):
+                if child.property_id not in seen:
+                    seen.add(child.property_id)
+                    subtree.append(child.property_id)
+        return subtree
+
     # Chain Operations
 
     async def execute_chain_wide_operation(
@@ -548,9 +938,19 @@ class HotelChainManager:
         created_by: str,
         target_properties: Optional[List[str]] = None,
         target_property_types: Optional[List[PropertyType]] = None,
-        scheduled_start: Optional[datetime] = None
+        scheduled_start: Optional[datetime] = None,
+        background: bool = False,
+        **execution_options
     ) -> ChainOperation:
-        """Execute a chain-wide operation"""
+        """
+        Execute a chain-wide operation
+
+        ``execution_options`` set the ChainOperation execution strategy
+        (``batch_size``, ``max_concurrency``, ``properties_per_second``,
+        ``rollout_waves``, ``wave_pause_seconds``, ``max_failure_rate``).
+        With ``background=True`` the operation is queued for
+        ``run_operation_worker`` instead of running in this request.
+        """
 
         operation = ChainOperation(
             chain_id=chain_id,
@@ -560,9 +960,14 @@ class HotelChainManager:
             target_properties=target_properties or [],
             target_property_types=target_property_types or [],
             scheduled_start=scheduled_start or datetime.now(timezone.utc),
-            created_by=created_by
+            created_by=created_by,
+            **execution_options
         )
 
+        if background:
+            await self.enqueue_chain_operation(operation)
+            return operation
+
         # Save operation
         await self._save_chain_operation(operation)
 
@@ -572,12 +977,23 @@ class HotelChainManager:
 
         return operation
 
-    async def _execute_chain_operation(self, operation: ChainOperation) -> bool:
-        """Execute a chain operation across properties"""
+    async def _execute_chain_operation(self, operation: ChainOperation, refresh_configs: bool = True) -> bool:
+        """
+        Execute a chain operation across properties
+
+        Targets are rolled out wave by wave (``rollout_waves``, canary
+        first) in batches of ``batch_size``, each batch processed by up to
+        ``max_concurrency`` lanes and paced by ``properties_per_second``.
+        Progress is checkpointed to ``chain_operations`` after every batch
+        and published for ``stream_operation_progress``. Properties already
+        recorded as succeeded or failed are skipped, so an interrupted
+        operation resumes where it stopped.
+        """
         try:
             operation.status = "in_progress"
-            operation.actual_start = datetime.now(timezone.utc)
+            operation.actual_start = operation.actual_start or datetime.now(timezone.utc)
             await self._save_chain_operation(operation)
+            await self._publish_operation_progress(operation)
 
             # Get target properties
             target_properties = await self._get_operation_targets(operation)
@@ -588,55 +1004,314 @@ class HotelChainManager:
                 operation.actual_end = datetime.now(timezone.utc)
                 operation.progress_percentage = 100.0
                 await self._save_chain_operation(operation)
+                await self._publish_operation_progress(operation)
                 return True
 
-            # Execute operation on each property
-            for i, property_id in enumerate(target_properties):
-                try:
-                    success = await self._execute_property_operation(
-                        property_id, operation.operation_type, operation.operation_payload
-                    )
-
-                    if success:
-                        operation.successful_properties.append(property_id)
-                    else:
-                        operation.failed_properties.append(property_id)
-
-                    # Update progress
-                    operation.progress_percentage = ((i + 1) / total_properties) * 100
-                    await self._save_chain_operation(operation)
-
-                except Exception as e:
-                    logger.error("property_operation_failed",
-                               property_id=property_id,
-                               error=str(e))
-                    operation.failed_properties.append(property_id)
+            done = set(operation.successful_properties) | set(operation.failed_properties)
+            pacer = _StartPacer(operation.properties_per_second)
+            halted = False
+
+            async with AsyncExitStack() as stack:
+                lanes = await self._operation_lanes(stack, operation.max_concurrency)
+
+                for wave_index, wave in enumerate(self._rollout_waves(operation, target_properties)):
+                    pending = [property_id for property_id in wave if property_id not in done]
+                    if not pending:
+                        continue
+
+                    if wave_index > operation.current_wave and operation.wave_pause_seconds:
+                        await asyncio.sleep(operation.wave_pause_seconds)
+                    operation.current_wave = wave_index
+
+                    wave_failures = 0
+                    for start in range(0, len(pending), operation.batch_size):
+                        batch = pending[start:start + operation.batch_size]
+                        results = await self._run_operation_batch(operation, batch, lanes, pacer)
+
+                        for property_id, success in results.items():
+                            done.add(property_id)
+                            if success:
+                                operation.successful_properties.append(property_id)
+                            else:
+                                operation.failed_properties.append(property_id)
+                                wave_failures += 1
+
+                        # Checkpoint once per batch
+                        operation.completed_batches += 1
+                        operation.progress_percentage = len(done) / total_properties * 100
+                        operation.updated_at = datetime.now(timezone.utc)
+                        await self._save_chain_operation(operation)
+                        await self._publish_operation_progress(operation)
+
+                    if wave_failures / len(pending) > operation.max_failure_rate:
+                        operation.skipped_properties = [p for p in target_properties if p not in done]
+                        operation.error_message = (
+                            f"Rollout halted after wave {wave_index + 1}: "
+                            f"{wave_failures} of {len(pending)} properties failed"
+                        )
+                        halted = True
+                        break
 
             # Complete operation
-            operation.status = "completed" if not operation.failed_properties else "failed"
+            operation.status = "completed" if not operation.failed_properties and not halted else "failed"
             operation.actual_end = datetime.now(timezone.utc)
             operation.progress_percentage = 100.0
 
-            if operation.failed_properties:
+            if operation.failed_properties and not halted:
                 operation.error_message = f"Failed on {len(operation.failed_properties)} properties"
 
             await self._save_chain_operation(operation)
+            await self._publish_operation_progress(operation)
+
+            if (
+                refresh_configs
+                and operation.operation_type == ChainOperationType.CONFIG_UPDATE
+                and operation.successful_properties
+            ):
+                await self._refresh_subtrees(operation.chain_id, operation.successful_properties)
 
             logger.info("chain_operation_completed",
                        operation_id=operation.operation_id,
                        successful_count=len(operation.successful_properties),
-                       failed_count=len(operation.failed_properties))
+                       failed_count=len(operation.failed_properties),
+                       skipped_count=len(operation.skipped_properties),
+                       batches=operation.completed_batches)
 
-            return len(operation.failed_properties) == 0
+            return operation.status == "completed"
 
         except Exception as e:
             operation.status = "failed"
             operation.error_message = str(e)
             operation.actual_end = datetime.now(timezone.utc)
             await self._save_chain_operation(operation)
+            await self._publish_operation_progress(operation)
             logger.error("chain_operation_failed", operation_id=operation.operation_id, error=str(e))
             return False
 
+    @staticmethod
+    def _rollout_waves(operation: ChainOperation, target_properties: List[str]) -> List[List[str]]:
+        """Split targets into cumulative waves; the last wave always covers every target"""
+        total = len(target_properties)
+        waves, start = [], 0
+        for share in sorted(set(min(max(share, 0.0), 1.0) for share in operation.rollout_waves)) + [1.0]:
+            end = max(start + 1, math.ceil(total * share)) if share > 0 else start
+            end = min(end, total)
+            if end > start:
+                waves.append(target_properties[start:end])
+                start = end
+        return waves
+
+    async def _operation_lanes(self, stack: AsyncExitStack, max_concurrency: int) -> List[TenantManager]:
+        """
+        One tenant manager per concurrent lane, each on its own session
+
+        Lanes share the main manager's in-process tenant cache, so the
+        configuration refresh after an operation (and any later update made
+        through ``self.tenant_manager``) sees what the lanes wrote rather than
+        a stale copy.
+        """
+        if self.session_factory is None or max_concurrency <= 1:
+            return [self.tenant_manager]
+
+        lanes = []
+        for _ in range(max_concurrency):
+            session = await stack.enter_async_context(self.session_factory())
+            lane = TenantManager(self.redis, session)
+            lane.tenant_cache = self.tenant_manager.tenant_cache
+            lanes.append(lane)
+        return lanes
+
+    async def _run_operation_batch(
+        self,
+        operation: ChainOperation,
+        batch: List[str],
+        lanes: List[TenantManager],
+        pacer: "_StartPacer"
+    ) -> Dict[str, bool]:
+        """Process one batch with a lane per worker; returns success per property"""
+        queue: Deque[str] = deque(batch)
+        results: Dict[str, bool] = {}
+
+        async def lane(tenant_manager: TenantManager):
+            while queue:
+                property_id = queue.popleft()
+                await pacer.wait()
+                try:
+                    results[property_id] = await self._execute_property_operation(
+                        property_id, operation.operation_type, operation.operation_payload,
+                        tenant_manager=tenant_manager
+                    )
+                except Exception as e:
+                    logger.error("property_operation_failed",
+                               property_id=property_id,
+                               error=str(e))
+                    results[property_id] = False
+
+        await asyncio.gather(*(lane(tenant_manager) for tenant_manager in lanes[:len(batch)]))
+        return results
+
+    # Background Execution
+
+    async def enqueue_chain_operation(self, operation: ChainOperation) -> str:
+        """Persist an operation and queue it for the worker pool"""
+        await self._save_chain_operation(operation)
+        message_id = await self.redis.xadd(self.OPERATION_STREAM, {
+            "operation_id": operation.operation_id,
+            "chain_id": operation.chain_id
+        })
+        logger.info("chain_operation_enqueued",
+                   operation_id=operation.operation_id,
+                   chain_id=operation.chain_id)
+        return message_id
+
+    async def run_operation_worker(
+        self,
+        consumer_name: str,
+        stop_event: Optional[asyncio.Event] = None,
+        block_ms: int = 5000,
+        claim_idle_ms: Optional[int] = None
+    ):
+        """
+        Consume queued chain operations until ``stop_event`` is set
+
+        Workers share a consumer group, so each operation runs once. A
+        worker first re-reads its own unacknowledged messages, then before
+        each read of new ones claims messages left pending for
+        ``claim_idle_ms`` by workers that stopped (XAUTOCLAIM). A running
+        operation keeps its message claimed. Because progress is
+        checkpointed per batch, an interrupted operation resumes from its
+        last completed batch.
+        """
+        claim_idle_ms = claim_idle_ms or self.OPERATION_CLAIM_IDLE_MS
+        try:
+            await self.redis.xgroup_create(self.OPERATION_STREAM, self.OPERATION_WORKER_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        stream_id = "0"  # Own pending messages first, then new ones
+        claim_start = "0-0"  # XAUTOCLAIM cursor over the group's pending entries
+        while stop_event is None or not stop_event.is_set():
+            messages = []
+            if stream_id == ">":
+                claimed = await self.redis.xautoclaim(
+                    self.OPERATION_STREAM, self.OPERATION_WORKER_GROUP, consumer_name,
+                    min_idle_time=claim_idle_ms, start_id=claim_start, count=1
+                )
+                # [next_start_id, messages] (+ deleted ids on Redis 7)
+                if claimed:
+                    claim_start, messages = claimed[0], claimed[1]
+
+            if not messages:
+                response = await self.redis.xreadgroup(
+                    self.OPERATION_WORKER_GROUP, consumer_name,
+                    {self.OPERATION_STREAM: stream_id}, count=1, block=block_ms
+                )
+                messages = response[0][1] if response else []
+            if not messages:
+                if stream_id == "0":
+                    stream_id = ">"
+                continue
+
+            for message_id, fields in messages:
+                fields = fields or {}  # Claimed entries trimmed from the stream have no fields
+                operation_id = fields.get("operation_id") or fields.get(b"operation_id")
+                if isinstance(operation_id, bytes):
+                    operation_id = operation_id.decode()
+
+                operation = await self._load_chain_operation(operation_id) if operation_id else None
+                if operation and operation.status in ("scheduled", "in_progress"):
+                    keepalive = asyncio.create_task(
+                        self._keep_operation_claimed(consumer_name, message_id, claim_idle_ms)
+                    )
+                    try:
+                        await self._execute_chain_operation(operation)
+                    finally:
+                        keepalive.cancel()
+
+                await self.redis.xack(self.OPERATION_STREAM, self.OPERATION_WORKER_GROUP, message_id)
+
+    async def _keep_operation_claimed(self, consumer_name: str, message_id, claim_idle_ms: int):
+        """Reset the message's idle time so other workers don't claim a running operation"""
+        while True:
+            await asyncio.sleep(claim_idle_ms / 3000)
+            try:
+                await self.redis.xclaim(
+                    self.OPERATION_STREAM, self.OPERATION_WORKER_GROUP, consumer_name,
+                    min_idle_time=0, message_ids=[message_id], justid=True
+                )
+            except Exception as e:
+                logger.warning("chain_operation_claim_refresh_error",
+                             message_id=str(message_id),
+                             error=str(e))
+
+    # Progress Streaming
+
+    @staticmethod
+    def _progress_channel(operation_id: str) -> str:
+        return f"chain:operation:{operation_id}:progress"
+
+    @staticmethod
+    def _progress_event(operation: ChainOperation) -> Dict[str, Any]:
+        return {
+            "operation_id": operation.operation_id,
+            "status": operation.status,
+            "progress_percentage": round(operation.progress_percentage, 2),
+            "current_wave": operation.current_wave,
+            "completed_batches": operation.completed_batches,
+            "successful": len(operation.successful_properties),
+            "failed": len(operation.failed_properties),
+            "skipped": len(operation.skipped_properties),
+            "error_message": operation.error_message
+        }
+
+    async def _publish_operation_progress(self, operation: ChainOperation):
+        try:
+            await self.redis.publish(
+                self._progress_channel(operation.operation_id),
+                json.dumps(self._progress_event(operation))
+            )
+        except Exception as e:
+            logger.warning("chain_operation_progress_publish_error",
+                         operation_id=operation.operation_id,
+                         error=str(e))
+
+    async def stream_operation_progress(self, operation_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield progress events for an operation until it finishes
+
+        Starts with the checkpointed state, then follows the events
+        published by whichever worker runs the operation. Suitable as the
+        source of an SSE response:
+
+            async def events():
+                async for event in manager.stream_operation_progress(operation_id):
+                    yield f"data: {json.dumps(event)}\\n\\n"
+            return StreamingResponse(events(), media_type="text/event-stream")
+        """
+        terminal = ("completed", "failed", "cancelled")
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self._progress_channel(operation_id))
+        try:
+            operation = await self._load_chain_operation(operation_id)
+            if operation is None:
+                raise ValueError(f"Chain operation {operation_id} not found")
+
+            yield self._progress_event(operation)
+            if operation.status in terminal:
+                return
+
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                event = json.loads(message["data"])
+                yield event
+                if event["status"] in terminal:
+                    return
+        finally:
+            await pubsub.unsubscribe(self._progress_channel(operation_id))
+            await pubsub.close()
+
     # Analytics and Reporting
 
     async def generate_chain_analytics(
@@ -645,7 +1320,12 @@ class HotelChainManager:
         period_start: datetime,
         period_end: datetime
     ) -> ChainAnalytics:
-        """Generate comprehensive chain analytics"""
+        """
+        Generate comprehensive chain analytics
+
+        Computed in a single aggregate query over the chain's hierarchy
+        joined to tenant usage; nothing is loaded per property.
+        """
 
         analytics = ChainAnalytics(
             chain_id=chain_id,
@@ -654,39 +1334,16 @@ class HotelChainManager:
         )
 
         try:
-            # Get all properties in chain
-            properties = await self.get_chain_properties(chain_id)
-            analytics.total_properties = len(properties)
-            analytics.active_properties = len([p for p in properties if p.property_status == PropertyStatus.ACTIVE])
-
-            # Aggregate property metrics
-            for property_hierarchy in properties:
-                if property_hierarchy.property_status != PropertyStatus.ACTIVE:
-                    continue
-
-                property_tenant = await self.tenant_manager.get_tenant(property_hierarchy.property_id)
-                if not property_tenant:
-                    continue
-
-                # Add room count
-                if property_hierarchy.room_count:
-                    analytics.total_rooms += property_hierarchy.room_count
-
-                # Get usage metrics
-                usage = property_tenant.current_usage
-                analytics.total_calls_handled += usage.calls_count
+            result = await self.db.execute(CHAIN_ANALYTICS_QUERY, {"chain_id": chain_id})
+            row = result.mappings().fetchone()
+            if not row:
+                return analytics
 
-                # Calculate regional metrics
-                region = property_hierarchy.region
-                if region not in analytics.performance_by_region:
-                    analytics.performance_by_region[region] = {
-                        "properties": 0,
-                        "calls": 0,
-                        "revenue": 0.0
-                    }
-
-                analytics.performance_by_region[region]["properties"] += 1
-                analytics.performance_by_region[region]["calls"] += usage.calls_count
+            analytics.total_properties = row["total_properties"]
+            analytics.active_properties = row["active_properties"]
+            analytics.total_rooms = int(row["total_rooms"])
+            analytics.total_calls_handled = int(row["total_calls"])
+            analytics.performance_by_region = _json_value(row["by_region"])
 
             # Calculate averages
             if analytics.active_properties > 0:
@@ -696,21 +1353,13 @@ class HotelChainManager:
                 # This would be calculated from actual call data in production
                 analytics.average_call_duration_minutes = 5.5  # Placeholder
 
-            # Calculate performance rankings
-            property_scores = []
-            for property_hierarchy in properties:
-                if property_hierarchy.property_status == PropertyStatus.ACTIVE:
-                    property_tenant = await self.tenant_manager.get_tenant(property_hierarchy.property_id)
-                    if property_tenant:
-                        # Simple scoring based on call volume (would be more sophisticated in production)
-                        score = property_tenant.current_usage.calls_count
-                        property_scores.append((property_hierarchy.property_id, score))
-
-            # Sort by performance
-            property_scores.sort(key=lambda x: x[1], reverse=True)
-
-            analytics.top_performing_properties = [p[0] for p in property_scores[:5]]
-            analytics.underperforming_properties = [p[0] for p in property_scores[-5:] if p[1] < (sum(s[1] for s in property_scores) / len(property_scores) * 0.5)]
+            # Performance rankings (simple scoring based on call volume)
+            analytics.top_performing_properties = _json_value(row["top_properties"])
+            threshold = float(row["average_calls"]) * 0.5
+            analytics.underperforming_properties = [
+                property_id for property_id, calls in _json_value(row["bottom_properties"])
+                if calls < threshold
+            ]
 
         except Exception as e:
             logger.error("chain_analytics_error", chain_id=chain_id, error=str(e))
@@ -907,6 +1556,16 @@ class HotelChainManager:
         })
         await self.db.commit()
 
+    async def _load_chain_operation(self, operation_id: str) -> Optional[ChainOperation]:
+        """Load chain operation from database"""
+        query = text("SELECT operation_data FROM chain_operations WHERE operation_id = :operation_id")
+        result = await self.db.execute(query, {"operation_id": operation_id})
+        row = result.fetchone()
+
+        if row:
+            return ChainOperation.model_validate_json(row[0])
+        return None
+
     async def _get_operation_targets(self, operation: ChainOperation) -> List[str]:
         """Get list of properties targeted by an operation"""
         if operation.target_properties:
@@ -928,13 +1587,15 @@ class HotelChainManager:
         self,
         property_id: str,
         operation_type: ChainOperationType,
-        payload: Dict[str, Any]
+        payload: Dict[str, Any],
+        tenant_manager: Optional[TenantManager] = None
     ) -> bool:
         """Execute operation on a specific property"""
+        tenant_manager = tenant_manager or self.tenant_manager
         try:
             if operation_type == ChainOperationType.CONFIG_UPDATE:
                 # Update property configuration
-                await self.tenant_manager.update_tenant_config(property_id, payload)
+                await tenant_manager.update_tenant_config(property_id, payload)
                 return True
 
             # Add more operation types as needed
@@ -977,19 +1638,13 @@ class HotelChainManager:
 
     async def _get_inherited_configuration(self, property_hierarchy: PropertyHierarchy) -> Dict[str, Any]:
         """Get configuration that should be inherited from parent/chain"""
-        inherited_config = {}
-
-        # Get chain-level configuration
         chain = await self.get_chain(property_hierarchy.chain_id)
-        if chain:
-            inherited_config.update(chain.chain_policies)
 
-        # Get parent property configuration if applicable
+        parent_config = None
         if property_hierarchy.parent_property_id:
             parent_config = await self.get_effective_configuration(property_hierarchy.parent_property_id)
-            inherited_config.update(parent_config)
 
-        return inherited_config
+        return self._merge_inherited_configuration(chain, parent_config)
 
     async def _update_chain_statistics(self, chain_id: str):
         """Update chain-level statistics"""
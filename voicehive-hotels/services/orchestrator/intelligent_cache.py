@@ -4,14 +4,22 @@ Multi-level caching with configurable TTL policies and performance optimization
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import hashlib
+import inspect
+import math
 import pickle
+import random
+import time
+import uuid
+from collections import OrderedDict
 from typing import Any, Optional, Dict, List, Union, Callable, TypeVar, Generic
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 import weakref
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 
 try:
     import redis.asyncio as aioredis
@@ -79,6 +87,12 @@ cache_evictions_total = Counter(
     ['cache_name', 'level', 'reason']
 )
 
+cache_loads_total = Counter(
+    'voicehive_cache_loads_total',
+    'get_or_set outcomes (loader calls vs. coalesced and stale serves)',
+    ['cache_name', 'outcome']  # hit, stale_hit, early_refresh, coalesced, loaded, lock_wait_hit
+)
+
 
 class CacheLevel(str, Enum):
     """Cache levels in order of speed"""
@@ -116,14 +130,19 @@ class CacheEntry:
     ttl_seconds: Optional[int] = None
     size_bytes: int = 0
     tags: List[str] = field(default_factory=list)
+    expires_at: Optional[float] = None  # time.monotonic() deadline
+    
+    def __post_init__(self):
+        if self.expires_at is None and self.ttl_seconds is not None:
+            age_seconds = (datetime.now(timezone.utc) - self.created_at).total_seconds()
+            self.expires_at = time.monotonic() - age_seconds + self.ttl_seconds
     
     def is_expired(self) -> bool:
         """Check if entry is expired"""
-        if self.ttl_seconds is None:
+        if self.expires_at is None:
             return False
         
-        expiry_time = self.created_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.now(timezone.utc) > expiry_time
+        return time.monotonic() > self.expires_at
     
     def touch(self):
         """Update access metadata"""
@@ -139,12 +158,35 @@ class CacheEntry:
             self.size_bytes = len(str(self.value).encode('utf-8'))
 
 
+@dataclass
+class CachedValue:
+    """Value stored by get_or_set, with freshness metadata shared across tiers"""
+    value: Any
+    soft_expires_at: float  # epoch seconds; after this the value is stale
+    compute_seconds: float = 0.0  # loader duration, used by XFetch
+    
+    def is_stale(self, now: float) -> bool:
+        return now >= self.soft_expires_at
+    
+    def should_refresh_early(self, now: float, beta: float) -> bool:
+        """XFetch: refresh with rising probability as expiry approaches"""
+        if beta <= 0 or self.compute_seconds <= 0:
+            return False
+        return now - self.compute_seconds * beta * math.log(1.0 - random.random()) >= self.soft_expires_at
+
+
+def _unwrap(value: Any) -> Any:
+    return value.value if isinstance(value, CachedValue) else value
+
+
 class CacheConfig(BaseModel):
     """Configuration for cache behavior"""
     # Memory cache settings
     memory_max_size: int = Field(1000, description="Maximum memory cache entries")
     memory_max_bytes: int = Field(50 * 1024 * 1024, description="Maximum memory cache size in bytes")
     memory_eviction_policy: EvictionPolicy = Field(EvictionPolicy.LRU, description="Memory eviction policy")
+    memory_admission_policy: str = Field("none", description="Memory admission policy (none, tinylfu)")
+    memory_admission_window_percent: float = Field(1.0, description="W-TinyLFU window size as percent of memory_max_size")
     
     # Redis cache settings
     redis_enabled: bool = Field(True, description="Enable Redis caching")
@@ -167,6 +209,13 @@ class CacheConfig(BaseModel):
     # Cleanup settings
     cleanup_interval_seconds: int = Field(300, description="Cleanup interval for expired entries")
     cleanup_batch_size: int = Field(100, description="Cleanup batch size")
+    
+    # Stampede protection for get_or_set
+    stale_while_revalidate_seconds: int = Field(0, description="Serve stale values this long past TTL while one refresh runs")
+    xfetch_beta: float = Field(0.0, description="XFetch probabilistic early refresh factor (0 disables, 1 is typical)")
+    distributed_lock_enabled: bool = Field(False, description="Coalesce loads across replicas with a Redis lease")
+    distributed_lock_ttl_seconds: int = Field(30, description="Redis load lease duration")
+    distributed_lock_wait_seconds: float = Field(5.0, description="Max wait for another replica's load before loading locally")
 
 
 class CacheStats(BaseModel):
@@ -201,17 +250,87 @@ class CacheStats(BaseModel):
     last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class FrequencySketch:
+    """
+    Count-min sketch of recent access frequency for TinyLFU admission
+    
+    Four rows of 4-bit-saturating counters; all counters are halved after
+    ``10 * capacity`` increments so the sketch tracks recent popularity.
+    """
+    
+    _HALVE = bytes(value >> 1 for value in range(256))
+    
+    # Odd 64-bit multipliers, one per row (multiplicative hashing)
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    
+    def __init__(self, capacity: int, depth: int = 4):
+        width_bits = 4
+        while (1 << width_bits) < capacity * 4:
+            width_bits += 1
+        self._shift = 64 - width_bits
+        self._rows = [bytearray(1 << width_bits) for _ in range(depth)]
+        self._seeds = self._SEEDS[:depth]
+        self._additions = 0
+        self._sample_size = max(10 * capacity, 100)
+    
+    def _indexes(self, key: str):
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        shift = self._shift
+        return [((key_hash * seed) & 0xFFFFFFFFFFFFFFFF) >> shift for seed in self._seeds]
+    
+    def increment(self, key: str):
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                row[:] = row.translate(self._HALVE)
+            self._additions //= 2
+    
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
 class MemoryCache:
-    """In-memory cache with configurable eviction policies"""
+    """
+    In-memory cache with configurable eviction policies
+    
+    Eviction bookkeeping is O(1) per operation: LRU and FIFO order lives in an
+    OrderedDict, LFU keys sit in per-frequency buckets, and expiry deadlines
+    are kept in a min-heap so neither eviction nor cleanup scans all entries.
+    With ``memory_admission_policy="tinylfu"`` (or the ADAPTIVE policy) new
+    keys enter a small LRU window and are only promoted into the main region
+    when the frequency sketch rates them above the main region's victim.
+    """
     
     def __init__(self, name: str, config: CacheConfig):
         self.name = name
         self.config = config
         self.entries: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []  # For LRU
+        self.access_order: "OrderedDict[str, None]" = OrderedDict()  # LRU / FIFO order
         self.stats = CacheStats(name=name, level=CacheLevel.MEMORY)
         self._lock = asyncio.Lock()
         
+        self._policy = config.memory_eviction_policy
+        
+        # LFU: access_count -> keys in insertion order
+        self._frequency_buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+        
+        # (expires_at, tiebreak, key, entry); stale items are skipped lazily
+        self._expiry_heap: List[tuple] = []
+        self._heap_counter = itertools.count()
+        
+        # W-TinyLFU admission
+        self._window: Optional["OrderedDict[str, None]"] = None
+        self._sketch: Optional[FrequencySketch] = None
+        if config.memory_admission_policy == "tinylfu" or self._policy == EvictionPolicy.ADAPTIVE:
+            self._window = OrderedDict()
+            self._window_size = max(1, int(config.memory_max_size * config.memory_admission_window_percent / 100))
+            self._sketch = FrequencySketch(config.memory_max_size)
+        
     async def get(self, key: str) -> Optional[Any]:
         """Get value from memory cache"""
         start_time = datetime.now(timezone.utc)
@@ -219,6 +338,9 @@ class MemoryCache:
         async with self._lock:
             entry = self.entries.get(key)
             
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            
             if entry is None:
                 self.stats.misses += 1
                 self.stats.gets += 1
@@ -227,7 +349,7 @@ class MemoryCache:
             
             if entry.is_expired():
                 # Remove expired entry
-                await self._remove_entry(key)
+                self._remove_entry(key)
                 self.stats.misses += 1
                 self.stats.gets += 1
                 self._record_operation('get', 'miss', start_time)
@@ -235,7 +357,7 @@ class MemoryCache:
             
             # Update access metadata
             entry.touch()
-            self._update_access_order(key)
+            self._update_access_order(key, entry)
             
             self.stats.hits += 1
             self.stats.gets += 1
@@ -261,16 +383,29 @@ class MemoryCache:
             )
             entry.calculate_size()
             
-            # Check if we need to evict entries
-            await self._ensure_capacity(entry.size_bytes)
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            
+            # Replacing a key keeps its region; new keys start in the window
+            in_main = key in self.entries and (self._window is None or key not in self._window)
+            self._remove_entry(key)
             
             # Store entry
             self.entries[key] = entry
-            self._update_access_order(key)
+            self.stats.total_size_bytes += entry.size_bytes
+            self._push_expiry(key, entry)
+            
+            if self._window is not None and not in_main:
+                self._window[key] = None
+                self._rebalance_window()
+            else:
+                self._track(key, entry)
+            
+            # Evict entries until within limits
+            self._ensure_capacity()
             
             self.stats.sets += 1
             self.stats.total_entries = len(self.entries)
-            self.stats.total_size_bytes += entry.size_bytes
             
             self._record_operation('set', 'success', start_time)
             return True
@@ -281,7 +416,7 @@ class MemoryCache:
         
         async with self._lock:
             if key in self.entries:
-                await self._remove_entry(key)
+                self._remove_entry(key)
                 self.stats.deletes += 1
                 self._record_operation('delete', 'success', start_time)
                 return True
@@ -294,6 +429,11 @@ class MemoryCache:
         async with self._lock:
             self.entries.clear()
             self.access_order.clear()
+            self._frequency_buckets.clear()
+            self._min_frequency = 0
+            self._expiry_heap.clear()
+            if self._window is not None:
+                self._window.clear()
             self.stats.total_entries = 0
             self.stats.total_size_bytes = 0
     
@@ -302,93 +442,168 @@ class MemoryCache:
         removed_count = 0
         
         async with self._lock:
-            expired_keys = [
-                key for key, entry in self.entries.items()
-                if entry.is_expired()
-            ]
+            now = time.monotonic()
+            heap = self._expiry_heap
             
-            for key in expired_keys:
-                await self._remove_entry(key)
-                removed_count += 1
+            # Only the expired prefix of the heap is visited
+            while heap and heap[0][0] <= now:
+                _, _, key, entry = heapq.heappop(heap)
+                if self.entries.get(key) is entry:
+                    self._remove_entry(key)
+                    removed_count += 1
         
         if removed_count > 0:
             logger.debug("memory_cache_cleanup", name=self.name, removed=removed_count)
         
         return removed_count
     
-    async def _ensure_capacity(self, new_entry_size: int):
-        """Ensure cache has capacity for new entry"""
+    def _ensure_capacity(self):
+        """Evict entries until the cache is within its limits"""
         # Check entry count limit
-        while len(self.entries) >= self.config.memory_max_size:
-            await self._evict_entry("max_entries")
+        while len(self.entries) > self.config.memory_max_size:
+            if not self._evict_entry("max_entries"):
+                break
         
         # Check size limit
-        while (self.stats.total_size_bytes + new_entry_size) > self.config.memory_max_bytes:
-            await self._evict_entry("max_size")
+        while self.stats.total_size_bytes > self.config.memory_max_bytes:
+            if not self._evict_entry("max_size"):
+                break
+    
+    def _rebalance_window(self):
+        """Move overflow from the admission window into the main region"""
+        while len(self._window) > self._window_size:
+            candidate, _ = self._window.popitem(last=False)
+            
+            if len(self.entries) <= self.config.memory_max_size:
+                # Main region has room; no contest needed
+                self._track(candidate, self.entries[candidate])
+                continue
+            
+            victim = self._select_victim()
+            if victim is None or self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+                self._track(candidate, self.entries[candidate])
+                if victim is not None:
+                    self._evict_key(victim, "max_entries")
+            else:
+                self._evict_key(candidate, "admission_rejected")
     
-    async def _evict_entry(self, reason: str):
-        """Evict entry based on eviction policy"""
-        if not self.entries:
-            return
+    def _select_victim(self) -> Optional[str]:
+        """Pick the main-region key the eviction policy would remove next"""
+        if self._policy in (EvictionPolicy.LRU, EvictionPolicy.FIFO, EvictionPolicy.ADAPTIVE):
+            # Least recently used / first inserted
+            return next(iter(self.access_order), None)
         
-        key_to_evict = None
+        if self._policy == EvictionPolicy.LFU:
+            # Least frequently used, oldest first within a frequency
+            if not self._frequency_buckets:
+                return None
+            if self._min_frequency not in self._frequency_buckets:
+                self._min_frequency = min(self._frequency_buckets)
+            return next(iter(self._frequency_buckets[self._min_frequency]))
+        
+        if self._policy == EvictionPolicy.TTL:
+            # Shortest TTL remaining; window keys are set aside and restored
+            heap = self._expiry_heap
+            window_items = []
+            victim = None
+            while heap:
+                _, _, key, entry = heap[0]
+                if self.entries.get(key) is not entry:
+                    heapq.heappop(heap)
+                elif self._window is not None and key in self._window:
+                    window_items.append(heapq.heappop(heap))
+                else:
+                    victim = key
+                    break
+            for item in window_items:
+                heapq.heappush(heap, item)
+            return victim
         
-        if self.config.memory_eviction_policy == EvictionPolicy.LRU:
-            # Least recently used
-            key_to_evict = self.access_order[0] if self.access_order else None
+        return None
+    
+    def _evict_entry(self, reason: str) -> bool:
+        """Evict entry based on eviction policy"""
+        key_to_evict = self._select_victim()
         
-        elif self.config.memory_eviction_policy == EvictionPolicy.LFU:
-            # Least frequently used
-            min_access_count = min(entry.access_count for entry in self.entries.values())
-            for key, entry in self.entries.items():
-                if entry.access_count == min_access_count:
-                    key_to_evict = key
-                    break
+        if key_to_evict is None and self._window:
+            key_to_evict = next(iter(self._window))
         
-        elif self.config.memory_eviction_policy == EvictionPolicy.TTL:
-            # Shortest TTL remaining
-            now = datetime.now(timezone.utc)
-            min_remaining_ttl = float('inf')
-            for key, entry in self.entries.items():
-                if entry.ttl_seconds:
-                    remaining = entry.ttl_seconds - (now - entry.created_at).total_seconds()
-                    if remaining < min_remaining_ttl:
-                        min_remaining_ttl = remaining
-                        key_to_evict = key
-        
-        elif self.config.memory_eviction_policy == EvictionPolicy.FIFO:
-            # First in, first out (oldest created)
-            oldest_time = min(entry.created_at for entry in self.entries.values())
-            for key, entry in self.entries.items():
-                if entry.created_at == oldest_time:
-                    key_to_evict = key
-                    break
+        if key_to_evict is None:
+            return False
         
-        if key_to_evict:
-            await self._remove_entry(key_to_evict)
-            self.stats.evictions += 1
-            
-            cache_evictions_total.labels(
-                cache_name=self.name,
-                level=CacheLevel.MEMORY.value,
-                reason=reason
-            ).inc()
+        self._evict_key(key_to_evict, reason)
+        return True
     
-    async def _remove_entry(self, key: str):
-        """Remove entry and update metadata"""
-        if key in self.entries:
-            entry = self.entries.pop(key)
-            self.stats.total_size_bytes -= entry.size_bytes
-            self.stats.total_entries = len(self.entries)
-            
-            if key in self.access_order:
-                self.access_order.remove(key)
+    def _evict_key(self, key: str, reason: str):
+        self._remove_entry(key)
+        self.stats.evictions += 1
+        
+        cache_evictions_total.labels(
+            cache_name=self.name,
+            level=CacheLevel.MEMORY.value,
+            reason=reason
+        ).inc()
     
-    def _update_access_order(self, key: str):
-        """Update access order for LRU"""
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+    def _remove_entry(self, key: str):
+        """Remove entry and update metadata"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        
+        self.stats.total_size_bytes -= entry.size_bytes
+        self.stats.total_entries = len(self.entries)
+        
+        self.access_order.pop(key, None)
+        if self._window is not None:
+            self._window.pop(key, None)
+        
+        bucket = self._frequency_buckets.get(entry.access_count)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._frequency_buckets[entry.access_count]
+        
+        # Expiry heap items are dropped lazily; rebuild when mostly stale
+        if len(self._expiry_heap) > 2 * len(self.entries) + 64:
+            self._expiry_heap = [
+                item for item in self._expiry_heap if self.entries.get(item[2]) is item[3]
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _push_expiry(self, key: str, entry: CacheEntry):
+        expires_at = entry.expires_at if entry.expires_at is not None else float('inf')
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._heap_counter), key, entry))
+    
+    def _track(self, key: str, entry: CacheEntry):
+        """Add a key to the main region's eviction structure"""
+        if self._policy == EvictionPolicy.LFU:
+            frequency = entry.access_count
+            self._frequency_buckets.setdefault(frequency, OrderedDict())[key] = None
+            if frequency < self._min_frequency:
+                self._min_frequency = frequency
+        elif self._policy != EvictionPolicy.TTL:
+            self.access_order[key] = None
+    
+    def _update_access_order(self, key: str, entry: CacheEntry):
+        """Update eviction metadata after a hit"""
+        if self._window is not None and key in self._window:
+            self._window.move_to_end(key)
+            return
+        
+        if self._policy in (EvictionPolicy.LRU, EvictionPolicy.ADAPTIVE):
+            self.access_order.move_to_end(key)
+        
+        elif self._policy == EvictionPolicy.LFU:
+            # touch() already incremented access_count
+            previous = entry.access_count - 1
+            bucket = self._frequency_buckets.get(previous)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._frequency_buckets[previous]
+                    if previous == self._min_frequency:
+                        self._min_frequency = entry.access_count
+            self._frequency_buckets.setdefault(entry.access_count, OrderedDict())[key] = None
     
     def _record_operation(self, operation: str, result: str, start_time: datetime):
         """Record operation metrics"""
@@ -637,6 +852,8 @@ class RedisCache:
     def _serialize(self, value: Any) -> bytes:
         """Serialize value for Redis storage"""
         if self.config.serialization_format == "json":
+            if isinstance(value, CachedValue):
+                value = {"__cached_value__": True, **asdict(value)}
             return json.dumps(value, default=str).encode('utf-8')
         else:  # pickle
             return pickle.dumps(value)
@@ -644,7 +861,10 @@ class RedisCache:
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize value from Redis storage"""
         if self.config.serialization_format == "json":
-            return json.loads(data.decode('utf-8'))
+            value = json.loads(data.decode('utf-8'))
+            if isinstance(value, dict) and value.pop("__cached_value__", False):
+                return CachedValue(**value)
+            return value
         else:  # pickle
             return pickle.loads(data)
     
@@ -677,6 +897,15 @@ class RedisCache:
         return self.stats
 
 
+# Compare-and-delete so a replica never releases a lease it no longer owns
+_RELEASE_LOCK_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+"""
+
+
 class IntelligentCache(Generic[T]):
     """Multi-level intelligent cache with automatic optimization"""
     
@@ -700,6 +929,10 @@ class IntelligentCache(Generic[T]):
         # Cache warming
         self._warm_cache_functions: Dict[str, Callable] = {}
         
+        # get_or_set single-flight: key -> future of the in-progress load
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: set = set()
+        
         logger.info("intelligent_cache_initialized", name=name)
     
     async def initialize(self):
@@ -716,6 +949,10 @@ class IntelligentCache(Generic[T]):
     
     async def get(self, key: str) -> Optional[T]:
         """Get value from cache (multi-level lookup)"""
+        return _unwrap(await self._get_stored(key))
+    
+    async def _get_stored(self, key: str) -> Any:
+        """Multi-level lookup returning the stored object (possibly a CachedValue)"""
         # Try memory cache first
         value = await self.memory_cache.get(key)
         if value is not None:
@@ -726,11 +963,19 @@ class IntelligentCache(Generic[T]):
             value = await self.redis_cache.get(key)
             if value is not None:
                 # Promote to memory cache
-                await self.memory_cache.set(key, value)
+                await self._promote(key, value)
                 return value
         
         return None
     
+    async def _promote(self, key: str, value: Any):
+        """Copy a Redis value into memory without outliving its hard TTL"""
+        ttl_seconds = None
+        if isinstance(value, CachedValue):
+            hard_expires_at = value.soft_expires_at + self.config.stale_while_revalidate_seconds
+            ttl_seconds = max(1, int(hard_expires_at - time.time()))
+        await self.memory_cache.set(key, value, ttl_seconds)
+    
     async def set(
         self,
         key: str,
@@ -773,22 +1018,144 @@ class IntelligentCache(Generic[T]):
         factory_func: Callable[[], T],
         ttl_seconds: Optional[int] = None
     ) -> T:
-        """Get value from cache or compute and store it"""
-        # Try to get from cache first
-        value = await self.get(key)
-        if value is not None:
-            return value
+        """
+        Get value from cache or compute and store it
+        
+        Concurrent misses for a key share one loader call (single-flight, and
+        across replicas when ``distributed_lock_enabled``). Values past their
+        TTL are still served for ``stale_while_revalidate_seconds`` while one
+        background task refreshes them, and ``xfetch_beta`` triggers that
+        refresh probabilistically before expiry.
+        """
+        ttl = ttl_seconds or self.config.default_ttl_seconds
+        stored = await self._get_stored(key)
+        
+        if stored is not None:
+            if not isinstance(stored, CachedValue):
+                # Written by set(); no freshness metadata
+                return stored
+            
+            now = time.time()
+            if stored.is_stale(now):
+                self._record_load('stale_hit')
+                self._schedule_refresh(key, factory_func, ttl)
+            elif stored.should_refresh_early(now, self.config.xfetch_beta):
+                self._record_load('early_refresh')
+                self._schedule_refresh(key, factory_func, ttl)
+            else:
+                self._record_load('hit')
+            return stored.value
+        
+        return await self._load_single_flight(key, factory_func, ttl)
+    
+    async def _load_single_flight(self, key: str, factory_func: Callable[[], T], ttl: int) -> T:
+        """Run the loader once per key in this process; other callers await it"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record_load('coalesced')
+            return await asyncio.shield(inflight)
+        
+        # The loader runs in its own task so cancelling this caller does not
+        # cancel it for the callers that coalesced onto it
+        task = asyncio.ensure_future(self._load(key, factory_func, ttl))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_load(key, done))
+        return await asyncio.shield(task)
+    
+    def _finish_load(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished single-flight load"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Waiters re-raise it; avoid "never retrieved" warnings
+    
+    async def _load(self, key: str, factory_func: Callable[[], T], ttl: int) -> T:
+        """Call the loader (holding the Redis lease if enabled) and store the result"""
+        lock_key = None
+        lock_token = None
+        
+        if self.redis_cache and self.config.distributed_lock_enabled:
+            lock_key = self.redis_cache._make_key(f"lock:{key}")
+            lock_token = uuid.uuid4().hex
+            try:
+                acquired = await self.redis_cache.redis.set(
+                    lock_key, lock_token, nx=True, px=int(self.config.distributed_lock_ttl_seconds * 1000)
+                )
+            except Exception as e:
+                logger.warning("cache_lock_error", name=self.name, key=key, error=str(e))
+                acquired = True  # Redis trouble: fall back to process-local single-flight
+                lock_key = None
+            
+            if not acquired:
+                lock_key = None
+                value = await self._wait_for_remote_load(key)
+                if value is not None:
+                    self._record_load('lock_wait_hit')
+                    return value
         
-        # Compute value
-        if asyncio.iscoroutinefunction(factory_func):
-            value = await factory_func()
-        else:
+        try:
+            start = time.monotonic()
             value = factory_func()
+            if inspect.isawaitable(value):
+                value = await value
+            compute_seconds = time.monotonic() - start
+            
+            self._record_load('loaded')
+            
+            envelope = CachedValue(
+                value=value,
+                soft_expires_at=time.time() + ttl,
+                compute_seconds=compute_seconds
+            )
+            await self.set(key, envelope, ttl + self.config.stale_while_revalidate_seconds)
+            
+            return value
+        finally:
+            if lock_key:
+                await self._release_lock(lock_key, lock_token)
+    
+    async def _wait_for_remote_load(self, key: str) -> Optional[T]:
+        """Poll Redis for a fresh value while another replica holds the lease"""
+        deadline = time.monotonic() + self.config.distributed_lock_wait_seconds
+        delay = 0.01
+        
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            
+            stored = await self.redis_cache.get(key)
+            if stored is not None and not (isinstance(stored, CachedValue) and stored.is_stale(time.time())):
+                await self._promote(key, stored)
+                return _unwrap(stored)
         
-        # Store in cache
-        await self.set(key, value, ttl_seconds)
+        return None
+    
+    async def _release_lock(self, lock_key: str, lock_token: str):
+        """Release the lease only if we still own it"""
+        try:
+            await self.redis_cache.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+        except Exception as e:
+            logger.warning("cache_lock_release_error", name=self.name, key=lock_key, error=str(e))
+    
+    def _schedule_refresh(self, key: str, factory_func: Callable[[], T], ttl: int):
+        """Refresh a key in the background unless a load is already running"""
+        if key in self._inflight:
+            return
         
-        return value
+        task = asyncio.create_task(self._refresh(key, factory_func, ttl))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _refresh(self, key: str, factory_func: Callable[[], T], ttl: int):
+        try:
+            await self._load_single_flight(key, factory_func, ttl)
+        except Exception as e:
+            # Keep serving the stale value; the next caller retries
+            logger.warning("cache_refresh_failed", name=self.name, key=key, error=str(e))
+    
+    def _record_load(self, outcome: str):
+        if self.config.enable_metrics:
+            cache_loads_total.labels(cache_name=self.name, outcome=outcome).inc()
     
     async def invalidate_by_tags(self, tags: List[str]):
         """Invalidate cache entries by tags (memory cache only for now)"""
@@ -892,6 +1259,8 @@ class IntelligentCache(Generic[T]):
             self._cleanup_task.cancel()
         if self._stats_task:
             self._stats_task.cancel()
+        for task in list(self._refresh_tasks):
+            task.cancel()
         
         # Clear caches
         await self.clear()
@@ -0,0 +1,108 @@
+"""
+Composed pure-ASGI middleware chain for VoiceHive Hotels Orchestrator
+
+Starlette's ``BaseHTTPMiddleware`` runs every layer in its own task and
+wraps the response body in a memory stream, which adds per-request overhead
+and interferes with streaming and WebSocket endpoints. The orchestrator's
+cross-cutting middlewares are pure ASGI callables instead, and this module
+composes them into a single application that is installed with one
+``app.add_middleware`` call.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from audit_logging import AuditLogger, AuditMiddleware
+from auth_middleware import AuthenticationMiddleware, AuthRouteTable
+from correlation_middleware import CorrelationIDMiddleware
+from error_middleware import ComprehensiveErrorMiddleware
+from input_validation_middleware import InputValidationMiddleware, ValidationConfig
+from rate_limit_middleware import RateLimitMiddleware
+from rate_limiter import RateLimitConfig
+from security_headers_middleware import SecurityHeadersConfig, SecurityHeadersMiddleware
+from logging_adapter import get_safe_logger
+
+logger = get_safe_logger("orchestrator.middleware_chain")
+
+# (middleware class, constructor keyword arguments)
+MiddlewareLayer = Tuple[Type, Dict[str, Any]]
+
+
+class MiddlewareChain:
+    """
+    Compose pure-ASGI middleware layers into one ASGI application
+
+    ``layers`` are listed outermost first, i.e. the first layer sees the
+    request first and the response last. The chain is built once at
+    construction, so a request costs one call per layer and no extra tasks
+    or body buffering.
+    """
+
+    def __init__(self, app: ASGIApp, layers: Sequence[MiddlewareLayer]):
+        self.app = app
+        self.layers = list(layers)
+
+        composed = app
+        for middleware_class, options in reversed(self.layers):
+            composed = middleware_class(composed, **options)
+        self._composed = composed
+
+        logger.info(
+            "middleware_chain_built",
+            layers=[middleware_class.__name__ for middleware_class, _ in self.layers]
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._composed(scope, receive, send)
+
+
+def build_orchestrator_layers(
+    security_headers_config: Optional[SecurityHeadersConfig] = None,
+    environment: str = "production",
+    jwt_service=None,
+    vault_client=None,
+    auth_route_table: Optional[AuthRouteTable] = None,
+    audit_logger: Optional[AuditLogger] = None,
+    validation_config: Optional[ValidationConfig] = None,
+    rate_limit_redis_url: Optional[str] = None,
+    rate_limit_rules: Optional[list] = None,
+    rate_limit_default_config: Optional[RateLimitConfig] = None
+) -> List[MiddlewareLayer]:
+    """
+    Build the standard orchestrator middleware layers
+
+    Order (outermost first):
+    1. Correlation ID - set before anything logs, echoed on every response
+    2. Audit - records every request, including ones rejected further in
+    3. Security headers - applied to error and auth-rejection responses too
+    4. Error handling - converts unhandled exceptions into JSON errors
+    5. Rate limiting - only when a Redis URL is configured
+    6. Authentication - rejects before any request body is parsed
+    7. Input validation - innermost, only sees authenticated requests
+    """
+
+    layers: List[MiddlewareLayer] = [
+        (CorrelationIDMiddleware, {}),
+        (AuditMiddleware, {"audit_logger": audit_logger}),
+        (SecurityHeadersMiddleware, {"config": security_headers_config, "environment": environment}),
+        (ComprehensiveErrorMiddleware, {}),
+    ]
+
+    if rate_limit_redis_url:
+        layers.append((
+            RateLimitMiddleware,
+            {
+                "redis_url": rate_limit_redis_url,
+                "default_config": rate_limit_default_config,
+                "rules": rate_limit_rules
+            }
+        ))
+
+    layers.append((
+        AuthenticationMiddleware,
+        {"jwt_service": jwt_service, "vault_client": vault_client, "route_table": auth_route_table}
+    ))
+    layers.append((InputValidationMiddleware, {"config": validation_config}))
+
+    return layers
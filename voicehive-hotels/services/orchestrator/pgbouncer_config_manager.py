@@ -122,6 +122,9 @@ class PgBouncerConfig(BaseModel):
     query_timeout: int = Field(default=0, ge=0, le=3600, description="Query timeout")
     query_wait_timeout: int = Field(default=120, ge=1, le=600, description="Query wait timeout")
     cancel_wait_timeout: int = Field(default=10, ge=1, le=60, description="Cancel wait timeout")
+    # PgBouncer 1.21+ tracks protocol-level prepared statements across transaction-pooled
+    # server connections, so clients can keep their statement caches enabled
+    max_prepared_statements: int = Field(default=200, ge=0, le=5000, description="Prepared statements tracked per server connection")
     
     # Authentication
     auth_type: AuthType = Field(default=AuthType.MD5, description="Authentication type")
@@ -287,6 +290,7 @@ class PgBouncerConfigManager:
         config_content.append(f"query_timeout = {self.config.query_timeout}")
         config_content.append(f"query_wait_timeout = {self.config.query_wait_timeout}")
         config_content.append(f"cancel_wait_timeout = {self.config.cancel_wait_timeout}")
+        config_content.append(f"max_prepared_statements = {self.config.max_prepared_statements}")
         
         # Authentication
         config_content.append(f"auth_type = {self.config.auth_type}")
@@ -614,6 +618,13 @@ class PgBouncerConfigManager:
                 "Statement pooling not recommended for production use"
             )
         
+        # Prepared statements only survive transaction pooling when PgBouncer tracks them
+        if self.config.pool_mode != PoolMode.SESSION and self.config.max_prepared_statements == 0:
+            validation_result["warnings"].append(
+                "max_prepared_statements is 0: clients must disable prepared statements "
+                "(database prepared_statements=false) in transaction pooling"
+            )
+        
         # Performance recommendations
         if self.config.default_pool_size < 10:
             validation_result["recommendations"].append(
@@ -3,13 +3,15 @@ Rate Limiting Middleware for FastAPI
 Integrates with Redis-based rate limiter and provides per-client, per-endpoint limiting
 """
 
+import hashlib
 import time
 from typing import Optional, Dict, Any
-from urllib.parse import urlparse
 
-from fastapi import Request, Response, HTTPException
+from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import redis.asyncio as aioredis
 
 from rate_limiter import RateLimiter, RateLimitConfig, RateLimitRule, RateLimitAlgorithm
@@ -18,19 +20,22 @@ from logging_adapter import get_safe_logger
 logger = get_safe_logger("orchestrator.rate_limit_middleware")
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    FastAPI middleware for rate limiting requests
+    Pure ASGI middleware for rate limiting requests
+    
+    Rate limit headers are attached to the ``http.response.start`` message,
+    so response bodies (including streaming responses) pass through as-is.
     """
     
     def __init__(
         self, 
-        app,
+        app: ASGIApp,
         redis_url: str,
         default_config: Optional[RateLimitConfig] = None,
         rules: Optional[list] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.redis_url = redis_url
         self.redis_client: Optional[aioredis.Redis] = None
         self.rate_limiter: Optional[RateLimiter] = None
@@ -38,20 +43,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.rules = rules or []
         
         # Paths to exclude from rate limiting
-        self.excluded_paths = {
+        self.excluded_paths = frozenset({
             "/healthz",
             "/health",
             "/metrics",
             "/docs",
             "/openapi.json",
             "/redoc"
-        }
+        })
         
         # Internal service identifiers
-        self.internal_service_headers = {
+        self.internal_service_headers = (
             "X-Internal-Service",
             "X-Service-Token"
-        }
+        )
     
     async def setup_redis(self):
         """Initialize Redis connection and rate limiter"""
@@ -81,9 +86,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 self.redis_client = None
                 self.rate_limiter = None
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting"""
         
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Skip rate limiting for excluded paths
+        if scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        
         # Initialize Redis connection if needed
         if self.redis_client is None:
             await self.setup_redis()
@@ -91,56 +105,56 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Skip rate limiting if Redis is unavailable
         if self.rate_limiter is None:
             logger.warning("rate_limiting_disabled_redis_unavailable")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
-        # Skip rate limiting for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+        request = HTTPConnection(scope)
         
         # Extract client information
         client_info = await self._extract_client_info(request)
         
         # Skip rate limiting for internal services
         if client_info["client_type"] == "internal":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         try:
             # Check rate limit
             result = await self.rate_limiter.check_rate_limit(
                 client_id=client_info["client_id"],
-                path=request.url.path,
-                method=request.method,
+                path=scope["path"],
+                method=scope["method"],
                 client_type=client_info["client_type"]
             )
-            
-            # Add rate limit headers to response
-            start_time = time.time()
-            response = await call_next(request)
-            
-            # Add rate limiting headers
-            self._add_rate_limit_headers(response, result)
-            
-            # Log rate limit info
-            processing_time = time.time() - start_time
-            logger.info(
-                "request_processed",
-                client_id=client_info["client_id"],
-                path=request.url.path,
-                method=request.method,
-                allowed=result.allowed,
-                current_usage=result.current_usage,
-                remaining=result.remaining,
-                processing_time=processing_time
-            )
-            
-            return response
-            
         except Exception as e:
             logger.error("rate_limit_check_failed", error=str(e))
             # Continue without rate limiting if check fails
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limiting headers
+                self._add_rate_limit_headers(MutableHeaders(scope=message), result)
+            await send(message)
+        
+        start_time = time.time()
+        await self.app(scope, receive, send_with_rate_limit_headers)
+        
+        # Log rate limit info
+        processing_time = time.time() - start_time
+        logger.info(
+            "request_processed",
+            client_id=client_info["client_id"],
+            path=scope["path"],
+            method=scope["method"],
+            allowed=result.allowed,
+            current_usage=result.current_usage,
+            remaining=result.remaining,
+            processing_time=processing_time
+        )
     
-    async def _extract_client_info(self, request: Request) -> Dict[str, str]:
+    async def _extract_client_info(self, request: HTTPConnection) -> Dict[str, str]:
         """Extract client identification information from request"""
         
         # Check for internal service headers
@@ -156,7 +170,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]
             # For JWT tokens, we'll use a hash of the token as client ID
-            import hashlib
             client_id = hashlib.sha256(token.encode()).hexdigest()[:16]
             return {
                 "client_id": f"jwt:{client_id}",
@@ -176,7 +189,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "client_type": "anonymous"
         }
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, request: HTTPConnection) -> str:
         """Extract client IP address from request"""
         # Check for forwarded headers (behind proxy/load balancer)
         forwarded_for = request.headers.get("X-Forwarded-For")
@@ -194,14 +207,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return "unknown"
     
-    def _add_rate_limit_headers(self, response: Response, result):
+    def _add_rate_limit_headers(self, headers: MutableHeaders, result):
         """Add rate limiting headers to response"""
-        response.headers["X-RateLimit-Limit"] = str(result.current_usage + result.remaining)
-        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(result.reset_time.timestamp()))
+        headers["X-RateLimit-Limit"] = str(result.current_usage + result.remaining)
+        headers["X-RateLimit-Remaining"] = str(result.remaining)
+        headers["X-RateLimit-Reset"] = str(int(result.reset_time.timestamp()))
         
         if not result.allowed and result.retry_after:
-            response.headers["Retry-After"] = str(result.retry_after)
+            headers["Retry-After"] = str(result.retry_after)
 
 
 class RateLimitExceededError(HTTPException):
@@ -454,12 +454,8 @@ async def initialize_resilience_for_app(
         logger.error("failed_to_initialize_resilience_manager")
         return manager
     
-    # Add rate limiting middleware
-    if manager.config.rate_limiting_enabled:
-        middleware = manager.create_rate_limit_middleware()
-        if middleware:
-            app.add_middleware(RateLimitMiddleware, **middleware.__dict__)
-            logger.info("rate_limit_middleware_added_to_app")
+    # Rate limiting middleware is part of the MiddlewareChain installed at
+    # import time; middleware can't be added once the application has started
     
     # Store manager in app state for access in endpoints
     app.state.resilience_manager = manager
@@ -15,6 +15,7 @@ from ..call_manager import CallEvent
 from ..logging_adapter import get_safe_logger
 from ..metrics import call_events_total
 from ..security.webhook_security import WebhookSecurityManager, create_apaleo_webhook_source
+from connectors.reference_data import invalidate_reference_data
 
 # Use safe logger
 logger = get_safe_logger("orchestrator.webhook")
@@ -37,6 +38,15 @@ class ApaleoWebhookEvent(BaseModel):
     data: Optional[Dict[str, Any]] = Field(None, description="Event-specific data")
 
 
+# Apaleo topics that change cached PMS reference data, mapped to the resource
+# prefix to invalidate (None drops everything cached for the property)
+APALEO_REFERENCE_DATA_TOPICS = {
+    "Property": None,
+    "UnitGroup": "/inventory/v1/unit-groups",
+    "RatePlan": "/rateplan/v1/rate-plans",
+}
+
+
 class ReservationEventData(BaseModel):
     """Reservation event data model"""
     entityId: str = Field(..., description="Reservation entity ID")
@@ -253,6 +263,8 @@ async def handle_apaleo_webhook(
             return await handle_apaleo_healthcheck(event)
         elif event.topic == "Reservation":
             return await handle_apaleo_reservation_event(event, request)
+        elif event.topic in APALEO_REFERENCE_DATA_TOPICS:
+            return await handle_apaleo_reference_data_event(event)
         else:
             logger.info(
                 "apaleo_webhook_ignored",
@@ -286,6 +298,33 @@ async def handle_apaleo_healthcheck(event: ApaleoWebhookEvent) -> Dict[str, Any]
     }
 
 
+async def handle_apaleo_reference_data_event(event: ApaleoWebhookEvent) -> Dict[str, Any]:
+    """Invalidate cached inventory when Apaleo reports a change"""
+    resource_prefix = APALEO_REFERENCE_DATA_TOPICS[event.topic]
+    property_ids = [event.propertyId] if event.propertyId else (event.propertyIds or [None])
+
+    invalidated = sum(
+        invalidate_reference_data("apaleo", property_id, resource_prefix)
+        for property_id in property_ids
+    )
+
+    logger.info(
+        "apaleo_reference_data_invalidated",
+        event_id=event.id,
+        topic=event.topic,
+        event_type=event.type,
+        property_ids=property_ids,
+        invalidated=invalidated
+    )
+
+    return {
+        "status": "processed",
+        "event_type": event.type,
+        "invalidated": invalidated,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
 async def handle_apaleo_reservation_event(event: ApaleoWebhookEvent, request: Request) -> Dict[str, Any]:
     """Handle Apaleo reservation events (created, changed, canceled)"""
     try:
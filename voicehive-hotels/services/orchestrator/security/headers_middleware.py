@@ -3,11 +3,10 @@ Security Headers Middleware for VoiceHive Hotels
 Implements comprehensive security headers for web application security
 """
 
-from typing import Dict, List, Optional, Union
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response as StarletteResponse
+from typing import Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from logging_adapter import get_safe_logger
 
@@ -84,84 +83,119 @@ class SecurityHeadersConfig(BaseModel):
     })
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add comprehensive security headers"""
+class SecurityHeadersMiddleware:
+    """
+    Middleware to add comprehensive security headers
     
-    def __init__(self, app, config: Optional[SecurityHeadersConfig] = None, environment: str = "production"):
-        super().__init__(app)
+    Header values are rendered once at construction time; per request the
+    middleware only selects which of the precomputed headers apply to the
+    path and amends the ``http.response.start`` message.
+    """
+    
+    def __init__(self, app: ASGIApp, config: Optional[SecurityHeadersConfig] = None, environment: str = "production"):
+        self.app = app
         self.config = config or SecurityHeadersConfig()
         self.environment = environment
         
         # Apply development overrides if in development
         if environment == "development" and self.config.development_overrides:
             self._apply_development_overrides()
+        
+        self._precompute_headers()
+    
+    def _precompute_headers(self):
+        """Render all header values from the (immutable at runtime) config"""
+        
+        self._csp_header = self._build_csp_header()
+        self._hsts_header = self._build_hsts_header()
+        
+        common: List[Tuple[str, str]] = [
+            # X-Content-Type-Options
+            ("X-Content-Type-Options", self.config.x_content_type_options),
+            # Referrer Policy
+            ("Referrer-Policy", self.config.referrer_policy),
+        ]
+        
+        # Permissions Policy
+        permissions_header = self._build_permissions_policy_header()
+        if permissions_header:
+            common.append(("Permissions-Policy", permissions_header))
+        
+        # Cross-Origin Policies
+        common.extend([
+            ("Cross-Origin-Embedder-Policy", self.config.cross_origin_embedder_policy),
+            ("Cross-Origin-Opener-Policy", self.config.cross_origin_opener_policy),
+            ("Cross-Origin-Resource-Policy", self.config.cross_origin_resource_policy),
+            # X-XSS-Protection (legacy support)
+            ("X-XSS-Protection", self.config.x_xss_protection),
+        ])
+        
+        # Custom headers
+        common.extend(self.config.custom_headers.items())
+        
+        self._common_headers = common
+        self._api_cache_headers = [
+            ("Cache-Control", "no-store, no-cache, must-revalidate, private"),
+            ("Pragma", "no-cache"),
+            ("Expires", "0"),
+        ]
+        self._csp_exact, self._csp_prefixes = self._split_excluded_paths("csp")
+        self._frame_exact, self._frame_prefixes = self._split_excluded_paths("frame_options")
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to response"""
         
-        # Process request
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        security_headers = self._security_headers_for(scope["path"], scope.get("scheme", "http"))
         
-        # Add security headers
-        self._add_security_headers(request, response)
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in security_headers:
+                    headers[name] = value
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_security_headers)
     
-    def _add_security_headers(self, request: Request, response: Response):
-        """Add all configured security headers to response"""
+    def _security_headers_for(self, path: str, scheme: str) -> List[Tuple[str, str]]:
+        """Select the configured security headers that apply to a request"""
         
-        path = request.url.path
+        headers: List[Tuple[str, str]] = []
         
         # Content Security Policy
-        if not self._is_path_excluded("csp", path):
-            csp_header = self._build_csp_header()
-            if csp_header:
-                response.headers["Content-Security-Policy"] = csp_header
+        if self._csp_header and not self._is_excluded(path, self._csp_exact, self._csp_prefixes):
+            headers.append(("Content-Security-Policy", self._csp_header))
         
         # HTTP Strict Transport Security (only for HTTPS)
-        if request.url.scheme == "https" or self.environment == "production":
-            hsts_header = self._build_hsts_header()
-            response.headers["Strict-Transport-Security"] = hsts_header
+        if scheme == "https" or self.environment == "production":
+            headers.append(("Strict-Transport-Security", self._hsts_header))
         
         # X-Frame-Options
-        if not self._is_path_excluded("frame_options", path):
-            response.headers["X-Frame-Options"] = self.config.x_frame_options
-        
-        # X-Content-Type-Options
-        response.headers["X-Content-Type-Options"] = self.config.x_content_type_options
-        
-        # Referrer Policy
-        response.headers["Referrer-Policy"] = self.config.referrer_policy
-        
-        # Permissions Policy
-        permissions_header = self._build_permissions_policy_header()
-        if permissions_header:
-            response.headers["Permissions-Policy"] = permissions_header
+        if not self._is_excluded(path, self._frame_exact, self._frame_prefixes):
+            headers.append(("X-Frame-Options", self.config.x_frame_options))
         
-        # Cross-Origin Policies
-        response.headers["Cross-Origin-Embedder-Policy"] = self.config.cross_origin_embedder_policy
-        response.headers["Cross-Origin-Opener-Policy"] = self.config.cross_origin_opener_policy
-        response.headers["Cross-Origin-Resource-Policy"] = self.config.cross_origin_resource_policy
+        headers.extend(self._common_headers)
         
-        # X-XSS-Protection (legacy support)
-        response.headers["X-XSS-Protection"] = self.config.x_xss_protection
+        # Security-related headers for API responses
+        if path.startswith("/api/"):
+            headers.extend(self._api_cache_headers)
         
-        # Custom headers
-        for header_name, header_value in self.config.custom_headers.items():
-            response.headers[header_name] = header_value
+        return headers
+    
+    def _split_excluded_paths(self, header_type: str) -> Tuple[frozenset, Tuple[str, ...]]:
+        """Split exclusion patterns into exact paths and wildcard prefixes"""
         
-        # Security-related headers for API responses
-        if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, private"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-        
-        # Log security headers application
-        logger.debug(
-            "security_headers_applied",
-            path=path,
-            headers_count=len([h for h in response.headers.keys() if self._is_security_header(h)])
-        )
+        excluded_paths = self.config.exclude_paths.get(header_type, [])
+        exact = frozenset(p for p in excluded_paths if not p.endswith("*"))
+        prefixes = tuple(p[:-1] for p in excluded_paths if p.endswith("*"))
+        return exact, prefixes
+    
+    @staticmethod
+    def _is_excluded(path: str, exact: frozenset, prefixes: Tuple[str, ...]) -> bool:
+        return path in exact or (bool(prefixes) and path.startswith(prefixes))
     
     def _build_csp_header(self) -> str:
         """Build Content Security Policy header"""
@@ -254,42 +288,6 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         
         return ", ".join(policies)
     
-    def _is_path_excluded(self, header_type: str, path: str) -> bool:
-        """Check if path is excluded from specific header type"""
-        
-        excluded_paths = self.config.exclude_paths.get(header_type, [])
-        
-        for excluded_path in excluded_paths:
-            if excluded_path.endswith("*"):
-                # Wildcard matching
-                prefix = excluded_path[:-1]
-                if path.startswith(prefix):
-                    return True
-            else:
-                # Exact matching
-                if path == excluded_path:
-                    return True
-        
-        return False
-    
-    def _is_security_header(self, header_name: str) -> bool:
-        """Check if header is a security-related header"""
-        
-        security_headers = {
-            "content-security-policy",
-            "strict-transport-security",
-            "x-frame-options",
-            "x-content-type-options",
-            "referrer-policy",
-            "permissions-policy",
-            "cross-origin-embedder-policy",
-            "cross-origin-opener-policy",
-            "cross-origin-resource-policy",
-            "x-xss-protection"
-        }
-        
-        return header_name.lower() in security_headers
-    
     def _apply_development_overrides(self):
         """Apply development environment overrides"""
         
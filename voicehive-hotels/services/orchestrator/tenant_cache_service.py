@@ -6,15 +6,41 @@ Provides tenant-specific caching strategies with isolation and quota enforcement
 import asyncio
 import hashlib
 import json
+import struct
 import time
 import zlib
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 from enum import Enum
 
 import redis.asyncio as redis
 from pydantic import BaseModel
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
 from services.orchestrator.tenant_management import TenantManager, TenantMetadata
 from services.orchestrator.logging_adapter import get_safe_logger
 
@@ -43,19 +69,159 @@ class CacheNamespace(str, Enum):
     TEMPORARY = "temp"
 
 
-class CacheEntry(BaseModel):
-    """Cache entry with metadata"""
+class CacheCodec(str, Enum):
+    """Compression codecs for cached payloads"""
+    NONE = "none"
+    ZLIB = "zlib"
+    ZSTD = "zstd"
+    LZ4 = "lz4"
+
+
+class CacheSerializer(str, Enum):
+    """Serializers for cached values"""
+    JSON = "json"
+    ORJSON = "orjson"
+    MSGPACK = "msgpack"
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str).encode("utf-8")
+
+
+# Codecs and serializers that can be used in this process; the header ids are
+# part of the stored format and must never be reassigned
+_CODECS: Dict[CacheCodec, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    CacheCodec.ZLIB: (zlib.compress, zlib.decompress),
+}
+_SERIALIZERS: Dict[CacheSerializer, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    CacheSerializer.JSON: (_json_dumps, json.loads),
+}
+
+if ZSTD_AVAILABLE:
+    _CODECS[CacheCodec.ZSTD] = (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+if LZ4_AVAILABLE:
+    _CODECS[CacheCodec.LZ4] = (lz4.frame.compress, lz4.frame.decompress)
+if ORJSON_AVAILABLE:
+    _SERIALIZERS[CacheSerializer.ORJSON] = (lambda value: orjson.dumps(value, default=str), orjson.loads)
+if MSGPACK_AVAILABLE:
+    _SERIALIZERS[CacheSerializer.MSGPACK] = (
+        lambda value: msgpack.packb(value, default=str, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    )
+
+_CODEC_IDS = {CacheCodec.NONE: 0, CacheCodec.ZLIB: 1, CacheCodec.ZSTD: 2, CacheCodec.LZ4: 3}
+_SERIALIZER_IDS = {CacheSerializer.JSON: 0, CacheSerializer.ORJSON: 1, CacheSerializer.MSGPACK: 2}
+_CODECS_BY_ID = {codec_id: codec for codec, codec_id in _CODEC_IDS.items()}
+_SERIALIZERS_BY_ID = {serializer_id: serializer for serializer, serializer_id in _SERIALIZER_IDS.items()}
+
+
+def resolve_codec(codec: CacheCodec) -> CacheCodec:
+    """Fall back to zlib when the configured codec is not installed"""
+    if codec == CacheCodec.NONE or codec in _CODECS:
+        return codec
+    return CacheCodec.ZLIB
+
+
+def resolve_serializer(serializer: CacheSerializer) -> CacheSerializer:
+    """Fall back to stdlib JSON when the configured serializer is not installed"""
+    return serializer if serializer in _SERIALIZERS else CacheSerializer.JSON
+
+
+@dataclass
+class CacheEnvelope:
+    """
+    Binary envelope stored as the Redis value of a cache entry
+
+    Layout (version 1)::
+
+        version:u8 | flags:u8 | codec:u8 | serializer:u8 | tags_offset:u32
+        payload bytes (serialized value, compressed when FLAG_COMPRESSED)
+        trailer at tags_offset: JSON {"k": key, "n": namespace, "t": tags}
+
+    The trailer is never compressed, so tag lookups and index cleanup read it
+    without touching the payload. Mutable metadata (access counts, sizes)
+    lives in a separate hash so reads never rewrite the envelope.
+    """
     key: str
-    value: Any
-    tenant_id: str
     namespace: CacheNamespace
-    created_at: datetime
-    expires_at: Optional[datetime] = None
-    access_count: int = 0
-    last_accessed: datetime
-    size_bytes: int = 0
-    compressed: bool = False
-    tags: List[str] = []
+    tags: List[str]
+    payload: bytes
+    serializer: CacheSerializer = CacheSerializer.JSON
+    codec: CacheCodec = CacheCodec.NONE
+
+    VERSION = 1
+    FLAG_COMPRESSED = 0x01
+    HEADER = struct.Struct(">BBBBI")
+
+    @property
+    def compressed(self) -> bool:
+        return self.codec != CacheCodec.NONE
+
+    @classmethod
+    def pack(
+        cls,
+        key: str,
+        namespace: CacheNamespace,
+        value: Any,
+        tags: List[str],
+        serializer: CacheSerializer,
+        codec: CacheCodec = CacheCodec.NONE,
+        compression_threshold_bytes: int = 0
+    ) -> Tuple["CacheEnvelope", int]:
+        """Serialize (and maybe compress) a value; returns the envelope and raw payload size"""
+        dumps, _ = _SERIALIZERS[serializer]
+        payload = dumps(value)
+        size_bytes = len(payload)
+
+        envelope = cls(key=key, namespace=namespace, tags=list(tags), payload=payload, serializer=serializer)
+        if codec != CacheCodec.NONE and size_bytes > compression_threshold_bytes:
+            compress, _ = _CODECS[codec]
+            compressed = compress(payload)
+            # Keep the raw payload when compression does not pay off
+            if len(compressed) < size_bytes:
+                envelope.payload = compressed
+                envelope.codec = codec
+
+        return envelope, size_bytes
+
+    def to_bytes(self) -> bytes:
+        trailer = json.dumps({"k": self.key, "n": self.namespace.value, "t": self.tags}).encode("utf-8")
+        header = self.HEADER.pack(
+            self.VERSION,
+            self.FLAG_COMPRESSED if self.compressed else 0,
+            _CODEC_IDS[self.codec],
+            _SERIALIZER_IDS[self.serializer],
+            self.HEADER.size + len(self.payload)
+        )
+        return header + self.payload + trailer
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "CacheEnvelope":
+        """Parse header and trailer; the payload is decoded lazily by value()"""
+        version, flags, codec_id, serializer_id, tags_offset = cls.HEADER.unpack_from(blob)
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported cache envelope version {version}")
+
+        trailer = json.loads(blob[tags_offset:])
+        return cls(
+            key=trailer["k"],
+            namespace=CacheNamespace(trailer["n"]),
+            tags=trailer["t"],
+            payload=blob[cls.HEADER.size:tags_offset],
+            serializer=_SERIALIZERS_BY_ID[serializer_id],
+            codec=_CODECS_BY_ID[codec_id] if flags & cls.FLAG_COMPRESSED else CacheCodec.NONE
+        )
+
+    def value(self) -> Any:
+        payload = self.payload
+        if self.compressed:
+            _, decompress = _CODECS[self.codec]
+            payload = decompress(payload)
+        _, loads = _SERIALIZERS[self.serializer]
+        return loads(payload)
 
 
 class TenantCacheConfig(BaseModel):
@@ -75,6 +241,8 @@ class TenantCacheConfig(BaseModel):
     # Performance settings
     compression_enabled: bool = False
     compression_threshold_bytes: int = 1024
+    compression_codec: CacheCodec = CacheCodec.ZLIB
+    serializer: CacheSerializer = CacheSerializer.ORJSON
     prefetch_enabled: bool = False
     write_through_enabled: bool = False
 
@@ -117,6 +285,18 @@ class TenantCacheMetrics(BaseModel):
         return (self.memory_used_mb / self.memory_quota_mb) * 100
 
 
+# Bump access metadata only while the entry's hash exists, so a read racing
+# expiry never recreates it without a TTL
+_TOUCH_METADATA_SCRIPT = """
+    if redis.call("exists", KEYS[1]) == 1 then
+        redis.call("hincrby", KEYS[1], "access_count", 1)
+        redis.call("hset", KEYS[1], "last_accessed", ARGV[1])
+        return 1
+    end
+    return 0
+"""
+
+
 class TenantCacheService:
     """Tenant-aware caching service with isolation and quotas"""
 
@@ -140,6 +320,9 @@ class TenantCacheService:
         self.local_cache: Dict[str, Tuple[Any, float]] = {}  # Simple in-memory cache
         self.local_cache_ttl = 60  # 1 minute local cache
 
+        # Keys per MGET/UNLINK command when walking the tag and LRU indexes
+        self.index_batch_size = 100
+
     # Core Cache Operations
 
     async def get(
@@ -162,30 +345,17 @@ class TenantCacheService:
                 # Remove expired entry
                 del self.local_cache[cache_key]
 
-        # Check Redis cache
+        # Check Redis cache (expiry is enforced by the Redis TTL)
         try:
             cached_data = await self.redis.get(cache_key)
             if cached_data is None:
                 await self._track_cache_miss(tenant_id, namespace)
                 return None
 
-            # Deserialize and decompress if needed
-            entry_data = json.loads(cached_data)
-            entry = CacheEntry(**entry_data)
-
-            # Check expiration
-            if entry.expires_at and datetime.now(timezone.utc) > entry.expires_at:
-                await self.delete(tenant_id, key, namespace)
-                await self._track_cache_miss(tenant_id, namespace)
-                return None
+            value = CacheEnvelope.from_bytes(cached_data).value()
 
             # Update access tracking
-            await self._update_access_tracking(cache_key, entry)
-
-            # Decompress if needed
-            value = entry.value
-            if entry.compressed and isinstance(value, str):
-                value = self._decompress_value(value)
+            await self._update_access_tracking(tenant_id, cache_key)
 
             # Store in local cache
             if use_local_cache:
@@ -223,44 +393,44 @@ class TenantCacheService:
                 ttl_seconds = config.default_ttl_seconds
             ttl_seconds = min(ttl_seconds, config.max_ttl_seconds)
 
-            # Serialize value
-            serialized_value = self._serialize_value(value)
-            size_bytes = len(str(serialized_value).encode('utf-8'))
+            # Serialize and compress if needed
+            envelope, size_bytes = CacheEnvelope.pack(
+                key,
+                namespace,
+                value,
+                tags or [],
+                serializer=resolve_serializer(config.serializer),
+                codec=resolve_codec(config.compression_codec) if config.compression_enabled else CacheCodec.NONE,
+                compression_threshold_bytes=config.compression_threshold_bytes
+            )
 
             # Check entry size limit
             if size_bytes > config.max_entry_size_kb * 1024:
                 logger.warning("cache_entry_too_large", tenant_id=tenant_id, size_bytes=size_bytes)
                 return False
 
-            # Compress if needed
-            compressed = False
-            if (config.compression_enabled and
-                size_bytes > config.compression_threshold_bytes):
-                serialized_value = self._compress_value(serialized_value)
-                compressed = True
-
-            # Create cache entry
+            blob = envelope.to_bytes()
             now = datetime.now(timezone.utc)
-            entry = CacheEntry(
-                key=key,
-                value=serialized_value,
-                tenant_id=tenant_id,
-                namespace=namespace,
-                created_at=now,
-                expires_at=now + timedelta(seconds=ttl_seconds),
-                last_accessed=now,
-                size_bytes=size_bytes,
-                compressed=compressed,
-                tags=tags or []
-            )
 
-            # Store in Redis
+            # Store the envelope, its metadata hash and the tag and LRU indexes atomically
             cache_key = self._build_cache_key(tenant_id, namespace, key)
-            await self.redis.setex(
-                cache_key,
-                ttl_seconds,
-                entry.model_dump_json()
-            )
+            meta_key = self._build_meta_key(cache_key)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.setex(cache_key, ttl_seconds, blob)
+            pipe.unlink(meta_key)
+            pipe.hset(meta_key, mapping={
+                "key": key,
+                "namespace": namespace.value,
+                "created_at": now.isoformat(),
+                "last_accessed": now.isoformat(),
+                "access_count": 0,
+                "size_bytes": size_bytes,
+                "stored_bytes": len(blob),
+                "codec": envelope.codec.value,
+            })
+            pipe.expire(meta_key, ttl_seconds)
+            self._queue_index_add(pipe, tenant_id, namespace, cache_key, envelope.tags, config)
+            await pipe.execute()
 
             # Update tenant usage tracking
             await self._update_tenant_usage(tenant_id, namespace, size_bytes, "add")
@@ -285,17 +455,19 @@ class TenantCacheService:
         try:
             cache_key = self._build_cache_key(tenant_id, namespace, key)
 
-            # Get entry info for usage tracking
-            cached_data = await self.redis.get(cache_key)
-            if cached_data:
-                entry_data = json.loads(cached_data)
-                entry = CacheEntry(**entry_data)
-                size_bytes = entry.size_bytes
-            else:
-                size_bytes = 0
+            # Get entry info for usage tracking and index cleanup
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(cache_key)
+            pipe.hget(self._build_meta_key(cache_key), "size_bytes")
+            cached_data, size_bytes = await pipe.execute()
+            envelope = CacheEnvelope.from_bytes(cached_data) if cached_data else None
+            size_bytes = int(size_bytes or 0)
 
-            # Delete from Redis
-            deleted = await self.redis.delete(cache_key)
+            # Delete from Redis and drop the key from the indexes
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.unlink(cache_key)
+            self._queue_index_remove(pipe, tenant_id, [cache_key], [envelope])
+            deleted = (await pipe.execute())[0]
 
             # Remove from local cache
             if cache_key in self.local_cache:
@@ -330,7 +502,10 @@ class TenantCacheService:
     ) -> bool:
         """Set expiration for cache key"""
         cache_key = self._build_cache_key(tenant_id, namespace, key)
-        return bool(await self.redis.expire(cache_key, ttl_seconds))
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.expire(cache_key, ttl_seconds)
+        pipe.expire(self._build_meta_key(cache_key), ttl_seconds)
+        return bool((await pipe.execute())[0])
 
     # Batch Operations
 
@@ -351,20 +526,7 @@ class TenantCacheService:
                 original_key = keys[i]
                 if cached_data:
                     try:
-                        entry_data = json.loads(cached_data)
-                        entry = CacheEntry(**entry_data)
-
-                        # Check expiration
-                        if entry.expires_at and datetime.now(timezone.utc) > entry.expires_at:
-                            await self.delete(tenant_id, original_key, namespace)
-                            continue
-
-                        # Decompress if needed
-                        value = entry.value
-                        if entry.compressed and isinstance(value, str):
-                            value = self._decompress_value(value)
-
-                        result[original_key] = value
+                        result[original_key] = CacheEnvelope.from_bytes(cached_data).value()
                         await self._track_cache_hit(tenant_id, namespace)
 
                     except Exception as e:
@@ -404,27 +566,12 @@ class TenantCacheService:
     ) -> Dict[str, Any]:
         """Get all cache entries matching tags"""
         result = {}
-        pattern = self._build_cache_key(tenant_id, namespace, "*")
 
         try:
-            async for cache_key in self.redis.scan_iter(match=pattern):
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    try:
-                        entry_data = json.loads(cached_data)
-                        entry = CacheEntry(**entry_data)
+            matches = await self._lookup_tagged_entries(tenant_id, tags, namespace)
 
-                        # Check if any of the requested tags match
-                        if any(tag in entry.tags for tag in tags):
-                            # Decompress if needed
-                            value = entry.value
-                            if entry.compressed and isinstance(value, str):
-                                value = self._decompress_value(value)
-
-                            result[entry.key] = value
-
-                    except Exception as e:
-                        logger.error("cache_get_by_tags_entry_error", cache_key=cache_key, error=str(e))
+            for _, envelope in matches:
+                result[envelope.key] = envelope.value()
 
         except Exception as e:
             logger.error("cache_get_by_tags_error", tenant_id=tenant_id, error=str(e))
@@ -438,36 +585,22 @@ class TenantCacheService:
         namespace: CacheNamespace = CacheNamespace.TEMPORARY
     ) -> int:
         """Invalidate all cache entries matching tags"""
-        deleted_count = 0
-        pattern = self._build_cache_key(tenant_id, namespace, "*")
-
         try:
-            keys_to_delete = []
-
-            async for cache_key in self.redis.scan_iter(match=pattern):
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    try:
-                        entry_data = json.loads(cached_data)
-                        entry = CacheEntry(**entry_data)
+            matches = await self._lookup_tagged_entries(tenant_id, tags, namespace)
+            if not matches:
+                return 0
 
-                        # Check if any of the tags match
-                        if any(tag in entry.tags for tag in tags):
-                            keys_to_delete.append(cache_key)
-
-                    except Exception as e:
-                        logger.error("cache_invalidate_entry_error", cache_key=cache_key, error=str(e))
+            cache_keys = [cache_key for cache_key, _ in matches]
+            deleted_count = await self._unlink_entries(
+                tenant_id, cache_keys, [envelope for _, envelope in matches]
+            )
 
-            # Delete in batches
-            if keys_to_delete:
-                for i in range(0, len(keys_to_delete), 100):
-                    batch = keys_to_delete[i:i+100]
-                    deleted_count += await self.redis.delete(*batch)
+            logger.debug("cache_invalidated_by_tags", tenant_id=tenant_id, tags=tags, deleted_count=deleted_count)
+            return deleted_count
 
         except Exception as e:
             logger.error("cache_invalidate_by_tags_error", tenant_id=tenant_id, error=str(e))
-
-        return deleted_count
+            return 0
 
     # Tenant Management
 
@@ -502,24 +635,49 @@ class TenantCacheService:
     ) -> int:
         """Clear all cache entries for a tenant"""
         try:
+            lru_key = self._build_lru_key(tenant_id)
+
+            # Every live entry of the tenant is a member of its LRU index
             if namespace:
-                pattern = self._build_cache_key(tenant_id, namespace, "*")
+                namespaces = [namespace]
+                match = self._build_cache_key(tenant_id, namespace, "*")
             else:
-                pattern = f"{self.global_prefix}:tenant:{tenant_id}:*"
+                namespaces = list(CacheNamespace)
+                match = None
 
-            keys_to_delete = []
-            async for key in self.redis.scan_iter(match=pattern):
-                keys_to_delete.append(key)
+            cache_keys = [
+                self._decode_key(member)
+                async for member, _ in self.redis.zscan_iter(lru_key, match=match)
+            ]
 
-            # Delete in batches
             deleted_count = 0
-            if keys_to_delete:
-                for i in range(0, len(keys_to_delete), 100):
-                    batch = keys_to_delete[i:i+100]
-                    deleted_count += await self.redis.delete(*batch)
+            pipe = self.redis.pipeline(transaction=False)
+            for i in range(0, len(cache_keys), self.index_batch_size):
+                pipe.unlink(*cache_keys[i:i + self.index_batch_size])
+            if cache_keys:
+                deleted_count = sum(await pipe.execute())
+
+            # Drop the metadata hashes and tag indexes of the cleared namespaces
+            index_keys = [self._build_meta_key(cache_key) for cache_key in cache_keys]
+            for ns in namespaces:
+                registry_key = self._build_tag_registry_key(tenant_id, ns)
+                tags = await self.redis.smembers(registry_key)
+                index_keys.extend(self._build_tag_key(tenant_id, ns, self._decode_key(tag)) for tag in tags)
+                index_keys.append(registry_key)
+
+            pipe = self.redis.pipeline(transaction=False)
+            if namespace:
+                for i in range(0, len(cache_keys), self.index_batch_size):
+                    pipe.zrem(lru_key, *cache_keys[i:i + self.index_batch_size])
+            else:
+                index_keys.append(lru_key)
+            for i in range(0, len(index_keys), self.index_batch_size):
+                pipe.unlink(*index_keys[i:i + self.index_batch_size])
+            await pipe.execute()
 
             # Clear from local cache
-            local_keys_to_remove = [key for key in self.local_cache.keys() if key.startswith(pattern.replace("*", ""))]
+            local_prefix = (match or f"{self.global_prefix}:tenant:{tenant_id}:*").replace("*", "")
+            local_keys_to_remove = [key for key in self.local_cache.keys() if key.startswith(local_prefix)]
             for key in local_keys_to_remove:
                 del self.local_cache[key]
 
@@ -543,24 +701,22 @@ class TenantCacheService:
         )
 
         try:
-            pattern = f"{self.global_prefix}:tenant:{tenant_id}:*"
             total_entries = 0
             total_size = 0
             access_counts = {}
 
-            async for cache_key in self.redis.scan_iter(match=pattern):
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    try:
-                        entry_data = json.loads(cached_data)
-                        entry = CacheEntry(**entry_data)
+            # Sizes and access counts come from the metadata hashes, not the values
+            pipe = self.redis.pipeline(transaction=False)
+            async for member, _ in self.redis.zscan_iter(self._build_lru_key(tenant_id)):
+                pipe.hmget(self._build_meta_key(self._decode_key(member)), "key", "size_bytes", "access_count")
 
-                        total_entries += 1
-                        total_size += entry.size_bytes
-                        access_counts[entry.key] = entry.access_count
+            for key, size_bytes, access_count in await pipe.execute():
+                if key is None:
+                    continue
 
-                    except Exception:
-                        continue
+                total_entries += 1
+                total_size += int(size_bytes)
+                access_counts[self._decode_key(key)] = int(access_count or 0)
 
             metrics.total_entries = total_entries
             metrics.memory_used_mb = total_size / (1024 * 1024)
@@ -595,6 +751,155 @@ class TenantCacheService:
         else:
             return f"{self.global_prefix}:tenant:{tenant_id}:{namespace.value}:{key}"
 
+    def _build_meta_key(self, cache_key: str) -> str:
+        """Build key of the metadata hash kept beside a cache entry"""
+        entry_path = cache_key[len(f"{self.global_prefix}:tenant:"):]
+        return f"{self.global_prefix}:meta:{entry_path}"
+
+    def _build_tag_key(self, tenant_id: str, namespace: CacheNamespace, tag: str) -> str:
+        """Build key of the set holding the cache keys carrying a tag"""
+        return f"{self.global_prefix}:index:{tenant_id}:tag:{namespace.value}:{tag}"
+
+    def _build_tag_registry_key(self, tenant_id: str, namespace: CacheNamespace) -> str:
+        """Build key of the set of tags in use in a tenant namespace"""
+        return f"{self.global_prefix}:index:{tenant_id}:tags:{namespace.value}"
+
+    def _build_lru_key(self, tenant_id: str) -> str:
+        """Build key of the sorted set of cache keys scored by last access time"""
+        return f"{self.global_prefix}:index:{tenant_id}:lru"
+
+    @staticmethod
+    def _decode_key(key: Union[str, bytes]) -> str:
+        return key.decode() if isinstance(key, bytes) else key
+
+    def _queue_index_add(
+        self,
+        pipe,
+        tenant_id: str,
+        namespace: CacheNamespace,
+        cache_key: str,
+        tags: List[str],
+        config: TenantCacheConfig
+    ):
+        """Queue the index updates for a stored entry on a pipeline"""
+        now = time.time()
+
+        # No entry outlives max_ttl_seconds, so neither does anything indexing it
+        index_ttl = config.max_ttl_seconds
+
+        for tag in tags:
+            tag_key = self._build_tag_key(tenant_id, namespace, tag)
+            pipe.sadd(tag_key, cache_key)
+            pipe.expire(tag_key, index_ttl)
+
+        if tags:
+            registry_key = self._build_tag_registry_key(tenant_id, namespace)
+            pipe.sadd(registry_key, *tags)
+            pipe.expire(registry_key, index_ttl)
+
+        lru_key = self._build_lru_key(tenant_id)
+        pipe.zadd(lru_key, {cache_key: now})
+        # Members not touched within max_ttl_seconds have expired from Redis
+        pipe.zremrangebyscore(lru_key, "-inf", now - index_ttl)
+        pipe.expire(lru_key, index_ttl)
+
+    def _queue_index_remove(
+        self,
+        pipe,
+        tenant_id: str,
+        cache_keys: List[str],
+        envelopes: List[Optional[CacheEnvelope]]
+    ):
+        """Queue removal of deleted cache keys from the metadata and indexes on a pipeline"""
+        pipe.unlink(*[self._build_meta_key(cache_key) for cache_key in cache_keys])
+        pipe.zrem(self._build_lru_key(tenant_id), *cache_keys)
+
+        keys_by_tag: Dict[str, List[str]] = {}
+        for cache_key, envelope in zip(cache_keys, envelopes):
+            if envelope is None:
+                continue
+            for tag in envelope.tags:
+                tag_key = self._build_tag_key(tenant_id, envelope.namespace, tag)
+                keys_by_tag.setdefault(tag_key, []).append(cache_key)
+
+        for tag_key, tagged_keys in keys_by_tag.items():
+            pipe.srem(tag_key, *tagged_keys)
+
+    async def _mget_envelopes(self, cache_keys: List[str]) -> List[Optional[CacheEnvelope]]:
+        """Load envelopes with batched MGETs sent in a single round trip"""
+        if not cache_keys:
+            return []
+
+        pipe = self.redis.pipeline(transaction=False)
+        for i in range(0, len(cache_keys), self.index_batch_size):
+            pipe.mget(cache_keys[i:i + self.index_batch_size])
+
+        envelopes: List[Optional[CacheEnvelope]] = []
+        cached_values = [value for batch in await pipe.execute() for value in batch]
+        for cache_key, cached_data in zip(cache_keys, cached_values):
+            envelope = None
+            if cached_data:
+                try:
+                    envelope = CacheEnvelope.from_bytes(cached_data)
+                except Exception as e:
+                    logger.error("cache_index_entry_error", cache_key=cache_key, error=str(e))
+            envelopes.append(envelope)
+
+        return envelopes
+
+    async def _lookup_tagged_entries(
+        self,
+        tenant_id: str,
+        tags: List[str],
+        namespace: CacheNamespace
+    ) -> List[Tuple[str, CacheEnvelope]]:
+        """Resolve tags to live entries through the tag index"""
+        if not tags:
+            return []
+
+        tag_keys = {tag: self._build_tag_key(tenant_id, namespace, tag) for tag in tags}
+        members = await self.redis.sunion(list(tag_keys.values()))
+        cache_keys = sorted(self._decode_key(member) for member in members)
+        envelopes = await self._mget_envelopes(cache_keys)
+
+        # Index members may outlive their entry (TTL expiry) or a retag on overwrite
+        matches = []
+        stale: Dict[str, List[str]] = {}
+        for cache_key, envelope in zip(cache_keys, envelopes):
+            for tag in tags:
+                if envelope is None or tag not in envelope.tags:
+                    stale.setdefault(tag_keys[tag], []).append(cache_key)
+            if envelope is not None and any(tag in envelope.tags for tag in tags):
+                matches.append((cache_key, envelope))
+
+        if stale:
+            pipe = self.redis.pipeline(transaction=False)
+            for tag_key, stale_keys in stale.items():
+                pipe.srem(tag_key, *stale_keys)
+            await pipe.execute()
+
+        return matches
+
+    async def _unlink_entries(
+        self,
+        tenant_id: str,
+        cache_keys: List[str],
+        envelopes: List[Optional[CacheEnvelope]]
+    ) -> int:
+        """UNLINK entries, their metadata and index memberships atomically"""
+        pipe = self.redis.pipeline(transaction=True)
+        batch_count = 0
+        for i in range(0, len(cache_keys), self.index_batch_size):
+            pipe.unlink(*cache_keys[i:i + self.index_batch_size])
+            batch_count += 1
+        self._queue_index_remove(pipe, tenant_id, cache_keys, envelopes)
+        results = await pipe.execute()
+
+        for cache_key in cache_keys:
+            self.local_cache.pop(cache_key, None)
+
+        return sum(results[:batch_count])
+
     async def _get_tenant_cache_config(self, tenant_id: str) -> TenantCacheConfig:
         """Get cache configuration for tenant"""
         # Check memory cache first
@@ -643,6 +948,7 @@ class TenantCacheService:
                 max_memory_mb=1000,
                 max_entries=100000,
                 compression_enabled=True,
+                compression_codec=CacheCodec.ZSTD,
                 prefetch_enabled=True
             ),
             "custom": TenantCacheConfig(
@@ -656,51 +962,24 @@ class TenantCacheService:
 
         return configs.get(tenant.tenant_tier.value, configs["starter"])
 
-    def _serialize_value(self, value: Any) -> Any:
-        """Serialize value for storage"""
-        if isinstance(value, (dict, list, tuple)):
-            return value  # JSON serializable
-        elif isinstance(value, (str, int, float, bool)):
-            return value
-        else:
-            # Convert to JSON string for complex objects
-            return json.dumps(value, default=str)
-
-    def _compress_value(self, value: Any) -> str:
-        """Compress value using zlib"""
-        json_str = json.dumps(value) if not isinstance(value, str) else value
-        compressed = zlib.compress(json_str.encode('utf-8'))
-        return compressed.hex()
-
-    def _decompress_value(self, compressed_hex: str) -> Any:
-        """Decompress value from hex string"""
-        try:
-            compressed_bytes = bytes.fromhex(compressed_hex)
-            decompressed = zlib.decompress(compressed_bytes)
-            json_str = decompressed.decode('utf-8')
-            return json.loads(json_str)
-        except Exception as e:
-            logger.error("decompression_error", error=str(e))
-            return compressed_hex  # Return as-is if decompression fails
-
     async def _check_quota(self, tenant_id: str, config: TenantCacheConfig) -> bool:
         """Check if tenant can store more data"""
         metrics = await self.get_tenant_cache_metrics(tenant_id)
         return (metrics.memory_used_mb < config.max_memory_mb and
                 metrics.total_entries < config.max_entries)
 
-    async def _update_access_tracking(self, cache_key: str, entry: CacheEntry):
-        """Update access tracking for cache entry"""
+    async def _update_access_tracking(self, tenant_id: str, cache_key: str):
+        """Update access metadata and LRU score without rewriting the value"""
         try:
-            entry.access_count += 1
-            entry.last_accessed = datetime.now(timezone.utc)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.eval(
+                _TOUCH_METADATA_SCRIPT, 1, self._build_meta_key(cache_key),
+                datetime.now(timezone.utc).isoformat()
+            )
+            pipe.zadd(self._build_lru_key(tenant_id), {cache_key: time.time()})
 
             # Update in Redis (async, don't wait)
-            asyncio.create_task(self.redis.setex(
-                cache_key,
-                int((entry.expires_at - datetime.now(timezone.utc)).total_seconds()) if entry.expires_at else 3600,
-                entry.model_dump_json()
-            ))
+            asyncio.create_task(pipe.execute())
 
         except Exception as e:
             logger.error("access_tracking_error", cache_key=cache_key, error=str(e))
@@ -767,35 +1046,20 @@ class TenantCacheService:
             logger.info("cache_eviction_performed", tenant_id=tenant_id, evicted_count=evicted_count)
 
     async def _evict_entries(self, tenant_id: str, config: TenantCacheConfig) -> int:
-        """Evict cache entries based on configured policy"""
-        # This is a simplified LRU eviction
-        # In production, you'd implement proper LRU/LFU algorithms
-
-        pattern = f"{self.global_prefix}:tenant:{tenant_id}:*"
-        entries_to_evict = []
-
+        """Evict the least recently used entries of a tenant"""
         try:
-            async for cache_key in self.redis.scan_iter(match=pattern):
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    try:
-                        entry_data = json.loads(cached_data)
-                        entry = CacheEntry(**entry_data)
-                        entries_to_evict.append((cache_key, entry.last_accessed))
-                    except Exception:
-                        continue
-
-            # Sort by last accessed time (oldest first)
-            entries_to_evict.sort(key=lambda x: x[1])
-
-            # Evict oldest entries
-            evicted_count = 0
-            for cache_key, _ in entries_to_evict[:config.eviction_batch_size]:
-                if await self.redis.delete(cache_key):
-                    evicted_count += 1
-
-            return evicted_count
+            lru_key = self._build_lru_key(tenant_id)
+            victims = [
+                self._decode_key(member)
+                for member in await self.redis.zrange(lru_key, 0, config.eviction_batch_size - 1)
+            ]
+            if not victims:
+                return 0
+
+            # Envelope trailers are read only to drop victims from their tag sets
+            envelopes = await self._mget_envelopes(victims)
+            return await self._unlink_entries(tenant_id, victims, envelopes)
 
         except Exception as e:
             logger.error("cache_eviction_error", tenant_id=tenant_id, error=str(e))
-            return 0
\ No newline at end of file
+            return 0
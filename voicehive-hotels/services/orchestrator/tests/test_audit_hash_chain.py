@@ -0,0 +1,246 @@
+"""
+Tests for the audit log hash chain, Merkle checkpoints and incremental
+chain verification in AuditTrailVerifier
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from audit_hash_chain import (
+    GENESIS_HASH, AuditHashChain, MerkleTree,
+    verify_chain_segment, verify_merkle_proof
+)
+from audit_trail_verifier import AuditTrailVerifier, AuditGapType
+
+
+def make_rows(count, day="2026-01-15"):
+    timestamp = f"{day}T12:00:00+00:00"
+    return [
+        {
+            "event_id": f"event-{i}",
+            "timestamp": timestamp,
+            "checksum": hashlib.sha256(f"row-{i}".encode()).hexdigest(),
+        }
+        for i in range(count)
+    ]
+
+
+def segment(rows):
+    return [
+        (row["chain_position"], row["event_id"], row["checksum"], row["prev_hash"], row["chain_hash"])
+        for row in rows
+    ]
+
+
+class TestMerkleTree:
+    """Test Merkle roots and inclusion proofs"""
+
+    @pytest.mark.parametrize("leaf_count", [1, 2, 3, 7, 8, 100])
+    def test_every_leaf_has_valid_proof(self, leaf_count):
+        leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(leaf_count)]
+        tree = MerkleTree(leaves)
+
+        for index, leaf in enumerate(leaves):
+            proof = tree.proof(index)
+            assert len(proof) <= max(1, (leaf_count - 1).bit_length())
+            assert verify_merkle_proof(leaf, proof, tree.root)
+
+    @pytest.mark.parametrize("leaf_count", [1, 2, 5, 13, 64])
+    def test_sibling_path_matches_stored_levels(self, leaf_count):
+        leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(leaf_count)]
+        tree = MerkleTree(leaves)
+        stored = {(level, index): node for level, index, node in tree.interior_nodes()}
+
+        for index in range(leaf_count):
+            proof = [
+                (side, leaves[node_index] if level == 0 else stored[(level, node_index)])
+                for level, node_index, side in MerkleTree.sibling_path(leaf_count, index)
+            ]
+            assert proof == tree.proof(index)
+
+    def test_tampered_leaf_fails_proof(self):
+        leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(16)]
+        tree = MerkleTree(leaves)
+
+        assert not verify_merkle_proof("f" * 64, tree.proof(5), tree.root)
+
+
+class TestAuditHashChain:
+    """Test linking and segment verification"""
+
+    def test_link_continues_across_batches(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        first, second = make_rows(3), make_rows(5)[3:]
+
+        chain.commit(chain.link(first))
+        chain.commit(chain.link(second))
+
+        rows = first + second
+        assert [row["chain_position"] for row in rows] == [1, 2, 3, 4, 5]
+        assert rows[0]["prev_hash"] == GENESIS_HASH
+        assert rows[0]["chain_partition"] == "writer-1:2026-01-15"
+
+        breaks, head, leaves = verify_chain_segment(segment(rows), GENESIS_HASH, 0)
+        assert breaks == []
+        assert head.position == 5
+        assert head.chain_hash == rows[-1]["chain_hash"]
+        assert len(leaves) == 5
+
+    def test_uncommitted_link_does_not_advance_head(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        rows = make_rows(2)
+
+        chain.link(rows)  # write failed, never committed
+        chain.link(rows)
+
+        assert [row["chain_position"] for row in rows] == [1, 2]
+
+    def test_tampered_and_missing_rows_are_detected(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        rows = make_rows(6)
+        chain.commit(chain.link(rows))
+
+        rows[2]["checksum"] = "0" * 64
+        del rows[4]
+
+        breaks, _, _ = verify_chain_segment(segment(rows), GENESIS_HASH, 0)
+        reasons = {(chain_break.position, chain_break.reason) for chain_break in breaks}
+        assert (3, "chain_hash mismatch") in reasons
+        assert (6, "missing chain positions 5-5") in reasons
+
+
+class FakeChainSession:
+    """Minimal stand-in for the AsyncSession queries used by chain verification"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.checkpoints = []
+        self.nodes = {}
+        self.page_reads = []
+        self.range_reads = 0
+
+    async def execute(self, query, params):
+        sql = str(query)
+        result = MagicMock()
+
+        if "INSERT INTO audit_chain_checkpoints" in sql:
+            self.checkpoints.append(params)
+            result.fetchone.return_value = (params["checkpoint_id"],)
+        elif "INSERT INTO audit_chain_checkpoint_nodes" in sql:
+            for node in params:
+                self.nodes[(node["checkpoint_id"], node["level"], node["node_index"])] = node["node_hash"]
+        elif "WHERE e.event_id = :event_id" in sql:
+            row = next(row for row in self.rows if row["event_id"] == params["event_id"])
+            checkpoint = next(
+                c for c in self.checkpoints
+                if c["start_position"] <= row["chain_position"] <= c["end_position"]
+            )
+            result.fetchone.return_value = (
+                row["chain_partition"], row["chain_position"], row["checksum"], row["prev_hash"],
+                row["chain_hash"], checkpoint["checkpoint_id"], checkpoint["start_position"],
+                checkpoint["end_position"], checkpoint["merkle_root"], checkpoint["leaf_count"]
+            )
+        elif "chain_position = :position" in sql:
+            row = next(row for row in self.rows if row["chain_position"] == params["position"])
+            result.fetchone.return_value = (row["chain_hash"],)
+        elif "FROM audit_chain_checkpoint_nodes" in sql:
+            result.fetchall.return_value = [
+                (level, node_index, self.nodes[(params["checkpoint_id"], level, node_index)])
+                for level, node_index in zip(params["levels"], params["node_indexes"])
+                if (params["checkpoint_id"], level, node_index) in self.nodes
+            ]
+        elif "BETWEEN :start_position AND :end_position" in sql:
+            self.range_reads += 1
+            result.fetchall.return_value = [
+                (row["chain_hash"],) for row in self.rows
+                if params["start_position"] <= row["chain_position"] <= params["end_position"]
+            ]
+        elif "FROM audit_chain_checkpoints" in sql:
+            latest = max(self.checkpoints, key=lambda c: c["end_position"], default=None)
+            result.fetchone.return_value = (latest["end_position"], latest["chain_hash"]) if latest else None
+        elif "chain_position > :after_position" in sql:
+            self.page_reads.append(params["after_position"])
+            page = [row for row in segment(self.rows) if row[0] > params["after_position"]]
+            result.fetchall.return_value = page[:params["page_size"]]
+        return result
+
+    async def commit(self):
+        pass
+
+
+class TestIncrementalChainVerification:
+    """Test AuditTrailVerifier chain verification from checkpoints"""
+
+    @pytest.mark.asyncio
+    async def test_verification_resumes_from_last_checkpoint(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        rows = make_rows(25)
+        chain.commit(chain.link(rows))
+
+        db = FakeChainSession(rows)
+        verifier = AuditTrailVerifier(db)
+        verifier.config["chain_checkpoint_interval"] = 10
+
+        gaps = await verifier.verify_hash_chains(["writer-1:2026-01-15"])
+
+        assert gaps == []
+        assert [c["end_position"] for c in db.checkpoints] == [10, 20, 25]
+        leaves = [row["chain_hash"] for row in rows[:10]]
+        assert db.checkpoints[0]["merkle_root"] == MerkleTree(leaves).root
+
+        # New rows arrive; only they are read on the next run
+        more = make_rows(30)[25:]
+        chain.commit(chain.link(more))
+        db.rows = rows + more
+        db.page_reads.clear()
+
+        gaps = await verifier.verify_hash_chains(["writer-1:2026-01-15"])
+
+        assert gaps == []
+        assert db.page_reads == [25]
+        assert db.checkpoints[-1]["end_position"] == 30
+
+    @pytest.mark.asyncio
+    async def test_break_is_reported_and_not_checkpointed(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        rows = make_rows(20)
+        chain.commit(chain.link(rows))
+        rows[14]["prev_hash"] = "f" * 64
+
+        db = FakeChainSession(rows)
+        verifier = AuditTrailVerifier(db)
+        verifier.config["chain_checkpoint_interval"] = 10
+
+        gaps = await verifier.verify_hash_chains(["writer-1:2026-01-15"])
+
+        assert len(gaps) == 1
+        assert gaps[0].gap_type == AuditGapType.CHECKSUM_MISMATCH
+        assert gaps[0].severity == "critical"
+        assert [c["end_position"] for c in db.checkpoints] == [10]
+
+    @pytest.mark.asyncio
+    async def test_inclusion_proof_reads_only_the_sibling_path(self):
+        chain = AuditHashChain(writer_id="writer-1")
+        rows = make_rows(25)
+        chain.commit(chain.link(rows))
+
+        db = FakeChainSession(rows)
+        verifier = AuditTrailVerifier(db)
+        verifier.config["chain_checkpoint_interval"] = 10
+        await verifier.verify_hash_chains(["writer-1:2026-01-15"])
+
+        proof = await verifier.prove_event_inclusion("event-13")
+
+        assert proof["checkpointed"] is True
+        assert proof["verified"] is True
+        assert len(proof["proof"]) == 4
+        assert db.range_reads == 0
+
+        # Checkpoints without stored interior nodes fall back to a rebuild
+        db.nodes.clear()
+        proof = await verifier.prove_event_inclusion("event-13")
+
+        assert proof["verified"] is True
+        assert db.range_reads == 1
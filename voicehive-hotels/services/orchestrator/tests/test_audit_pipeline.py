@@ -0,0 +1,206 @@
+"""
+Tests for the asynchronous, batched audit event pipeline
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from audit_logging import AuditLogger, AuditEventType, AuditContext
+from audit_pipeline import AuditPipeline, AuditPipelineConfig, AuditSink, categorize_event_type
+
+
+class RecordingSink(AuditSink):
+    """Sink that records batches and can be made slow or failing"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self.replayed = []
+
+    async def write_batch(self, rows):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(rows))
+
+    async def replay_batch(self, rows):
+        await self.write_batch(rows)
+        self.replayed.extend(rows)
+
+    @property
+    def rows(self):
+        return [row for batch in self.batches for row in batch]
+
+
+def make_config(tmp_path, **overrides):
+    options = {
+        "queue_size": 1000,
+        "batch_size": 100,
+        "flush_interval_seconds": 0.01,
+        "db_write_timeout_seconds": 0.2,
+        "spool_path": str(tmp_path / "spool" / "audit.jsonl"),
+        "spool_replay_interval_seconds": 0.0,
+    }
+    options.update(overrides)
+    return AuditPipelineConfig(**options)
+
+
+def make_logger():
+    return AuditLogger(enable_pii_redaction=False)
+
+
+async def wait_for(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class TestAuditPipeline:
+    """Test batching, spooling and replay"""
+
+    def test_event_categories(self):
+        assert categorize_event_type("auth.login.success") == "authentication"
+        assert categorize_event_type("authz.access.denied") == "authorization"
+        assert categorize_event_type("data.read") == "data_access"
+        assert categorize_event_type("data.delete") == "data_modification"
+        assert categorize_event_type("pii.redacted") == "compliance_events"
+        assert categorize_event_type("system.security.violation") == "security_events"
+        assert categorize_event_type("system.config.change") == "system_administration"
+
+    @pytest.mark.asyncio
+    async def test_events_are_batched_to_sink(self, tmp_path):
+        sink = RecordingSink()
+        audit_logger = make_logger()
+        pipeline = AuditPipeline(config=make_config(tmp_path), sink=sink)
+        await pipeline.start()
+        audit_logger.attach_pipeline(pipeline)
+
+        context = AuditContext(user_id="user-1", correlation_id="corr-1")
+        for i in range(250):
+            audit_logger.log_event(AuditEventType.DATA_READ, f"read {i}", context=context, resource_id=str(i))
+
+        await pipeline.stop()
+
+        assert len(sink.rows) == 250
+        assert len(sink.batches) < 250
+        row = sink.rows[0]
+        assert row["event_category"] == "data_access"
+        assert row["user_id"] == "user-1"
+        assert row["correlation_id"] == "corr-1"
+        assert len(row["checksum"]) == 64
+        assert "_context" not in row
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_spooled_and_replayed(self, tmp_path):
+        sink = RecordingSink(fail=True)
+        config = make_config(tmp_path, spool_replay_interval_seconds=3600)
+        pipeline = AuditPipeline(config=config, sink=sink)
+        audit_logger = make_logger()
+        await pipeline.start()
+        audit_logger.attach_pipeline(pipeline)
+
+        for i in range(20):
+            audit_logger.log_event(AuditEventType.CONFIG_CHANGE, f"change {i}")
+
+        await wait_for(lambda: pipeline.stats["spooled"] == 20)
+        spooled = [json.loads(line) for line in open(config.spool_path)]
+        assert len(spooled) == 20
+
+        # Database recovers; the worker replays the spool on its next cycle
+        sink.fail = False
+        config.spool_replay_interval_seconds = 0.0
+        await wait_for(lambda: pipeline.stats["replayed"] == 20)
+        await pipeline.stop()
+
+        assert {row["event_id"] for row in sink.replayed} == {row["event_id"] for row in spooled}
+        assert not pipeline.spool.has_pending()
+
+    @pytest.mark.asyncio
+    async def test_slow_database_does_not_block_request_path(self, tmp_path):
+        sink = RecordingSink(delay=1.0)
+        pipeline = AuditPipeline(config=make_config(tmp_path, db_write_timeout_seconds=0.05), sink=sink)
+        audit_logger = make_logger()
+        await pipeline.start()
+        audit_logger.attach_pipeline(pipeline)
+
+        start = time.perf_counter()
+        for i in range(500):
+            audit_logger.log_event(AuditEventType.CALL_START, f"call {i}")
+        elapsed = time.perf_counter() - start
+
+        await pipeline.stop()
+
+        # Submitting never waits on the sink; timed-out batches land in the spool
+        assert elapsed < 0.5
+        assert pipeline.stats["spooled"] == 500
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_spools_instead_of_dropping(self, tmp_path):
+        sink = RecordingSink()
+        config = make_config(tmp_path, queue_size=5)
+        pipeline = AuditPipeline(config=config, sink=sink)
+        audit_logger = make_logger()
+        # No worker drains the queue; mark running so the logger routes events here
+        pipeline._running = True
+        audit_logger.attach_pipeline(pipeline)
+
+        for i in range(8):
+            audit_logger.log_event(AuditEventType.CALL_END, f"call {i}")
+
+        # Overflowed events are spooled by a background task, not inline
+        assert pipeline.stats["overflow_spooled"] == 0
+        await wait_for(lambda: pipeline.stats["overflow_spooled"] == 3)
+        assert len(open(config.spool_path).readlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_batch(self, tmp_path):
+        sink = RecordingSink(delay=0.1)
+        pipeline = AuditPipeline(config=make_config(tmp_path, db_write_timeout_seconds=1.0), sink=sink)
+        audit_logger = make_logger()
+        await pipeline.start()
+        audit_logger.attach_pipeline(pipeline)
+
+        for i in range(10):
+            audit_logger.log_event(AuditEventType.CALL_START, f"call {i}")
+        await wait_for(lambda: pipeline._queue.empty())
+
+        await pipeline.stop()
+
+        assert len(sink.rows) == 10
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_spools_the_batch(self, tmp_path):
+        sink = RecordingSink(delay=1.0)
+        config = make_config(tmp_path, db_write_timeout_seconds=5.0)
+        pipeline = AuditPipeline(config=config, sink=sink)
+        audit_logger = make_logger()
+        await pipeline.start()
+        audit_logger.attach_pipeline(pipeline)
+
+        for i in range(10):
+            audit_logger.log_event(AuditEventType.CALL_START, f"call {i}")
+        await wait_for(lambda: pipeline._queue.empty())
+
+        pipeline._worker_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pipeline._worker_task
+
+        assert pipeline.stats["spooled"] == 10
+        assert len(open(config.spool_path).readlines()) == 10
+
+    @pytest.mark.asyncio
+    async def test_logger_falls_back_without_running_pipeline(self, tmp_path):
+        pipeline = AuditPipeline(config=make_config(tmp_path), sink=RecordingSink())
+        audit_logger = make_logger()
+        audit_logger.attach_pipeline(pipeline)
+
+        audit_logger.log_event(AuditEventType.CALL_START, "inline")
+
+        assert pipeline.stats["submitted"] == 0
@@ -0,0 +1,141 @@
+"""
+Tests for set-based bulk retention enforcement
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from data_retention_enforcer import DataRetentionEnforcer, RetentionAction
+
+
+def expired_row(record_id, tables=("call_transcripts",)):
+    return {
+        "record_id": record_id,
+        "created_at": datetime.now(timezone.utc) - timedelta(days=400),
+        "data_subject_id": f"guest-{record_id}",
+        "file_paths": json.dumps([]),
+        "database_tables": json.dumps(list(tables)),
+    }
+
+
+class FakeSession:
+    """Records executed SQL and serves pages of expired records"""
+
+    def __init__(self, rows, columns=("email", "phone")):
+        self.rows = rows
+        self.columns = columns
+        self.statements = []
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        self.statements.append((sql, params or {}))
+        result = MagicMock()
+        if "FROM data_retention_records" in sql and "SELECT" in sql:
+            page = [r for r in self.rows if r["record_id"] > params["after"]][:params["limit"]]
+            result.mappings.return_value.fetchall.return_value = page
+        elif "information_schema.columns" in sql:
+            result.fetchall.return_value = [(c,) for c in self.columns]
+        return result
+
+    def matching(self, fragment):
+        return [(sql, params) for sql, params in self.statements if fragment in sql]
+
+
+@pytest.fixture
+def enforcer_factory():
+    def build(session, **kwargs):
+        with patch("data_retention_enforcer.boto3"):
+            enforcer = DataRetentionEnforcer(session, audit_logger=MagicMock(), **kwargs)
+        enforcer.config["bulk_enforcement"]["chunk_pause_seconds"] = 0
+        return enforcer
+    return build
+
+
+@pytest.mark.asyncio
+async def test_delete_is_one_statement_per_table_per_chunk(enforcer_factory):
+    session = FakeSession([expired_row(f"rec-{i:03d}") for i in range(5)])
+    enforcer = enforcer_factory(session)
+    policy = enforcer.policies["pii_data_1y"]
+    policy.batch_size = 2
+
+    results = await enforcer._enforce_policy(policy)
+
+    assert results["records_processed"] == 5
+    assert results["actions_taken"]["deleted"] == 5
+    assert results["errors"] == []
+    deletes = session.matching("DELETE FROM call_transcripts")
+    assert [params["record_ids"] for _, params in deletes] == [
+        ["rec-000", "rec-001"], ["rec-002", "rec-003"], ["rec-004"]
+    ]
+    # Keyset pagination resumes after the last ID of the previous page
+    pages = session.matching("SELECT record_id")
+    assert [params["after"] for _, params in pages] == ["", "rec-001", "rec-003"]
+    # One processing and one final status update per chunk, one audit event per chunk
+    assert len(session.matching("UPDATE data_retention_records")) == 6
+    assert enforcer.audit_logger.log_event.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_anonymize_updates_only_existing_columns(enforcer_factory):
+    session = FakeSession([expired_row("rec-1")], columns=("email", "record_id"))
+    enforcer = enforcer_factory(session)
+    policy = enforcer.policies["transcripts_90d"]
+    assert policy.action == RetentionAction.ANONYMIZE
+
+    results = await enforcer._enforce_policy(policy)
+
+    assert results["actions_taken"]["anonymized"] == 1
+    (sql, params), = session.matching("UPDATE call_transcripts")
+    assert "email =" in sql and "phone =" not in sql
+    assert params["record_ids"] == ["rec-1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_marked_failed(enforcer_factory):
+    session = FakeSession([expired_row("rec-1", tables=())])
+    enforcer = enforcer_factory(session)
+    policy = enforcer.policies["audit_logs_7y"]
+    policy.archive_location = None
+
+    results = await enforcer._enforce_policy(policy)
+
+    assert results["actions_taken"]["archived"] == 0
+    assert len(results["errors"]) == 1
+    session.rollback.assert_awaited()
+    final_update = session.matching("UPDATE data_retention_records")[-1][1]
+    assert final_update["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_dry_run_counts_without_writing(enforcer_factory):
+    session = FakeSession([expired_row(f"rec-{i}") for i in range(3)])
+    enforcer = enforcer_factory(session)
+
+    results = await enforcer._enforce_policy(enforcer.policies["pii_data_1y"], dry_run=True)
+
+    assert results["records_processed"] == 3
+    assert session.matching("DELETE") == []
+    assert session.matching("UPDATE") == []
+    session.commit.assert_not_awaited()
+
+
+def test_partial_bulk_enforcement_config_keeps_defaults(enforcer_factory, tmp_path):
+    config_path = tmp_path / "retention.yaml"
+    config_path.write_text("batch_size: 500\nbulk_enforcement:\n  max_parallel_chunks: 2\n  transfer:\n    max_concurrency: 8\n")
+
+    enforcer = enforcer_factory(FakeSession([]), config_path=str(config_path))
+
+    bulk = enforcer.config["bulk_enforcement"]
+    assert enforcer.config["batch_size"] == 500
+    assert bulk["max_parallel_chunks"] == 2
+    assert bulk["archive_concurrency"] == 8
+    assert bulk["transfer"] == {
+        "multipart_threshold": 8 * 1024 * 1024,
+        "multipart_chunksize": 8 * 1024 * 1024,
+        "max_concurrency": 8,
+    }
@@ -0,0 +1,192 @@
+"""
+Tests for named prepared statements and batched writes in DatabaseManager
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from config import DatabaseConfig
+
+
+def app_config(**database):
+    return SimpleNamespace(database=DatabaseConfig(
+        host="localhost", port=5432, database="voicehive",
+        username="voicehive", password="s3cure-test-pass", **database
+    ))
+
+
+# The module builds its process-wide DatabaseManager at import time
+with patch("config.get_config", return_value=app_config()):
+    from database.connection import DatabaseManager, PreparedStatementCache, QUERY_REGISTRY
+
+
+class FakeStatement:
+    def __init__(self, sql):
+        self.sql = sql
+        self.fetch = AsyncMock(return_value=[{"id": 1}])
+        self.fetchrow = AsyncMock(return_value={"id": 1})
+        self.fetchval = AsyncMock(return_value=1)
+        self.executemany = AsyncMock()
+
+
+class FakeConnection:
+    """Stand-in for an asyncpg connection that records prepares and transactions"""
+
+    def __init__(self):
+        self.prepared = []
+        self.transactions = 0
+        self.fetch = AsyncMock(return_value=[])
+        self.fetchrow = AsyncMock(return_value={"id": 1})
+        self.fetchval = AsyncMock(return_value=1)
+        self.execute = AsyncMock()
+        self.executemany = AsyncMock()
+
+    async def prepare(self, sql):
+        self.prepared.append(sql)
+        return FakeStatement(sql)
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.acquired = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        yield self.conn
+
+
+def make_manager(conn, **database):
+    with patch("database.connection.get_config", return_value=app_config(**database)):
+        manager = DatabaseManager()
+    manager._circuit_breakers = {}
+    manager._asyncpg_pool = FakePool(conn)
+    return manager
+
+
+class TestPreparedStatementCache:
+
+    @pytest.mark.asyncio
+    async def test_hit_reuses_prepared_statement(self):
+        conn = FakeConnection()
+        cache = PreparedStatementCache(conn, max_size=4)
+
+        first = await cache.get("user_by_id", QUERY_REGISTRY["user_by_id"])
+        second = await cache.get("user_by_id", QUERY_REGISTRY["user_by_id"])
+
+        assert first is second
+        assert conn.prepared == [QUERY_REGISTRY["user_by_id"]]
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        conn = FakeConnection()
+        cache = PreparedStatementCache(conn, max_size=2)
+
+        await cache.get("a", "SELECT 1")
+        await cache.get("b", "SELECT 2")
+        await cache.get("a", "SELECT 1")  # "b" is now least recently used
+        await cache.get("c", "SELECT 3")
+
+        assert len(cache) == 2
+        await cache.get("a", "SELECT 1")
+        assert conn.prepared == ["SELECT 1", "SELECT 2", "SELECT 3"]
+        await cache.get("b", "SELECT 2")
+        assert conn.prepared[-1] == "SELECT 2"
+
+
+class TestExecuteNamed:
+
+    @pytest.mark.asyncio
+    async def test_runs_registered_statement_prepared_once_per_connection(self):
+        conn = FakeConnection()
+        manager = make_manager(conn)
+
+        row = await manager.execute_named("session_by_jti", "jti-1", fetch="one")
+        await manager.execute_named("session_by_jti", "jti-2", fetch="one")
+
+        assert row == {"id": 1}
+        assert conn.prepared == [QUERY_REGISTRY["session_by_jti"]]
+        conn.fetchrow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_plain_sql_when_prepared_statements_disabled(self):
+        conn = FakeConnection()
+        manager = make_manager(conn, prepared_statements=False)
+
+        row = await manager.execute_named("user_by_email", "guest@example.com", fetch="one")
+
+        assert row == {"id": 1}
+        assert conn.prepared == []
+        conn.fetchrow.assert_awaited_once_with(QUERY_REGISTRY["user_by_email"], "guest@example.com")
+        assert DatabaseManager._statement_cache_size(manager._config.database) == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_statement_is_rejected(self):
+        manager = make_manager(FakeConnection())
+
+        with pytest.raises(KeyError):
+            await manager.execute_named("no_such_query")
+
+    @pytest.mark.asyncio
+    async def test_unavailable_without_asyncpg_pool(self):
+        manager = make_manager(FakeConnection())
+        manager._asyncpg_pool = None
+
+        assert not manager.asyncpg_available
+        with pytest.raises(RuntimeError):
+            await manager.execute_named("user_by_id", 1)
+
+
+class TestExecuteMany:
+
+    @pytest.mark.asyncio
+    async def test_registered_statement_uses_prepared_executemany(self):
+        conn = FakeConnection()
+        manager = make_manager(conn)
+        rows = [("s1",), ("s2",), ("s3",)]
+
+        await manager.execute_many("session_touch", rows)
+
+        assert conn.transactions == 1
+        assert conn.prepared == [QUERY_REGISTRY["session_touch"]]
+        conn.executemany.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sql_text_uses_connection_executemany(self):
+        conn = FakeConnection()
+        manager = make_manager(conn)
+        sql = "INSERT INTO call_events (call_id, event) VALUES ($1, $2)"
+
+        await manager.execute_many(sql, iter([("c1", "ringing"), ("c1", "answered")]))
+
+        assert conn.transactions == 1
+        conn.executemany.assert_awaited_once_with(sql, [("c1", "ringing"), ("c1", "answered")])
+
+    @pytest.mark.asyncio
+    async def test_registered_statement_without_prepared_statements(self):
+        conn = FakeConnection()
+        manager = make_manager(conn, prepared_statements=False)
+
+        await manager.execute_many("session_touch", [("s1",)])
+
+        assert conn.prepared == []
+        conn.executemany.assert_awaited_once_with(QUERY_REGISTRY["session_touch"], [("s1",)])
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_the_pool(self):
+        conn = FakeConnection()
+        manager = make_manager(conn)
+
+        await manager.execute_many("session_touch", [])
+
+        assert manager._asyncpg_pool.acquired == 0
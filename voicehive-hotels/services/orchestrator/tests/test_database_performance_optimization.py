@@ -7,6 +7,12 @@ import pytest
 import asyncio
 import tempfile
 import os
+import gzip
+import bz2
+import hashlib
+import json
+import io
+import tarfile
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
@@ -23,7 +29,8 @@ from database_migration_manager import (
     DatabaseMigrationManager, MigrationTestSuite, MigrationInfo, MigrationStatus
 )
 from database_backup_manager import (
-    DatabaseBackupManager, BackupConfig, BackupType, StorageType, BackupMetadata
+    DatabaseBackupManager, BackupConfig, BackupType, StorageType, BackupMetadata,
+    BackupStatus, DumpFormat, CompressionType
 )
 from database_capacity_planner import (
     DatabaseCapacityManager, CapacityMetric, MetricType, GrowthTrend
@@ -273,6 +280,7 @@ class TestPgBouncerConfigManager:
         assert "[databases]" in config_content
         assert "test_db" in config_content
         assert "[pgbouncer]" in config_content
+        assert "max_prepared_statements = 200" in config_content
         
         # Check auth file content
         auth_content = auth_file.read_text()
@@ -476,6 +484,8 @@ class TestDatabaseBackupManager:
         conn.fetchval.return_value = "PostgreSQL 13.0"
         conn.fetchrow.return_value = {"pg_current_wal_lsn": "0/1000000", "version": "PostgreSQL 13.0"}
         
+        # acquire() is used as "async with pool.acquire()", so it must not be a coroutine
+        pool.acquire = MagicMock()
         pool.acquire.return_value.__aenter__.return_value = conn
         pool.acquire.return_value.__aexit__.return_value = None
         
@@ -504,10 +514,17 @@ class TestDatabaseBackupManager:
     @pytest.mark.asyncio
     async def test_backup_creation(self, backup_manager, temp_backup_dir):
         """Test backup creation process"""
-        # Mock subprocess for pg_dump
+        # Mock subprocess for pg_dump, streaming its output in several chunks
+        dump = b"-- PostgreSQL dump\n" + b"COPY guests FROM stdin;\n" * 50000
+        backup_manager.config.stream_chunk_size = 64 * 1024
+        
         with patch('asyncio.create_subprocess_exec') as mock_subprocess:
             mock_process = AsyncMock()
-            mock_process.communicate.return_value = (b"-- PostgreSQL dump", b"")
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stdout.feed_data(dump)
+            mock_process.stdout.feed_eof()
+            mock_process.stderr = asyncio.StreamReader()
+            mock_process.stderr.feed_eof()
             mock_process.returncode = 0
             mock_subprocess.return_value = mock_process
             
@@ -517,7 +534,355 @@ class TestDatabaseBackupManager:
             
             assert backup_metadata.database_name == "test_db"
             assert backup_metadata.backup_type == BackupType.LOGICAL
+            assert backup_metadata.size_bytes == len(dump)
+            
+            stored = Path(backup_metadata.storage_location).read_bytes()
+            assert gzip.decompress(stored) == dump
+            assert backup_metadata.compressed_size_bytes == len(stored)
+            assert backup_metadata.checksum == hashlib.sha256(stored).hexdigest()
     
+    @pytest.mark.asyncio
+    async def test_streaming_verification_of_large_backup(self, backup_manager):
+        """Test block-sampled checksums and streaming decompression checks"""
+        dump = os.urandom(512 * 1024)
+        config = backup_manager.config
+        config.verify_after_backup = False
+        config.stream_chunk_size = 64 * 1024
+        config.checksum_block_size = 64 * 1024
+        config.sampled_verification_threshold = 0  # Treat every artifact as large
+        config.verification_sample_blocks = 100
+
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stdout.feed_data(dump)
+            mock_process.stdout.feed_eof()
+            mock_process.stderr = asyncio.StreamReader()
+            mock_process.stderr.feed_eof()
+            mock_process.returncode = 0
+            mock_subprocess.return_value = mock_process
+
+            with patch.object(backup_manager, '_save_backup_metadata'):
+                backup_metadata = await backup_manager.create_backup("test_db")
+
+        backup_path = Path(backup_metadata.storage_location)
+        stored = backup_path.read_bytes()
+        assert len(backup_metadata.block_checksums["sha256"]) == -(-len(stored) // (64 * 1024))
+
+        verifier = backup_manager.verifier
+        checksum = await verifier._verify_checksum(backup_metadata, config)
+        assert checksum["passed"] and checksum["details"]["mode"] == "sampled"
+
+        # Flip one byte in the middle of the artifact
+        corrupted = bytearray(stored)
+        corrupted[len(stored) // 2] ^= 0xFF
+        backup_path.write_bytes(bytes(corrupted))
+        checksum = await verifier._verify_checksum(backup_metadata, config)
+        assert not checksum["passed"]
+        assert checksum["details"]["mismatched_blocks"] == [len(stored) // 2 // (64 * 1024)]
+
+        # Truncation is caught by streaming decompression
+        config.sampled_verification_threshold = len(stored) * 2
+        backup_path.write_bytes(stored[:-100])
+        integrity = await verifier._verify_file_integrity(backup_metadata, config)
+        assert not integrity["passed"]
+        assert any("Decompression failed" in error for error in integrity["errors"])
+
+    @staticmethod
+    def _mock_pg_dump(mock_subprocess, dump):
+        """Make ``asyncio.create_subprocess_exec`` stream ``dump`` like pg_dump"""
+        mock_process = AsyncMock()
+        mock_process.stdout = asyncio.StreamReader()
+        mock_process.stdout.feed_data(dump)
+        mock_process.stdout.feed_eof()
+        mock_process.stderr = asyncio.StreamReader()
+        mock_process.stderr.feed_eof()
+        mock_process.returncode = 0
+        mock_subprocess.return_value = mock_process
+
+    @pytest.mark.asyncio
+    async def test_non_gzip_backup_is_verified_with_applied_codec(self, backup_manager):
+        """Test that bzip2 backups are written and verified as bzip2"""
+        dump = (b"CREATE TABLE guests ();\nCREATE INDEX g ON guests;\nCREATE SEQUENCE s;\n"
+                b"COPY guests FROM stdin;\n" + os.urandom(8192))
+        config = backup_manager.config
+        config.compression = CompressionType.BZIP2
+        backup_metadata = BackupMetadata(
+            backup_id="test_db_logical_bzip2",
+            database_name="test_db",
+            backup_type=BackupType.LOGICAL,
+            start_time=datetime.now(timezone.utc)
+        )
+
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+            self._mock_pg_dump(mock_subprocess, dump)
+            await backup_manager._create_logical_backup(backup_metadata)
+
+        assert "--compress=0" in mock_subprocess.call_args.args
+        assert backup_metadata.compression == CompressionType.BZIP2
+        assert backup_metadata.storage_location.endswith(".bz2")
+        assert bz2.decompress(Path(backup_metadata.storage_location).read_bytes()) == dump
+
+        # Verification follows the recorded codec even if the configuration changes later
+        config.compression = CompressionType.GZIP
+        verifier = backup_manager.verifier
+        integrity = await verifier._verify_file_integrity(backup_metadata, config)
+        assert integrity["passed"], integrity["errors"]
+        assert integrity["details"]["decompressed_bytes"] == len(dump)
+        completeness = await verifier._verify_completeness(backup_metadata, config)
+        assert completeness["passed"] and not completeness["errors"]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_stream_codec_is_recorded_as_uncompressed(self, backup_manager):
+        """Test that codecs without a stream compressor leave compression to pg_dump"""
+        dump = b"PGDMP custom archive"
+        backup_manager.config.compression = CompressionType.LZ4
+        backup_metadata = BackupMetadata(
+            backup_id="test_db_logical_lz4",
+            database_name="test_db",
+            backup_type=BackupType.LOGICAL,
+            start_time=datetime.now(timezone.utc)
+        )
+
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+            self._mock_pg_dump(mock_subprocess, dump)
+            await backup_manager._create_logical_backup(backup_metadata)
+
+        assert f"--compress={backup_manager.config.compression_level}" in mock_subprocess.call_args.args
+        assert backup_metadata.compression == CompressionType.NONE
+        assert Path(backup_metadata.storage_location).read_bytes() == dump
+        assert backup_metadata.stored_compression(backup_manager.config) == CompressionType.NONE
+
+    def test_stored_compression_of_untracked_backups(self):
+        """Test the codec assumed for backups recorded before codecs were tracked"""
+        backup_metadata = BackupMetadata(
+            backup_id="legacy", database_name="test_db",
+            backup_type=BackupType.LOGICAL, start_time=datetime.now(timezone.utc)
+        )
+        gzip_config = BackupConfig(BackupType.LOGICAL, StorageType.LOCAL, compression=CompressionType.GZIP)
+        zstd_config = BackupConfig(BackupType.LOGICAL, StorageType.LOCAL, compression=CompressionType.ZSTD)
+
+        assert backup_metadata.stored_compression(gzip_config) == CompressionType.GZIP
+        assert backup_metadata.stored_compression(zstd_config) == CompressionType.NONE
+
+    @pytest.mark.asyncio
+    async def test_directory_backup_runs_parallel_dump(self, backup_manager):
+        """Test parallel directory-format dumps"""
+        backup_manager.config.dump_format = DumpFormat.DIRECTORY
+        backup_manager.config.verify_after_backup = False
+
+        async def fake_pg_dump(*cmd, **kwargs):
+            output_dir = Path(cmd[cmd.index("--file") + 1])
+            output_dir.mkdir()
+            (output_dir / "toc.dat").write_bytes(b"toc")
+            (output_dir / "3001.dat.gz").write_bytes(b"data")
+            process = AsyncMock()
+            process.communicate.return_value = (b"", b"")
+            process.returncode = 0
+            return process
+
+        with patch('asyncio.create_subprocess_exec', side_effect=fake_pg_dump) as mock_subprocess, \
+             patch.object(backup_manager, '_save_backup_metadata'):
+            backup_metadata = await backup_manager.create_backup("test_db")
+
+        cmd = mock_subprocess.call_args.args
+        assert "--format=directory" in cmd
+        assert f"--jobs={backup_manager.config.parallel_jobs}" in cmd
+        assert f"--compress={backup_manager.config.compression_level}" in cmd
+        assert Path(backup_metadata.storage_location).is_dir()
+        assert backup_metadata.size_bytes == 7
+
+    @pytest.mark.asyncio
+    async def test_incremental_backup_collects_wal_since_base(self, backup_manager, temp_backup_dir):
+        """Test incremental backups copy archived WAL after the base backup"""
+        archive_dir = Path(temp_backup_dir) / "wal_archive"
+        archive_dir.mkdir()
+        for name in ["000000010000000000000001", "000000010000000000000002",
+                     "000000010000000000000003", "000000010000000000000004",
+                     "000000010000000000000002.00000028.backup"]:
+            (archive_dir / name).write_bytes(name.encode())
+
+        backup_manager.config.wal_archive_path = str(archive_dir)
+        backup_manager.config.verify_after_backup = False
+        backup_manager.backup_history.append(BackupMetadata(
+            backup_id="test_db_physical_base",
+            database_name="test_db",
+            backup_type=BackupType.PHYSICAL,
+            start_time=datetime.now(timezone.utc) - timedelta(hours=1),
+            storage_location=str(Path(temp_backup_dir) / "test_db_physical_base"),
+            wal_start_lsn="0/2000028",
+            status=BackupStatus.VERIFIED
+        ))
+
+        conn = backup_manager.pool.acquire.return_value.__aenter__.return_value
+        conn.fetchval.side_effect = [
+            "0/4000000",  # pg_switch_wal()
+            "000000010000000000000003",  # segment holding the switch point
+            "000000010000000000000002",  # segment holding the base start LSN
+            "PostgreSQL 13.0"
+        ]
+
+        with patch.object(backup_manager, '_save_backup_metadata'):
+            backup_metadata = await backup_manager.create_backup("test_db", BackupType.INCREMENTAL)
+
+        backup_dir = Path(backup_metadata.storage_location)
+        manifest = json.loads((backup_dir / "wal_manifest.json").read_text())
+        assert [s["name"] for s in manifest["segments"]] == [
+            "000000010000000000000002", "000000010000000000000003"
+        ]
+        assert manifest["base_backup_id"] == "test_db_physical_base"
+        assert manifest["chain"] == [{"backup_id": backup_metadata.backup_id,
+                                      "wal_directory": str(backup_dir / "wal")}]
+        assert backup_metadata.wal_start_lsn == "0/2000028"
+        assert backup_metadata.wal_end_lsn == "0/4000000"
+
+    @staticmethod
+    def _write_tar(path, members):
+        """Write a gzipped tar holding ``{name: bytes}``"""
+        with tarfile.open(path, "w:gz") as tar:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+    def test_prepare_recovery_cluster(self, backup_manager, temp_backup_dir):
+        """Test base backup unpacking and archive recovery settings"""
+        base_path = Path(temp_backup_dir) / "base"
+        base_path.mkdir()
+        self._write_tar(base_path / "base.tar.gz", {"PG_VERSION": b"16\n", "global/pg_control": b"ctl"})
+        self._write_tar(base_path / "pg_wal.tar.gz", {"000000010000000000000002": b"wal"})
+        wal_directory = Path(temp_backup_dir) / "incremental_wal"
+        wal_directory.mkdir()
+        (wal_directory / "000000010000000000000003").write_bytes(b"later wal")
+
+        workdir = Path(temp_backup_dir) / "work"
+        workdir.mkdir()
+        data_dir = workdir / "data"
+        target_time = datetime(2026, 3, 9, 12, tzinfo=timezone.utc)
+        backup_manager.verifier._prepare_recovery_cluster(
+            base_path, [wal_directory], workdir, data_dir, target_time
+        )
+
+        assert (data_dir / "global" / "pg_control").read_bytes() == b"ctl"
+        assert (data_dir / "pg_wal" / "000000010000000000000002").read_bytes() == b"wal"
+        assert (workdir / "wal_archive" / "000000010000000000000003").exists()
+        assert (data_dir / "recovery.signal").exists()
+        settings = (data_dir / "postgresql.auto.conf").read_text()
+        assert f"restore_command = 'cp {workdir / 'wal_archive'}/%f %p'" in settings
+        assert f"recovery_target_time = '{target_time.isoformat()}'" in settings
+
+    def test_prepare_recovery_cluster_rejects_unsafe_members(self, backup_manager, temp_backup_dir):
+        """Test that a base backup cannot write outside the scratch data directory"""
+        base_path = Path(temp_backup_dir) / "base"
+        base_path.mkdir()
+        self._write_tar(base_path / "base.tar.gz", {"../escaped": b"x"})
+        workdir = Path(temp_backup_dir) / "work"
+        workdir.mkdir()
+
+        with pytest.raises(tarfile.FilterError):
+            backup_manager.verifier._prepare_recovery_cluster(
+                base_path, [], workdir, workdir / "data", None
+            )
+        assert not (workdir / "escaped").exists()
+
+    @pytest.mark.asyncio
+    async def test_point_in_time_restore_replays_incremental_chain(self, backup_manager, temp_backup_dir):
+        """Test PITR restore of an incremental backup into a scratch cluster"""
+        base_path = Path(temp_backup_dir) / "test_db_physical_base"
+        base_path.mkdir()
+        self._write_tar(base_path / "base.tar.gz", {"PG_VERSION": b"16\n"})
+        backup_dir = Path(temp_backup_dir) / "test_db_incremental"
+        (backup_dir / "wal").mkdir(parents=True)
+        (backup_dir / "wal" / "000000010000000000000003").write_bytes(b"wal")
+        (backup_dir / "wal_manifest.json").write_text(json.dumps({
+            "base_backup_id": "test_db_physical_base",
+            "base_location": str(base_path),
+            "chain": [{"backup_id": "test_db_incremental", "wal_directory": str(backup_dir / "wal")}],
+        }))
+        backup_metadata = BackupMetadata(
+            backup_id="test_db_incremental",
+            database_name="test_db",
+            backup_type=BackupType.INCREMENTAL,
+            start_time=datetime.now(timezone.utc),
+            storage_location=str(backup_dir)
+        )
+        target_time = datetime(2026, 3, 9, 12, tzinfo=timezone.utc)
+        verifier = backup_manager.verifier
+
+        with patch.object(verifier, '_run_command', new_callable=AsyncMock) as mock_run, \
+             patch.object(verifier, '_verify_restored_data',
+                          new_callable=AsyncMock, return_value={"passed": True}) as mock_verify:
+            result = await verifier._test_restore(backup_metadata, backup_manager.config, target_time)
+
+        assert result["passed"], result["errors"]
+        assert result["details"]["base_backup_id"] == "test_db_physical_base"
+        assert result["details"]["target_time"] == target_time.isoformat()
+
+        start, stop = [call.args for call in mock_run.call_args_list]
+        assert start[:2] == ("pg_ctl", "start")
+        assert stop[:2] == ("pg_ctl", "stop")
+        data_dir = start[start.index("-D") + 1]
+        assert stop[stop.index("-D") + 1] == data_dir
+        port = int(start[-1].split()[1])
+        assert mock_verify.call_args.args == ("test_db",)
+        assert mock_verify.call_args.kwargs["port"] == port
+        assert not Path(data_dir).exists()  # Scratch cluster is removed afterwards
+
+    @pytest.mark.asyncio
+    async def test_point_in_time_restore_stops_cluster_on_verification_error(self, backup_manager, temp_backup_dir):
+        """Test that the scratch cluster is stopped when verification fails"""
+        base_path = Path(temp_backup_dir) / "test_db_physical"
+        base_path.mkdir()
+        self._write_tar(base_path / "base.tar.gz", {"PG_VERSION": b"16\n"})
+        backup_metadata = BackupMetadata(
+            backup_id="test_db_physical",
+            database_name="test_db",
+            backup_type=BackupType.PHYSICAL,
+            start_time=datetime.now(timezone.utc),
+            storage_location=str(base_path)
+        )
+        verifier = backup_manager.verifier
+
+        with patch.object(verifier, '_run_command', new_callable=AsyncMock) as mock_run, \
+             patch.object(verifier, '_verify_restored_data',
+                          new_callable=AsyncMock, side_effect=RuntimeError("connection refused")):
+            result = await verifier._test_restore(backup_metadata, backup_manager.config)
+
+        assert not result["passed"]
+        assert "connection refused" in result["errors"][0]
+        assert [call.args[:2] for call in mock_run.call_args_list] == [("pg_ctl", "start"), ("pg_ctl", "stop")]
+
+    @pytest.mark.asyncio
+    async def test_restore_to_test_database_runs_parallel_pg_restore(self, backup_manager, temp_backup_dir):
+        """Test gzip unwrapping and parallel pg_restore of logical backups"""
+        backup_path = Path(temp_backup_dir) / "test_db_logical.dump.gz"
+        backup_path.write_bytes(gzip.compress(b"PGDMP custom archive"))
+        backup_metadata = BackupMetadata(
+            backup_id="test_db_logical",
+            database_name="test_db",
+            backup_type=BackupType.LOGICAL,
+            start_time=datetime.now(timezone.utc),
+            storage_location=str(backup_path)
+        )
+        backup_manager.config.parallel_jobs = 6
+        restored = {}
+
+        async def fake_pg_restore(*cmd):
+            restored["cmd"] = cmd
+            restored["archive"] = Path(cmd[-1]).read_bytes()
+
+        with patch.object(backup_manager.verifier, '_run_command', side_effect=fake_pg_restore):
+            await backup_manager.verifier._restore_to_test_database(
+                backup_metadata, backup_manager.config, "restore_test_db"
+            )
+
+        cmd = restored["cmd"]
+        assert cmd[0] == "pg_restore"
+        assert "--jobs=6" in cmd
+        assert cmd[cmd.index("--dbname") + 1] == "restore_test_db"
+        assert restored["archive"] == b"PGDMP custom archive"
+        assert not Path(cmd[-1]).exists()
+
     @pytest.mark.asyncio
     async def test_backup_verification(self, backup_manager):
         """Test backup verification"""
@@ -0,0 +1,131 @@
+"""
+Tests for the named-statement read path of the user and session repositories
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, DateTime, ForeignKey, String, Table
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import declarative_base, relationship
+
+from database import repository
+from database.repository import SessionRepository, UserRepository
+
+# Minimal stand-ins for the user models, mapped on their own registry
+Base = declarative_base()
+
+fake_user_roles = Table(
+    "user_roles", Base.metadata,
+    Column("user_id", PGUUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Column("role_id", PGUUID(as_uuid=True), ForeignKey("roles.id"), primary_key=True),
+)
+fake_user_hotels = Table(
+    "user_hotels", Base.metadata,
+    Column("user_id", PGUUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Column("hotel_id", String(50), ForeignKey("hotels.id"), primary_key=True),
+)
+
+
+class FakeUser(Base):
+    __tablename__ = "users"
+    id = Column(PGUUID(as_uuid=True), primary_key=True)
+    email = Column(String(255))
+    created_at = Column(DateTime(timezone=True))
+    roles = relationship("FakeRole", secondary=fake_user_roles)
+    hotels = relationship("FakeHotel", secondary=fake_user_hotels)
+
+
+class FakeRole(Base):
+    __tablename__ = "roles"
+    id = Column(PGUUID(as_uuid=True), primary_key=True)
+    name = Column(String(50))
+
+
+class FakeHotel(Base):
+    __tablename__ = "hotels"
+    id = Column(String(50), primary_key=True)
+    name = Column(String(255))
+
+
+class FakeSession(Base):
+    __tablename__ = "user_sessions"
+    id = Column(PGUUID(as_uuid=True), primary_key=True)
+    session_id = Column(String(255))
+    user_id = Column(PGUUID(as_uuid=True), ForeignKey("users.id"))
+    expires_at = Column(DateTime(timezone=True))
+    user = relationship("FakeUser")
+
+
+USER_ID = "1b7f3c2e-8a4d-4f0e-9c61-3d2a5e7b9f10"
+ROLE_ID = "6f1c0a52-5b7e-4a38-9d7e-6c2f6b0a1d11"
+ROLES_JSON = json.dumps([{"id": ROLE_ID, "name": "hotel_admin"}])
+HOTELS_JSON = json.dumps([{"id": "HOTEL1", "name": "Harbour View"}])
+
+
+@pytest.fixture(autouse=True)
+def fake_models(monkeypatch):
+    for name, model in {"User": FakeUser, "Role": FakeRole, "Hotel": FakeHotel, "UserSession": FakeSession}.items():
+        monkeypatch.setattr(repository, name, model)
+
+
+def make_repository(repository_class, row):
+    db_manager = MagicMock(asyncpg_available=True)
+    db_manager.execute_named = AsyncMock(return_value=row)
+    session = MagicMock()
+    session.merge = AsyncMock(side_effect=lambda instance, load: instance)
+    return repository_class(session, db_manager=db_manager), db_manager, session
+
+
+class TestSessionRepository:
+
+    @pytest.mark.asyncio
+    async def test_session_user_and_access_load_in_one_statement(self):
+        row = {
+            "id": UUID("0c9d8e7f-6a5b-4c3d-2e1f-0a9b8c7d6e5f"),
+            "session_id": "sess-1",
+            "user_id": UUID(USER_ID),
+            "expires_at": datetime(2026, 3, 9, 13, tzinfo=timezone.utc),
+            "user_json": json.dumps({"id": USER_ID, "email": "guest@example.com",
+                                     "created_at": "2026-03-09T12:00:00.123456+00:00"}),
+            "roles_json": ROLES_JSON,
+            "hotels_json": json.loads(HOTELS_JSON),  # as returned with a json codec registered
+        }
+        repo, db_manager, session = make_repository(SessionRepository, row)
+
+        user_session = await repo.get_session_by_jti("jti-1")
+
+        db_manager.execute_named.assert_awaited_once_with("session_with_user_by_jti", "jti-1", fetch="one")
+        session.merge.assert_awaited_once_with(user_session, load=False)
+        assert user_session.session_id == "sess-1"
+        user = user_session.user
+        assert user.id == UUID(USER_ID)
+        assert user.created_at == datetime(2026, 3, 9, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        assert [(role.id, role.name) for role in user.roles] == [(UUID(ROLE_ID), "hotel_admin")]
+        assert [hotel.id for hotel in user.hotels] == ["HOTEL1"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_jti_returns_none(self):
+        repo, db_manager, session = make_repository(SessionRepository, None)
+
+        assert await repo.get_session_by_jti("missing") is None
+        session.merge.assert_not_awaited()
+
+
+class TestUserRepository:
+
+    @pytest.mark.asyncio
+    async def test_user_and_access_load_in_one_statement(self):
+        row = {"id": UUID(USER_ID), "email": "guest@example.com", "created_at": None,
+               "roles_json": "[]", "hotels_json": HOTELS_JSON}
+        repo, db_manager, session = make_repository(UserRepository, row)
+
+        user = await repo.get_user_by_email(" Guest@Example.com")
+
+        db_manager.execute_named.assert_awaited_once_with("user_with_access_by_email", "guest@example.com", fetch="one")
+        assert user.id == UUID(USER_ID)
+        assert user.roles == []
+        assert [hotel.name for hotel in user.hotels] == ["Harbour View"]
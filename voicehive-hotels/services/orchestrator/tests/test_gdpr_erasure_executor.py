@@ -0,0 +1,124 @@
+"""
+Tests for the parallel, resumable GDPR erasure executor
+"""
+
+import asyncio
+
+import pytest
+
+from gdpr_erasure_executor import (
+    ErasureExecutor, ErasureExecutorConfig, ErasureStore,
+    plan_erasure, restore_progress, summarize_by_category
+)
+
+
+def fast_config(**overrides):
+    config = ErasureExecutorConfig(retry_backoff_seconds=0)
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+class TestPlanning:
+    """Test work item planning"""
+
+    def test_plan_covers_every_store(self):
+        items = plan_erasure("guest-1", ["call_recordings", "voice_profiles"])
+
+        assert [item.item_id for item in items] == [
+            "database:call_recordings:call_recordings",
+            "database:call_recordings:call_metadata",
+            "files:call_recordings:recordings/guest-1/*.wav",
+            "files:call_recordings:recordings/guest-1/*.mp3",
+            "external:voice_profiles:elevenlabs",
+            "external:voice_profiles:azure_speech",
+        ]
+
+    def test_plan_keeps_categories_outside_automatic_erasure(self):
+        items = plan_erasure("guest-1", ["pii_data", "documents", "analytics", "audio_files"])
+
+        assert [item.item_id for item in items] == ["files:audio_files:audio/guest-1/*"]
+
+    def test_restore_only_carries_completed_items(self):
+        items = plan_erasure("guest-1", ["transcripts"])
+        progress = {"items": {
+            "database:transcripts:call_transcripts": {"status": "completed", "attempts": 1, "result": 7},
+            "database:transcripts:transcript_segments": {"status": "failed", "attempts": 3},
+        }}
+
+        assert restore_progress(items, progress) == 1
+        assert [item.status for item in items] == ["completed", "pending"]
+        assert items[0].result == 7
+
+
+class TestExecution:
+    """Test concurrent execution, limits and checkpointing"""
+
+    @pytest.mark.asyncio
+    async def test_per_store_concurrency_limit(self):
+        in_flight = {"database": 0, "external": 0, "files": 0}
+        peak = {"database": 0, "external": 0, "files": 0}
+
+        async def handler(item, subject):
+            in_flight[item.store] += 1
+            peak[item.store] = max(peak[item.store], in_flight[item.store])
+            await asyncio.sleep(0.01)
+            in_flight[item.store] -= 1
+            return 1
+
+        items = plan_erasure("guest-1", ["call_recordings", "transcripts", "metadata", "ai_models"])
+        executor = ErasureExecutor(
+            handlers={ErasureStore.DATABASE: handler, ErasureStore.EXTERNAL: handler,
+                      ErasureStore.FILES: handler},
+            config=fast_config(store_concurrency={"database": 2, "external": 1, "files": 8})
+        )
+
+        await executor.run("guest-1", items)
+
+        assert all(item.status == "completed" for item in items)
+        assert peak == {"database": 2, "external": 1, "files": 2}
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_items_and_retries_failures(self):
+        calls = []
+        checkpoints = []
+        flaky = {"count": 0}
+
+        async def handler(item, subject):
+            calls.append(item.target)
+            if item.target == "transcript_segments" and flaky["count"] < 1:
+                flaky["count"] += 1
+                raise ConnectionError("database unavailable")
+            return 3
+
+        async def checkpoint(progress):
+            checkpoints.append(progress)
+
+        items = plan_erasure("guest-1", ["transcripts"])
+        restore_progress(items, {"items": {
+            "database:transcripts:call_transcripts": {"status": "completed", "result": 5}
+        }})
+        executor = ErasureExecutor({ErasureStore.DATABASE: handler}, checkpoint, fast_config())
+
+        await executor.run("guest-1", items)
+
+        assert calls == ["transcript_segments", "transcript_segments"]
+        assert items[1].attempts == 2
+        assert checkpoints[-1]["items"]["database:transcripts:transcript_segments"]["status"] == "completed"
+        summary = summarize_by_category(items, ["transcripts"])["transcripts"]
+        assert summary["records_affected"] == 8
+        assert summary["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_exhausted_item_is_reported_not_raised(self):
+        async def handler(item, subject):
+            raise TimeoutError("store timed out")
+
+        items = plan_erasure("guest-1", ["metadata"])
+        executor = ErasureExecutor({ErasureStore.DATABASE: handler}, config=fast_config(max_attempts=2))
+
+        await executor.run("guest-1", items)
+
+        assert [item.status for item in items] == ["failed", "failed"]
+        assert all(item.attempts == 2 for item in items)
+        assert len(summarize_by_category(items, ["metadata"])["metadata"]["errors"]) == 2
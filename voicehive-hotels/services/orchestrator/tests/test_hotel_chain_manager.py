@@ -0,0 +1,403 @@
+"""
+Tests for materialized effective configurations in HotelChainManager
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add repo root to path
+repo_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(repo_root))
+
+from services.orchestrator.hotel_chain_manager import (
+    HotelChainManager, ChainMetadata, ChainOperation, ChainOperationType,
+    PropertyHierarchy, PropertyType, ConfigInheritanceType
+)
+from services.orchestrator.tenant_management import (
+    TenantConfiguration, TenantManager, TenantMetadata, TenantTier, ResourceUsage
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls used by HotelChainManager"""
+
+    def __init__(self):
+        self.values = {}
+        self.gets = 0
+        # Operation stream: entries, how many were delivered, and pending entries as id -> [consumer, idle ms]
+        self.stream = []
+        self.delivered = 0
+        self.pending = {}
+        self.claims = []
+
+    async def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.values.setdefault(channel, []).append(message)
+
+    async def xgroup_create(self, name, groupname, id="0", mkstream=False):
+        pass
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        (name, stream_id), = streams.items()
+        if stream_id == ">":
+            messages = self.stream[self.delivered:self.delivered + count]
+            self.delivered += len(messages)
+            for message_id, _ in messages:
+                self.pending[message_id] = [consumername, 0]
+        else:
+            messages = [(mid, fields) for mid, fields in self.stream
+                        if self.pending.get(mid, [None])[0] == consumername][:count]
+        return [[name, messages]] if messages else []
+
+    async def xautoclaim(self, name, groupname, consumername, min_idle_time, start_id="0-0", count=None):
+        claimed = [(mid, fields) for mid, fields in self.stream
+                   if mid in self.pending and self.pending[mid][1] >= min_idle_time][:count]
+        for message_id, _ in claimed:
+            self.pending[message_id] = [consumername, 0]
+        return ["0-0", claimed, []]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids, justid=False):
+        self.claims.extend(message_ids)
+        for message_id in message_ids:
+            self.pending[message_id] = [consumername, 0]
+
+    async def xack(self, name, groupname, message_id):
+        self.pending.pop(message_id, None)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.writes = []
+
+            def setex(self, key, ttl, value):
+                self.writes.append((key, value))
+
+            async def execute(self):
+                redis.values.update(self.writes)
+
+        return Pipeline()
+
+
+def hierarchy(property_id, level, parent=None, **kwargs):
+    return PropertyHierarchy(
+        property_id=property_id,
+        property_name=property_id,
+        property_type=PropertyType.STANDARD_HOTEL,
+        chain_id="chain-1",
+        parent_property_id=parent,
+        level=level,
+        country="DE",
+        region="Bavaria",
+        city="Munich",
+        **kwargs
+    )
+
+
+@pytest.fixture
+def manager():
+    chain = ChainMetadata(
+        chain_id="chain-1",
+        chain_name="Alpine Hotels",
+        chain_code="ALP",
+        headquarters_property_id="hq",
+        corporate_entity="Alpine Hotels GmbH",
+        primary_market="DACH",
+        corporate_contact_email="ops@alpine.example",
+        created_by="admin",
+        chain_policies={"timezone": "Europe/Berlin", "max_conversation_turns": 40}
+    )
+    properties = {
+        "hq": hierarchy("hq", 0, inheritance_type=ConfigInheritanceType.FULL_INHERITANCE),
+        "region": hierarchy("region", 1, "hq", inheritance_type=ConfigInheritanceType.FULL_INHERITANCE),
+        "hotel": hierarchy(
+            "hotel", 2, "region",
+            inherited_configs=["timezone", "max_conversation_turns"],
+            local_overrides={"default_language": "de"}
+        ),
+    }
+    tenants = {pid: SimpleNamespace(tenant_config=TenantConfiguration()) for pid in properties}
+
+    tenant_manager = MagicMock()
+    tenant_manager.get_tenant = AsyncMock(side_effect=lambda pid: tenants.get(pid))
+    tenant_manager.update_tenant = AsyncMock()
+
+    manager = HotelChainManager(FakeRedis(), MagicMock(), tenant_manager)
+    manager.chain_cache["chain-1"] = chain
+    manager.property_cache.update(properties)
+    manager.get_chain_properties = AsyncMock(side_effect=lambda chain_id: list(properties.values()))
+    manager._save_chain_to_db = AsyncMock()
+    manager._save_property_hierarchy = AsyncMock()
+    return manager
+
+
+class TestEffectiveConfiguration:
+    """Test materialization, fan-out refresh and version tags"""
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_the_materialized_store(self, manager):
+        config = await manager.get_effective_configuration("hotel")
+        assert config["timezone"] == "Europe/Berlin"
+        assert config["max_conversation_turns"] == 40
+        assert config["default_language"] == "de"
+
+        manager.tenant_manager.get_tenant.reset_mock()
+        manager.redis.gets = 0
+        assert await manager.get_effective_configuration("hotel", "timezone") == "Europe/Berlin"
+
+        assert manager.redis.gets == 1
+        manager.tenant_manager.get_tenant.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chain_policy_change_refreshes_every_property(self, manager):
+        await manager.refresh_chain_configurations("chain-1")
+        before = await manager.get_effective_configuration_version("hotel")
+
+        await manager.update_chain_configuration(
+            "chain-1", {"chain_policies": {"timezone": "Europe/Vienna"}}, "admin",
+            propagate_to_properties=False
+        )
+
+        assert (await manager.get_effective_configuration("region"))["timezone"] == "Europe/Vienna"
+        assert (await manager.get_effective_configuration("hotel"))["timezone"] == "Europe/Vienna"
+        assert await manager.get_effective_configuration_version("hotel") > before
+        # One hierarchy read for the whole fan-out
+        assert manager.get_chain_properties.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_overrides_fan_out_to_descendants(self, manager):
+        await manager.refresh_chain_configurations("chain-1")
+        hq_version = await manager.get_effective_configuration_version("hq")
+
+        await manager.update_property_overrides("region", {"max_conversation_turns": 25})
+
+        assert (await manager.get_effective_configuration("hotel"))["max_conversation_turns"] == 25
+        assert await manager.get_effective_configuration_version("hq") == hq_version
+
+    @pytest.mark.asyncio
+    async def test_move_property_reparents_and_refreshes(self, manager):
+        await manager.update_property_overrides("region", {"timezone": "Europe/Zurich"})
+        assert (await manager.get_effective_configuration("hotel"))["timezone"] == "Europe/Zurich"
+
+        with pytest.raises(ValueError):
+            await manager.move_property("region", "hotel")
+
+        moved = await manager.move_property("hotel", "hq")
+
+        assert moved.level == 1
+        assert (await manager.get_effective_configuration("hotel"))["timezone"] == "Europe/Berlin"
+
+
+def chain_operation(**kwargs):
+    return ChainOperation(
+        chain_id="chain-1",
+        operation_type=ChainOperationType.CONFIG_UPDATE,
+        operation_name="Prompt rollout",
+        scheduled_start=datetime.now(timezone.utc),
+        created_by="admin",
+        target_properties=[f"hotel-{i}" for i in range(20)],
+        **kwargs
+    )
+
+
+class TestChainOperations:
+    """Test batched, concurrent and wave-based chain operation execution"""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_and_checkpoint_per_batch(self, manager):
+        sessions = []
+
+        @asynccontextmanager
+        async def session_factory():
+            sessions.append(MagicMock())
+            yield sessions[-1]
+
+        manager.session_factory = session_factory
+        manager._save_chain_operation = AsyncMock()
+        in_flight = {"now": 0, "max": 0}
+
+        async def execute(property_id, operation_type, payload, tenant_manager=None):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return True
+
+        manager._execute_property_operation = execute
+        operation = chain_operation(batch_size=5, max_concurrency=4)
+
+        assert await manager._execute_chain_operation(operation, refresh_configs=False)
+
+        assert in_flight["max"] == 4
+        assert len(sessions) == 4
+        assert operation.completed_batches == 4
+        assert len(operation.successful_properties) == 20
+        # Start, one checkpoint per batch, completion
+        assert manager._save_chain_operation.await_count == 6
+        assert len(manager.redis.values[f"chain:operation:{operation.operation_id}:progress"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_failing_canary_halts_rollout(self, manager):
+        manager._save_chain_operation = AsyncMock()
+        manager._execute_property_operation = AsyncMock(return_value=False)
+        operation = chain_operation(rollout_waves=[0.1, 0.5], max_failure_rate=0.5)
+
+        assert not await manager._execute_chain_operation(operation, refresh_configs=False)
+
+        assert operation.status == "failed"
+        assert operation.failed_properties == ["hotel-0", "hotel-1"]
+        assert len(operation.skipped_properties) == 18
+        assert manager._execute_property_operation.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_interrupted_operation_resumes_after_last_checkpoint(self, manager):
+        manager._save_chain_operation = AsyncMock()
+        manager._execute_property_operation = AsyncMock(return_value=True)
+        operation = chain_operation(
+            status="in_progress",
+            successful_properties=[f"hotel-{i}" for i in range(15)],
+            completed_batches=3,
+            batch_size=5
+        )
+
+        assert await manager._execute_chain_operation(operation, refresh_configs=False)
+
+        executed = [call.args[0] for call in manager._execute_property_operation.await_args_list]
+        assert executed == [f"hotel-{i}" for i in range(15, 20)]
+        assert operation.completed_batches == 4
+
+    @pytest.mark.asyncio
+    async def test_refresh_after_concurrent_lanes_sees_new_config(self, manager):
+        @asynccontextmanager
+        async def session_factory():
+            yield AsyncMock()
+
+        tenant_manager = TenantManager(manager.redis, AsyncMock())
+        now = datetime.now(timezone.utc)
+        for property_id in ("hq", "region", "hotel"):
+            tenant = TenantMetadata(
+                tenant_id=property_id,
+                tenant_name=property_id,
+                organization_name="Alpine Hotels GmbH",
+                contact_email="ops@alpine.example",
+                subscription_started=now,
+                resource_quota=tenant_manager._get_default_quota(TenantTier.STARTER),
+                current_usage=ResourceUsage(period_start=now, period_end=now),
+                tenant_config=TenantConfiguration(),
+                created_by="admin"
+            )
+            # Warm both the in-process and the Redis tenant cache
+            await tenant_manager._cache_tenant(tenant)
+
+        manager.tenant_manager = tenant_manager
+        manager.session_factory = session_factory
+        manager._save_chain_operation = AsyncMock()
+        operation = chain_operation(operation_payload={"greeting_style": "formal"}, max_concurrency=3)
+        operation.target_properties = ["hq", "region", "hotel"]
+
+        assert await manager._execute_chain_operation(operation)
+
+        config = await manager.get_effective_configuration("region")
+        assert config["custom_settings"]["greeting_style"] == "formal"
+        assert tenant_manager.tenant_cache["hotel"].tenant_config.custom_settings["greeting_style"] == "formal"
+
+
+class TestOperationWorker:
+    """Test consumption of the chain operation stream"""
+
+    @staticmethod
+    def worker_manager(manager, stop_after, delay=0):
+        stop_event = asyncio.Event()
+        executed = []
+
+        async def execute(operation):
+            await asyncio.sleep(delay)
+            executed.append(operation.operation_id)
+            if operation.operation_id == stop_after:
+                stop_event.set()
+
+        manager._load_chain_operation = AsyncMock(
+            side_effect=lambda operation_id: SimpleNamespace(operation_id=operation_id, status="scheduled")
+        )
+        manager._execute_chain_operation = AsyncMock(side_effect=execute)
+        return stop_event, executed
+
+    @pytest.mark.asyncio
+    async def test_claims_operations_left_pending_by_a_dead_worker(self, manager):
+        redis = manager.redis
+        redis.stream = [("1-0", {"operation_id": "op-1"}), ("2-0", {"operation_id": "op-2"})]
+        redis.delivered = 1
+        redis.pending["1-0"] = ["worker-dead", 120000]
+        stop_event, executed = self.worker_manager(manager, stop_after="op-2")
+
+        await asyncio.wait_for(manager.run_operation_worker("worker-2", stop_event, block_ms=10), timeout=1)
+
+        assert executed == ["op-1", "op-2"]
+        assert redis.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_running_operation_stays_claimed(self, manager):
+        redis = manager.redis
+        redis.stream = [("1-0", {"operation_id": "op-1"})]
+        stop_event, executed = self.worker_manager(manager, stop_after="op-1", delay=0.05)
+
+        await asyncio.wait_for(
+            manager.run_operation_worker("worker-1", stop_event, block_ms=10, claim_idle_ms=30), timeout=1
+        )
+
+        assert executed == ["op-1"]
+        assert "1-0" in redis.claims
+
+
+class TestChainAnalytics:
+    """Test set-based chain analytics"""
+
+    @pytest.mark.asyncio
+    async def test_analytics_come_from_one_aggregate_query(self, manager):
+        row = {
+            "total_properties": 12,
+            "active_properties": 10,
+            "total_rooms": 1450,
+            "total_calls": 900,
+            "average_calls": 90.0,
+            "by_region": '{"Bavaria": {"properties": 10, "calls": 900, "revenue": 0.0}}',
+            "top_properties": ["hotel-3", "hotel-1"],
+            "bottom_properties": [["hotel-7", 50], ["hotel-8", 40], ["hotel-9", 10]],
+        }
+        result = MagicMock()
+        result.mappings.return_value.fetchone.return_value = row
+        manager.db.execute = AsyncMock(return_value=result)
+
+        analytics = await manager.generate_chain_analytics(
+            "chain-1", datetime(2024, 3, 1, tzinfo=timezone.utc), datetime(2024, 3, 31, tzinfo=timezone.utc)
+        )
+
+        manager.db.execute.assert_awaited_once()
+        manager.tenant_manager.get_tenant.assert_not_called()
+        assert analytics.total_properties == 12
+        assert analytics.total_rooms == 1450
+        assert analytics.total_calls_handled == 900
+        assert analytics.performance_by_region["Bavaria"]["calls"] == 900
+        assert analytics.top_performing_properties == ["hotel-3", "hotel-1"]
+        assert analytics.underperforming_properties == ["hotel-8", "hotel-9"]
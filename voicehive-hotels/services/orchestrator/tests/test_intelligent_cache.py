@@ -0,0 +1,397 @@
+"""
+Tests for the intelligent caching system
+
+Covers each memory eviction policy, expiry cleanup, W-TinyLFU admission,
+get_or_set stampede protection, and a microbenchmark suite checking that hit
+and eviction costs stay flat as the cache grows.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from intelligent_cache import (
+    CacheConfig, CacheEntry, CachedValue, EvictionPolicy, FrequencySketch, IntelligentCache, MemoryCache
+)
+
+
+def make_cache(policy=EvictionPolicy.LRU, max_size=3, **overrides):
+    options = {
+        "memory_max_size": max_size,
+        "memory_eviction_policy": policy,
+        "redis_enabled": False,
+        "enable_metrics": False,
+    }
+    options.update(overrides)
+    return MemoryCache("test", CacheConfig(**options))
+
+
+class TestEvictionPolicies:
+    """Test that each policy evicts the expected key"""
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self):
+        cache = make_cache(EvictionPolicy.LRU)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+
+        await cache.get("a")
+        await cache.set("d", "d")
+
+        assert set(cache.entries) == {"a", "c", "d"}
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_fifo_ignores_access(self):
+        cache = make_cache(EvictionPolicy.FIFO)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+
+        await cache.get("a")
+        await cache.set("d", "d")
+
+        assert set(cache.entries) == {"b", "c", "d"}
+
+    @pytest.mark.asyncio
+    async def test_lfu_evicts_least_frequently_used(self):
+        cache = make_cache(EvictionPolicy.LFU)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+
+        for _ in range(3):
+            await cache.get("a")
+        await cache.get("b")
+        await cache.set("d", "d")
+
+        assert set(cache.entries) == {"a", "b", "d"}
+
+        # "d" now has the lowest frequency
+        await cache.get("b")
+        await cache.set("e", "e")
+        assert set(cache.entries) == {"a", "b", "e"}
+
+    @pytest.mark.asyncio
+    async def test_ttl_evicts_shortest_remaining(self):
+        cache = make_cache(EvictionPolicy.TTL)
+        await cache.set("long", 1, ttl_seconds=300)
+        await cache.set("short", 2, ttl_seconds=10)
+        await cache.set("medium", 3, ttl_seconds=60)
+
+        await cache.set("new", 4, ttl_seconds=120)
+
+        assert set(cache.entries) == {"long", "medium", "new"}
+
+    @pytest.mark.asyncio
+    async def test_replacing_key_keeps_size_accounting(self):
+        cache = make_cache(EvictionPolicy.LRU, max_size=10)
+        await cache.set("a", "x" * 100)
+        await cache.set("a", "y")
+
+        assert cache.stats.total_size_bytes == cache.entries["a"].size_bytes
+        assert len(cache.access_order) == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_limit_evicts(self):
+        cache = make_cache(EvictionPolicy.LRU, max_size=100, memory_max_bytes=300)
+        for i in range(10):
+            await cache.set(f"k{i}", "x" * 50)
+
+        assert cache.stats.total_size_bytes <= 300
+        assert "k9" in cache.entries
+        assert "k0" not in cache.entries
+
+
+class TestExpiry:
+    """Test TTL expiry and heap-based cleanup"""
+
+    def test_entry_expiry_respects_created_at(self):
+        from datetime import datetime, timedelta, timezone
+
+        entry = CacheEntry(
+            key="k", value="v", ttl_seconds=60,
+            created_at=datetime.now(timezone.utc) - timedelta(seconds=120)
+        )
+        assert entry.is_expired()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_only_expired(self):
+        cache = make_cache(EvictionPolicy.LRU, max_size=100)
+        await cache.set("short", 1, ttl_seconds=1)
+        await cache.set("long", 2, ttl_seconds=300)
+        await asyncio.sleep(1.05)
+
+        removed = await cache.cleanup_expired()
+
+        assert removed == 1
+        assert set(cache.entries) == {"long"}
+        assert list(cache.access_order) == ["long"]
+
+
+class TestTinyLFUAdmission:
+    """Test W-TinyLFU admission"""
+
+    def test_sketch_ages_counters(self):
+        sketch = FrequencySketch(capacity=10)
+        for _ in range(20):
+            sketch.increment("hot")
+        assert sketch.estimate("hot") == 15
+
+        for i in range(100):
+            sketch.increment(f"cold-{i}")
+        assert sketch.estimate("hot") < 15
+
+    @pytest.mark.asyncio
+    async def test_scan_does_not_flush_hot_keys(self):
+        cache = make_cache(EvictionPolicy.LRU, max_size=1000, memory_admission_policy="tinylfu")
+        hot_keys = [f"hot-{i}" for i in range(100)]
+        for key in hot_keys:
+            await cache.set(key, key)
+        for _ in range(10):
+            for key in hot_keys:
+                await cache.get(key)
+
+        # A one-off scan much larger than the cache
+        for i in range(5000):
+            await cache.set(f"scan-{i}", i)
+
+        assert all(key in cache.entries for key in hot_keys)
+        assert len(cache.entries) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_plain_lru_is_flushed_by_scan(self):
+        cache = make_cache(EvictionPolicy.LRU, max_size=100)
+        hot_keys = [f"hot-{i}" for i in range(50)]
+        for key in hot_keys:
+            await cache.set(key, key)
+            await cache.get(key)
+
+        for i in range(1000):
+            await cache.set(f"scan-{i}", i)
+
+        assert not any(key in cache.entries for key in hot_keys)
+
+
+def make_intelligent_cache(redis_client=None, **overrides):
+    options = {"redis_enabled": redis_client is not None, "enable_metrics": False, "default_ttl_seconds": 60}
+    options.update(overrides)
+    return IntelligentCache("loader_test", CacheConfig(**options), redis_client)
+
+
+class CountingLoader:
+    """Async loader that counts calls and can be slowed down"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"rooms_available": self.calls}
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls used by RedisCache"""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {k.encode(): str(v).encode() for k, v in mapping.items()}
+        )
+
+    async def eval(self, script, numkeys, key, token):
+        if self.values.get(key) == token:
+            del self.values[key]
+            return 1
+        return 0
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.ops:
+            if name == "get":
+                results.append(self.redis.values.get(args[0]))
+            elif name == "hgetall":
+                results.append(dict(self.redis.hashes.get(args[0], {})))
+            elif name in ("setex", "set"):
+                self.redis.values[args[0]] = args[-1]
+                results.append(True)
+            elif name == "hset":
+                await self.redis.hset(args[0], kwargs["mapping"])
+                results.append(True)
+            else:
+                results.append(True)
+        return results
+
+
+class TestGetOrSet:
+    """Test single-flight, stale-while-revalidate and XFetch"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = make_intelligent_cache()
+        loader = CountingLoader()
+
+        results = await asyncio.gather(*[cache.get_or_set("availability:hotel-1", loader) for _ in range(100)])
+
+        assert loader.calls == 1
+        assert all(result == {"rooms_available": 1} for result in results)
+        assert await cache.get("availability:hotel-1") == {"rooms_available": 1}
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_all_waiters(self):
+        cache = make_intelligent_cache()
+        calls = 0
+
+        async def failing_loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            raise ConnectionError("PMS unavailable")
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("config:hotel-1", failing_loader) for _ in range(10)],
+            return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        cache = make_intelligent_cache()
+        loader = CountingLoader()
+
+        leader = asyncio.create_task(cache.get_or_set("availability:hotel-1", loader))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_set("availability:hotel-1", loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*waiters) == [{"rooms_available": 1}] * 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert loader.calls == 1
+        assert await cache.get("availability:hotel-1") == {"rooms_available": 1}
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_one_refresh_runs(self):
+        cache = make_intelligent_cache(stale_while_revalidate_seconds=30)
+        loader = CountingLoader()
+        await cache.get_or_set("availability:hotel-1", loader, ttl_seconds=10)
+
+        # Past the soft TTL but inside the stale window
+        stored = cache.memory_cache.entries["availability:hotel-1"].value
+        stored.soft_expires_at = time.time() - 1
+
+        results = await asyncio.gather(*[cache.get_or_set("availability:hotel-1", loader) for _ in range(50)])
+
+        assert all(result == {"rooms_available": 1} for result in results)
+        await asyncio.gather(*cache._refresh_tasks)
+        assert loader.calls == 2
+        assert await cache.get("availability:hotel-1") == {"rooms_available": 2}
+
+    @pytest.mark.asyncio
+    async def test_xfetch_refreshes_before_expiry(self):
+        cache = make_intelligent_cache(xfetch_beta=1e9)
+        loader = CountingLoader()
+        await cache.get_or_set("config:hotel-1", loader, ttl_seconds=60)
+
+        # A huge beta makes early refresh (almost) certain
+        value = await cache.get_or_set("config:hotel-1", loader, ttl_seconds=60)
+        await asyncio.gather(*cache._refresh_tasks)
+
+        assert value == {"rooms_available": 1}
+        assert loader.calls == 2
+
+    def test_xfetch_disabled_without_beta(self):
+        entry = CachedValue(value=1, soft_expires_at=time.time() + 0.001, compute_seconds=10.0)
+        assert not entry.should_refresh_early(time.time(), beta=0.0)
+
+    @pytest.mark.asyncio
+    async def test_replica_waits_for_lease_holder(self):
+        redis = FakeRedis()
+        config = {"distributed_lock_enabled": True, "distributed_lock_wait_seconds": 2.0}
+        replica_a = make_intelligent_cache(redis, **config)
+        replica_b = make_intelligent_cache(redis, **config)
+        loader_a = CountingLoader(delay=0.2)
+        loader_b = CountingLoader(delay=0.2)
+
+        result_a, result_b = await asyncio.gather(
+            replica_a.get_or_set("availability:hotel-1", loader_a),
+            replica_b.get_or_set("availability:hotel-1", loader_b),
+        )
+
+        assert loader_a.calls + loader_b.calls == 1
+        assert result_a == result_b == {"rooms_available": 1}
+        assert not any(key.endswith("lock:availability:hotel-1") for key in redis.values)
+
+
+class TestMemoryCacheMicrobenchmarks:
+    """Hit and eviction cost must not grow with cache size"""
+
+    @staticmethod
+    async def fill(cache, count):
+        for i in range(count):
+            await cache.set(f"key-{i}", i)
+
+    @staticmethod
+    async def hit_cost(cache, count, iterations=20000):
+        keys = [f"key-{i % count}" for i in range(0, iterations * 7919, 7919)]
+        start = time.perf_counter()
+        for key in keys:
+            await cache.get(key)
+        return (time.perf_counter() - start) / iterations
+
+    @staticmethod
+    async def eviction_cost(cache, count, iterations=5000):
+        start = time.perf_counter()
+        for i in range(iterations):
+            await cache.set(f"new-{i}", i)
+        return (time.perf_counter() - start) / iterations
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy", [EvictionPolicy.LRU, EvictionPolicy.LFU, EvictionPolicy.FIFO, EvictionPolicy.TTL])
+    async def test_hit_and_eviction_cost_flat_at_100k_entries(self, policy):
+        small = make_cache(policy, max_size=1000)
+        large = make_cache(policy, max_size=100000)
+        await self.fill(small, 1000)
+        await self.fill(large, 100000)
+
+        small_hit = await self.hit_cost(small, 1000)
+        large_hit = await self.hit_cost(large, 100000)
+        small_evict = await self.eviction_cost(small, 1000)
+        large_evict = await self.eviction_cost(large, 100000)
+
+        print(
+            f"\n{policy.value}: hit {small_hit * 1e6:.2f}us @1k vs {large_hit * 1e6:.2f}us @100k, "
+            f"evicting set {small_evict * 1e6:.2f}us @1k vs {large_evict * 1e6:.2f}us @100k"
+        )
+
+        # An O(n) structure would be ~100x slower at 100k entries
+        assert large_hit < small_hit * 4
+        assert large_evict < small_evict * 4
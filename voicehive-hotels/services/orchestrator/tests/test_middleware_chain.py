@@ -0,0 +1,400 @@
+"""
+Tests for the composed pure-ASGI middleware chain
+
+Covers authentication, auditing, correlation IDs, security headers and error
+handling through MiddlewareChain, plus a throughput benchmark against the previous
+BaseHTTPMiddleware-based stack.
+"""
+
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from audit_logging import AuditMiddleware
+from auth_models import UserContext, UserRole, Permission
+from auth_middleware import AuthenticationMiddleware, AuthRouteTable
+from correlation_middleware import CorrelationIDMiddleware
+from error_middleware import ComprehensiveErrorMiddleware
+from input_validation_middleware import InputValidationMiddleware, ValidationConfig
+from middleware_chain import MiddlewareChain, build_orchestrator_layers
+from rate_limit_middleware import RateLimitMiddleware
+from security_headers_middleware import SecurityHeadersMiddleware, get_production_security_config
+
+
+VALID_TOKEN = "valid-token"
+
+
+def make_user(permissions=None, hotel_ids=None) -> UserContext:
+    return UserContext(
+        user_id="user-1",
+        email="user@example.com",
+        roles=[UserRole.HOTEL_STAFF],
+        permissions=permissions if permissions is not None else [Permission.CALL_VIEW, Permission.HOTEL_VIEW],
+        session_id="session-1",
+        expires_at=datetime.utcnow() + timedelta(hours=1),
+        hotel_ids=hotel_ids,
+    )
+
+
+@pytest.fixture
+def jwt_service():
+    service = AsyncMock()
+
+    async def validate_token(token):
+        if token != VALID_TOKEN:
+            raise ValueError("invalid token")
+        return make_user()
+
+    service.validate_token = AsyncMock(side_effect=validate_token)
+    return service
+
+
+@pytest.fixture
+def vault_client():
+    return AsyncMock()
+
+
+def make_routes():
+    async def ok(request):
+        return JSONResponse({"status": "ok", "correlation_id": request.state.correlation_id})
+
+    async def stream(request):
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i};"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return [
+        Route("/healthz", ok),
+        Route("/calls/{call_id}", ok),
+        Route("/calls/{call_id}/stream", stream),
+        Route("/admin/settings", ok),
+        Route("/hotels/{hotel_id}/rooms", ok),
+    ]
+
+
+async def drive(app, path, headers=None, method="GET"):
+    """Call an ASGI app directly and collect the response"""
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    messages = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    body_messages = [m for m in messages if m["type"] == "http.response.body"]
+    response_headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in body_messages)
+    return start["status"], response_headers, body, body_messages
+
+
+@pytest.fixture
+def chain_app(jwt_service, vault_client):
+    app = Starlette(routes=make_routes())
+    return MiddlewareChain(
+        app,
+        layers=build_orchestrator_layers(
+            security_headers_config=get_production_security_config(),
+            environment="production",
+            jwt_service=jwt_service,
+            vault_client=vault_client,
+        ),
+    )
+
+
+class TestAuthRouteTable:
+    """Test precomputed public-path and permission tables"""
+
+    def test_root_is_exact_match_only(self):
+        table = AuthRouteTable()
+
+        assert table.is_public("/")
+        assert table.is_public("/healthz")
+        assert table.is_public("/docs/oauth2-redirect")
+        assert not table.is_public("/calls/123")
+
+    def test_probes_and_signed_webhooks_are_public(self):
+        table = AuthRouteTable()
+
+        for path in (
+            "/health/live",
+            "/health/ready",
+            "/v1/livekit/webhook",
+            "/v1/livekit/transcription",
+            "/call/event",
+            "/v1/apaleo/webhook",
+        ):
+            assert table.is_public(path), path
+        assert not table.is_public("/v1/call/start")
+
+    def test_required_permissions(self):
+        table = AuthRouteTable()
+
+        assert table.required_permissions("/admin/settings") == [Permission.SYSTEM_ADMIN]
+        assert table.required_permissions("/calls/abc") == [Permission.CALL_START, Permission.CALL_VIEW]
+        assert table.required_permissions("/unprotected") == []
+
+    def test_permission_cache_is_bounded(self):
+        table = AuthRouteTable(cache_size=8)
+
+        for i in range(100):
+            table.required_permissions(f"/hotels/{i}/rooms")
+
+        assert len(table._permission_cache) == 8
+
+
+class TestMiddlewareChain:
+    """Test the composed middleware chain end to end"""
+
+    def test_layer_order(self):
+        layers = build_orchestrator_layers(
+            rate_limit_redis_url="redis://localhost:6379",
+            validation_config=ValidationConfig(),
+        )
+
+        assert [middleware_class for middleware_class, _ in layers] == [
+            CorrelationIDMiddleware,
+            AuditMiddleware,
+            SecurityHeadersMiddleware,
+            ComprehensiveErrorMiddleware,
+            RateLimitMiddleware,
+            AuthenticationMiddleware,
+            InputValidationMiddleware,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_are_audited(self, jwt_service, vault_client):
+        audit_logger = MagicMock()
+        chain = MiddlewareChain(
+            Starlette(routes=make_routes()),
+            layers=build_orchestrator_layers(
+                jwt_service=jwt_service, vault_client=vault_client, audit_logger=audit_logger
+            ),
+        )
+
+        status, _, _, _ = await drive(chain, "/calls/123")
+
+        assert status == 401
+        audit_logger.log_event.assert_called_once()
+        assert audit_logger.log_event.call_args.kwargs["metadata"]["path"] == "/calls/123"
+
+    @pytest.mark.asyncio
+    async def test_public_path_skips_authentication(self, chain_app, jwt_service):
+        status, headers, _, _ = await drive(chain_app, "/healthz")
+
+        assert status == 200
+        assert "x-correlation-id" in headers
+        assert headers["x-frame-options"] == "DENY"
+        jwt_service.validate_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_rejected_with_headers(self, chain_app):
+        status, headers, body, _ = await drive(chain_app, "/calls/123")
+
+        assert status == 401
+        assert b"AUTHENTICATION_ERROR" in body
+        assert "x-correlation-id" in headers
+        assert "content-security-policy" in headers
+
+    @pytest.mark.asyncio
+    async def test_valid_token_reaches_endpoint(self, chain_app):
+        status, headers, body, _ = await drive(
+            chain_app,
+            "/calls/123",
+            headers={"Authorization": f"Bearer {VALID_TOKEN}", "X-Correlation-ID": "corr-123"},
+        )
+
+        assert status == 200
+        assert headers["x-correlation-id"] == "corr-123"
+        assert b'"correlation_id":"corr-123"' in body
+        assert headers["strict-transport-security"].startswith("max-age=31536000")
+
+    @pytest.mark.asyncio
+    async def test_insufficient_permissions(self, chain_app):
+        status, _, body, _ = await drive(
+            chain_app, "/admin/settings", headers={"Authorization": f"Bearer {VALID_TOKEN}"}
+        )
+
+        assert status == 403
+        assert b"AUTHORIZATION_ERROR" in body
+
+    @pytest.mark.asyncio
+    async def test_unhandled_exception_becomes_json_error(self, jwt_service, vault_client):
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        chain = MiddlewareChain(
+            failing_app,
+            layers=build_orchestrator_layers(jwt_service=jwt_service, vault_client=vault_client),
+        )
+        status, headers, body, _ = await drive(
+            chain,
+            "/calls/123",
+            headers={"Authorization": f"Bearer {VALID_TOKEN}", "X-Correlation-ID": "corr-err"},
+        )
+
+        assert status == 500
+        assert b"INTERNAL_ERROR" in body
+        assert b"corr-err" in body
+        assert headers["x-correlation-id"] == "corr-err"
+        assert headers["x-content-type-options"] == "nosniff"
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_not_buffered(self, chain_app):
+        status, _, body, body_messages = await drive(
+            chain_app, "/calls/123/stream", headers={"Authorization": f"Bearer {VALID_TOKEN}"}
+        )
+
+        assert status == 200
+        assert body == b"chunk-0;chunk-1;chunk-2;"
+        # Each chunk arrives as its own body message rather than one buffered blob
+        assert len([m for m in body_messages if m.get("body")]) == 3
+
+    @pytest.mark.asyncio
+    async def test_services_resolved_from_app_state(self, jwt_service, vault_client):
+        app = Starlette(routes=make_routes())
+        app.state.jwt_service = jwt_service
+        app.state.vault_client = vault_client
+        chain = MiddlewareChain(app, layers=build_orchestrator_layers(environment="development"))
+
+        async def asgi_with_app(scope, receive, send):
+            scope["app"] = app
+            await chain(scope, receive, send)
+
+        status, _, _, _ = await drive(
+            asgi_with_app, "/calls/123", headers={"Authorization": f"Bearer {VALID_TOKEN}"}
+        )
+
+        assert status == 200
+
+
+# Previous stack: the same cross-cutting concerns as BaseHTTPMiddleware layers
+class _LegacyErrorMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception:
+            return JSONResponse(status_code=500, content={"error": {"code": "INTERNAL_ERROR"}})
+
+
+class _LegacyCorrelationMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        request.state.correlation_id = correlation_id
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+class _LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        self.headers_source = SecurityHeadersMiddleware(None, get_production_security_config())
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        for name, value in self.headers_source._security_headers_for(request.url.path, request.url.scheme):
+            response.headers[name] = value
+        return response
+
+
+class _LegacyAuthMiddleware(BaseHTTPMiddleware):
+    public_paths = ["/docs", "/openapi.json", "/redoc", "/healthz", "/metrics", "/auth/login"]
+    protected_paths = {r"/calls/.*": [Permission.CALL_START, Permission.CALL_VIEW]}
+
+    def __init__(self, app, jwt_service):
+        super().__init__(app)
+        self.jwt_service = jwt_service
+
+    async def dispatch(self, request, call_next):
+        if any(request.url.path.startswith(p) for p in self.public_paths):
+            return await call_next(request)
+        context = await self.jwt_service.validate_token(request.headers["Authorization"][7:])
+        request.state.auth_context = context
+        for pattern, permissions in self.protected_paths.items():
+            if re.match(pattern, request.url.path):
+                assert any(p in context.permissions for p in permissions)
+        return await call_next(request)
+
+
+@pytest.mark.asyncio
+async def test_throughput_benchmark_against_base_http_middleware_stack(jwt_service, vault_client):
+    """Benchmark: pure-ASGI chain vs the BaseHTTPMiddleware stack it replaces"""
+
+    async def hello(request):
+        return PlainTextResponse("ok")
+
+    routes = [Route("/calls/{call_id}", hello)]
+    headers = {"Authorization": f"Bearer {VALID_TOKEN}"}
+    iterations = 2000
+
+    legacy = Starlette(routes=routes)
+    legacy.add_middleware(InputValidationMiddleware)
+    legacy.add_middleware(AuditMiddleware)
+    legacy.add_middleware(_LegacyAuthMiddleware, jwt_service=jwt_service)
+    legacy.add_middleware(_LegacySecurityHeadersMiddleware)
+    legacy.add_middleware(_LegacyCorrelationMiddleware)
+    legacy.add_middleware(_LegacyErrorMiddleware)
+
+    chained = Starlette(routes=routes)
+    chained.add_middleware(
+        MiddlewareChain,
+        layers=build_orchestrator_layers(
+            security_headers_config=get_production_security_config(),
+            jwt_service=jwt_service,
+            vault_client=vault_client,
+        ),
+    )
+
+    async def requests_per_second(app):
+        # Warm up (builds the middleware stack, fills route caches)
+        for _ in range(50):
+            await drive(app, "/calls/1", headers=headers)
+        start = time.perf_counter()
+        for i in range(iterations):
+            status, _, _, _ = await drive(app, f"/calls/{i % 100}", headers=headers)
+            assert status == 200
+        return iterations / (time.perf_counter() - start)
+
+    legacy_rps = await requests_per_second(legacy)
+    chained_rps = await requests_per_second(chained)
+
+    print(
+        f"\nmiddleware throughput: BaseHTTPMiddleware stack {legacy_rps:,.0f} req/s, "
+        f"pure-ASGI chain {chained_rps:,.0f} req/s ({chained_rps / legacy_rps:.2f}x)"
+    )
+
+    assert chained_rps > legacy_rps
@@ -0,0 +1,177 @@
+"""
+Tests for range-partition maintenance of the audit and compliance tables
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from database.partition_manager import (
+    PartitionManager, PartitionedTable, PartitionInterval, DEFAULT_PARTITIONED_TABLES
+)
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class FakeConnection:
+    """Records SQL and serves pg_inherits rows for the partition manager"""
+
+    def __init__(self, partitions=None, default_rows=False, fail_on=None):
+        self.partitions = partitions or {}
+        self.default_rows = default_rows
+        self.fail_on = fail_on
+        self.statements = []
+
+    async def fetch(self, query, table_name):
+        return [{"relname": name} for name in self.partitions.get(table_name, [])]
+
+    async def fetchval(self, query, *args):
+        self.statements.append(query)
+        return self.default_rows
+
+    async def execute(self, query, *args):
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("lock timeout")
+        self.statements.append(query)
+        return "INSERT 0 3"
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    def executed(self, prefix):
+        return [q for q in self.statements if q.startswith(prefix)]
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def daily(premake=2, **kwargs):
+    return PartitionedTable("audit_logs", "timestamp", PartitionInterval.DAY,
+                            retention_days=30, premake=premake, **kwargs)
+
+
+def monthly(premake=2):
+    return PartitionedTable("pii_detections", "detected_at", PartitionInterval.MONTH,
+                            retention_days=365, premake=premake)
+
+
+class TestPartitionedTable:
+
+    def test_partition_names_round_trip(self):
+        table = daily()
+        start = table.floor(utc(2026, 3, 9, 17, 45))
+
+        assert start == utc(2026, 3, 9)
+        assert table.partition_name(start) == "audit_logs_p20260309"
+        assert table.partition_start("audit_logs_p20260309") == start
+        assert monthly().partition_name(utc(2026, 3, 1)) == "pii_detections_p202603"
+
+    def test_default_and_foreign_partitions_have_no_start(self):
+        table = daily()
+
+        assert table.partition_start("audit_logs_default") is None
+        assert table.partition_start("audit_logs_p2026") is None
+        assert table.partition_start("pii_detections_p20260309") is None
+
+    def test_month_rollover_crosses_year(self):
+        table = monthly()
+        start = table.floor(utc(2026, 12, 31, 23, 59))
+
+        assert start == utc(2026, 12, 1)
+        assert table.advance(start) == utc(2027, 1, 1)
+        assert table.advance(start, 13) == utc(2028, 1, 1)
+        assert daily().advance(utc(2026, 12, 31)) == utc(2027, 1, 1)
+
+    def test_audit_logs_declares_per_partition_unique_keys(self):
+        audit = next(t for t in DEFAULT_PARTITIONED_TABLES if t.table_name == "audit_logs")
+
+        assert ("chain_partition", "chain_position") in audit.partition_unique_keys
+        assert ("event_id",) in audit.partition_unique_keys
+
+
+class TestEnsurePartitions:
+
+    @pytest.mark.asyncio
+    async def test_creates_current_and_premade_partitions(self):
+        conn = FakeConnection(partitions={"audit_logs": ["audit_logs_default", "audit_logs_p20260309"]})
+        manager = PartitionManager(FakePool(conn), tables=[daily(premake=2)])
+
+        created = await manager.ensure_partitions(utc(2026, 3, 9, 12))
+
+        assert created == {"audit_logs": ["audit_logs_p20260310", "audit_logs_p20260311"]}
+        statements = conn.executed("CREATE TABLE IF NOT EXISTS audit_logs_p20260310 PARTITION OF audit_logs")
+        assert statements and "FROM ('2026-03-10T00:00:00+00:00') TO ('2026-03-11T00:00:00+00:00')" in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_rows_in_default_are_moved_into_new_partition(self):
+        conn = FakeConnection(partitions={"audit_logs": ["audit_logs_default"]}, default_rows=True)
+        manager = PartitionManager(FakePool(conn), tables=[daily(premake=0)])
+
+        created = await manager.ensure_partitions(utc(2026, 3, 9))
+
+        assert created == {"audit_logs": ["audit_logs_p20260309"]}
+        assert conn.executed("CREATE TABLE audit_logs_p20260309 (LIKE audit_logs")
+        assert conn.executed("WITH moved AS (DELETE FROM audit_logs_default")
+        assert conn.executed("ALTER TABLE audit_logs ATTACH PARTITION audit_logs_p20260309")
+        assert not conn.executed("CREATE TABLE IF NOT EXISTS audit_logs_p20260309 PARTITION OF")
+
+    @pytest.mark.asyncio
+    async def test_failed_partition_does_not_stop_later_ones(self):
+        conn = FakeConnection(partitions={"audit_logs": []}, fail_on="audit_logs_p20260310 PARTITION OF")
+        manager = PartitionManager(FakePool(conn), tables=[daily(premake=2)])
+
+        created = await manager.ensure_partitions(utc(2026, 3, 9))
+
+        assert created == {"audit_logs": ["audit_logs_p20260309", "audit_logs_p20260311"]}
+
+    @pytest.mark.asyncio
+    async def test_unique_indexes_created_on_each_partition(self):
+        table = daily(premake=1, partition_unique_keys=(("chain_partition", "chain_position"), ("event_id",)))
+        conn = FakeConnection(partitions={"audit_logs": ["audit_logs_p20260309"]})
+        manager = PartitionManager(FakePool(conn), tables=[table])
+
+        await manager.ensure_partitions(utc(2026, 3, 9))
+
+        indexes = conn.executed("CREATE UNIQUE INDEX IF NOT EXISTS")
+        assert ("CREATE UNIQUE INDEX IF NOT EXISTS audit_logs_p20260310_chain_partition_chain_position_key "
+                "ON audit_logs_p20260310 (chain_partition, chain_position)") in indexes
+        assert ("CREATE UNIQUE INDEX IF NOT EXISTS audit_logs_p20260309_event_id_key "
+                "ON audit_logs_p20260309 (event_id)") in indexes
+        assert len(indexes) == 4
+
+
+class TestDropExpiredPartitions:
+
+    @pytest.mark.asyncio
+    async def test_only_partitions_wholly_past_retention_are_dropped(self):
+        # retention_days=30 from 2026-03-31 12:00 puts the cutoff at 2026-03-01 12:00
+        conn = FakeConnection(partitions={"audit_logs": [
+            "audit_logs_default", "audit_logs_p20260227", "audit_logs_p20260228",
+            "audit_logs_p20260301", "audit_logs_p20260302",
+        ]})
+        manager = PartitionManager(FakePool(conn), tables=[daily()])
+
+        dropped = await manager.drop_expired_partitions(utc(2026, 3, 31, 12))
+
+        assert dropped == {"audit_logs": ["audit_logs_p20260227", "audit_logs_p20260228"]}
+        assert conn.executed("DROP TABLE") == ["DROP TABLE audit_logs_p20260227", "DROP TABLE audit_logs_p20260228"]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_without_dropping(self):
+        conn = FakeConnection(partitions={"audit_logs": ["audit_logs_p20260101", "audit_logs_p20260331"]})
+        manager = PartitionManager(FakePool(conn), tables=[daily()])
+
+        dropped = await manager.drop_expired_partitions(utc(2026, 3, 31), dry_run=True)
+
+        assert dropped == {"audit_logs": ["audit_logs_p20260101"]}
+        assert conn.statements == []
@@ -0,0 +1,341 @@
+"""
+Tests for the binary envelope format and the tag and LRU indexes of
+TenantCacheService
+"""
+
+import asyncio
+import fnmatch
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add repo root to path
+repo_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(repo_root))
+
+from services.orchestrator.tenant_cache_service import (
+    TenantCacheService, TenantCacheConfig, CacheNamespace, CacheEnvelope,
+    CacheCodec, CacheSerializer, resolve_codec, resolve_serializer
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls used by TenantCacheService"""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.sets = {}
+        self.zsets = {}
+        self.commands = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def execute_command(self, name, *args, **kwargs):
+        self.commands.append(name)
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    async def get(self, key):
+        return await self.execute_command("get", key)
+
+    async def mget(self, keys):
+        return await self.execute_command("mget", keys)
+
+    async def sunion(self, keys):
+        return await self.execute_command("sunion", keys)
+
+    async def smembers(self, key):
+        return await self.execute_command("smembers", key)
+
+    async def zrange(self, key, start, end):
+        return await self.execute_command("zrange", key, start, end)
+
+    async def zscan_iter(self, key, match=None):
+        self.commands.append("zscan")
+        for member, score in sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1]):
+            if match is None or fnmatch.fnmatchcase(member, match):
+                yield member, score
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def _setex(self, key, ttl, value):
+        self.values[key] = value
+        return True
+
+    def _unlink(self, *keys):
+        removed = 0
+        for key in keys:
+            for store in (self.values, self.hashes, self.sets, self.zsets):
+                if store.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def _expire(self, key, ttl):
+        return True
+
+    def _hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v).encode() for k, v in mapping.items()})
+        return len(mapping)
+
+    def _hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def _hmget(self, key, *fields):
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    def _eval(self, script, numkeys, key, last_accessed):
+        if key not in self.hashes:
+            return 0
+        meta = self.hashes[key]
+        meta["access_count"] = str(int(meta["access_count"]) + 1).encode()
+        meta["last_accessed"] = last_accessed.encode()
+        return 1
+
+    def _sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    def _srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+        if not self.sets.get(key, True):
+            del self.sets[key]
+        return len(members)
+
+    def _sunion(self, keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    def _smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+        if not self.zsets.get(key, True):
+            del self.zsets[key]
+        return len(members)
+
+    def _zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        expired = [member for member, score in zset.items() if score <= high]
+        for member in expired:
+            del zset[member]
+        return len(expired)
+
+    def _zrange(self, key, start, end):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, _ in members[start:end + 1 if end >= 0 else None]]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.redis.commands.append("pipeline")
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+def make_service(**config_overrides):
+    redis_client = FakeRedis()
+    tenant_manager = MagicMock()
+    tenant_manager.get_tenant = AsyncMock(return_value=None)
+    tenant_manager.track_resource_usage = AsyncMock()
+
+    service = TenantCacheService(redis_client, tenant_manager)
+    service.tenant_configs["hotel-1"] = TenantCacheConfig(tenant_id="hotel-1", **config_overrides)
+    return service, redis_client
+
+
+class TestCacheEnvelope:
+    """Test the binary envelope layout"""
+
+    @pytest.mark.parametrize("serializer", list(CacheSerializer))
+    def test_round_trip(self, serializer):
+        value = {"rooms": [{"id": i, "rate": 99.5} for i in range(200)], "hotel": "Grand"}
+        envelope, size_bytes = CacheEnvelope.pack(
+            "rooms", CacheNamespace.PMS_DATA, value, ["rooms", "rates"],
+            serializer=resolve_serializer(serializer), codec=CacheCodec.ZLIB, compression_threshold_bytes=1024
+        )
+        blob = envelope.to_bytes()
+
+        decoded = CacheEnvelope.from_bytes(blob)
+        assert decoded.key == "rooms"
+        assert decoded.namespace == CacheNamespace.PMS_DATA
+        assert decoded.tags == ["rooms", "rates"]
+        assert decoded.codec == CacheCodec.ZLIB
+        assert decoded.value() == value
+        # Compressed bytes are stored as-is, not hex encoded
+        assert len(blob) < size_bytes / 2
+
+    def test_small_values_are_not_compressed(self):
+        envelope, _ = CacheEnvelope.pack(
+            "k", CacheNamespace.TEMPORARY, "small", [], serializer=CacheSerializer.JSON,
+            codec=CacheCodec.ZLIB, compression_threshold_bytes=1024
+        )
+        blob = envelope.to_bytes()
+
+        assert blob[1] & CacheEnvelope.FLAG_COMPRESSED == 0
+        assert CacheEnvelope.from_bytes(blob).value() == "small"
+
+    def test_tags_are_read_without_decoding_payload(self):
+        envelope, _ = CacheEnvelope.pack(
+            "k", CacheNamespace.TEMPORARY, "x" * 4096, ["a"], serializer=CacheSerializer.JSON,
+            codec=CacheCodec.ZLIB, compression_threshold_bytes=0
+        )
+        blob = bytearray(envelope.to_bytes())
+        blob[CacheEnvelope.HEADER.size] ^= 0xFF  # corrupt the compressed payload
+
+        decoded = CacheEnvelope.from_bytes(bytes(blob))
+        assert decoded.tags == ["a"]
+        with pytest.raises(Exception):
+            decoded.value()
+
+    def test_unavailable_codec_falls_back_to_zlib(self):
+        for codec in CacheCodec:
+            assert resolve_codec(codec) in (codec, CacheCodec.ZLIB)
+
+
+class TestMetadata:
+    """Test that access metadata lives outside the stored value"""
+
+    @pytest.mark.asyncio
+    async def test_reads_update_metadata_without_rewriting_value(self):
+        service, redis_client = make_service(compression_enabled=True, compression_threshold_bytes=10)
+        await service.set("hotel-1", "config", {"greeting": "hello" * 100})
+        cache_key = service._build_cache_key("hotel-1", CacheNamespace.TEMPORARY, "config")
+        stored = redis_client.values[cache_key]
+
+        for _ in range(3):
+            assert await service.get("hotel-1", "config", use_local_cache=False) == {"greeting": "hello" * 100}
+        await asyncio.sleep(0)  # let the access tracking pipelines run
+
+        assert redis_client.values[cache_key] is stored
+        meta = redis_client.hashes[service._build_meta_key(cache_key)]
+        assert meta["access_count"] == b"3"
+        assert meta["codec"] == b"zlib"
+
+        service.metrics.clear()
+        metrics = await service.get_tenant_cache_metrics("hotel-1")
+        assert metrics.total_entries == 1
+        assert metrics.most_accessed_keys == ["config"]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_metadata(self):
+        service, redis_client = make_service()
+        await service.set("hotel-1", "k", 1, tags=["t"])
+
+        assert await service.delete("hotel-1", "k")
+        assert redis_client.values == {}
+        assert redis_client.hashes == {}
+        assert service._build_tag_key("hotel-1", CacheNamespace.TEMPORARY, "t") not in redis_client.sets
+
+
+class TestTagIndex:
+    """Test tag lookups and invalidation through the tag index"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_tags_reads_only_matching_entries(self):
+        service, redis_client = make_service()
+        for i in range(50):
+            await service.set("hotel-1", f"room-{i}", {"room": i}, tags=["rooms"] if i < 3 else ["other"])
+
+        redis_client.commands.clear()
+        result = await service.get_by_tags("hotel-1", ["rooms"])
+
+        assert result == {f"room-{i}": {"room": i} for i in range(3)}
+        # One SUNION and one pipelined MGET, independent of the keyspace size
+        assert redis_client.commands == ["sunion", "pipeline"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_tags_unlinks_entries_and_index(self):
+        service, redis_client = make_service()
+        await service.set("hotel-1", "rate-1", 100, tags=["rates", "summer"])
+        await service.set("hotel-1", "rate-2", 200, tags=["rates"])
+        await service.set("hotel-1", "room-1", "suite", tags=["rooms"])
+
+        deleted = await service.invalidate_by_tags("hotel-1", ["rates"])
+
+        assert deleted == 2
+        assert await service.get("hotel-1", "rate-1", use_local_cache=False) is None
+        assert await service.get("hotel-1", "room-1", use_local_cache=False) == "suite"
+        assert service._build_tag_key("hotel-1", CacheNamespace.TEMPORARY, "summer") not in redis_client.sets
+        assert list(redis_client.zsets[service._build_lru_key("hotel-1")]) == [
+            service._build_cache_key("hotel-1", CacheNamespace.TEMPORARY, "room-1")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retagged_and_expired_members_are_pruned(self):
+        service, redis_client = make_service()
+        await service.set("hotel-1", "rate-1", 100, tags=["rates"])
+        await service.set("hotel-1", "rate-2", 200, tags=["rates"])
+
+        # Overwritten without the tag, and expired out of Redis
+        await service.set("hotel-1", "rate-1", 150, tags=["archived"])
+        del redis_client.values[service._build_cache_key("hotel-1", CacheNamespace.TEMPORARY, "rate-2")]
+
+        assert await service.get_by_tags("hotel-1", ["rates"]) == {}
+        assert service._build_tag_key("hotel-1", CacheNamespace.TEMPORARY, "rates") not in redis_client.sets
+        assert await service.get_by_tags("hotel-1", ["archived"]) == {"rate-1": 150}
+
+
+class TestLRUIndex:
+    """Test LRU eviction and tenant clearing through the sorted set"""
+
+    @pytest.mark.asyncio
+    async def test_eviction_removes_least_recently_used(self):
+        service, redis_client = make_service(eviction_batch_size=2)
+        for i in range(4):
+            await service.set("hotel-1", f"key-{i}", i, tags=["all"])
+        # Deterministic access order: key-0 oldest, key-3 newest
+        lru = redis_client.zsets[service._build_lru_key("hotel-1")]
+        for i in range(4):
+            lru[service._build_cache_key("hotel-1", CacheNamespace.TEMPORARY, f"key-{i}")] = time.time() - 100 + i
+
+        # Reading key-0 moves it to the most recently used end
+        await service.get("hotel-1", "key-0", use_local_cache=False)
+        await asyncio.sleep(0)  # let the access tracking pipeline run
+
+        evicted = await service._evict_entries("hotel-1", service.tenant_configs["hotel-1"])
+
+        assert evicted == 2
+        remaining = await service.get_by_tags("hotel-1", ["all"])
+        assert remaining == {"key-0": 0, "key-3": 3}
+
+    @pytest.mark.asyncio
+    async def test_clear_namespace_leaves_other_namespaces(self):
+        service, redis_client = make_service()
+        await service.set("hotel-1", "a", 1, namespace=CacheNamespace.PMS_DATA, tags=["pms"])
+        await service.set("hotel-1", "b", 2, namespace=CacheNamespace.PMS_DATA)
+        await service.set("hotel-1", "c", 3, namespace=CacheNamespace.ANALYTICS, tags=["stats"])
+
+        cleared = await service.clear_tenant_cache("hotel-1", CacheNamespace.PMS_DATA)
+
+        assert cleared == 2
+        assert await service.get_by_tags("hotel-1", ["pms"], CacheNamespace.PMS_DATA) == {}
+        assert await service.get_by_tags("hotel-1", ["stats"], CacheNamespace.ANALYTICS) == {"c": 3}
+        assert len(redis_client.zsets[service._build_lru_key("hotel-1")]) == 1
+
+        assert await service.clear_tenant_cache("hotel-1") == 1
+        assert redis_client.values == {}
+        assert redis_client.hashes == {}
+        assert redis_client.zsets == {}
+        assert redis_client.sets == {}